@@ -0,0 +1,16 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from semantic_kernel.caching.completion_cache import CompletionCache
+from semantic_kernel.caching.completion_cache_store_base import CachedCompletion, CompletionCacheStoreBase
+from semantic_kernel.caching.plan_cache import PlanCache
+from semantic_kernel.caching.sqlite_completion_cache_store import SqliteCompletionCacheStore
+from semantic_kernel.caching.volatile_completion_cache_store import VolatileCompletionCacheStore
+
+__all__ = [
+    "CachedCompletion",
+    "CompletionCache",
+    "CompletionCacheStoreBase",
+    "PlanCache",
+    "SqliteCompletionCacheStore",
+    "VolatileCompletionCacheStore",
+]
@@ -0,0 +1,185 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+
+from numpy import ndarray
+from pydantic import Field, PrivateAttr
+
+from semantic_kernel.caching.completion_cache_store_base import CachedCompletion, CompletionCacheStoreBase
+from semantic_kernel.caching.volatile_completion_cache_store import VolatileCompletionCacheStore
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+from semantic_kernel.services.ai_service_client_base import AIServiceClientBase
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+RECENT_EMBEDDINGS_LIMIT = 256
+# fields that services fill in on the settings with the request itself, they are not part of the scope
+REQUEST_FIELDS = {"service_id", "ai_model_id", "messages", "prompt", "input", "stream"}
+
+
+class CompletionCache(KernelBaseModel):
+    """Cache of the completions of prompt functions, set it as completion_cache of the kernel to use it.
+
+    The exact tier finds completions by a hash of the service, the model, the execution settings and
+    the rendered prompt. When an embedding_generator is set, the semantic tier also embeds the rendered
+    prompt and, on a miss of the exact tier, reuses the completion of the most similar cached prompt for
+    the same service, model and settings, when its similarity is at least similarity_threshold.
+    The embeddings are kept in semantic_store, any MemoryStoreBase, a VolatileMemoryStore by default.
+
+    Completions older than ttl seconds are not used, the size budget is up to the store.
+    Only use a cache for functions whose answer depends on nothing but the prompt, the kernel
+    functions that are called automatically are not part of the key.
+    """
+
+    store: CompletionCacheStoreBase = Field(default_factory=VolatileCompletionCacheStore)
+    ttl: Optional[float] = Field(None, gt=0)
+    embedding_generator: Optional[EmbeddingGeneratorBase] = None
+    semantic_store: Optional[MemoryStoreBase] = None
+    semantic_collection: str = "completion_cache"
+    similarity_threshold: float = Field(0.95, gt=0, le=1)
+    semantic_candidates: int = Field(5, gt=0)
+    clock: Callable[[], float] = time.time
+
+    _recent_embeddings: "OrderedDict[str, ndarray]" = PrivateAttr(default_factory=OrderedDict)
+
+    def model_post_init(self, __context: Optional[object] = None):
+        if self.embedding_generator is not None and self.semantic_store is None:
+            self.semantic_store = VolatileMemoryStore()
+
+    def get_scope(self, service: AIServiceClientBase, settings: PromptExecutionSettings) -> str:
+        """Get the hash of everything but the prompt that determines a completion.
+
+        Get the scope before the request is sent, services fill in the settings while sending it.
+        """
+        normalized_settings = settings.model_dump(exclude=REQUEST_FIELDS, exclude_none=True, by_alias=True)
+        if "extension_data" in normalized_settings:
+            normalized_settings["extension_data"] = {
+                key: value for key, value in normalized_settings["extension_data"].items() if key not in REQUEST_FIELDS
+            }
+        scope = {
+            "service_id": service.service_id,
+            "ai_model_id": service.ai_model_id,
+            "settings": normalized_settings,
+        }
+        return hashlib.sha256(json.dumps(scope, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get_key(self, scope: str, prompt: str) -> str:
+        """Get the key of the completion of a prompt within a scope."""
+        return hashlib.sha256(f"{scope}\n{prompt}".encode("utf-8")).hexdigest()
+
+    async def get(self, scope: str, prompt: str) -> Optional[Tuple[CachedCompletion, str]]:
+        """Look up the completion of a rendered prompt.
+
+        Arguments:
+            scope {str} -- The scope of the request, from get_scope.
+            prompt {str} -- The rendered prompt.
+
+        Returns:
+            Optional[Tuple[CachedCompletion, str]] -- The completion and the tier that found it,
+                "exact" or "semantic", None on a miss.
+        """
+        key = self.get_key(scope, prompt)
+        completion = await self._get_fresh(key)
+        if completion is not None:
+            return completion, "exact"
+        if self.embedding_generator is None:
+            return None
+        if not await self.semantic_store.does_collection_exist(self.semantic_collection):
+            return None
+        embedding = await self._embed(key, prompt)
+        self._remember_embedding(key, embedding)
+        matches = await self.semantic_store.get_nearest_matches(
+            collection_name=self.semantic_collection,
+            embedding=embedding,
+            limit=self.semantic_candidates,
+            min_relevance_score=self.similarity_threshold,
+        )
+        for record, score in matches:
+            if record.description != scope:
+                continue
+            completion = await self._get_fresh(record.id)
+            if completion is not None:
+                logger.debug(f"Semantic cache hit with similarity {score:.3f}")
+                return completion, "semantic"
+            await self._remove_embeddings([record.id])
+        return None
+
+    async def set(self, scope: str, prompt: str, contents: List[Any], ai_model_id: Optional[str] = None) -> None:
+        """Store the completions of a rendered prompt.
+
+        Arguments:
+            scope {str} -- The scope of the request, from get_scope.
+            prompt {str} -- The rendered prompt.
+            contents {List[Any]} -- The completions, stored as their text.
+            ai_model_id {Optional[str]} -- The model that created the completions.
+        """
+        key = self.get_key(scope, prompt)
+        completion = CachedCompletion(
+            contents=[str(content) for content in contents],
+            ai_model_id=ai_model_id,
+            created_at=self.clock(),
+        )
+        evicted = await self.store.set(key, completion)
+        if self.embedding_generator is None:
+            return
+        if evicted:
+            await self._remove_embeddings(evicted)
+        if key in evicted:
+            self._recent_embeddings.pop(key, None)
+            return
+        if not await self.semantic_store.does_collection_exist(self.semantic_collection):
+            await self.semantic_store.create_collection(self.semantic_collection)
+        embedding = await self._embed(key, prompt)
+        await self.semantic_store.upsert(
+            self.semantic_collection,
+            MemoryRecord.local_record(
+                id=key, text=prompt, description=scope, additional_metadata=None, embedding=embedding
+            ),
+        )
+
+    async def clear(self) -> None:
+        """Remove all cached completions."""
+        await self.store.clear()
+        if self.semantic_store is not None and await self.semantic_store.does_collection_exist(
+            self.semantic_collection
+        ):
+            await self.semantic_store.delete_collection(self.semantic_collection)
+
+    async def _get_fresh(self, key: str) -> Optional[CachedCompletion]:
+        completion = await self.store.get(key)
+        if completion is None:
+            return None
+        if self.ttl is not None and self.clock() - completion.created_at > self.ttl:
+            await self.store.remove(key)
+            if self.embedding_generator is not None:
+                await self._remove_embeddings([key])
+            return None
+        return completion
+
+    async def _embed(self, key: str, prompt: str) -> ndarray:
+        embedding = self._recent_embeddings.pop(key, None)
+        if embedding is None:
+            embedding = (await self.embedding_generator.generate_embeddings([prompt]))[0]
+        return embedding
+
+    def _remember_embedding(self, key: str, embedding: ndarray) -> None:
+        # the embedding of a miss is needed again when its completion is stored
+        self._recent_embeddings[key] = embedding
+        if len(self._recent_embeddings) > RECENT_EMBEDDINGS_LIMIT:
+            self._recent_embeddings.popitem(last=False)
+
+    async def _remove_embeddings(self, keys: List[str]) -> None:
+        try:
+            await self.semantic_store.remove_batch(self.semantic_collection, keys)
+        except Exception as exc:
+            logger.debug(f"Could not remove the embeddings of evicted completions: {exc}")
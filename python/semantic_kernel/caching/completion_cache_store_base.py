@@ -0,0 +1,66 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+
+
+class CachedCompletion(KernelBaseModel):
+    """The completions of a request, as stored in a completion cache."""
+
+    contents: List[str]
+    ai_model_id: Optional[str] = None
+    created_at: float
+
+    @property
+    def size(self) -> int:
+        """The size of the entry in bytes, as counted against the size budget of a store."""
+        return len(self.model_dump_json().encode("utf-8"))
+
+
+class CompletionCacheStoreBase(ABC):
+    """Storage of cached completions by key.
+
+    Stores keep to their own size budget and return the keys they evicted for it from set,
+    expiry is left to the CompletionCache.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CachedCompletion]:
+        """Gets the cached completion for a key.
+
+        Arguments:
+            key {str} -- The key of the completion.
+
+        Returns:
+            Optional[CachedCompletion] -- The cached completion, None if there is none.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, completion: CachedCompletion) -> List[str]:
+        """Stores a completion, replacing the completion with the same key.
+
+        Arguments:
+            key {str} -- The key of the completion.
+            completion {CachedCompletion} -- The completion to store.
+
+        Returns:
+            List[str] -- The keys that were evicted to stay within the size budget.
+        """
+        pass
+
+    @abstractmethod
+    async def remove(self, key: str) -> None:
+        """Removes the completion for a key, if there is one.
+
+        Arguments:
+            key {str} -- The key of the completion.
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Removes all completions."""
+        pass
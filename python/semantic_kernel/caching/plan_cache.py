@@ -0,0 +1,147 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import hashlib
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
+
+from pydantic import Field
+
+from semantic_kernel.caching.completion_cache_store_base import CachedCompletion, CompletionCacheStoreBase
+from semantic_kernel.caching.volatile_completion_cache_store import VolatileCompletionCacheStore
+from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+
+if TYPE_CHECKING:
+    from semantic_kernel.kernel import Kernel
+    from semantic_kernel.planners.plan import Plan
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class PlanCache(KernelBaseModel):
+    """Cache of the results of plan steps and of whole plans.
+
+    Steps whose function is marked cacheable, with kernel_function(cacheable=True) or the is_cacheable field
+    of its metadata, are memoized by the fully qualified name of the function and the arguments of its
+    parameters. Plans are cached by goal and the set of functions that were available to the planner, so a
+    repeated goal does not need the planner to call the model again.
+
+    Entries are kept in store, the same stores as for completions, which keep to their own size budget,
+    entries older than ttl seconds are not used. Only mark functions cacheable whose result depends on
+    nothing but their arguments. Step results are stored as JSON with their type, results that JSON does not
+    restore as they were, like objects, are not memoized.
+    """
+
+    store: CompletionCacheStoreBase = Field(default_factory=VolatileCompletionCacheStore)
+    ttl: Optional[float] = Field(None, gt=0)
+    clock: Callable[[], float] = time.time
+
+    def is_cacheable(self, step: "Plan") -> bool:
+        """Whether the result of a step can be memoized."""
+        return step.function is not None and step.metadata.is_cacheable
+
+    def get_step_key(self, metadata: KernelFunctionMetadata, arguments: Mapping[str, Any]) -> str:
+        """Get the key of the result of a function for the arguments of its parameters.
+
+        Arguments:
+            metadata {KernelFunctionMetadata} -- The metadata of the function.
+            arguments {Mapping[str, Any]} -- The arguments the step is invoked with, the function only gets
+                those of its parameters, the others are not part of the key.
+
+        Returns:
+            str -- The key.
+        """
+        normalized_arguments = {
+            parameter.name: arguments.get(parameter.name, parameter.default_value) for parameter in metadata.parameters
+        }
+        return self._hash({"function": f"{metadata.plugin_name}.{metadata.name}", "arguments": normalized_arguments})
+
+    def get_plan_key(self, goal: str, function_manual: str, *context: str) -> str:
+        """Get the key of the plan for a goal.
+
+        Arguments:
+            goal {str} -- The goal.
+            function_manual {str} -- The manual of the functions that were available to the planner.
+            *context {str} -- Anything else the plan depends on, like the prompt of the planner.
+
+        Returns:
+            str -- The key.
+        """
+        return self._hash({"goal": goal, "function_manual": function_manual, "context": list(context)})
+
+    async def get_step_result(self, key: str) -> Optional[Any]:
+        """Get the memoized result value of a step, None on a miss."""
+        entry = await self._get_fresh(key)
+        if entry is None:
+            return None
+        try:
+            return _restore_value(json.loads(entry.contents[0]))
+        except (ValueError, TypeError, KeyError) as exc:
+            logger.debug(f"Memoized step result {key} cannot be used: {exc}")
+            await self.store.remove(key)
+            return None
+
+    async def set_step_result(self, key: str, value: Any) -> None:
+        """Memoize the result value of a step, values that can not be restored from JSON are skipped.
+
+        Arguments:
+            key {str} -- The key of the step, see get_step_key.
+            value {Any} -- The value of the result of the step.
+        """
+        if value is None:
+            return
+        try:
+            text = json.dumps({"type": type(value).__name__, "value": value})
+            restorable = _restore_value(json.loads(text)) == value
+        except (ValueError, TypeError):
+            restorable = False
+        if not restorable:
+            logger.debug(f"The result of type {type(value).__name__} is not memoized, JSON does not restore it")
+            return
+        await self.store.set(key, CachedCompletion(contents=[text], created_at=self.clock()))
+
+    async def get_plan(self, key: str, kernel: "Kernel") -> Optional["Plan"]:
+        """Get a cached plan with its functions from the kernel, None on a miss or when a function is gone."""
+        from semantic_kernel.planners.plan import Plan
+
+        entry = await self._get_fresh(key)
+        if entry is None:
+            return None
+        try:
+            return Plan.from_json(entry.contents[0], kernel)
+        except Exception as exc:
+            logger.debug(f"Cached plan {key} cannot be used: {exc}")
+            await self.store.remove(key)
+            return None
+
+    async def set_plan(self, key: str, plan: "Plan") -> None:
+        """Cache a plan."""
+        await self.store.set(key, CachedCompletion(contents=[plan.to_json()], created_at=self.clock()))
+
+    async def clear(self) -> None:
+        """Remove all cached results and plans."""
+        await self.store.clear()
+
+    async def _get_fresh(self, key: str) -> Optional[CachedCompletion]:
+        entry = await self.store.get(key)
+        if entry is None:
+            return None
+        if self.ttl is not None and self.clock() - entry.created_at > self.ttl:
+            await self.store.remove(key)
+            return None
+        return entry
+
+    def _hash(self, value: Any) -> str:
+        return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _restore_value(stored: Mapping[str, Any]) -> Any:
+    """Restore a value stored as JSON with the name of its type, a value of another type is not restored."""
+    value = stored["value"]
+    if stored["type"] == "tuple" and isinstance(value, list):
+        value = tuple(value)
+    if type(value).__name__ != stored["type"]:
+        raise TypeError(f"Stored {stored['type']} is restored as {type(value).__name__}")
+    return value
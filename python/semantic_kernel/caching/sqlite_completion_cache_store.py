@@ -0,0 +1,116 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Callable, List, Optional, TypeVar
+
+from semantic_kernel.caching.completion_cache_store_base import CachedCompletion, CompletionCacheStoreBase
+
+T = TypeVar("T")
+
+
+class SqliteCompletionCacheStore(CompletionCacheStoreBase):
+    """Completion cache store in a sqlite database, so cached completions survive restarts.
+
+    The least recently used completions are evicted to stay within the size budget.
+    Database calls run in the default executor so they do not block the event loop.
+    """
+
+    def __init__(
+        self,
+        database: str = ":memory:",
+        table_name: str = "completion_cache",
+        max_entries: Optional[int] = None,
+        max_size: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initializes a new instance of the SqliteCompletionCacheStore class.
+
+        Arguments:
+            database {str} -- The path of the database file, ":memory:" for an in-memory database.
+            table_name {str} -- The table to store the completions in, created when it does not exist.
+            max_entries {Optional[int]} -- The maximum number of completions, None for no limit.
+            max_size {Optional[int]} -- The maximum total size of the completions in bytes, None for no limit.
+            clock {Callable[[], float]} -- The clock used to track when completions were last used.
+        """
+        if not table_name.isidentifier():
+            raise ValueError(f"Invalid table name: {table_name}")
+        self.table_name = table_name
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._connection.execute(f"CREATE INDEX IF NOT EXISTS {table_name}_last_used ON {table_name} (last_used)")
+
+    async def get(self, key: str) -> Optional[CachedCompletion]:
+        return await self._run(self._get, key)
+
+    async def set(self, key: str, completion: CachedCompletion) -> List[str]:
+        return await self._run(self._set, key, completion)
+
+    async def remove(self, key: str) -> None:
+        await self._run(self._execute, f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+
+    async def clear(self) -> None:
+        await self._run(self._execute, f"DELETE FROM {self.table_name}", ())
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    def _execute(self, statement: str, parameters: tuple) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(statement, parameters)
+
+    def _get(self, key: str) -> Optional[CachedCompletion]:
+        with self._lock, self._connection:
+            row = self._connection.execute(f"SELECT value FROM {self.table_name} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(f"UPDATE {self.table_name} SET last_used = ? WHERE key = ?", (self.clock(), key))
+        return CachedCompletion.model_validate_json(row[0])
+
+    def _set(self, key: str, completion: CachedCompletion) -> List[str]:
+        value = completion.model_dump_json()
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), self.clock()),
+            )
+            evicted = []
+            count, total_size = self._connection.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table_name}"
+            ).fetchone()
+            if not self._over_budget(count, total_size):
+                return evicted
+            for evict_key, size in self._connection.execute(
+                f"SELECT key, size FROM {self.table_name} WHERE key != ? ORDER BY last_used", (key,)
+            ).fetchall():
+                evicted.append(evict_key)
+                count -= 1
+                total_size -= size
+                if not self._over_budget(count, total_size):
+                    break
+            if self._over_budget(count, total_size):
+                # the new completion does not fit on its own
+                evicted.append(key)
+            self._connection.executemany(
+                f"DELETE FROM {self.table_name} WHERE key = ?", [(evict_key,) for evict_key in evicted]
+            )
+        return evicted
+
+    def _over_budget(self, count: int, total_size: int) -> bool:
+        if self.max_entries is not None and count > self.max_entries:
+            return True
+        return self.max_size is not None and total_size > self.max_size
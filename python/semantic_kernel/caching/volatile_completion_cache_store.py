@@ -0,0 +1,67 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from semantic_kernel.caching.completion_cache_store_base import CachedCompletion, CompletionCacheStoreBase
+
+
+class VolatileCompletionCacheStore(CompletionCacheStoreBase):
+    """In-memory completion cache store that evicts the least recently used completions."""
+
+    def __init__(self, max_entries: Optional[int] = None, max_size: Optional[int] = None) -> None:
+        """Initializes a new instance of the VolatileCompletionCacheStore class.
+
+        Arguments:
+            max_entries {Optional[int]} -- The maximum number of completions, None for no limit.
+            max_size {Optional[int]} -- The maximum total size of the completions in bytes, None for no limit.
+        """
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, CachedCompletion]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total_size = 0
+
+    @property
+    def total_size(self) -> int:
+        """The total size of the stored completions in bytes."""
+        return self._total_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[CachedCompletion]:
+        completion = self._entries.get(key)
+        if completion is not None:
+            self._entries.move_to_end(key)
+        return completion
+
+    async def set(self, key: str, completion: CachedCompletion) -> List[str]:
+        self._discard(key)
+        self._entries[key] = completion
+        self._sizes[key] = completion.size
+        self._total_size += self._sizes[key]
+        evicted = []
+        while self._entries and self._over_budget():
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            evicted.append(oldest)
+        return evicted
+
+    async def remove(self, key: str) -> None:
+        self._discard(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self._total_size = 0
+
+    def _over_budget(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_size is not None and self._total_size > self.max_size
+
+    def _discard(self, key: str) -> None:
+        if key in self._entries:
+            del self._entries[key]
+            self._total_size -= self._sizes.pop(key)
@@ -3,8 +3,12 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Type
 
+from pydantic import Field
+
 from semantic_kernel.contents import ChatMessageContent
+from semantic_kernel.contents.chat_history_reducer import ChatHistoryReducer
 from semantic_kernel.contents.chat_role import ChatRole
+from semantic_kernel.kernel_pydantic import can_change_in_place
 from semantic_kernel.services.ai_service_client_base import AIServiceClientBase
 
 if TYPE_CHECKING:
@@ -12,8 +16,18 @@ if TYPE_CHECKING:
     from semantic_kernel.contents import StreamingChatMessageContent
     from semantic_kernel.contents.chat_history import ChatHistory
 
+_TOOL_MESSAGE_EXCLUDE = frozenset({"encoding"})
+_MESSAGE_EXCLUDE = frozenset({"metadata", "encoding", "ai_model_id", "inner_content", "choice_index"})
+
 
 class ChatCompletionClientBase(AIServiceClientBase, ABC):
+    """Base class for chat completion services.
+
+    The chat_history_reducer is optional, services that support it only send the reduced chat history.
+    """
+
+    chat_history_reducer: Optional[ChatHistoryReducer] = Field(None, exclude=True)
+
     def get_chat_message_content_class(self) -> Type[ChatMessageContent]:
         """Get the chat message content types used by a class, default is ChatMessageContent."""
         return ChatMessageContent
@@ -61,6 +75,12 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
         """
         pass
 
+    async def _reduce_chat_history(self, chat_history: "ChatHistory") -> "ChatHistory":
+        """Get the chat history to send, reduced by the chat_history_reducer when there is one."""
+        if self.chat_history_reducer is None:
+            return chat_history
+        return await self.chat_history_reducer.reduce(chat_history)
+
     def _prepare_chat_history_for_request(
         self,
         chat_history: "ChatHistory",
@@ -73,23 +93,42 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
             They require a "tool_call_id" and (function) "name" key, and the "metadata" key should
             be removed. The "encoding" key should also be removed.
 
+        The dump of the fields of every message that can not be changed in place is cached on the message until one
+        of them is replaced, so preparing a growing chat history again only serializes the new messages. Fields that
+        can be changed in place, like the metadata or the tool calls, are dumped on every call.
+
         Arguments:
             chat_history {ChatHistory} -- The chat history to prepare.
 
         Returns:
             List[Dict[str, Optional[str]]] -- The prepared chat history.
         """
-        prepared_messages = []
-        for message in chat_history.messages:
-            if message.role == ChatRole.TOOL:
-                dump = message.model_dump(exclude_none=True, exclude=["encoding"])
-                if "metadata" in dump and "tool_call_id" in dump["metadata"]:
-                    dump["tool_call_id"] = dump["metadata"]["tool_call_id"]
-                    dump["name"] = dump["metadata"]["function_name"]
-                    dump.pop("metadata", None)
+        return [self._prepare_message_for_request(message) for message in chat_history.messages]
+
+    def _prepare_message_for_request(self, message: ChatMessageContent) -> Dict[str, Optional[str]]:
+        """Prepare a single message of the chat history for a request."""
+        exclude = _TOOL_MESSAGE_EXCLUDE if message.role == ChatRole.TOOL else _MESSAGE_EXCLUDE
+        mutable: List[str] = []
+        sources: List[Any] = []
+        for key, value in message.__dict__.items():
+            if key in exclude:
+                continue
+            if can_change_in_place(value):
+                mutable.append(key)
             else:
-                dump = message.model_dump(
-                    exclude_none=True, exclude=["metadata", "encoding", "ai_model_id", "inner_content", "choice_index"]
-                )
-            prepared_messages.append(dump)
-        return prepared_messages
+                sources.append(value)
+        # copied, so callers can rename keys without changing the cached dict
+        dump = dict(
+            message.get_derived_value(
+                ("request_dict", type(self), tuple(mutable)),
+                lambda: message.model_dump(exclude_none=True, exclude=exclude.union(mutable)),
+                tuple(sources),
+            )
+        )
+        if mutable:
+            dump.update(message.model_dump(exclude_none=True, include=set(mutable)))
+        if message.role == ChatRole.TOOL and "metadata" in dump and "tool_call_id" in dump["metadata"]:
+            dump["tool_call_id"] = dump["metadata"]["tool_call_id"]
+            dump["name"] = dump["metadata"]["function_name"]
+            dump.pop("metadata", None)
+        return dump
@@ -1,7 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 
+import asyncio
 import sys
+from functools import partial
 from typing import List
 
 if sys.version_info >= (3, 9):
@@ -10,8 +12,9 @@ else:
     from typing_extensions import Annotated
 
 import google.generativeai as palm
+from google.api_core.exceptions import TooManyRequests
 from numpy import array, ndarray
-from pydantic import StringConstraints
+from pydantic import Field, StringConstraints
 
 from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import (
     EmbeddingGeneratorBase,
@@ -21,8 +24,18 @@ from semantic_kernel.exceptions import ServiceInvalidAuthError, ServiceResponseE
 
 class GooglePalmTextEmbedding(EmbeddingGeneratorBase):
     api_key: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+    max_concurrency: int = Field(8, gt=0)
+    max_retries: int = Field(3, ge=0)
+    retry_delay: float = Field(1.0, ge=0)
 
-    def __init__(self, ai_model_id: str, api_key: str) -> None:
+    def __init__(
+        self,
+        ai_model_id: str,
+        api_key: str,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ) -> None:
         """
         Initializes a new instance of the GooglePalmTextEmbedding class.
 
@@ -31,37 +44,67 @@ class GooglePalmTextEmbedding(EmbeddingGeneratorBase):
             https://developers.generativeai.google/models/language
             api_key {str} -- GooglePalm API key, see
             https://developers.generativeai.google/products/palm
+            max_concurrency {int} -- The maximum number of embedding requests in flight at the same time.
+            max_retries {int} -- The number of times a rate limited request is retried.
+            retry_delay {float} -- The delay in seconds before the first retry, doubled for every next retry.
         """
-        super().__init__(ai_model_id=ai_model_id, api_key=api_key)
+        super().__init__(
+            ai_model_id=ai_model_id,
+            api_key=api_key,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+        )
+        try:
+            palm.configure(api_key=self.api_key)
+        except Exception as ex:
+            raise ServiceInvalidAuthError(
+                "Google PaLM service failed to configure. Invalid API key provided.",
+                ex,
+            ) from ex
 
     async def generate_embeddings(self, texts: List[str]) -> ndarray:
         """
         Generates embeddings for a list of texts.
 
+        The texts are embedded concurrently, at most max_concurrency at a time,
+        the order of the embeddings matches the order of the texts.
+
         Arguments:
             texts {List[str]} -- Texts to generate embeddings for.
 
         Returns:
             ndarray -- Embeddings for the texts.
         """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [asyncio.ensure_future(self._generate_embedding(text, semaphore)) for text in texts]
         try:
-            palm.configure(api_key=self.api_key)
-        except Exception as ex:
-            raise ServiceInvalidAuthError(
-                "Google PaLM service failed to configure. Invalid API key provided.",
-                ex,
-            ) from ex
-        embeddings = []
-        for text in texts:
-            try:
-                response = palm.generate_embeddings(
-                    model=self.ai_model_id,
-                    text=text,
-                )
-                embeddings.append(array(response["embedding"]))
-            except Exception as ex:
-                raise ServiceResponseException(
-                    "Google PaLM service failed to generate the embedding.",
-                    ex,
-                ) from ex
+            embeddings = await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            raise
         return array(embeddings)
+
+    async def _generate_embedding(self, text: str, semaphore: asyncio.Semaphore) -> ndarray:
+        """Generate the embedding for a single text, retrying when the request is rate limited."""
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    response = await loop.run_in_executor(
+                        None, partial(palm.generate_embeddings, model=self.ai_model_id, text=text)
+                    )
+                    return array(response["embedding"])
+                except TooManyRequests as ex:
+                    if attempt == self.max_retries:
+                        raise ServiceResponseException(
+                            "Google PaLM service failed to generate the embedding, the request was rate limited.",
+                            ex,
+                        ) from ex
+                    await asyncio.sleep(self.retry_delay * 2**attempt)
+                except Exception as ex:
+                    raise ServiceResponseException(
+                        "Google PaLM service failed to generate the embedding.",
+                        ex,
+                    ) from ex
@@ -1,11 +1,15 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
-from threading import Thread
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Literal, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Literal, Optional, Set
 
 import torch
-from transformers import AutoTokenizer, TextIteratorStreamer, pipeline
+from pydantic import Field, PrivateAttr
+from transformers import AutoTokenizer, StoppingCriteria, StoppingCriteriaList, TextStreamer, pipeline
 
 from semantic_kernel.connectors.ai.hugging_face.hf_prompt_execution_settings import (
     HuggingFacePromptExecutionSettings,
@@ -22,11 +26,46 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_STREAM_END = object()
+
+
+class _AsyncTextIteratorStreamer(TextStreamer):
+    """Streamer that hands decoded text from the generation thread to an asyncio.Queue.
+
+    The text is pushed onto the queue through the event loop, so the consumer can await the next
+    piece of text without blocking the loop, like TextIteratorStreamer does.
+    """
+
+    def __init__(self, tokenizer: Any, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, **decode_kwargs):
+        super().__init__(tokenizer, skip_prompt=False, **decode_kwargs)
+        self.loop = loop
+        self.queue = queue
+
+    def on_finalized_text(self, text: str, stream_end: bool = False):
+        """Put the new text in the queue. If the stream is ending, also put a stop signal in the queue."""
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, text)
+        if stream_end:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, _STREAM_END)
+
+
+class _StopOnEvent(StoppingCriteria):
+    """Stopping criteria that stops the generation once an event is set, like when the consumer stopped reading."""
+
+    def __init__(self, event: threading.Event):
+        self.event = event
+
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor, **kwargs) -> torch.BoolTensor:
+        return torch.full((input_ids.shape[0],), self.event.is_set(), dtype=torch.bool, device=input_ids.device)
+
 
 class HuggingFaceTextCompletion(TextCompletionClientBase):
     task: Literal["summarization", "text-generation", "text2text-generation"]
     device: str
     generator: Any
+    tokenizer: Any = None
+    max_concurrent_streams: int = Field(1, gt=0)
+    _stream_executor: Optional[ThreadPoolExecutor] = PrivateAttr(default=None)
+    _stream_stops: Set[threading.Event] = PrivateAttr(default_factory=set)
 
     def __init__(
         self,
@@ -36,6 +75,7 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
         service_id: Optional[str] = None,
         model_kwargs: Optional[Dict[str, Any]] = None,
         pipeline_kwargs: Optional[Dict[str, Any]] = None,
+        max_concurrent_streams: int = 1,
     ) -> None:
         """
         Initializes a new instance of the HuggingFaceTextCompletion class.
@@ -59,6 +99,9 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
             pipeline_kwargs {Optional[Dict[str, Any]]} -- Additional keyword arguments passed along
                 to the specific pipeline init (see the documentation for the corresponding pipeline class
                 for possible values).
+            max_concurrent_streams {int} -- The maximum number of generation threads used for streaming
+                at the same time, additional streaming requests wait for a thread to become available. Call close
+                to stop the running generations and shut the threads down.
 
         Note that this model will be downloaded from the Hugging Face model hub.
         """
@@ -75,6 +118,8 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
             task=task,
             device=(f"cuda:{device}" if device >= 0 and torch.cuda.is_available() else "cpu"),
             generator=generator,
+            tokenizer=getattr(generator, "tokenizer", None) or AutoTokenizer.from_pretrained(ai_model_id),
+            max_concurrent_streams=max_concurrent_streams,
         )
 
     async def complete(
@@ -128,25 +173,54 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
                 "HuggingFace TextIteratorStreamer does not stream multiple responses in a parseable format. \
                     If you need multiple responses, please use the complete method.",
             )
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        streamer = _AsyncTextIteratorStreamer(self.tokenizer, loop, queue)
+        stop = threading.Event()
+        self._stream_stops.add(stop)
+        # See https://github.com/huggingface/transformers/blob/main/src/transformers/generation/streamers.py#L159
+        generation = loop.run_in_executor(
+            self._get_stream_executor(),
+            partial(
+                self.generator,
+                prompt,
+                **settings.prepare_settings_dict(
+                    streamer=streamer, stopping_criteria=StoppingCriteriaList([_StopOnEvent(stop)])
+                ),
+            ),
+        )
+        # make sure the consumer is released when the generation fails before the stream has ended
+        generation.add_done_callback(lambda _: queue.put_nowait(_STREAM_END))
         try:
-            streamer = TextIteratorStreamer(AutoTokenizer.from_pretrained(self.ai_model_id))
-            # See https://github.com/huggingface/transformers/blob/main/src/transformers/generation/streamers.py#L159
-            thread = Thread(
-                target=self.generator, args={prompt}, kwargs=settings.prepare_settings_dict(streamer=streamer)
-            )
-            thread.start()
-
-            for new_text in streamer:
+            while (new_text := await queue.get()) is not _STREAM_END:
                 yield [
                     StreamingTextContent(
                         choice_index=0, inner_content=new_text, text=new_text, ai_model_id=self.ai_model_id
                     )
                 ]
-
-            thread.join()
-
+            await generation
         except Exception as e:
             raise ServiceResponseException("Hugging Face completion failed", e) from e
+        finally:
+            # when the consumer stops reading early, the generation stops at its next token and frees its thread
+            stop.set()
+            self._stream_stops.discard(stop)
+
+    def close(self) -> None:
+        """Stop the running streaming generations and shut down their threads."""
+        for stop in self._stream_stops:
+            stop.set()
+        if self._stream_executor is not None:
+            self._stream_executor.shutdown(wait=False)
+            self._stream_executor = None
+
+    def _get_stream_executor(self) -> ThreadPoolExecutor:
+        """Get the executor that runs the streaming generations, bounded by max_concurrent_streams."""
+        if self._stream_executor is None:
+            self._stream_executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_streams, thread_name_prefix="hf_text_completion"
+            )
+        return self._stream_executor
 
     def get_prompt_execution_settings_class(self) -> "PromptExecutionSettings":
         """Create a request settings object."""
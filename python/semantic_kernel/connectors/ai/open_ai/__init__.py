@@ -20,6 +20,10 @@ from semantic_kernel.connectors.ai.open_ai.services.azure_text_embedding import
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import (
     OpenAIChatCompletion,
 )
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion_batch import (
+    OpenAIBatchJob,
+    OpenAIChatCompletionBatch,
+)
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_completion import (
     OpenAITextCompletion,
 )
@@ -34,6 +38,8 @@ __all__ = [
     "AzureChatPromptExecutionSettings",
     "OpenAITextCompletion",
     "OpenAIChatCompletion",
+    "OpenAIChatCompletionBatch",
+    "OpenAIBatchJob",
     "OpenAITextEmbedding",
     "AzureTextCompletion",
     "AzureChatCompletion",
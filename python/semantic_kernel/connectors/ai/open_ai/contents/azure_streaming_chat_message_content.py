@@ -1,9 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from semantic_kernel.connectors.ai.open_ai.contents.open_ai_streaming_chat_message_content import (
     OpenAIStreamingChatMessageContent,
 )
+from semantic_kernel.contents import StreamingChatMessageContent
 from semantic_kernel.exceptions import ContentAdditionException
 
 
@@ -74,3 +75,19 @@ class AzureStreamingChatMessageContent(OpenAIStreamingChatMessageContent):
             tool_calls=tc,
             tool_message=(self.tool_message or "") + (other.tool_message or ""),
         )
+
+    @classmethod
+    def merge(cls, contents: List["AzureStreamingChatMessageContent"]) -> "AzureStreamingChatMessageContent":
+        """Combine the streamed contents of a single choice, joining the contents and call arguments at once.
+
+        Tool call deltas are combined by the index of the tool call.
+        """
+        if len(contents) == 1 or cls.__add__ is not AzureStreamingChatMessageContent.__add__:
+            return super(StreamingChatMessageContent, cls).merge(contents)
+        return AzureStreamingChatMessageContent(**cls._merge_fields(contents))
+
+    @classmethod
+    def _merge_fields(cls, contents: List["AzureStreamingChatMessageContent"]) -> Dict[str, Any]:
+        fields = super()._merge_fields(contents)
+        fields["tool_message"] = "".join(content.tool_message or "" for content in contents)
+        return fields
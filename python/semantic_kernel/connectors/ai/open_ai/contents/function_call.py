@@ -28,6 +28,21 @@ class FunctionCall(KernelBaseModel):
             id=self.id or other.id,
         )
 
+    @classmethod
+    def merge(cls, function_calls: List[Optional["FunctionCall"]]) -> Optional["FunctionCall"]:
+        """Combine streamed function call deltas in order, the same as adding them one by one.
+
+        The arguments are joined at once, instead of copying them for every delta.
+        """
+        deltas = [function_call for function_call in function_calls if function_call is not None]
+        if len(deltas) <= 1:
+            return deltas[0] if deltas else None
+        return FunctionCall(
+            name=next((delta.name for delta in deltas if delta.name), deltas[-1].name),
+            arguments="".join(delta.arguments or "" for delta in deltas),
+            id=next((delta.id for delta in deltas if delta.id), deltas[-1].id),
+        )
+
     def parse_arguments(self) -> Optional[Dict[str, Any]]:
         """Parse the arguments into a dictionary."""
         if not self.arguments:
@@ -1,5 +1,5 @@
 # Copyright (c) Microsoft. All rights reserved.
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 from xml.etree.ElementTree import Element
 
 from defusedxml import ElementTree
@@ -39,6 +39,19 @@ class OpenAIChatMessageContent(ChatMessageContent):
         # Directly using the class name and the attribute name as strings
         return f"{ToolCall.__name__}.{ToolCall.id.__name__}"
 
+    def _get_token_count_sources(self) -> Tuple[Any, ...]:
+        return (self.content, self.function_call, self.tool_calls)
+
+    def _get_token_count_text(self) -> str:
+        """The content and the names and arguments of the function and tool calls."""
+        parts = [self.content or ""]
+        function_calls = [self.function_call] if self.function_call else []
+        function_calls.extend(tool_call.function for tool_call in self.tool_calls or [] if tool_call.function)
+        for function_call in function_calls:
+            parts.append(function_call.name or "")
+            parts.append(function_call.arguments or "")
+        return "\n".join(parts)
+
     def to_prompt(self, root_key: str) -> str:
         """Convert the OpenAIChatMessageContent to a prompt.
 
@@ -1,5 +1,5 @@
 # Copyright (c) Microsoft. All rights reserved.
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 
@@ -76,3 +76,20 @@ class OpenAIStreamingChatMessageContent(StreamingChatMessageContent):
             function_call=fc,
             tool_calls=tc,
         )
+
+    @classmethod
+    def merge(cls, contents: List["OpenAIStreamingChatMessageContent"]) -> "OpenAIStreamingChatMessageContent":
+        """Combine the streamed contents of a single choice, joining the contents and call arguments at once.
+
+        Tool call deltas are combined by the index of the tool call.
+        """
+        if len(contents) == 1 or cls.__add__ is not OpenAIStreamingChatMessageContent.__add__:
+            return super(StreamingChatMessageContent, cls).merge(contents)
+        return OpenAIStreamingChatMessageContent(**cls._merge_fields(contents))
+
+    @classmethod
+    def _merge_fields(cls, contents: List["OpenAIStreamingChatMessageContent"]) -> Dict[str, Any]:
+        fields = super()._merge_fields(contents)
+        fields["function_call"] = FunctionCall.merge([content.function_call for content in contents])
+        fields["tool_calls"] = ToolCall.merge([content.tool_calls for content in contents])
+        return fields
@@ -1,5 +1,5 @@
 # Copyright (c) Microsoft. All rights reserved.
-from typing import Literal, Optional
+from typing import Dict, List, Literal, Optional
 
 from semantic_kernel.connectors.ai.open_ai.contents.function_call import FunctionCall
 from semantic_kernel.kernel_pydantic import KernelBaseModel
@@ -23,3 +23,32 @@ class ToolCall(KernelBaseModel):
             type=self.type or other.type,
             function=self.function + other.function if self.function else other.function,
         )
+
+    @classmethod
+    def merge(cls, tool_call_lists: List[Optional[List["ToolCall"]]]) -> Optional[List["ToolCall"]]:
+        """Combine the tool call deltas of streamed contents, in order and grouped by their index.
+
+        Deltas without an index belong to the tool call at the same position in their list.
+        """
+        non_empty = [tool_calls for tool_calls in tool_call_lists if tool_calls]
+        if len(non_empty) <= 1:
+            return non_empty[0] if non_empty else tool_call_lists[-1]
+        groups: Dict[int, List[ToolCall]] = {}
+        for tool_calls in non_empty:
+            for position, tool_call in enumerate(tool_calls):
+                key = tool_call.index if tool_call.index is not None else position
+                groups.setdefault(key, []).append(tool_call)
+        merged = []
+        for deltas in groups.values():
+            if len(deltas) == 1:
+                merged.append(deltas[0])
+                continue
+            merged.append(
+                ToolCall(
+                    index=next((delta.index for delta in deltas if delta.index), deltas[-1].index),
+                    id=next((delta.id for delta in deltas if delta.id), deltas[-1].id),
+                    type=next((delta.type for delta in deltas if delta.type), deltas[-1].type),
+                    function=FunctionCall.merge([delta.function for delta in deltas]),
+                )
+            )
+        return merged
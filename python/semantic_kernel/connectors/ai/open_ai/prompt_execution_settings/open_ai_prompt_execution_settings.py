@@ -1,13 +1,16 @@
 import logging
 from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.exceptions import ServiceInvalidExecutionSettingsError
+from semantic_kernel.kernel_pydantic import DerivedValueCache, can_change_in_place
 
 logger = logging.getLogger(__name__)
 
+_SETTINGS_DICT_EXCLUDE = frozenset({"service_id", "extension_data", "messages"})
+
 
 class OpenAIPromptExecutionSettings(PromptExecutionSettings):
     """Common request settings for (Azure) OpenAI services."""
@@ -63,6 +66,8 @@ class OpenAIChatPromptExecutionSettings(OpenAIPromptExecutionSettings):
     auto_invoke_kernel_functions: Optional[bool] = Field(default=False, exclude=True)
     max_auto_invoke_attempts: Optional[int] = Field(default=5, exclude=True)
 
+    _derived_values: DerivedValueCache = PrivateAttr(default_factory=DerivedValueCache)
+
     @field_validator("functions", "function_call", mode="after")
     @classmethod
     def validate_function_call(cls, v: Optional[Union[str, List[Dict[str, Any]]]] = None):
@@ -72,6 +77,31 @@ class OpenAIChatPromptExecutionSettings(OpenAIPromptExecutionSettings):
             )
         return v
 
+    def prepare_settings_dict(self, **kwargs) -> Dict[str, Any]:
+        """Prepare the settings as a dictionary for the request.
+
+        The dump of the settings that can not be changed in place is cached until one of them is replaced, the
+        settings of the requests in the auto invoke loop only differ in their messages, which are added as they are.
+        Settings that can be changed in place, like the stop sequences or the tools, are dumped on every call.
+        """
+        mutable = frozenset(
+            key
+            for key, value in self.__dict__.items()
+            if key not in _SETTINGS_DICT_EXCLUDE and can_change_in_place(value)
+        )
+        settings_dict = dict(
+            self._derived_values.get(
+                ("settings_dict", mutable),
+                tuple(value for key, value in self.__dict__.items() if key not in mutable and key != "messages"),
+                lambda: self.model_dump(exclude=_SETTINGS_DICT_EXCLUDE | mutable, exclude_none=True, by_alias=True),
+            )
+        )
+        if mutable:
+            settings_dict.update(self.model_dump(include=mutable, exclude_none=True, by_alias=True))
+        if self.messages is not None:
+            settings_dict["messages"] = self.messages
+        return settings_dict
+
 
 class OpenAIEmbeddingPromptExecutionSettings(PromptExecutionSettings):
     input: Optional[Union[str, List[str], List[int], List[List[int]]]] = None
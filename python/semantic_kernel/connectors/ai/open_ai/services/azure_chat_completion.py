@@ -3,7 +3,6 @@ import logging
 from typing import (
     Any,
     Dict,
-    List,
     Mapping,
     Optional,
     Union,
@@ -34,6 +33,7 @@ from semantic_kernel.connectors.ai.open_ai.services.open_ai_handler import (
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_completion_base import (
     OpenAITextCompletionBase,
 )
+from semantic_kernel.connectors.ai.open_ai.services.streaming_chat_state import ChoiceBuffer, StreamingChatState
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.contents.chat_role import ChatRole
 from semantic_kernel.contents.finish_reason import FinishReason
@@ -305,53 +305,31 @@ class AzureChatCompletion(AzureOpenAIConfigBase, OpenAIChatCompletionBase, OpenA
             tool_message=self._get_tool_message_from_chat_choice(choice),
         )
 
-    def _get_update_storage_fields(self) -> Dict[str, Dict[int, Any]]:
-        """Get the fields to store the updates."""
-        out_messages = {}
-        tool_messages_by_index = {}
-        tool_call_ids_by_index = {}
-        function_call_by_index = {}
-        return {
-            "out_messages": out_messages,
-            "tool_call_ids_by_index": tool_call_ids_by_index,
-            "function_call_by_index": function_call_by_index,
-            "tool_messages_by_index": tool_messages_by_index,
-        }
+    def _update_streaming_chat_state(
+        self, state: StreamingChatState, chunk: ChatCompletionChunk, choice: ChunkChoice
+    ) -> ChoiceBuffer:
+        """Add the delta of a streamed choice to the state, including the tool message."""
+        buffer = state.update(chunk, choice)
+        state.add_tool_message(choice.index, self._get_tool_message_from_chat_choice(choice))
+        return buffer
 
-    def _update_storages(
-        self, contents: List[AzureStreamingChatMessageContent], update_storage: Dict[str, Dict[int, Any]]
-    ):
-        """Handle updates to the messages, tool_calls and function_calls.
-
-        This will be used for auto-invoking tools.
-        """
-        out_messages = update_storage["out_messages"]
-        tool_call_ids_by_index = update_storage["tool_call_ids_by_index"]
-        function_call_by_index = update_storage["function_call_by_index"]
-        tool_messages_by_index = update_storage["tool_messages_by_index"]
-
-        for index, content in enumerate(contents):
-            if content.content is not None:
-                if index not in out_messages:
-                    out_messages[index] = content.content
-                else:
-                    out_messages[index] += content.content
-            if content.tool_calls is not None:
-                if index not in tool_call_ids_by_index:
-                    tool_call_ids_by_index[index] = content.tool_calls
-                else:
-                    for tc_index, tool_call in enumerate(content.tool_calls):
-                        tool_call_ids_by_index[index][tc_index] += tool_call
-            if content.function_call is not None:
-                if index not in function_call_by_index:
-                    function_call_by_index[index] = content.function_call
-                else:
-                    function_call_by_index[index] += content.function_call
-            if content.tool_message is not None:
-                if index not in tool_messages_by_index:
-                    tool_messages_by_index[index] = content.tool_message
-                else:
-                    tool_messages_by_index[index] += content.tool_message
+    def _create_streaming_chat_message_content_from_buffer(
+        self, choice_index: int, buffer: ChoiceBuffer
+    ) -> AzureStreamingChatMessageContent:
+        """Create a Azure streaming chat message content object from an assembled choice."""
+        metadata = self._get_metadata_from_streaming_chat_response(buffer.first_chunk)
+        return AzureStreamingChatMessageContent(
+            choice_index=choice_index,
+            inner_content=buffer.first_chunk,
+            ai_model_id=self.ai_model_id,
+            metadata=metadata,
+            role=ChatRole.ASSISTANT,
+            content=buffer.content,
+            finish_reason=buffer.finish_reason,
+            function_call=buffer.function_call,
+            tool_calls=buffer.get_tool_calls(),
+            tool_message="".join(buffer.tool_message_parts) or None,
+        )
 
     def _get_tool_message_from_chat_choice(self, choice: Union[Choice, ChunkChoice]) -> Optional[str]:
         """Get the tool message from a choice."""
@@ -28,7 +28,8 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_pro
     OpenAIChatPromptExecutionSettings,
     OpenAIPromptExecutionSettings,
 )
-from semantic_kernel.connectors.ai.open_ai.services.open_ai_handler import OpenAIHandler
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_handler import OpenAIHandler, RateLimitedStream
+from semantic_kernel.connectors.ai.open_ai.services.streaming_chat_state import ChoiceBuffer, StreamingChatState
 from semantic_kernel.connectors.ai.open_ai.services.tool_call_behavior import ToolCallBehavior
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.contents.chat_history import ChatHistory
@@ -63,6 +64,9 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
     ) -> List[OpenAIChatMessageContent]:
         """Executes a chat completion request and returns the result.
 
+        Every request to the service is retried with the retry mechanism of the kernel, so a failure after
+        functions were auto-invoked retries that request only and does not invoke the functions again.
+
         Arguments:
             chat_history {ChatHistory} -- The chat history to use for the chat completion.
             settings {OpenAIChatPromptExecutionSettings | AzureChatPromptExecutionSettings} -- The settings to use
@@ -76,8 +80,10 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
         kernel = self._validate_kernel_for_tool_calling(**kwargs)
 
         for _ in range(max_auto_invoke_attempts):
-            settings = self._prepare_settings(settings, chat_history, stream_request=False)
-            completions = await self._send_chat_request(settings)
+            settings = self._prepare_settings(
+                settings, await self._reduce_chat_history(chat_history), stream_request=False
+            )
+            completions = await kernel.retry_mechanism.execute_with_retry(lambda: self._send_chat_request(settings))
             if self._should_return_completions_response(completions, auto_invoke_kernel_functions):
                 return completions
             await self._process_chat_response_with_tool_call(completions, chat_history, kernel)
@@ -90,6 +96,9 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
     ) -> AsyncIterable[List[OpenAIStreamingChatMessageContent]]:
         """Executes a streaming chat completion request and returns the result.
 
+        Starting every stream is retried with the retry mechanism of the kernel, like the requests of
+        complete_chat, a failure while a stream is read is not retried.
+
         Arguments:
             chat_history {ChatHistory} -- The chat history to use for the chat completion.
             settings {OpenAIChatPromptExecutionSettings | AzureChatPromptExecutionSettings} -- The settings to use
@@ -111,13 +120,21 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
         continue_loop = True
 
         while attempts < max_auto_invoke_attempts and continue_loop:
-            settings = self._prepare_settings(settings, chat_history, stream_request=True)
-            response = await self._send_chat_stream_request(settings)
-            async for content in self._process_chat_stream_response(response, tool_call_behavior, chat_history, kernel):
-                yield content
-                if tool_call_behavior and not tool_call_behavior.auto_invoke_kernel_functions:
-                    continue_loop = False
-                    break
+            settings = self._prepare_settings(
+                settings, await self._reduce_chat_history(chat_history), stream_request=True
+            )
+            response = await kernel.retry_mechanism.execute_with_retry(lambda: self._send_chat_stream_request(settings))
+            try:
+                async for content in self._process_chat_stream_response(
+                    response, tool_call_behavior, chat_history, kernel
+                ):
+                    yield content
+                    if tool_call_behavior and not tool_call_behavior.auto_invoke_kernel_functions:
+                        continue_loop = False
+                        break
+            finally:
+                # the stream is not always read to the end, closing it releases the connection and the rate limit
+                await response.close()
             attempts += 1
 
     def _validate_kernel_for_tool_calling(self, **kwargs: Dict[str, Any]) -> "Kernel":
@@ -161,10 +178,12 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
 
         return completions
 
-    async def _send_chat_stream_request(self, settings: OpenAIChatPromptExecutionSettings) -> AsyncStream:
+    async def _send_chat_stream_request(
+        self, settings: OpenAIChatPromptExecutionSettings
+    ) -> Union[AsyncStream, RateLimitedStream]:
         """Send the chat stream request"""
         response = await self._send_request(request_settings=settings)
-        if not isinstance(response, AsyncStream):
+        if not isinstance(response, (AsyncStream, RateLimitedStream)):
             raise ServiceInvalidResponseError("Expected an AsyncStream[ChatCompletionChunk] response.")
         return response
 
@@ -181,38 +200,47 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
             await self._process_tool_calls(result, kernel, chat_history)
 
     async def _process_chat_stream_response(
-        self, response: AsyncStream, tool_call_behavior: ToolCallBehavior, chat_history: ChatHistory, kernel: "Kernel"
+        self,
+        response: Union[AsyncStream, RateLimitedStream],
+        tool_call_behavior: ToolCallBehavior,
+        chat_history: ChatHistory,
+        kernel: "Kernel",
     ) -> AsyncIterable[List[OpenAIStreamingChatMessageContent]]:
-        """Process the chat stream response and handle tool calls if applicable."""
-        stream_chunks, update_storage = {}, self._get_update_storage_fields()
+        """Process the chat stream response and handle tool calls if applicable.
+
+        The deltas are assembled in a StreamingChatState, content objects are only created for the chunks
+        that are yielded and for the assembled messages with tool calls.
+        """
+        state = StreamingChatState()
         async for chunk in response:
             if len(chunk.choices) == 0:
                 continue
 
-            chunk_metadata = self._get_metadata_from_streaming_chat_response(chunk)
-            contents = [
-                self._create_streaming_chat_message_content(chunk, choice, chunk_metadata) for choice in chunk.choices
-            ]
-            self._update_storages(contents, update_storage)
+            for choice in chunk.choices:
+                self._update_streaming_chat_state(state, chunk, choice)
 
-            finish_reason = getattr(contents[0], "finish_reason", None)
-            if tool_call_behavior and tool_call_behavior.auto_invoke_kernel_functions and contents[0].tool_calls:
-                stream_chunks.setdefault(contents[0].choice_index, []).append(contents[0])
+            first_choice = chunk.choices[0]
+            finish_reason = FinishReason(first_choice.finish_reason) if first_choice.finish_reason else None
+            if tool_call_behavior and tool_call_behavior.auto_invoke_kernel_functions and first_choice.delta.tool_calls:
                 if finish_reason == FinishReason.STOP:
                     break
             elif (tool_call_behavior and not tool_call_behavior.auto_invoke_kernel_functions) or finish_reason not in (
                 FinishReason.STOP,
                 FinishReason.TOOL_CALLS,
             ):
-                yield contents
+                chunk_metadata = self._get_metadata_from_streaming_chat_response(chunk)
+                yield [
+                    self._create_streaming_chat_message_content(chunk, choice, chunk_metadata)
+                    for choice in chunk.choices
+                ]
 
             if finish_reason == FinishReason.STOP:
                 if tool_call_behavior:
                     tool_call_behavior.auto_invoke_kernel_functions = False
                 break
 
-            if stream_chunks and finish_reason == FinishReason.TOOL_CALLS:
-                chat_contents = self._build_streaming_message_with_tool_call(stream_chunks, update_storage)
+            if finish_reason == FinishReason.TOOL_CALLS and state.has_tool_calls():
+                chat_contents = self._build_streaming_message_with_tool_call(state)
                 for chat_content in chat_contents:
                     chat_history = store_results(chat_history=chat_history, results=[chat_content])
                     await self._process_tool_calls(chat_content, kernel, chat_history)
@@ -255,48 +283,11 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
             tool_calls=self._get_tool_calls_from_chat_choice(choice),
         )
 
-    def _get_update_storage_fields(self) -> Dict[str, Dict[int, Any]]:
-        """Get the fields to use for storing updates to the messages, tool_calls and function_calls."""
-        out_messages = {}
-        tool_call_ids_by_index = {}
-        function_call_by_index = {}
-        return {
-            "out_messages": out_messages,
-            "tool_call_ids_by_index": tool_call_ids_by_index,
-            "function_call_by_index": function_call_by_index,
-        }
-
-    def _update_storages(
-        self, contents: List[OpenAIStreamingChatMessageContent], update_storage: Dict[str, Dict[int, Any]]
-    ):
-        """Handle updates to the messages, tool_calls and function_calls.
-
-        This will be used for auto-invoking tools.
-        """
-        out_messages = update_storage["out_messages"]
-        tool_call_ids_by_index = update_storage["tool_call_ids_by_index"]
-        function_call_by_index = update_storage["function_call_by_index"]
-
-        for index, content in enumerate(contents):
-            if content.content is not None:
-                if index not in out_messages:
-                    out_messages[index] = str(content)
-                else:
-                    out_messages[index] += str(content)
-            if content.tool_calls is not None:
-                for tc in content.tool_calls:
-                    if tc.index not in tool_call_ids_by_index:
-                        tool_call_ids_by_index[tc.index] = tc
-                    else:
-                        for tc in content.tool_calls:
-                            tool_call_ids_by_index[tc.index] += tc
-            if content.function_call is not None:
-                for fc in content.function_call:
-                    if fc.index not in function_call_by_index:
-                        function_call_by_index[fc.index] = fc
-                    else:
-                        for tc in content.function_call:
-                            function_call_by_index[fc.index] += fc
+    def _update_streaming_chat_state(
+        self, state: StreamingChatState, chunk: ChatCompletionChunk, choice: ChunkChoice
+    ) -> ChoiceBuffer:
+        """Add the delta of a streamed choice to the state, used for auto-invoking tools."""
+        return state.update(chunk, choice)
 
     def _get_metadata_from_chat_response(self, response: ChatCompletion) -> Dict[str, Any]:
         """Get metadata from a chat response."""
@@ -350,23 +341,33 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
         return FunctionCall(name=content.function_call.name, arguments=content.function_call.arguments)
 
     def _build_streaming_message_with_tool_call(
-        self,
-        stream_chunks: Dict[int, List[OpenAIStreamingChatMessageContent]],
-        update_storage: Dict[str, Dict[int, Any]],
+        self, state: StreamingChatState
     ) -> List[OpenAIStreamingChatMessageContent]:
-        """Build the streaming message with the tool call(s)."""
-        if not stream_chunks:
-            raise ServiceInvalidResponseError("Expected a non-empty stream_chunks.")
-        streaming_chat_message_contents = []
-        for _, chunk in stream_chunks.items():
-            chat_message: OpenAIStreamingChatMessageContent = None
-            for result in chunk:
-                chat_message = result if chat_message is None else chat_message + result
-            tool_calls_dict = update_storage["tool_call_ids_by_index"]
-            chat_message.tool_calls = list(tool_calls_dict.values())
-            chat_message.role = ChatRole.ASSISTANT
-            streaming_chat_message_contents.append(chat_message)
-        return streaming_chat_message_contents
+        """Build the streaming message(s) with the tool call(s) from the assembled stream."""
+        if not state.has_tool_calls():
+            raise ServiceInvalidResponseError("Expected a stream with tool calls.")
+        return [
+            self._create_streaming_chat_message_content_from_buffer(choice_index, buffer)
+            for choice_index, buffer in state.choices.items()
+            if buffer.tool_calls
+        ]
+
+    def _create_streaming_chat_message_content_from_buffer(
+        self, choice_index: int, buffer: ChoiceBuffer
+    ) -> OpenAIStreamingChatMessageContent:
+        """Create a streaming chat message content object from an assembled choice."""
+        metadata = self._get_metadata_from_streaming_chat_response(buffer.first_chunk)
+        return OpenAIStreamingChatMessageContent(
+            choice_index=choice_index,
+            inner_content=buffer.first_chunk,
+            ai_model_id=self.ai_model_id,
+            metadata=metadata,
+            role=ChatRole.ASSISTANT,
+            content=buffer.content,
+            finish_reason=buffer.finish_reason,
+            function_call=buffer.function_call,
+            tool_calls=buffer.get_tool_calls(),
+        )
 
     def _get_auto_invoke_execution_settings(
         self, execution_settings: OpenAIPromptExecutionSettings
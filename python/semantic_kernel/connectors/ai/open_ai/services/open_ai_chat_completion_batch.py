@@ -0,0 +1,275 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+from openai import APIStatusError, AsyncAzureOpenAI
+from openai.types.chat import ChatCompletion
+from pydantic import Field
+
+from semantic_kernel.connectors.ai.open_ai.contents.open_ai_chat_message_content import OpenAIChatMessageContent
+from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
+    OpenAIChatPromptExecutionSettings,
+)
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion_base import OpenAIChatCompletionBase
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.exceptions import ServiceResponseException
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+BatchResult = Tuple[str, Union[List[OpenAIChatMessageContent], ServiceResponseException]]
+
+
+class OpenAIBatchJob(KernelBaseModel):
+    """The state of a batch job, as the batches endpoint returns it."""
+
+    id: str
+    status: str
+    input_file_id: Optional[str] = None
+    output_file_id: Optional[str] = None
+    error_file_id: Optional[str] = None
+    request_counts: Dict[str, int] = Field(default_factory=dict)
+    errors: Optional[Any] = None
+    metadata: Optional[Dict[str, str]] = None
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the job stopped, successfully or not, the results that were made can be read."""
+        return self.status in TERMINAL_STATUSES
+
+
+class OpenAIChatCompletionBatch(KernelBaseModel):
+    """Runs chat completions of an (Azure) OpenAI chat completion service as an offline batch job.
+
+    The requests are written to a JSONL file with one line per chat history and settings, keyed by a custom id,
+    the file is uploaded and a batch job is created for it. When the job is done, the results are streamed
+    back as OpenAIChatMessageContent by custom id. Result files are downloaded in chunks to a local file,
+    when the download was interrupted it is resumed where it stopped.
+
+    Functions are not invoked automatically for tool calls, the tool calls are in the results.
+
+    Arguments:
+        service {OpenAIChatCompletionBase} -- The service whose client, model and settings are used.
+        completion_window {str} -- The time frame in which the job should be processed.
+        poll_interval {float} -- The seconds between checks of the job status in wait.
+        chunk_size {int} -- The number of bytes read at a time from result files.
+        sleep {Callable[[float], Awaitable[None]]} -- Waits between polls, can be replaced in tests.
+    """
+
+    service: OpenAIChatCompletionBase
+    completion_window: str = "24h"
+    poll_interval: float = Field(60.0, gt=0)
+    chunk_size: int = Field(1024 * 1024, gt=0)
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+
+    @property
+    def request_url(self) -> str:
+        """The url of the requests in the batch, relative to the api root."""
+        if isinstance(self.service.client, AsyncAzureOpenAI):
+            return "/chat/completions"
+        return "/v1/chat/completions"
+
+    async def create_request(
+        self, custom_id: str, chat_history: ChatHistory, settings: PromptExecutionSettings
+    ) -> Dict[str, Any]:
+        """Create the request line of a chat completion, the body is the same as for complete_chat."""
+        if not isinstance(settings, OpenAIChatPromptExecutionSettings):
+            settings = self.service.get_prompt_execution_settings_from_settings(settings)
+        settings = self.service._prepare_settings(
+            settings, await self.service._reduce_chat_history(chat_history), stream_request=False
+        )
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": self.request_url,
+            "body": settings.prepare_settings_dict(),
+        }
+
+    async def write_requests(
+        self, requests: Iterable[Tuple[str, ChatHistory, PromptExecutionSettings]], path: str
+    ) -> int:
+        """Write the requests to a JSONL file, one line at a time.
+
+        Arguments:
+            requests {Iterable[Tuple[str, ChatHistory, PromptExecutionSettings]]} -- The custom id, chat history
+                and settings of every request, the custom ids have to be unique.
+            path {str} -- The file to write.
+
+        Returns:
+            int -- The number of requests written.
+        """
+        count = 0
+        with open(path, "w", encoding="utf-8") as file:
+            for custom_id, chat_history, settings in requests:
+                request = await self.create_request(custom_id, chat_history, settings)
+                file.write(json.dumps(request, default=str))
+                file.write("\n")
+                count += 1
+        return count
+
+    async def submit(self, path: str, metadata: Optional[Dict[str, str]] = None) -> OpenAIBatchJob:
+        """Upload a request file and create a batch job for it.
+
+        Arguments:
+            path {str} -- The JSONL file with the requests, as written by write_requests.
+            metadata {Optional[Dict[str, str]]} -- Metadata to store with the job.
+
+        Returns:
+            OpenAIBatchJob -- The created job.
+        """
+        try:
+            with open(path, "rb") as file:
+                uploaded = await self.service.client.files.create(file=file, purpose="batch")
+        except Exception as ex:
+            raise ServiceResponseException(f"Failed to upload the batch request file {path}", ex) from ex
+        body = {
+            "input_file_id": uploaded.id,
+            "endpoint": self.request_url,
+            "completion_window": self.completion_window,
+        }
+        if metadata:
+            body["metadata"] = metadata
+        job = await self._request("post", "/batches", body)
+        logger.info(f"Created batch job {job.id} for {path}")
+        return job
+
+    async def get_job(self, job_id: str) -> OpenAIBatchJob:
+        """Get the current state of a batch job."""
+        return await self._request("get", f"/batches/{job_id}")
+
+    async def cancel(self, job_id: str) -> OpenAIBatchJob:
+        """Cancel a batch job, the results that were made before it stopped can still be read."""
+        return await self._request("post", f"/batches/{job_id}/cancel", {})
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> OpenAIBatchJob:
+        """Poll a batch job until it is done.
+
+        Arguments:
+            job_id {str} -- The id of the job.
+            timeout {Optional[float]} -- The maximum number of seconds to wait, None to wait until it is done.
+
+        Returns:
+            OpenAIBatchJob -- The job, done or, after the timeout, as it was last seen.
+        """
+        waited = 0.0
+        while True:
+            job = await self.get_job(job_id)
+            if job.is_done or (timeout is not None and waited >= timeout):
+                return job
+            logger.debug(f"Batch job {job_id} is {job.status}: {job.request_counts}")
+            await self.sleep(self.poll_interval)
+            waited += self.poll_interval
+
+    async def get_results(self, job: OpenAIBatchJob, path: Optional[str] = None) -> AsyncIterator[BatchResult]:
+        """Stream the results of a finished batch job, first the successful ones, then the failed ones.
+
+        Arguments:
+            job {OpenAIBatchJob} -- The finished job.
+            path {Optional[str]} -- The local file to download the results to, the failed requests go to
+                the same path with .errors appended. A partly downloaded file is resumed, its results are
+                yielded again. None to not keep the results.
+
+        Yields:
+            Tuple[str, Union[List[OpenAIChatMessageContent], ServiceResponseException]] -- The custom id of the
+                request and its choices, or the exception with the error of the request.
+        """
+        if not job.is_done:
+            raise ServiceResponseException(f"Batch job {job.id} is not done, its status is {job.status}")
+        if job.output_file_id is None and job.error_file_id is None:
+            raise ServiceResponseException(f"Batch job {job.id} has no results, its status is {job.status}")
+        for file_id, suffix in ((job.output_file_id, ""), (job.error_file_id, ".errors")):
+            if file_id is None:
+                continue
+            async for line in self._read_result_lines(file_id, path + suffix if path else None):
+                yield self._parse_result(line)
+
+    async def _request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> OpenAIBatchJob:
+        """Send a request to the batches endpoint, the installed openai package has no batches resource."""
+        try:
+            if method == "post":
+                response = await self.service.client.post(path, body=body, cast_to=httpx.Response)
+            else:
+                response = await self.service.client.get(path, cast_to=httpx.Response)
+            return OpenAIBatchJob.model_validate(response.json())
+        except Exception as ex:
+            raise ServiceResponseException(f"Batch request {method.upper()} {path} failed", ex) from ex
+
+    async def _read_result_lines(self, file_id: str, path: Optional[str]) -> AsyncIterator[bytes]:
+        """Read the lines of a result file, from the local copy first and then from the service."""
+        offset = 0
+        if path and os.path.exists(path):
+            with open(path, "rb+") as file:
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        # drop the partly downloaded line, it is downloaded again
+                        file.truncate(offset)
+                        break
+                    offset += len(line)
+                    yield line
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        try:
+            async with self.service.client.files.with_streaming_response.content(
+                file_id, extra_headers=headers
+            ) as response:
+                if offset and response.status_code != 206:
+                    raise ServiceResponseException(
+                        f"Cannot resume the download of batch result file {file_id}, the range was not accepted"
+                    )
+                logger.info(f"Downloading batch result file {file_id} from byte {offset}")
+                with open(path, "ab") if path else _NoFile() as file:
+                    remainder = b""
+                    async for chunk in response.iter_bytes(self.chunk_size):
+                        file.write(chunk)
+                        lines = (remainder + chunk).split(b"\n")
+                        remainder = lines.pop()
+                        for line in lines:
+                            if line.strip():
+                                yield line
+                    if remainder.strip():
+                        yield remainder
+        except ServiceResponseException:
+            raise
+        except APIStatusError as ex:
+            if offset and ex.status_code == 416:
+                # the local copy is complete
+                return
+            raise ServiceResponseException(f"Failed to download batch result file {file_id}", ex) from ex
+        except Exception as ex:
+            raise ServiceResponseException(f"Failed to download batch result file {file_id}", ex) from ex
+
+    def _parse_result(self, line: bytes) -> BatchResult:
+        result = json.loads(line)
+        custom_id = result.get("custom_id")
+        response = result.get("response") or {}
+        body = response.get("body") or {}
+        error = result.get("error") or body.get("error")
+        if error or response.get("status_code") != 200:
+            return custom_id, ServiceResponseException(
+                f"Batch request {custom_id} failed with status {response.get('status_code')}: {error}"
+            )
+        completion = ChatCompletion.model_validate(body)
+        metadata = self.service._get_metadata_from_chat_response(completion)
+        return custom_id, [
+            self.service._create_chat_message_content(completion, choice, metadata) for choice in completion.choices
+        ]
+
+
+class _NoFile:
+    """Stands in for the local file when the results are not kept."""
+
+    def __enter__(self) -> "_NoFile":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def write(self, data: bytes) -> None:
+        pass
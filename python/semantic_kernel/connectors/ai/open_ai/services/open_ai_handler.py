@@ -1,11 +1,14 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import json
 import logging
 from abc import ABC
-from typing import List, Union
+from email.utils import parsedate_to_datetime
+from time import monotonic, time
+from typing import Any, List, Optional, Union
 
 from numpy import array, ndarray
-from openai import AsyncOpenAI, AsyncStream, BadRequestError
+from openai import AsyncOpenAI, AsyncStream, BadRequestError, RateLimitError
 from openai.types import Completion
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
@@ -19,8 +22,10 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_pro
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_model_types import (
     OpenAIModelTypes,
 )
-from semantic_kernel.exceptions import ServiceResponseException
+from semantic_kernel.exceptions import ServiceRateLimitException, ServiceResponseException
 from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.reliability.rate_limiter import RateLimitLease
+from semantic_kernel.services.request_latency import report_request_latency
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -37,7 +42,9 @@ class OpenAIHandler(KernelBaseModel, ABC):
     async def _send_request(
         self,
         request_settings: OpenAIPromptExecutionSettings,
-    ) -> Union[ChatCompletion, Completion, AsyncStream[ChatCompletionChunk], AsyncStream[Completion]]:
+    ) -> Union[
+        ChatCompletion, Completion, AsyncStream[ChatCompletionChunk], AsyncStream[Completion], "RateLimitedStream"
+    ]:
         """
         Completes the given prompt. Returns a single string completion.
         Cannot return multiple completions. Cannot return logprobs.
@@ -49,48 +56,212 @@ class OpenAIHandler(KernelBaseModel, ABC):
             stream {bool} -- Whether to stream the response.
 
         Returns:
-            ChatCompletion, Completion, AsyncStream[Completion | ChatCompletionChunk] -- The completion response.
+            ChatCompletion, Completion, AsyncStream[Completion | ChatCompletionChunk] -- The completion response,
+                with a rate limiter a stream is wrapped in a RateLimitedStream that holds the lease until it is
+                read to the end or closed.
         """
+        # the estimate serializes the whole prompt, it is only needed for the rate limiter
+        estimated_tokens = self._estimate_request_tokens(request_settings) if self._has_rate_limiter() else 0
+        lease = await self.rate_limiter.acquire(estimated_tokens) if self._has_rate_limiter() else None
         try:
-            if self.ai_model_type == OpenAIModelTypes.CHAT:
-                response = await self.client.chat.completions.create(**request_settings.prepare_settings_dict())
-            else:
-                response = await self.client.completions.create(**request_settings.prepare_settings_dict())
-            self.store_usage(response)
-            return response
-        except BadRequestError as ex:
-            if ex.code == "content_filter":
-                raise ContentFilterAIException(
-                    f"{type(self)} service encountered a content error",
+            start = monotonic()
+            try:
+                if self.ai_model_type == OpenAIModelTypes.CHAT:
+                    response = await self.client.chat.completions.create(**request_settings.prepare_settings_dict())
+                else:
+                    response = await self.client.completions.create(**request_settings.prepare_settings_dict())
+            except BadRequestError as ex:
+                if ex.code == "content_filter":
+                    raise ContentFilterAIException(
+                        f"{type(self)} service encountered a content error",
+                        ex,
+                    )
+                raise ServiceResponseException(
+                    f"{type(self)} service failed to complete the prompt",
+                    ex,
+                ) from ex
+            except Exception as ex:
+                raise self._response_exception(
+                    f"{type(self)} service failed to complete the prompt",
                     ex,
+                    lease or RateLimitLease(),
+                ) from ex
+            report_request_latency(monotonic() - start)
+            if lease is not None and isinstance(response, AsyncStream):
+                # the request runs until the stream is read, the stream gives back the lease when it is done
+                stream = RateLimitedStream(
+                    self, response, lease, request_settings.max_tokens * request_settings.number_of_responses
                 )
-            raise ServiceResponseException(
-                f"{type(self)} service failed to complete the prompt",
-                ex,
-            ) from ex
-        except Exception as ex:
-            raise ServiceResponseException(
-                f"{type(self)} service failed to complete the prompt",
-                ex,
-            ) from ex
+                lease = None
+                return stream
+            self.store_usage(response, lease)
+            return response
+        finally:
+            if lease is not None:
+                self.rate_limiter.release(lease)
 
     async def _send_embedding_request(self, settings: OpenAIEmbeddingPromptExecutionSettings) -> List[ndarray]:
-        try:
-            response = await self.client.embeddings.create(**settings.prepare_settings_dict())
-            self.store_usage(response)
+        estimated_tokens = _estimate_tokens(settings.input)
+        async with self._rate_limit(estimated_tokens) as lease:
+            try:
+                response = await self.client.embeddings.create(**settings.prepare_settings_dict())
+            except Exception as ex:
+                raise self._response_exception(
+                    f"{type(self)} service failed to generate embeddings",
+                    ex,
+                    lease,
+                ) from ex
+            self.store_usage(response, lease)
             # make numpy arrays from the response
             # TODO: the openai response is cast to a list[float], could be used instead of ndarray
             return [array(x.embedding) for x in response.data]
-        except Exception as ex:
-            raise ServiceResponseException(
-                f"{type(self)} service failed to generate embeddings",
-                ex,
-            ) from ex
 
-    def store_usage(self, response):
+    def _has_rate_limiter(self) -> bool:
+        return getattr(self, "rate_limiter", None) is not None
+
+    def _rate_limit(self, estimated_tokens: int):
+        """Get a lease from the rate limiter of the service, or a dummy lease when there is no rate limiter."""
+        if not self._has_rate_limiter():
+            return _NoRateLimit()
+        return self.rate_limiter.limit(estimated_tokens)
+
+    def _response_exception(self, message: str, ex: Exception, lease: RateLimitLease) -> ServiceResponseException:
+        """Create the exception for a failed request, rate limit errors are recorded on the lease."""
+        if isinstance(ex, RateLimitError):
+            lease.rate_limited = True
+            lease.retry_after = _get_retry_after(ex.response.headers)
+            return ServiceRateLimitException(message, ex, retry_after=lease.retry_after)
+        return ServiceResponseException(message, ex)
+
+    def _estimate_request_tokens(self, request_settings: OpenAIPromptExecutionSettings) -> int:
+        """Estimate the tokens a request counts against the tokens-per-minute quota.
+
+        The service counts the prompt tokens and the requested max_tokens for every response.
+        """
+        prompt_tokens = _estimate_tokens(getattr(request_settings, "prompt", None)) + _estimate_tokens(
+            getattr(request_settings, "messages", None)
+        )
+        return prompt_tokens + request_settings.max_tokens * request_settings.number_of_responses
+
+    def store_usage(self, response, lease: Optional[RateLimitLease] = None):
         if not isinstance(response, AsyncStream):
             logger.info(f"OpenAI usage: {response.usage}")
+            if lease:
+                lease.used_tokens = response.usage.total_tokens
             self.prompt_tokens += response.usage.prompt_tokens
             self.total_tokens += response.usage.total_tokens
             if hasattr(response.usage, "completion_tokens"):
                 self.completion_tokens += response.usage.completion_tokens
+
+
+class RateLimitedStream:
+    """A stream response that holds the rate limit lease of its request until it is exhausted or closed.
+
+    The used tokens of the lease are taken from the usage the service sends with the chunks, or, when it sends
+    none, estimated from the prompt and the streamed text. Close the stream when it is not read to the end.
+    """
+
+    def __init__(
+        self, handler: OpenAIHandler, stream: AsyncStream, lease: RateLimitLease, max_completion_tokens: int
+    ) -> None:
+        self.handler = handler
+        self.stream = stream
+        self.lease = lease
+        # the estimate of the lease includes the max_tokens of every response, the prompt is the rest
+        self._prompt_tokens = max(lease.estimated_tokens - max_completion_tokens, 0)
+        self._streamed_text: List[str] = []
+        self._usage_chunk: Optional[Union[ChatCompletionChunk, Completion]] = None
+        self._released = False
+
+    def __aiter__(self) -> "RateLimitedStream":
+        return self
+
+    async def __anext__(self) -> Union[ChatCompletionChunk, Completion]:
+        try:
+            chunk = await self.stream.__anext__()
+        except BaseException:
+            self._release()
+            raise
+        if getattr(chunk, "usage", None) is not None:
+            self._usage_chunk = chunk
+        self._streamed_text.extend(_get_chunk_texts(chunk))
+        return chunk
+
+    async def close(self) -> None:
+        """Close the response and give back the lease."""
+        try:
+            await self.stream.close()
+        finally:
+            self._release()
+
+    async def aclose(self) -> None:
+        await self.close()
+
+    def _release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        if self._usage_chunk is not None:
+            self.handler.store_usage(self._usage_chunk, self.lease)
+        else:
+            self.lease.used_tokens = self._prompt_tokens + _estimate_tokens("".join(self._streamed_text))
+        self.handler.rate_limiter.release(self.lease)
+
+
+def _get_chunk_texts(chunk: Any) -> List[str]:
+    """Get the generated texts of a chunk, the text of a completion or the content and calls of a chat delta."""
+    texts = []
+    for choice in getattr(chunk, "choices", None) or []:
+        delta = getattr(choice, "delta", None)
+        if delta is None:
+            texts.append(getattr(choice, "text", None) or "")
+            continue
+        texts.append(delta.content or "")
+        if delta.function_call is not None:
+            texts.extend([delta.function_call.name or "", delta.function_call.arguments or ""])
+        for tool_call in delta.tool_calls or []:
+            if tool_call.function is not None:
+                texts.extend([tool_call.function.name or "", tool_call.function.arguments or ""])
+    return texts
+
+
+class _NoRateLimit:
+    """Async context manager that hands out a lease without limiting anything."""
+
+    async def __aenter__(self) -> RateLimitLease:
+        return RateLimitLease()
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+
+def _estimate_tokens(content: Any) -> int:
+    """Estimate the number of tokens in a prompt, a list of messages or a list of inputs, roughly 4 chars a token."""
+    if not content:
+        return 0
+    if not isinstance(content, str):
+        content = json.dumps(content, default=str)
+    return len(content) // 4 + 1
+
+
+def _get_retry_after(headers: Any) -> Optional[float]:
+    """Get the number of seconds to wait from the retry-after-ms or retry-after headers of a response."""
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time(), 0.0)
+    except (TypeError, ValueError):
+        return None
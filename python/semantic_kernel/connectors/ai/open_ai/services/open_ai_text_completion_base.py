@@ -14,6 +14,7 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_pro
 )
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_handler import (
     OpenAIHandler,
+    RateLimitedStream,
 )
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.contents import StreamingTextContent, TextContent
@@ -99,14 +100,18 @@ class OpenAITextCompletionBase(OpenAIHandler, TextCompletionClientBase):
         settings.ai_model_id = self.ai_model_id
         settings.stream = True
         response = await self._send_request(request_settings=settings)
-        if not isinstance(response, AsyncStream):
+        if not isinstance(response, (AsyncStream, RateLimitedStream)):
             raise ServiceInvalidResponseError("Expected an AsyncStream[Completion] response.")
 
-        async for chunk in response:
-            if len(chunk.choices) == 0:
-                continue
-            chunk_metadata = self._get_metadata_from_text_response(chunk)
-            yield [self._create_streaming_text_content(chunk, choice, chunk_metadata) for choice in chunk.choices]
+        try:
+            async for chunk in response:
+                if len(chunk.choices) == 0:
+                    continue
+                chunk_metadata = self._get_metadata_from_text_response(chunk)
+                yield [self._create_streaming_text_content(chunk, choice, chunk_metadata) for choice in chunk.choices]
+        finally:
+            # the consumer can stop early, closing the stream releases the connection and the rate limit
+            await response.close()
 
     def _create_streaming_text_content(
         self, chunk: Completion, choice: Union[CompletionChoice, ChatCompletionChunk], response_metadata: Dict[str, Any]
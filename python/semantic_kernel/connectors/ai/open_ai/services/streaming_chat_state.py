@@ -0,0 +1,125 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import Dict, List, Optional
+
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
+
+from semantic_kernel.connectors.ai.open_ai.contents.function_call import FunctionCall
+from semantic_kernel.connectors.ai.open_ai.contents.tool_calls import ToolCall
+from semantic_kernel.contents.chat_role import ChatRole
+from semantic_kernel.contents.finish_reason import FinishReason
+
+
+class ToolCallBuffer:
+    """The fragments of a single streamed tool call."""
+
+    __slots__ = ("index", "id", "type", "name", "argument_parts")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.id: Optional[str] = None
+        self.type: Optional[str] = None
+        self.name: Optional[str] = None
+        self.argument_parts: List[str] = []
+
+    def to_tool_call(self) -> ToolCall:
+        return ToolCall(
+            index=self.index,
+            id=self.id,
+            type=self.type or "function",
+            function=FunctionCall(name=self.name, arguments="".join(self.argument_parts), id=self.id),
+        )
+
+
+class ChoiceBuffer:
+    """The fragments of a single streamed choice."""
+
+    __slots__ = (
+        "first_chunk",
+        "role",
+        "content_parts",
+        "finish_reason",
+        "function_name",
+        "function_argument_parts",
+        "tool_calls",
+        "tool_message_parts",
+    )
+
+    def __init__(self, first_chunk: ChatCompletionChunk) -> None:
+        self.first_chunk = first_chunk
+        self.role: Optional[ChatRole] = None
+        self.content_parts: List[str] = []
+        self.finish_reason: Optional[FinishReason] = None
+        self.function_name: Optional[str] = None
+        self.function_argument_parts: Optional[List[str]] = None
+        self.tool_calls: Dict[int, ToolCallBuffer] = {}
+        self.tool_message_parts: List[str] = []
+
+    @property
+    def content(self) -> Optional[str]:
+        return "".join(self.content_parts) if self.content_parts else None
+
+    @property
+    def function_call(self) -> Optional[FunctionCall]:
+        if self.function_argument_parts is None:
+            return None
+        return FunctionCall(name=self.function_name, arguments="".join(self.function_argument_parts))
+
+    def get_tool_calls(self) -> List[ToolCall]:
+        return [self.tool_calls[index].to_tool_call() for index in sorted(self.tool_calls)]
+
+
+class StreamingChatState:
+    """Assembles the deltas of a streamed chat completion per choice.
+
+    Content, function call and tool call argument fragments are appended to buffers
+    and only joined when the assembled message is needed, tool calls are kept by their index.
+    """
+
+    def __init__(self) -> None:
+        self.choices: Dict[int, ChoiceBuffer] = {}
+
+    def update(self, chunk: ChatCompletionChunk, choice: ChunkChoice) -> ChoiceBuffer:
+        """Add the delta of a choice of a chunk to the buffers of that choice."""
+        buffer = self.choices.get(choice.index)
+        if buffer is None:
+            buffer = self.choices[choice.index] = ChoiceBuffer(chunk)
+        delta = choice.delta
+        if delta.role and buffer.role is None:
+            buffer.role = ChatRole(delta.role)
+        if delta.content:
+            buffer.content_parts.append(delta.content)
+        if choice.finish_reason:
+            buffer.finish_reason = FinishReason(choice.finish_reason)
+        if delta.function_call is not None:
+            if buffer.function_argument_parts is None:
+                buffer.function_argument_parts = []
+            if delta.function_call.name:
+                buffer.function_name = delta.function_call.name
+            if delta.function_call.arguments:
+                buffer.function_argument_parts.append(delta.function_call.arguments)
+        if delta.tool_calls:
+            for position, tool_call in enumerate(delta.tool_calls):
+                index = tool_call.index if tool_call.index is not None else position
+                tool_buffer = buffer.tool_calls.get(index)
+                if tool_buffer is None:
+                    tool_buffer = buffer.tool_calls[index] = ToolCallBuffer(index)
+                if tool_call.id:
+                    tool_buffer.id = tool_call.id
+                if tool_call.type:
+                    tool_buffer.type = tool_call.type
+                if tool_call.function is not None:
+                    if tool_call.function.name:
+                        tool_buffer.name = tool_call.function.name
+                    if tool_call.function.arguments:
+                        tool_buffer.argument_parts.append(tool_call.function.arguments)
+        return buffer
+
+    def add_tool_message(self, choice_index: int, tool_message: Optional[str]) -> None:
+        """Add a fragment of the tool message of a choice, as sent by the Azure extensions API."""
+        if tool_message and choice_index in self.choices:
+            self.choices[choice_index].tool_message_parts.append(tool_message)
+
+    def has_tool_calls(self) -> bool:
+        return any(buffer.tool_calls for buffer in self.choices.values())
@@ -1,7 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from semantic_kernel import Kernel
 from semantic_kernel.functions.kernel_function import KernelFunction
@@ -23,7 +23,12 @@ def _describe_tool_call(function: KernelFunction) -> Dict[str, str]:
     """Create the object used for the tool call.
 
     Assumes that arguments for semantic functions are optional, for native functions required.
+    The object is cached on the metadata of the function until the metadata changes, it should not be changed.
     """
+    return function.metadata.get_derived_value("tool_call", lambda: _create_tool_call_object(function))
+
+
+def _create_tool_call_object(function: KernelFunction) -> Dict[str, str]:
     func_metadata = function.metadata
     return {
         "type": "function",
@@ -58,7 +63,12 @@ def parse_param(param_type: Optional[str]) -> str:
 def _describe_function(function: KernelFunction) -> Dict[str, str]:
     """Create the object used for function_calling.
     Assumes that arguments for semantic functions are optional, for native functions required.
+    The object is cached on the metadata of the function until the metadata changes, it should not be changed.
     """
+    return function.metadata.get_derived_value("function_call", lambda: _create_function_call_object(function))
+
+
+def _create_function_call_object(function: KernelFunction) -> Dict[str, str]:
     func_metadata = function.metadata
     return {
         "name": f"{func_metadata.plugin_name}-{func_metadata.name}",
@@ -142,24 +152,31 @@ def get_function_calling_object(
         raise ValueError("Cannot use both include_plugin and exclude_plugin at the same time.")
     if include_function and exclude_function:
         raise ValueError("Cannot use both include_function and exclude_function at the same time.")
-    if include_plugin:
-        include_plugin = [plugin for plugin in include_plugin]
-    if exclude_plugin:
-        exclude_plugin = [plugin for plugin in exclude_plugin]
-    if include_function:
-        include_function = [function for function in include_function]
-    if exclude_function:
-        exclude_function = [function for function in exclude_function]
+    # the functions are selected once for every filter until plugins are added or removed, their objects are
+    # cached on their metadata until it changes, the objects are shared and should not be changed
+    functions = kernel.plugins.get_derived_value(
+        ("filtered_functions", _get_filter_key(filter)), lambda: _filter_functions(kernel, filter)
+    )
+    describe = _describe_tool_call if is_tool_call else _describe_function
+    return [describe(function) for function in functions]
+
+
+def _get_filter_key(filter: Dict[str, List[str]]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    return tuple(sorted((name, tuple(values)) for name, values in filter.items() if values))
+
+
+def _filter_functions(kernel: Kernel, filter: Dict[str, List[str]]) -> List[KernelFunction]:
+    include_plugin = set(filter.get("include_plugin") or [])
+    exclude_plugin = set(filter.get("exclude_plugin") or [])
+    include_function = set(filter.get("include_function") or [])
+    exclude_function = set(filter.get("exclude_function") or [])
     result = []
-    for (
-        plugin_name,
-        plugin,
-    ) in kernel.plugins.plugins.items():
+    for plugin_name, plugin in kernel.plugins.plugins.items():
         if plugin_name in exclude_plugin or (include_plugin and plugin_name not in include_plugin):
             continue
         for function_name, function in plugin.functions.items():
             current_name = f"{plugin_name}-{function_name}"
             if current_name in exclude_function or (include_function and current_name not in include_function):
                 continue
-            result.append(_describe_tool_call(function) if is_tool_call else _describe_function(function))
+            result.append(function)
     return result
@@ -1,9 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
-from typing import Any, Dict, Final, Iterator, List, Optional, Tuple, Type, Union
+from typing import Any, Dict, Final, Iterator, List, Optional, Type, Union
 
 import defusedxml.ElementTree as ET
+from pydantic import PrivateAttr
 
 from semantic_kernel.contents.chat_message_content import ChatMessageContent
 from semantic_kernel.contents.chat_role import ChatRole
@@ -30,6 +31,9 @@ class ChatHistory(KernelBaseModel):
 
     messages: List[ChatMessageContent]
 
+    # the windows of the ChatHistoryReducers that reduced this history, by reducer
+    _reducer_windows: Dict[int, Any] = PrivateAttr(default_factory=dict)
+
     def __init__(self, **data: Any):
         """
         Initializes a new instance of the ChatHistory class, optionally incorporating a message and/or
@@ -184,51 +188,9 @@ class ChatHistory(KernelBaseModel):
         Returns:
             ChatHistory: The ChatHistory instance created from the rendered prompt.
         """
-        messages: List[chat_message_content_type] = []
-        result, remainder = cls._render_remaining(rendered_prompt, chat_message_content_type, True)
-        if result:
-            messages.append(result)
-        while remainder:
-            result, remainder = cls._render_remaining(remainder, chat_message_content_type)
-            if result:
-                messages.append(result)
-        return cls(messages=messages)
-
-    @staticmethod
-    def _render_remaining(
-        prompt: Optional[str],
-        chat_message_content_type: Type[ChatMessageContent] = ChatMessageContent,
-        first: bool = False,
-    ) -> Tuple[Optional[ChatMessageContent], Optional[str]]:
-        """Render the remaining messages in the history."""
-        if not prompt:
-            return None, None
-        prompt = prompt.strip()
-        start = prompt.find(f"<{ROOT_KEY_MESSAGE}")
-        end_tag = f"</{ROOT_KEY_MESSAGE}>"
-        single_item_end_tag = "/>"
-        end = prompt.find(end_tag)
-        end_of_tag = end + len(end_tag)
-        if end == -1:
-            end = prompt.find(single_item_end_tag)
-            end_of_tag = end + len(single_item_end_tag)
-        if start == -1 or end == -1:
-            return chat_message_content_type(role=ChatRole.SYSTEM if first else ChatRole.USER, content=prompt), None
-        if start > 0 and end > 0:
-            return (
-                chat_message_content_type(role=ChatRole.SYSTEM if first else ChatRole.USER, content=prompt[:start]),
-                prompt[start:],
-            )
-        try:
-            return chat_message_content_type.from_element(ET.fromstring(prompt[start:end_of_tag])), prompt[end_of_tag:]
-        except ET.ParseError:
-            logger.warning(f"Unable to parse prompt: {prompt[start:end_of_tag]}, returning as content")
-            return (
-                chat_message_content_type(
-                    role=ChatRole.SYSTEM if first else ChatRole.USER, content=prompt[start:end_of_tag]
-                ),
-                prompt[end_of_tag:],
-            )
+        if not rendered_prompt:
+            return cls(messages=[])
+        return cls(messages=list(_RenderedPromptParser(rendered_prompt, chat_message_content_type)))
 
     def serialize(self) -> str:
         """
@@ -291,3 +253,70 @@ class ChatHistory(KernelBaseModel):
         with open(file_path, "r") as file:
             json_str = file.read()
         return ChatHistory.restore_chat_history(json_str)
+
+
+class _RenderedPromptParser:
+    """Single pass parser of the messages in a rendered prompt.
+
+    Text outside of message tags becomes a message of its own, a system message when it starts the prompt
+    and a user message otherwise. A cursor moves over the prompt instead of slicing off the remainder
+    after every message, and the positions of the next tags are only searched for again once the cursor
+    has passed them, so the prompt is scanned once.
+    """
+
+    START_TAG: Final[str] = f"<{ROOT_KEY_MESSAGE}"
+    END_TAG: Final[str] = f"</{ROOT_KEY_MESSAGE}>"
+    SINGLE_ITEM_END_TAG: Final[str] = "/>"
+
+    def __init__(self, prompt: str, chat_message_content_type: Type[ChatMessageContent]) -> None:
+        self.prompt = prompt
+        self.chat_message_content_type = chat_message_content_type
+        # the end of the prompt without trailing whitespace
+        self.stop = len(prompt.rstrip())
+        self.pos = 0
+        self._found: Dict[str, int] = {}
+
+    def __iter__(self) -> Iterator[ChatMessageContent]:
+        first = True
+        while True:
+            self._skip_whitespace()
+            start = self._find(self.START_TAG)
+            end = self._find(self.END_TAG)
+            end_of_tag = end + len(self.END_TAG)
+            if end == -1:
+                end = self._find(self.SINGLE_ITEM_END_TAG)
+                end_of_tag = end + len(self.SINGLE_ITEM_END_TAG)
+            if start == -1 or end == -1:
+                yield self._text_message(self.prompt[self.pos : self.stop], first)
+                return
+            if start > self.pos and end > self.pos:
+                yield self._text_message(self.prompt[self.pos : start], first)
+                self.pos = start
+            else:
+                message = self.prompt[start:end_of_tag]
+                try:
+                    yield self.chat_message_content_type.from_element(ET.fromstring(message))
+                except ET.ParseError:
+                    logger.warning(f"Unable to parse prompt: {message}, returning as content")
+                    yield self._text_message(message, first)
+                self.pos = end_of_tag
+            first = False
+            if self.pos >= self.stop:
+                return
+
+    def _skip_whitespace(self) -> None:
+        prompt, pos, stop = self.prompt, self.pos, self.stop
+        while pos < stop and prompt[pos].isspace():
+            pos += 1
+        self.pos = pos
+
+    def _find(self, tag: str) -> int:
+        """Find the next tag at or after the cursor, reusing the last search while it is still ahead."""
+        found = self._found.get(tag)
+        if found is None or (found != -1 and found < self.pos):
+            found = self.prompt.find(tag, self.pos, self.stop)
+            self._found[tag] = found
+        return found
+
+    def _text_message(self, content: str, first: bool) -> ChatMessageContent:
+        return self.chat_message_content_type(role=ChatRole.SYSTEM if first else ChatRole.USER, content=content)
@@ -0,0 +1,175 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import logging
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from pydantic import Field
+
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.chat_role import ChatRole
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def _token_counter(text: str) -> int:
+    """A rough estimate of the number of tokens in a text."""
+    return len(text) // 4
+
+
+class ChatHistoryWindow:
+    """The window of a reducer over a chat history, updated as messages are added."""
+
+    __slots__ = (
+        "reducer",
+        "settings",
+        "seen",
+        "last_seen",
+        "start",
+        "tokens",
+        "summarized_until",
+        "summary",
+        "summary_tokens",
+    )
+
+    def __init__(self, reducer: "ChatHistoryReducer", start: int) -> None:
+        # holding on to the reducer keeps its id, the key of the window, from being reused
+        self.reducer = reducer
+        self.settings = reducer._get_window_settings()
+        self.seen = start
+        self.last_seen: Optional[ChatMessageContent] = None
+        self.start = start
+        self.tokens = 0
+        self.summarized_until = start
+        self.summary: Optional[str] = None
+        self.summary_tokens = 0
+
+
+class ChatHistoryReducer(KernelBaseModel):
+    """Reduces a chat history to the system messages at its start and the newest messages within a token budget.
+
+    The older messages are dropped, or, when a summarizer is set, summarized into a system message
+    that follows the system messages. The summarizer gets the previous summary and the messages that
+    were dropped since, and returns the new summary, which counts against the budget as well, the
+    messages that make room for a longer summary are summarized too. Tool messages are kept together with the assistant
+    message that called the tools, the window never starts with a tool message.
+
+    Token counts are cached on the messages and the window is kept per chat history, so reducing a
+    history again only costs the messages that were added since. The window is started over when
+    messages before the newest seen one were removed or replaced.
+
+    Arguments:
+        max_tokens {int} -- The token budget of the reduced chat history, including the system messages at
+            the start and the summary, the newest message is kept even when it does not fit.
+        token_counter {Callable[[str], int]} -- Counts the tokens in a text, a rough estimate by default.
+        tokens_per_message {int} -- The tokens added for every message, for the role and separators.
+        summarizer {Optional[Callable]} -- Summarizes the dropped messages, None to only drop them.
+    """
+
+    max_tokens: int = Field(gt=0)
+    token_counter: Callable[[str], int] = _token_counter
+    tokens_per_message: int = Field(4, ge=0)
+    summarizer: Optional[Callable[[Optional[str], List[ChatMessageContent]], Awaitable[str]]] = None
+
+    def count_tokens(self, message: ChatMessageContent) -> int:
+        """Count the tokens of a message, including the overhead per message."""
+        return message.get_token_count(self.token_counter) + self.tokens_per_message
+
+    def get_window(self, chat_history: ChatHistory) -> List[ChatMessageContent]:
+        """Get the messages to send, without summarizing the dropped messages.
+
+        Arguments:
+            chat_history {ChatHistory} -- The chat history to reduce.
+
+        Returns:
+            List[ChatMessageContent] -- The system messages at the start, followed by the newest messages.
+        """
+        messages = chat_history.messages
+        head = self._count_leading_system_messages(messages)
+        window = self._update_window(chat_history, head)
+        return messages[:head] + messages[window.start :]
+
+    async def reduce(self, chat_history: ChatHistory) -> ChatHistory:
+        """Get a reduced copy of a chat history, the chat history itself is not changed.
+
+        Arguments:
+            chat_history {ChatHistory} -- The chat history to reduce.
+
+        Returns:
+            ChatHistory -- The system messages at the start, the summary of the dropped messages
+                when there is a summarizer, and the newest messages within the token budget.
+        """
+        messages = chat_history.messages
+        head = self._count_leading_system_messages(messages)
+        window = self._update_window(chat_history, head)
+        summary_messages = []
+        if self.summarizer is not None:
+            # the start only moves forward and stops at the newest message, so this ends
+            while window.start > window.summarized_until:
+                dropped = messages[window.summarized_until : window.start]
+                logger.info(f"Summarizing {len(dropped)} dropped chat messages")
+                window.summary = await self.summarizer(window.summary, dropped)
+                window.summarized_until = window.start
+                window.summary_tokens = (
+                    self.token_counter(window.summary) + self.tokens_per_message if window.summary else 0
+                )
+                self._fit_window(window, messages, head)
+            if window.summary:
+                summary_messages.append(ChatMessageContent(role=ChatRole.SYSTEM, content=window.summary))
+        return ChatHistory(messages=messages[:head] + summary_messages + messages[window.start :])
+
+    def _update_window(self, chat_history: ChatHistory, head: int) -> ChatHistoryWindow:
+        messages = chat_history.messages
+        window = chat_history._reducer_windows.get(id(self))
+        if (
+            window is None
+            or window.start < head
+            or window.settings != self._get_window_settings()
+            or len(messages) < window.seen
+            or (window.seen > head and messages[window.seen - 1] is not window.last_seen)
+        ):
+            window = chat_history._reducer_windows[id(self)] = ChatHistoryWindow(self, head)
+
+        for message in messages[window.seen :]:
+            window.tokens += self.count_tokens(message)
+        window.seen = len(messages)
+        window.last_seen = messages[-1] if messages else None
+        self._fit_window(window, messages, head)
+        return window
+
+    def _fit_window(self, window: ChatHistoryWindow, messages: List[ChatMessageContent], head: int) -> None:
+        """Move the start of the window until the system messages, the summary and the window fit max_tokens."""
+        budget = (
+            self.max_tokens - sum(self.count_tokens(message) for message in messages[:head]) - window.summary_tokens
+        )
+        # keep at least the newest message
+        while window.tokens > budget and window.start < len(messages) - 1:
+            window.tokens -= self.count_tokens(messages[window.start])
+            window.start += 1
+        self._skip_tool_results(window, messages)
+
+    def _get_window_settings(self) -> Tuple[int, Callable[[str], int], int]:
+        return (self.max_tokens, self.token_counter, self.tokens_per_message)
+
+    def _skip_tool_results(self, window: ChatHistoryWindow, messages: List[ChatMessageContent]) -> None:
+        """Move the start of the window past tool messages whose tool call was dropped."""
+        start = window.start
+        while start < len(messages) and messages[start].role == ChatRole.TOOL:
+            start += 1
+        if start < len(messages):
+            for message in messages[window.start : start]:
+                window.tokens -= self.count_tokens(message)
+            window.start = start
+            return
+        # only tool messages are left, keep them with the message that called the tools instead
+        while window.start > window.summarized_until and messages[window.start].role == ChatRole.TOOL:
+            window.start -= 1
+            window.tokens += self.count_tokens(messages[window.start])
+
+    @staticmethod
+    def _count_leading_system_messages(messages: List[ChatMessageContent]) -> int:
+        head = 0
+        while head < len(messages) and messages[head].role == ChatRole.SYSTEM:
+            head += 1
+        return head
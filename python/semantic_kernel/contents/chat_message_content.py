@@ -1,11 +1,15 @@
 # Copyright (c) Microsoft. All rights reserved.
-from typing import Optional
+from typing import Any, Callable, Hashable, Optional, Tuple, TypeVar
 from xml.etree.ElementTree import Element
 
 from defusedxml import ElementTree
+from pydantic import PrivateAttr
 
 from semantic_kernel.contents.chat_role import ChatRole
 from semantic_kernel.contents.kernel_content import KernelContent
+from semantic_kernel.kernel_pydantic import DerivedValueCache, can_change_in_place
+
+T = TypeVar("T")
 
 
 class ChatMessageContent(KernelContent):
@@ -32,9 +36,59 @@ class ChatMessageContent(KernelContent):
     content: Optional[str] = None
     encoding: Optional[str] = None
 
+    _derived_values: DerivedValueCache = PrivateAttr(default_factory=DerivedValueCache)
+
     def __str__(self) -> str:
         return self.content or ""
 
+    def get_token_count(self, token_counter: Callable[[str], int]) -> int:
+        """Count the tokens of the message, the count is cached until the counted fields are replaced.
+
+        When a counted field can be changed in place, like the tool calls of a message, it is counted on every call.
+
+        Args:
+            token_counter: Callable[[str], int] - Counts the tokens in a text.
+
+        Returns:
+            int - The number of tokens in the message.
+        """
+        return self.get_derived_value(
+            "token_count",
+            lambda: token_counter(self._get_token_count_text()),
+            (token_counter, *self._get_token_count_sources()),
+        )
+
+    def get_derived_value(
+        self, key: Hashable, factory: Callable[[], T], sources: Optional[Tuple[Any, ...]] = None
+    ) -> T:
+        """Get a value derived from the message, cached until one of the fields it is derived from is replaced.
+
+        Values derived from a field that can be changed in place, like a list or dict, are computed on every call,
+        pass only the other fields as sources and derive from those fields separately to cache the rest.
+
+        Args:
+            key: Hashable - The name of the value.
+            factory: Callable[[], T] - Computes the value.
+            sources: Optional[Tuple[Any, ...]] - The fields the value is derived from, all fields when None.
+
+        Returns:
+            T - The value.
+        """
+        if sources is None:
+            sources = tuple(self.__dict__.values())
+        if any(can_change_in_place(source) for source in sources):
+            return factory()
+        # pydantic looks up private attributes slowly, this is called for every message of every request
+        return self.__pydantic_private__["_derived_values"].get(key, sources, factory)
+
+    def _get_token_count_sources(self) -> Tuple[Any, ...]:
+        """The fields the token count depends on, the count is recounted when one of them is replaced."""
+        return (self.content,)
+
+    def _get_token_count_text(self) -> str:
+        """The text that is counted for the token count of the message."""
+        return self.content or ""
+
     def to_prompt(self, root_key: str) -> str:
         """Convert the ChatMessageContent to a prompt.
 
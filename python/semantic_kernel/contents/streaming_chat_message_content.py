@@ -1,6 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from semantic_kernel.contents.chat_role import ChatRole
 from semantic_kernel.contents.finish_reason import FinishReason
@@ -68,3 +68,34 @@ class StreamingChatMessageContent(StreamingKernelContent):
             encoding=self.encoding,
             finish_reason=self.finish_reason or other.finish_reason,
         )
+
+    @classmethod
+    def merge(cls, contents: List["StreamingChatMessageContent"]) -> "StreamingChatMessageContent":
+        """Combine the streamed contents of a single choice, joining the contents at once."""
+        if len(contents) == 1 or cls.__add__ is not StreamingChatMessageContent.__add__:
+            return super().merge(contents)
+        return StreamingChatMessageContent(**cls._merge_fields(contents))
+
+    @classmethod
+    def _merge_fields(cls, contents: List["StreamingChatMessageContent"]) -> Dict[str, Any]:
+        """Check that the contents can be combined and get the combined fields, as __add__ would."""
+        first = contents[0]
+        for other in contents[1:]:
+            if first.choice_index != other.choice_index:
+                raise ContentAdditionException("Cannot add StreamingChatMessageContent with different choice_index")
+            if first.ai_model_id != other.ai_model_id:
+                raise ContentAdditionException("Cannot add StreamingChatMessageContent from different ai_model_id")
+            if first.encoding != other.encoding:
+                raise ContentAdditionException("Cannot add StreamingChatMessageContent with different encoding")
+            if first.role and other.role and first.role != other.role:
+                raise ContentAdditionException("Cannot add StreamingChatMessageContent with different role")
+        return {
+            "choice_index": first.choice_index,
+            "inner_content": first.inner_content,
+            "ai_model_id": first.ai_model_id,
+            "metadata": first.metadata,
+            "role": first.role,
+            "content": "".join(content.content or "" for content in contents),
+            "encoding": first.encoding,
+            "finish_reason": next((content.finish_reason for content in contents if content.finish_reason), None),
+        }
@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from copy import copy
+from typing import Any, Dict, List, Optional
 
 from pydantic import Field
 
@@ -26,3 +27,15 @@ class StreamingKernelContent(KernelBaseModel, ABC):
     @abstractmethod
     def __add__(self, other: "StreamingKernelContent") -> "StreamingKernelContent":
         pass
+
+    @classmethod
+    def merge(cls, contents: List["StreamingKernelContent"]) -> "StreamingKernelContent":
+        """Combine the streamed contents of a single choice into one content, in order.
+
+        The result is the same as adding the contents one by one, subclasses override this to
+        combine all contents at once, instead of creating a new content for every addition.
+        """
+        result = copy(contents[0])
+        for content in contents[1:]:
+            result += content
+        return result
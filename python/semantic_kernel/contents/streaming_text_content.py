@@ -1,5 +1,5 @@
 # Copyright (c) Microsoft. All rights reserved.
-from typing import Optional
+from typing import List, Optional
 
 from semantic_kernel.contents.streaming_kernel_content import StreamingKernelContent
 from semantic_kernel.exceptions import ContentAdditionException
@@ -55,3 +55,25 @@ class StreamingTextContent(StreamingKernelContent):
             text=(self.text or "") + (other.text or ""),
             encoding=self.encoding,
         )
+
+    @classmethod
+    def merge(cls, contents: List["StreamingTextContent"]) -> "StreamingTextContent":
+        """Combine the streamed contents of a single choice, joining the texts at once."""
+        if len(contents) == 1 or cls.__add__ is not StreamingTextContent.__add__:
+            return super().merge(contents)
+        first = contents[0]
+        for other in contents[1:]:
+            if first.choice_index != other.choice_index:
+                raise ContentAdditionException("Cannot add StreamingTextContent with different choice_index")
+            if first.ai_model_id != other.ai_model_id:
+                raise ContentAdditionException("Cannot add StreamingTextContent from different ai_model_id")
+            if first.encoding != other.encoding:
+                raise ContentAdditionException("Cannot add StreamingTextContent with different encoding")
+        return StreamingTextContent(
+            choice_index=first.choice_index,
+            inner_content=first.inner_content,
+            ai_model_id=first.ai_model_id,
+            metadata=first.metadata,
+            text="".join(content.text or "" for content in contents),
+            encoding=first.encoding,
+        )
@@ -1,6 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, AsyncIterator, List, Tuple
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -35,7 +35,12 @@ class ConversationSummaryPlugin:
     )
 
     def __init__(
-        self, kernel: "Kernel", prompt_template_config: "PromptTemplateConfig", return_key: str = "summary"
+        self,
+        kernel: "Kernel",
+        prompt_template_config: "PromptTemplateConfig",
+        return_key: str = "summary",
+        max_concurrency: int = 8,
+        hierarchical_reduce: bool = False,
     ) -> None:
         """
         Initializes a new instance of the ConversationSummaryPlugin class.
@@ -43,8 +48,12 @@ class ConversationSummaryPlugin:
         :param kernel: The kernel instance.
         :param prompt_template_config: The prompt template configuration.
         :param return_key: The key to use for the return value.
+        :param max_concurrency: The maximum number of chunks that are summarized at a time.
+        :param hierarchical_reduce: Summarize the chunk summaries again until they fit in a single chunk.
         """
         self.return_key = return_key
+        self.max_concurrency = max_concurrency
+        self.hierarchical_reduce = hierarchical_reduce
         self._summarizeConversationFunction = kernel.create_function_from_prompt(
             prompt=ConversationSummaryPlugin._summarize_conversation_prompt_template,
             plugin_name=ConversationSummaryPlugin.__name__,
@@ -72,15 +81,56 @@ class ConversationSummaryPlugin:
         :param arguments: Arguments used by the kernel.
         :return: KernelArguments with the summarized conversation result in key self.return_key.
         """
-        from semantic_kernel.text import text_chunker
         from semantic_kernel.text.function_extension import (
             aggregate_chunked_results,
+            reduce_chunked_results,
         )
 
-        lines = text_chunker._split_text_lines(input, ConversationSummaryPlugin._max_tokens, True)
-        paragraphs = text_chunker._split_text_paragraph(lines, ConversationSummaryPlugin._max_tokens)
+        paragraphs = self._split_conversation(input)
 
-        arguments[self.return_key] = await aggregate_chunked_results(
-            self._summarizeConversationFunction, paragraphs, kernel, arguments
-        )
+        if self.hierarchical_reduce:
+            arguments[self.return_key] = await reduce_chunked_results(
+                self._summarizeConversationFunction,
+                paragraphs,
+                kernel,
+                arguments,
+                ConversationSummaryPlugin._max_tokens,
+                self.max_concurrency,
+            )
+        else:
+            arguments[self.return_key] = await aggregate_chunked_results(
+                self._summarizeConversationFunction, paragraphs, kernel, arguments, self.max_concurrency
+            )
         return arguments
+
+    async def stream_chunk_summaries(
+        self, input: str, kernel: "Kernel", arguments: "KernelArguments"
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Summarize the chunks of a long conversation transcript and yield the summaries as they finish.
+
+        :param input: A long conversation transcript.
+        :param kernel: The kernel for function execution.
+        :param arguments: Arguments used by the kernel.
+        :return: The index of the chunk and its summary.
+        """
+        from semantic_kernel.text.function_extension import stream_chunked_results
+
+        results = stream_chunked_results(
+            self._summarizeConversationFunction,
+            self._split_conversation(input),
+            kernel,
+            arguments,
+            self.max_concurrency,
+        )
+        try:
+            async for index, summary in results:
+                yield index, summary
+        finally:
+            await results.aclose()
+
+    def _split_conversation(self, input: str) -> List[str]:
+        from semantic_kernel.text import text_chunker
+
+        lines = text_chunker._split_text_lines(input, ConversationSummaryPlugin._max_tokens, True)
+        return text_chunker._split_text_paragraph(lines, ConversationSummaryPlugin._max_tokens)
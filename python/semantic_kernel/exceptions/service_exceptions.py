@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from typing import Optional
 
 from semantic_kernel.exceptions.kernel_exceptions import KernelException
 
@@ -16,6 +17,17 @@ class ServiceResponseException(ServiceException):
     pass
 
 
+class ServiceRateLimitException(ServiceResponseException):
+    """Raised when the service rejected a request because a rate limit was exceeded.
+
+    retry_after holds the number of seconds the service asked to wait before retrying, if it did.
+    """
+
+    def __init__(self, message: str, *args, retry_after: Optional[float] = None):
+        super().__init__(message, *args)
+        self.retry_after = retry_after
+
+
 class ServiceInvalidAuthError(ServiceException):
     pass
 
@@ -49,6 +61,7 @@ __all__ = [
     "ServiceInvalidAuthError",
     "ServiceInitializationError",
     "ServiceResponseException",
+    "ServiceRateLimitException",
     "ServiceInvalidTypeError",
     "ServiceInvalidRequestError",
     "ServiceInvalidResponseError",
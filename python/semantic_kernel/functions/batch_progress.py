@@ -0,0 +1,66 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import time
+from typing import Callable, Optional, Union
+
+from pydantic import Field, PrivateAttr
+
+from semantic_kernel.functions.function_result import FunctionResult
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+
+
+class BatchProgress(KernelBaseModel):
+    """The progress of a batch of invocations, like the ones of Kernel.invoke_many.
+
+    The counters are updated while the batch runs, a result with an error in its metadata counts as failed.
+    """
+
+    started: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    clock: Callable[[], float] = Field(time.monotonic, exclude=True)
+
+    _started_at: Optional[float] = PrivateAttr(default=None)
+    _finished_at: Optional[float] = PrivateAttr(default=None)
+
+    @property
+    def completed(self) -> int:
+        """The number of invocations that finished, successfully or not."""
+        return self.succeeded + self.failed
+
+    @property
+    def in_flight(self) -> int:
+        """The number of invocations that were started and did not finish yet."""
+        return self.started - self.completed
+
+    @property
+    def elapsed(self) -> float:
+        """The seconds since the first invocation was started, until the batch finished."""
+        if self._started_at is None:
+            return 0.0
+        end = self._finished_at if self._finished_at is not None else self.clock()
+        return end - self._started_at
+
+    @property
+    def throughput(self) -> float:
+        """The number of completed invocations per second."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def record_started(self) -> None:
+        """Record that an invocation was started."""
+        if self._started_at is None:
+            self._started_at = self.clock()
+        self._finished_at = None
+        self.started += 1
+
+    def record_completed(self, outcome: Union[Optional[FunctionResult], Exception]) -> None:
+        """Record the result or the exception of a finished invocation."""
+        if isinstance(outcome, Exception) or (outcome is not None and "error" in outcome.metadata):
+            self.failed += 1
+        else:
+            self.succeeded += 1
+
+    def record_finished(self) -> None:
+        """Record that the batch finished, this stops the elapsed time."""
+        self._finished_at = self.clock()
@@ -13,6 +13,7 @@ def kernel_function(
     *,
     name: Optional[str] = None,
     description: Optional[str] = None,
+    cacheable: bool = False,
 ):
     """
     Decorator for kernel functions.
@@ -39,6 +40,8 @@ def kernel_function(
         name (Optional[str]) -- The name of the function, if not supplied, the function name will be used.
         description (Optional[str]) -- The description of the function,
             if not supplied, the function docstring will be used, can be None.
+        cacheable (bool) -- Whether the result only depends on the arguments, so it can be memoized
+            when the function is a step of a plan with a PlanCache, stored in __kernel_function_cacheable__.
 
     """
 
@@ -46,6 +49,7 @@ def kernel_function(
         func.__kernel_function__ = True
         func.__kernel_function_description__ = description or func.__doc__
         func.__kernel_function_name__ = name or func.__name__
+        func.__kernel_function_cacheable__ = cacheable
         func.__kernel_function_streaming__ = isasyncgenfunction(func) or isgeneratorfunction(func)
         logger.debug(f"Parsing decorator for function: {func.__kernel_function_name__}")
 
@@ -71,6 +71,7 @@ class KernelFunctionFromMethod(KernelFunction):
                 is_prompt=False,
                 is_asynchronous=isasyncgenfunction(method) or iscoroutinefunction(method),
                 plugin_name=plugin_name,
+                is_cacheable=getattr(method, "__kernel_function_cacheable__", False),
             )
         except ValidationError as exc:
             # reraise the exception to clarify it comes from KernelFunction init
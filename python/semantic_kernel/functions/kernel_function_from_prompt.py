@@ -1,7 +1,21 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from pydantic import Field, ValidationError, model_validator
 
@@ -15,7 +29,11 @@ from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecut
 from semantic_kernel.connectors.ai.text_completion_client_base import TextCompletionClientBase
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.chat_role import ChatRole
+from semantic_kernel.contents.kernel_content import KernelContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
 from semantic_kernel.contents.streaming_kernel_content import StreamingKernelContent
+from semantic_kernel.contents.streaming_text_content import StreamingTextContent
 from semantic_kernel.contents.text_content import TextContent
 from semantic_kernel.exceptions import FunctionExecutionException, FunctionInitializationError
 from semantic_kernel.functions.function_result import FunctionResult
@@ -27,8 +45,11 @@ from semantic_kernel.prompt_template.kernel_prompt_template import KernelPromptT
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
 
 if TYPE_CHECKING:
+    from semantic_kernel.caching.completion_cache_store_base import CachedCompletion
     from semantic_kernel.kernel import Kernel
 
+T = TypeVar("T")
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 PROMPT_RETURN_PARAM = KernelParameterMetadata(
@@ -146,24 +167,38 @@ through prompt_template_config or in the prompt_template."
         service, execution_settings = kernel.select_ai_service(self, arguments)
         prompt = await self.prompt_template.render(kernel, arguments)
 
+        if not isinstance(service, (ChatCompletionClientBase, TextCompletionClientBase)):
+            raise ValueError(f"Service `{type(service).__name__}` is not a valid AI service")
+
+        cache_scope, cached = await self._get_cached_completion(kernel, service, execution_settings, prompt)
+        if cached is not None:
+            completions = self._create_cached_contents(service, *cached)
+            if isinstance(service, ChatCompletionClientBase):
+                chat_history = ChatHistory.from_rendered_prompt(prompt, service.get_chat_message_content_class())
+                return self._create_function_result(completions, chat_history, arguments)
+            return self._create_function_result(completions, None, arguments, prompt=prompt)
+
         if isinstance(service, ChatCompletionClientBase):
-            return await self._handle_complete_chat(
+            result = await self._handle_complete_chat(
                 kernel=kernel,
                 service=service,
                 execution_settings=execution_settings,
                 prompt=prompt,
                 arguments=arguments,
             )
-
-        if isinstance(service, TextCompletionClientBase):
-            return await self._handle_text_complete(
+        else:
+            result = await self._handle_text_complete(
+                kernel=kernel,
                 service=service,
                 execution_settings=execution_settings,
                 prompt=prompt,
                 arguments=arguments,
             )
-
-        raise ValueError(f"Service `{type(service).__name__}` is not a valid AI service")
+        if cache_scope is not None:
+            await self._cache_completion(
+                kernel, service, cache_scope, prompt, [str(content) for content in result.value]
+            )
+        return result
 
     async def _handle_complete_chat(
         self,
@@ -174,21 +209,38 @@ through prompt_template_config or in the prompt_template."
         arguments: KernelArguments,
     ) -> FunctionResult:
         """Handles the chat service call."""
-        chat_history = ChatHistory.from_rendered_prompt(prompt, service.get_chat_message_content_class())
 
-        # pass the kernel in for auto function calling
-        kwargs = {}
-        if isinstance(execution_settings, OpenAIChatPromptExecutionSettings) and isinstance(
-            service, ChatCompletionClientBase
-        ):
-            kwargs["kernel"] = kernel
+        async def complete_chat(
+            service: ChatCompletionClientBase, execution_settings: PromptExecutionSettings
+        ) -> Tuple[List[ChatMessageContent], ChatHistory]:
+            chat_history = ChatHistory.from_rendered_prompt(prompt, service.get_chat_message_content_class())
+
+            # pass the kernel in for auto function calling
+            kwargs = {}
+            if self._passes_kernel(execution_settings):
+                kwargs["kernel"] = kernel
 
-        try:
             completions = await service.complete_chat(
                 chat_history=chat_history,
                 settings=execution_settings,
                 **kwargs,
             )
+            return completions, chat_history
+
+        def invoke_service() -> Awaitable[Tuple[List[ChatMessageContent], ChatHistory]]:
+            return kernel.ai_service_selector.invoke_service(
+                service,
+                execution_settings,
+                complete_chat,
+                idempotent=not self._auto_invokes_functions(execution_settings),
+            )
+
+        try:
+            if self._passes_kernel(execution_settings):
+                # the service retries its requests itself, retrying the call would invoke the functions again
+                completions, chat_history = await invoke_service()
+            else:
+                completions, chat_history = await kernel.retry_mechanism.execute_with_retry(invoke_service)
             if not completions:
                 raise FunctionExecutionException(f"No completions returned while invoking function {self.name}")
 
@@ -198,6 +250,7 @@ through prompt_template_config or in the prompt_template."
 
     async def _handle_text_complete(
         self,
+        kernel: "Kernel",
         service: TextCompletionClientBase,
         execution_settings: PromptExecutionSettings,
         prompt: str,
@@ -205,7 +258,13 @@ through prompt_template_config or in the prompt_template."
     ) -> FunctionResult:
         """Handles the text service call."""
         try:
-            completions = await service.complete(prompt, execution_settings)
+            completions = await kernel.retry_mechanism.execute_with_retry(
+                lambda: kernel.ai_service_selector.invoke_service(
+                    service,
+                    execution_settings,
+                    lambda service, execution_settings: service.complete(prompt, execution_settings),
+                )
+            )
             return self._create_function_result(completions, None, arguments, prompt=prompt)
         except Exception as exc:
             raise FunctionExecutionException(f"Error occurred while invoking function {self.name}: {exc}") from exc
@@ -243,25 +302,44 @@ through prompt_template_config or in the prompt_template."
         prompt = await self.prompt_template.render(kernel, arguments)
 
         if isinstance(service, ChatCompletionClientBase):
-            async for content in self._handle_complete_chat_stream(
+            stream = self._handle_complete_chat_stream(
                 kernel=kernel,
                 service=service,
                 execution_settings=execution_settings,
                 prompt=prompt,
-            ):
-                yield content
-            return
-
-        if isinstance(service, TextCompletionClientBase):
-            async for content in self._handle_complete_text_stream(
+            )
+        elif isinstance(service, TextCompletionClientBase):
+            stream = self._handle_complete_text_stream(
+                kernel=kernel,
                 service=service,
                 execution_settings=execution_settings,
                 prompt=prompt,
-            ):
-                yield content
+            )
+        else:
+            raise FunctionExecutionException(f"Service `{type(service)}` is not a valid AI service")  # pragma: no cover
+
+        cache_scope, cached = await self._get_cached_completion(kernel, service, execution_settings, prompt)
+        if cached is not None:
+            # replay the cached completions as a single chunk
+            yield self._create_cached_contents(service, *cached, streaming=True)
             return
 
-        raise FunctionExecutionException(f"Service `{type(service)}` is not a valid AI service")  # pragma: no cover
+        texts: Dict[int, List[str]] = {}
+        failed = False
+        async for content in stream:
+            if cache_scope is not None:
+                if isinstance(content, FunctionResult):
+                    failed = True
+                else:
+                    for chunk in content:
+                        texts.setdefault(chunk.choice_index, []).append(
+                            getattr(chunk, "content", None) or getattr(chunk, "text", None) or ""
+                        )
+            yield content
+        if cache_scope is not None and not failed:
+            await self._cache_completion(
+                kernel, service, cache_scope, prompt, ["".join(texts[index]) for index in sorted(texts)]
+            )
 
     async def _handle_complete_chat_stream(
         self,
@@ -272,20 +350,23 @@ through prompt_template_config or in the prompt_template."
     ) -> AsyncIterable[Union[FunctionResult, List[StreamingKernelContent]]]:
         """Handles the chat service call."""
 
-        # pass the kernel in for auto function calling
-        kwargs = {}
-        if isinstance(execution_settings, OpenAIChatPromptExecutionSettings) and isinstance(
-            service, ChatCompletionClientBase
-        ):
-            kwargs["kernel"] = kernel
+        def complete_chat_stream(
+            service: ChatCompletionClientBase, execution_settings: PromptExecutionSettings
+        ) -> AsyncIterable[List[StreamingKernelContent]]:
+            # pass the kernel in for auto function calling
+            kwargs = {}
+            if self._passes_kernel(execution_settings):
+                kwargs["kernel"] = kernel
 
-        chat_history = ChatHistory.from_rendered_prompt(prompt, service.get_chat_message_content_class())
-        try:
-            async for partial_content in service.complete_chat_stream(
+            chat_history = ChatHistory.from_rendered_prompt(prompt, service.get_chat_message_content_class())
+            return service.complete_chat_stream(
                 chat_history=chat_history,
                 settings=execution_settings,
                 **kwargs,
-            ):
+            )
+
+        try:
+            async for partial_content in self._start_stream(kernel, service, execution_settings, complete_chat_stream):
                 yield partial_content
 
             return  # Exit after processing all iterations
@@ -295,22 +376,172 @@ through prompt_template_config or in the prompt_template."
 
     async def _handle_complete_text_stream(
         self,
+        kernel: "Kernel",
         service: TextCompletionClientBase,
         execution_settings: PromptExecutionSettings,
         prompt: str,
     ) -> AsyncIterable[Union[FunctionResult, List[StreamingKernelContent]]]:
         """Handles the text service call."""
         try:
-            async for partial_content in service.complete_stream(prompt=prompt, settings=execution_settings):
+            async for partial_content in self._start_stream(
+                kernel,
+                service,
+                execution_settings,
+                lambda service, execution_settings: service.complete_stream(prompt=prompt, settings=execution_settings),
+            ):
                 yield partial_content
             return
         except Exception as e:
             logger.error(f"Error occurred while invoking function {self.name}: {e}")
             yield FunctionResult(function=self.metadata, value=None, metadata={"error": e})
 
+    async def _start_stream(
+        self,
+        kernel: "Kernel",
+        service: Union[ChatCompletionClientBase, TextCompletionClientBase],
+        execution_settings: PromptExecutionSettings,
+        create_stream: Callable[[Any, PromptExecutionSettings], AsyncIterable[T]],
+    ) -> AsyncIterable[T]:
+        """Starts a stream through the service selector and with the retry mechanism of the kernel.
+
+        The stream is retried until its first content arrives, after that content
+        has been passed on a failure can no longer be retried transparently.
+        Streams of services that get the kernel retry their requests themselves, see _passes_kernel.
+        The stream is closed when it is not read to the end, also when it lost a hedged request.
+        """
+
+        async def start_stream(service: Any, execution_settings: PromptExecutionSettings) -> _StartedStream:
+            stream = create_stream(service, execution_settings).__aiter__()
+            try:
+                return _StartedStream(stream, [await stream.__anext__()])
+            except StopAsyncIteration:
+                return _StartedStream(stream, [])
+            except BaseException:
+                await _close_stream(stream)
+                raise
+
+        def invoke_service() -> Awaitable[_StartedStream]:
+            return kernel.ai_service_selector.invoke_service(
+                service,
+                execution_settings,
+                start_stream,
+                idempotent=not self._auto_invokes_functions(execution_settings),
+            )
+
+        if self._passes_kernel(execution_settings):
+            stream, first_content = await invoke_service()
+        else:
+            stream, first_content = await kernel.retry_mechanism.execute_with_retry(invoke_service)
+        try:
+            for content in first_content:
+                yield content
+            if first_content:
+                async for content in stream:
+                    yield content
+        finally:
+            await _close_stream(stream)
+
+    @staticmethod
+    def _passes_kernel(execution_settings: PromptExecutionSettings) -> bool:
+        """Whether the service gets the kernel, to auto-invoke functions and to retry its own requests."""
+        return isinstance(execution_settings, OpenAIChatPromptExecutionSettings)
+
+    @staticmethod
+    def _auto_invokes_functions(execution_settings: PromptExecutionSettings) -> bool:
+        """Whether the service invokes kernel functions, which makes its call unsafe to make more than once."""
+        return isinstance(execution_settings, OpenAIChatPromptExecutionSettings) and bool(
+            execution_settings.auto_invoke_kernel_functions
+        )
+
+    async def _get_cached_completion(
+        self,
+        kernel: "Kernel",
+        service: Union[ChatCompletionClientBase, TextCompletionClientBase],
+        execution_settings: PromptExecutionSettings,
+        prompt: str,
+    ) -> Tuple[Optional[str], Optional[Tuple["CachedCompletion", str]]]:
+        """Looks up the rendered prompt in the completion cache of the kernel.
+
+        Returns the scope of the request, None when the kernel has no cache, and the cached completion with
+        the tier that found it. The scope is determined before the request, services change the settings.
+        """
+        if kernel.completion_cache is None:
+            return None, None
+        try:
+            scope = kernel.completion_cache.get_scope(service, execution_settings)
+            return scope, await kernel.completion_cache.get(scope, prompt)
+        except Exception as exc:
+            logger.warning(f"Completion cache lookup failed for function {self.name}: {exc}")
+            return None, None
+
+    async def _cache_completion(
+        self,
+        kernel: "Kernel",
+        service: Union[ChatCompletionClientBase, TextCompletionClientBase],
+        scope: str,
+        prompt: str,
+        contents: List[str],
+    ) -> None:
+        """Stores the completions in the completion cache of the kernel, completions without text are skipped."""
+        if not any(contents):
+            return
+        try:
+            await kernel.completion_cache.set(scope, prompt, contents, service.ai_model_id)
+        except Exception as exc:
+            logger.warning(f"Completion cache update failed for function {self.name}: {exc}")
+
+    def _create_cached_contents(
+        self,
+        service: Union[ChatCompletionClientBase, TextCompletionClientBase],
+        completion: "CachedCompletion",
+        tier: str,
+        streaming: bool = False,
+    ) -> List[KernelContent]:
+        """Creates the contents for cached completions, the metadata tells which cache tier found them."""
+        contents = []
+        for index, text in enumerate(completion.contents):
+            metadata = {"cache_hit": tier}
+            if isinstance(service, ChatCompletionClientBase):
+                if streaming:
+                    content = StreamingChatMessageContent(
+                        choice_index=index,
+                        role=ChatRole.ASSISTANT,
+                        content=text,
+                        ai_model_id=completion.ai_model_id,
+                        metadata=metadata,
+                    )
+                else:
+                    content = ChatMessageContent(
+                        role=ChatRole.ASSISTANT, content=text, ai_model_id=completion.ai_model_id, metadata=metadata
+                    )
+            elif streaming:
+                content = StreamingTextContent(
+                    choice_index=index, text=text, ai_model_id=completion.ai_model_id, metadata=metadata
+                )
+            else:
+                content = TextContent(text=text, ai_model_id=completion.ai_model_id, metadata=metadata)
+            contents.append(content)
+        return contents
+
     def add_default_values(self, arguments: "KernelArguments") -> KernelArguments:
         """Gathers the function parameters from the arguments."""
         for parameter in self.prompt_template.prompt_template_config.input_variables:
             if parameter.name not in arguments and parameter.default not in {None, "", False, 0}:
                 arguments[parameter.name] = parameter.default
         return arguments
+
+
+class _StartedStream(NamedTuple):
+    """A stream with its first content, the service selector closes it when it lost a hedged request."""
+
+    stream: AsyncIterator[Any]
+    first_content: List[Any]
+
+    async def aclose(self) -> None:
+        await _close_stream(self.stream)
+
+
+async def _close_stream(stream: AsyncIterator[Any]) -> None:
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
@@ -1,13 +1,16 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from typing import List, Optional
+from itertools import chain
+from typing import Any, Callable, Hashable, List, Optional, Tuple, TypeVar
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
-from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.kernel_pydantic import DerivedValueCache, KernelBaseModel, can_change_in_place
 from semantic_kernel.utils.validation import FUNCTION_NAME_REGEX, PLUGIN_NAME_REGEX
 
+T = TypeVar("T")
+
 
 class KernelFunctionMetadata(KernelBaseModel):
     name: str = Field(pattern=FUNCTION_NAME_REGEX)
@@ -17,6 +20,37 @@ class KernelFunctionMetadata(KernelBaseModel):
     is_prompt: bool
     is_asynchronous: Optional[bool] = Field(default=True)
     return_parameter: Optional[KernelParameterMetadata] = None
+    is_cacheable: bool = Field(default=False)
+
+    _derived_values: DerivedValueCache = PrivateAttr(default_factory=DerivedValueCache)
+
+    def get_derived_value(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Get a value derived from the metadata, like the schema of the function, cached until a field changes.
+
+        The parameters are compared by the values of their fields, so changing them in place is noticed. When
+        one of the values can be changed in place itself, like a list default value, the value is not cached.
+
+        Args:
+            key (Hashable): The name of the value.
+            factory (Callable[[], T]): Computes the value.
+
+        Returns:
+            The value.
+        """
+        sources = self._get_sources()
+        if sources is None:
+            return factory()
+        return self._derived_values.get(key, sources, factory)
+
+    def _get_sources(self) -> Optional[Tuple[Any, ...]]:
+        """Snapshot the values of the fields, with the parameters as tuples of their values."""
+        parameters = tuple(tuple(parameter.__dict__.values()) for parameter in self.parameters)
+        return_parameter = tuple(self.return_parameter.__dict__.values()) if self.return_parameter else ()
+        values = [value for key, value in self.__dict__.items() if key not in ("parameters", "return_parameter")]
+        if any(can_change_in_place(value) for value in chain(values, return_parameter, *parameters)):
+            return None
+        return (*values, parameters, return_parameter)
 
     def __eq__(self, other: "KernelFunctionMetadata") -> bool:
         """
@@ -39,4 +73,5 @@ class KernelFunctionMetadata(KernelBaseModel):
             and self.is_prompt == other.is_prompt
             and self.is_asynchronous == other.is_asynchronous
             and self.return_parameter == other.return_parameter
+            and self.is_cacheable == other.is_cacheable
         )
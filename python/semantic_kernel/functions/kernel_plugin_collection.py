@@ -1,7 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, TypeVar, Union
+from itertools import count
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, List, Optional, TypeVar, Union
+
+from pydantic import PrivateAttr
 
 from semantic_kernel.exceptions import (
     FunctionInvalidNameError,
@@ -10,10 +13,14 @@ from semantic_kernel.exceptions import (
 )
 from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
 from semantic_kernel.functions.kernel_plugin import KernelPlugin
-from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.kernel_pydantic import DerivedValueCache, KernelBaseModel
 
 # To support Python 3.8, need to use TypeVar since Iterable is not scriptable
 KernelPluginType = TypeVar("KernelPluginType", bound=KernelPlugin)
+T = TypeVar("T")
+
+# versions are unique over all collections, so a copy of a collection never has the version of another state
+_versions = count(1)
 
 if TYPE_CHECKING:
     from semantic_kernel.functions.kernel_function import KernelFunction
@@ -31,6 +38,9 @@ class KernelPluginCollection(KernelBaseModel):
 
     plugins: Dict[str, "KernelPlugin"]
 
+    _version: int = PrivateAttr(default_factory=lambda: next(_versions))
+    _derived_values: DerivedValueCache = PrivateAttr(default_factory=DerivedValueCache)
+
     def __init__(self, plugins: Union[None, "KernelPluginCollection", Iterable[KernelPluginType]] = None):
         """
         Initialize a new instance of the KernelPluginCollection class
@@ -81,6 +91,7 @@ class KernelPluginCollection(KernelBaseModel):
         if plugin.name in self.plugins.keys():
             logger.warning(f'Overwriting plugin "{plugin.name}" in collection')
         self.plugins[plugin.name] = plugin
+        self._changed()
 
     def add_plugin_from_functions(self, plugin_name: str, functions: List["KernelFunction"]) -> None:
         """
@@ -98,6 +109,7 @@ class KernelPluginCollection(KernelBaseModel):
 
         plugin = KernelPlugin.from_functions(plugin_name=plugin_name, functions=functions)
         self.plugins[plugin_name] = plugin
+        self._changed()
 
     def add_functions_to_plugin(self, functions: List["KernelFunction"], plugin_name: str) -> None:
         """
@@ -116,6 +128,7 @@ class KernelPluginCollection(KernelBaseModel):
 
         if plugin_name not in self.plugins:
             self.plugins[plugin_name] = KernelPlugin(name=plugin_name, functions=functions)
+            self._changed()
             return
 
         for func in functions:
@@ -124,6 +137,7 @@ class KernelPluginCollection(KernelBaseModel):
                     f"Function with name '{func.name}' already exists in plugin '{plugin_name}'"
                 )
             self.plugins[plugin_name].functions[func.name] = func
+            self._changed()
 
     def add_list_of_plugins(self, plugins: List["KernelPlugin"]) -> None:
         """
@@ -153,7 +167,7 @@ class KernelPluginCollection(KernelBaseModel):
         """
         if plugin is None or plugin.name is None:
             return False
-        return self.plugins.pop(plugin.name, None) is not None
+        return self.remove_by_name(plugin.name)
 
     def remove_by_name(self, plugin_name: str) -> bool:
         """
@@ -165,9 +179,10 @@ class KernelPluginCollection(KernelBaseModel):
         Returns:
             True if the plugin was removed, False otherwise.
         """
-        if plugin_name is None:
+        if plugin_name is None or self.plugins.pop(plugin_name, None) is None:
             return False
-        return self.plugins.pop(plugin_name, None) is not None
+        self._changed()
+        return True
 
     def __getitem__(self, name):
         """Define the [] operator for the collection
@@ -188,6 +203,30 @@ class KernelPluginCollection(KernelBaseModel):
     def clear(self):
         """Clear the collection of all plugins"""
         self.plugins.clear()
+        self._changed()
+
+    @property
+    def version(self) -> int:
+        """The version of the collection, it changes when plugins or functions are added or removed.
+
+        Changes made to the plugins dict or to the functions of a plugin directly are not tracked.
+        """
+        return self._version
+
+    def get_derived_value(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Get a value derived from the plugins, like the function schemas, cached until the version changes.
+
+        Args:
+            key (Hashable): The name of the value.
+            factory (Callable[[], T]): Computes the value.
+
+        Returns:
+            The value.
+        """
+        return self._derived_values.get(key, (self._version,), factory)
+
+    def _changed(self) -> None:
+        self._version = next(_versions)
 
     def get_list_of_function_metadata(
         self, include_prompt: bool = True, include_native: bool = True
@@ -195,6 +234,8 @@ class KernelPluginCollection(KernelBaseModel):
         """
         Get a list of the function metadata in the plugin collection
 
+        The list is cached until plugins or functions are added or removed, a copy is returned.
+
         Args:
             include_prompt (bool): Whether to include semantic functions in the list.
             include_native (bool): Whether to include native functions in the list.
@@ -204,13 +245,70 @@ class KernelPluginCollection(KernelBaseModel):
         """
         if not self.plugins:
             return []
+        return list(
+            self.get_derived_value(
+                ("function_metadata", include_prompt, include_native),
+                lambda: [
+                    func.metadata
+                    for plugin in self.plugins.values()
+                    for func in plugin.functions.values()
+                    if (include_prompt and func.is_prompt) or (include_native and not func.is_prompt)
+                ],
+            )
+        )
+
+    def get_function(self, function_name: str, plugin_name: Optional[str] = None) -> Optional["KernelFunction"]:
+        """
+        Get a function by its name and the name of its plugin
+
+        Without a plugin name the function is looked up in all plugins, the first plugin with a function
+        of that name is used. The functions are indexed by name, so this does not depend on the number of plugins.
+
+        Args:
+            function_name (str): The name of the function.
+            plugin_name (Optional[str]): The name of the plugin, None or empty to look in all plugins.
+
+        Returns:
+            The function if it exists, None otherwise.
+        """
+        if plugin_name:
+            plugin = self.plugins.get(plugin_name)
+            if plugin is None:
+                return None
+            return plugin.functions.get(function_name)
+        for function in self.get_functions_by_name(function_name):
+            return function
+        return None
+
+    def get_functions_by_name(self, function_name: str) -> List["KernelFunction"]:
+        """
+        Get the functions with a name from all plugins, in the order of the plugins
+
+        Args:
+            function_name (str): The name of the functions.
+
+        Returns:
+            The functions with that name, an empty list if there are none.
+        """
+        candidates = self.get_derived_value("functions_by_name", self._index_functions_by_name).get(function_name, [])
+        # changes made to the functions of a plugin directly are not in the index, check it before using it
+        if candidates and all(self._contains_function(function) for function in candidates):
+            return list(candidates)
         return [
-            func.metadata
-            for plugin in self.plugins.values()
-            for func in plugin.functions.values()
-            if (include_prompt and func.is_prompt) or (include_native and not func.is_prompt)
+            plugin.functions[function_name] for plugin in self.plugins.values() if function_name in plugin.functions
         ]
 
+    def _index_functions_by_name(self) -> Dict[str, List["KernelFunction"]]:
+        functions_by_name: Dict[str, List["KernelFunction"]] = {}
+        for plugin in self.plugins.values():
+            for function_name, function in plugin.functions.items():
+                functions_by_name.setdefault(function_name, []).append(function)
+        return functions_by_name
+
+    def _contains_function(self, function: "KernelFunction") -> bool:
+        plugin = self.plugins.get(function.plugin_name)
+        return plugin is not None and plugin.functions.get(function.name) is function
+
     def __iter__(self) -> Any:
         """Define an iterator for the collection"""
         return iter(self.plugins.values())
@@ -1,15 +1,30 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import glob
 import importlib
 import inspect
 import logging
 import os
-from copy import copy
-from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import Field, field_validator
 
+from semantic_kernel.caching.completion_cache import CompletionCache
 from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
 from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
@@ -30,6 +45,7 @@ from semantic_kernel.exceptions import (
     ServiceInvalidTypeError,
     TemplateSyntaxError,
 )
+from semantic_kernel.functions.batch_progress import BatchProgress
 from semantic_kernel.functions.function_result import FunctionResult
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.functions.kernel_function import KernelFunction
@@ -62,6 +78,8 @@ class Kernel(KernelBaseModel):
         plugins (Optional[KernelPluginCollection]): The collection of plugins to be used by the kernel
         services (Dict[str, AIServiceClientBase]): The services to be used by the kernel
         retry_mechanism (RetryMechanismBase): The retry mechanism to be used by the kernel
+        completion_cache (Optional[CompletionCache]): The cache for the completions of prompt functions,
+            None to not cache completions
         function_invoking_handlers (Dict): The function invoking handlers
         function_invoked_handlers (Dict): The function invoked handlers
     """
@@ -72,6 +90,7 @@ class Kernel(KernelBaseModel):
     services: Dict[str, AIServiceClientBase] = Field(default_factory=dict)
     ai_service_selector: AIServiceSelector = Field(default_factory=AIServiceSelector)
     retry_mechanism: RetryMechanismBase = Field(default_factory=PassThroughWithoutRetry)
+    completion_cache: Optional[CompletionCache] = None
     function_invoking_handlers: Dict[
         int, Callable[["Kernel", FunctionInvokingEventArgs], FunctionInvokingEventArgs]
     ] = Field(default_factory=dict)
@@ -100,7 +119,7 @@ class Kernel(KernelBaseModel):
             ai_service_selector (Optional[AIServiceSelector]): The AI service selector to be used by the kernel,
                 default is based on order of execution settings.
             **kwargs (Any): Additional fields to be passed to the Kernel model,
-                these are limited to retry_mechanism and function_invoking_handlers
+                these are limited to retry_mechanism, completion_cache, function_invoking_handlers
                 and function_invoked_handlers, the best way to add function_invoking_handlers
                 and function_invoked_handlers is to use the add_function_invoking_handler
                 and add_function_invoked_handler methods.
@@ -199,7 +218,8 @@ class Kernel(KernelBaseModel):
                 return
                 # TODO: decide how to put results into kernelarguments,
                 # might need to be done as part of the invoked_handler
-            function_result = []
+            # the streamed contents per choice, combined once the stream is done
+            contents_by_choice: Dict[int, List[StreamingKernelContent]] = {}
             exception = None
 
             async for stream_message in stream_function.invoke_stream(self, arguments):
@@ -207,16 +227,16 @@ class Kernel(KernelBaseModel):
                     exception = stream_message.metadata.get("exception", None)
                     if exception:
                         break
-                function_result.append(stream_message)
+                else:
+                    for choice in stream_message:
+                        if not isinstance(choice, StreamingKernelContent):
+                            continue
+                        contents_by_choice.setdefault(choice.choice_index, []).append(choice)
                 yield stream_message
 
-            output_function_result = []
-            for result in function_result:
-                for choice in result:
-                    if len(output_function_result) <= choice.choice_index:
-                        output_function_result.append(copy(choice))
-                    else:
-                        output_function_result[choice.choice_index] += choice
+            output_function_result = [
+                type(contents[0]).merge(contents) for _, contents in sorted(contents_by_choice.items())
+            ]
             func_result = FunctionResult(function=stream_function.metadata, value=output_function_result)
             function_invoked_args = self.on_function_invoked(
                 stream_function.metadata,
@@ -347,6 +367,89 @@ class Kernel(KernelBaseModel):
 
         return results if number_of_steps > 1 else results[0]
 
+    async def invoke_many(
+        self,
+        function: KernelFunction,
+        arguments: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+        max_concurrency: int = 8,
+        ordered: bool = False,
+        progress: Optional[BatchProgress] = None,
+    ) -> AsyncIterator[Tuple[int, Union[Optional[FunctionResult], Exception]]]:
+        """Invoke a function once for every set of arguments, with a bounded number of invocations at a time.
+
+        Every invocation goes through invoke, so the function invoking and invoked events fire for every item
+        and the requests to AI services wait for the rate limiter of the service, if it has one. The arguments
+        are read lazily and at most max_concurrency invocations are running or waiting to be yielded at any time,
+        so large or endless inputs can be processed with bounded memory.
+
+        The failure of an item does not stop the batch, the exception is yielded in place of its result.
+        When the iteration is stopped early, close the iterator (for instance with contextlib.aclosing)
+        to cancel the running invocations.
+
+        Arguments:
+            function (KernelFunction): The function to invoke.
+            arguments (Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]]): The argument sets,
+                KernelArguments or other mappings.
+            max_concurrency (int): The maximum number of invocations at a time.
+            ordered (bool): Yield the results in the order of the arguments, instead of as they finish.
+                A slow invocation then holds back the ones after it.
+            progress (Optional[BatchProgress]): Counters that are updated while the batch runs.
+
+        Yields:
+            Tuple[int, Union[Optional[FunctionResult], Exception]]: The index of the argument set
+                and the result of its invocation, or the exception it raised.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        progress = progress or BatchProgress()
+        argument_sets = _to_async_iterator(arguments)
+        running: Dict["asyncio.Future[Union[Optional[FunctionResult], Exception]]", int] = {}
+        finished: Dict[int, Union[Optional[FunctionResult], Exception]] = {}
+        next_index = 0
+        next_to_yield = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(running) + len(finished) < max_concurrency:
+                    try:
+                        item_arguments = await argument_sets.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    if not isinstance(item_arguments, KernelArguments):
+                        item_arguments = KernelArguments(**item_arguments)
+                    running[asyncio.ensure_future(self._invoke_batch_item(function, item_arguments))] = next_index
+                    progress.record_started()
+                    next_index += 1
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = running.pop(task)
+                    outcome = task.result()
+                    progress.record_completed(outcome)
+                    if ordered:
+                        finished[index] = outcome
+                    else:
+                        yield index, outcome
+                while next_to_yield in finished:
+                    yield next_to_yield, finished.pop(next_to_yield)
+                    next_to_yield += 1
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            progress.record_finished()
+
+    async def _invoke_batch_item(
+        self, function: KernelFunction, arguments: KernelArguments
+    ) -> Union[Optional[FunctionResult], Exception]:
+        try:
+            return await self.invoke(function, arguments)
+        except Exception as exc:
+            return exc
+
     async def invoke_prompt(
         self,
         prompt: str,
@@ -755,3 +858,12 @@ class Kernel(KernelBaseModel):
         self.services.clear()
 
     # endregion
+
+
+async def _to_async_iterator(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
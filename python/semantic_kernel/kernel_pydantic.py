@@ -1,4 +1,5 @@
 import sys
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -10,6 +11,8 @@ from pydantic.networks import Url
 
 HttpsUrl = Annotated[Url, UrlConstraints(max_length=2083, allowed_schemes=["https"])]
 
+T = TypeVar("T")
+
 
 class KernelBaseModel(BaseModel):
     """Base class for all pydantic models in the SK."""
@@ -17,6 +20,63 @@ class KernelBaseModel(BaseModel):
     model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True, validate_assignment=True)
 
 
+class DerivedValueCache:
+    """Cache for values derived from the fields of a model, meant to be a private attribute of the model.
+
+    A value is computed again when the objects it was derived from are no longer equal to the ones it was computed
+    from, objects that were not replaced are identical and are not compared. Changes made in place, like appending
+    to a list field, are not noticed, so values derived from fields for which can_change_in_place is true should
+    not be cached. The cache is left out when models are compared and copied.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, Tuple[Tuple[Any, ...], Any]] = {}
+
+    def get(self, key: Hashable, sources: Tuple[Any, ...], factory: Callable[[], T]) -> T:
+        """Get the cached value for key, or compute it with factory when it was derived from other sources.
+
+        Arguments:
+            key {Hashable} -- The name of the value.
+            sources {Tuple[Any, ...]} -- The objects the value is derived from.
+            factory {Callable[[], T]} -- Computes the value.
+
+        Returns:
+            T -- The value.
+        """
+        cached = self._values.get(key)
+        if cached is not None and cached[0] == sources:
+            return cached[1]
+        value = factory()
+        self._values[key] = (sources, value)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, DerivedValueCache)
+
+    def __copy__(self) -> "DerivedValueCache":
+        return DerivedValueCache()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "DerivedValueCache":
+        return DerivedValueCache()
+
+
+def can_change_in_place(value: Any) -> bool:
+    """Whether a value, like a list, dict, set or model, can be changed without being replaced.
+
+    Arguments:
+        value {Any} -- The value of a field.
+
+    Returns:
+        bool -- True when a DerivedValueCache would not notice changes of the value.
+    """
+    # most fields are strings or numbers, the isinstance check of pydantic models is slow
+    if value is None or isinstance(value, (str, bytes, int, float)):
+        return False
+    return isinstance(value, (list, dict, set, BaseModel))
+
+
 # TODO: remove these aliases in SK v1
 PydanticField = KernelBaseModel
 KernelGenericModel = KernelBaseModel
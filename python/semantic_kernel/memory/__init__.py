@@ -1,4 +1,14 @@
 # Copyright (c) Microsoft. All rights reserved.
+from semantic_kernel.memory.memory_reranker import CrossEncoderBase, MemoryReranker, maximal_marginal_relevance
+from semantic_kernel.memory.near_duplicate_detector import DeduplicationReport, DuplicateCheck, NearDuplicateDetector
 from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
 
-__all__ = ["VolatileMemoryStore"]
+__all__ = [
+    "CrossEncoderBase",
+    "DeduplicationReport",
+    "DuplicateCheck",
+    "MemoryReranker",
+    "maximal_marginal_relevance",
+    "NearDuplicateDetector",
+    "VolatileMemoryStore",
+]
@@ -0,0 +1,150 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import logging
+import math
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import List, Optional
+
+import numpy as np
+from numpy import ndarray
+from pydantic import Field
+
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.memory.memory_query_result import MemoryQueryResult
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class CrossEncoderBase(ABC):
+    """Scores the relevance of texts to a query by reading each text together with the query, like a cross-encoder.
+
+    Scoring is expected to be blocking and CPU or GPU bound, MemoryReranker runs it in an executor.
+    """
+
+    @abstractmethod
+    def score(self, query: str, texts: List[str]) -> List[float]:
+        """Score the relevance of texts to a query.
+
+        Arguments:
+            query {str} -- The query.
+            texts {List[str]} -- The texts.
+
+        Returns:
+            List[float] -- The score of every text, higher is more relevant, on any scale.
+        """
+        pass
+
+
+def maximal_marginal_relevance(
+    query_embedding: ndarray,
+    embeddings: ndarray,
+    limit: int,
+    diversity: float = 0.3,
+    relevance: Optional[ndarray] = None,
+) -> List[int]:
+    """Select embeddings that are relevant to the query but not similar to each other.
+
+    Every step selects the embedding with the highest (1 - diversity) * relevance - diversity * similarity,
+    where similarity is the highest cosine similarity to the embeddings selected before.
+
+    Arguments:
+        query_embedding {ndarray} -- The embedding of the query.
+        embeddings {ndarray} -- The embeddings to select from, one per row.
+        limit {int} -- The maximum number of embeddings to select.
+        diversity {float} -- From 0.0, by relevance only, to 1.0, by dissimilarity only. (default: {0.3})
+        relevance {Optional[ndarray]} -- The relevance of every embedding, the cosine similarity to the query
+            by default.
+
+    Returns:
+        List[int] -- The indexes of the selected embeddings, in the order they were selected.
+    """
+    embeddings = np.asarray(embeddings, dtype=float).reshape(len(embeddings), -1)
+    limit = min(limit, len(embeddings))
+    if limit <= 0:
+        return []
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    normalized = embeddings / np.where(norms == 0, 1, norms)
+    if relevance is None:
+        query = np.asarray(query_embedding, dtype=float).reshape(-1)
+        relevance = normalized @ (query / (np.linalg.norm(query) or 1))
+    relevance = np.asarray(relevance, dtype=float)
+
+    selected: List[int] = []
+    max_similarity = np.full(len(embeddings), -np.inf)
+    available = np.ones(len(embeddings), dtype=bool)
+    for _ in range(limit):
+        # nothing is selected yet for the first pick, so it is by relevance only
+        penalty = max_similarity if selected else 0.0
+        scores = np.where(available, (1 - diversity) * relevance - diversity * penalty, -np.inf)
+        index = int(np.argmax(scores))
+        selected.append(index)
+        available[index] = False
+        max_similarity = np.maximum(max_similarity, normalized @ normalized[index])
+    return selected
+
+
+class MemoryReranker(KernelBaseModel):
+    """Reranks the results of a memory search, set it as reranker of SemanticTextMemory to use it.
+
+    The search fetches over_fetch_factor times the limit of results with their embeddings from the store, in one
+    round-trip, and the reranker selects the limit of them with maximal marginal relevance, so results that are
+    nearly the same as a better result make room for other results. With a cross_encoder, the fetched results
+    are scored by it in the executor, a thread pool of the event loop by default, and those scores, scaled to
+    0.0 to 1.0, are the relevance of the selection. The relevance of the results stays the one of the store.
+    """
+
+    over_fetch_factor: float = Field(4.0, ge=1)
+    diversity: float = Field(0.3, ge=0, le=1)
+    cross_encoder: Optional[CrossEncoderBase] = None
+    executor: Optional[Executor] = None
+
+    def get_fetch_limit(self, limit: int) -> int:
+        """Get the number of results to fetch from the store for a limit.
+
+        Arguments:
+            limit {int} -- The maximum number of results to return.
+
+        Returns:
+            int -- The number of results to fetch.
+        """
+        return max(limit, math.ceil(limit * self.over_fetch_factor))
+
+    async def rerank(
+        self, query: str, query_embedding: ndarray, results: List[MemoryQueryResult], limit: int
+    ) -> List[MemoryQueryResult]:
+        """Select the limit of the results that are most relevant and diverse.
+
+        Arguments:
+            query {str} -- The query of the search.
+            query_embedding {ndarray} -- The embedding of the query.
+            results {List[MemoryQueryResult]} -- The results of the store, with their embeddings.
+            limit {int} -- The maximum number of results to return.
+
+        Returns:
+            List[MemoryQueryResult] -- The selected results, the best first.
+        """
+        if not results:
+            return []
+        if self.cross_encoder is not None:
+            loop = asyncio.get_running_loop()
+            scores = np.asarray(
+                await loop.run_in_executor(
+                    self.executor, self.cross_encoder.score, query, [result.text or "" for result in results]
+                ),
+                dtype=float,
+            )
+            spread = scores.max() - scores.min()
+            relevance = (scores - scores.min()) / spread if spread > 0 else np.ones(len(scores))
+        else:
+            relevance = np.array([result.relevance for result in results], dtype=float)
+
+        if any(result.embedding is None for result in results):
+            logger.warning("The store did not return the embeddings of the results, reranking by relevance only")
+            order = np.argsort(-relevance, kind="stable")[:limit]
+            return [results[index] for index in order]
+
+        embeddings = np.stack([np.asarray(result.embedding, dtype=float).reshape(-1) for result in results])
+        selected = maximal_marginal_relevance(query_embedding, embeddings, limit, self.diversity, relevance)
+        return [results[index] for index in selected]
@@ -0,0 +1,259 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import hashlib
+import logging
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import Field, PrivateAttr
+
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# a prime above 2**32, the hashes of the shingles and the coefficients are below 2**32 so a * hash + b fits in 64 bits
+_PRIME = np.uint64(4294967311)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+
+class DeduplicationReport(KernelBaseModel):
+    """The number of texts a NearDuplicateDetector checked and the duplicates it found among them."""
+
+    texts: int = 0
+    exact_duplicates: int = 0
+    near_duplicates: int = 0
+
+    @property
+    def embeddings_saved(self) -> int:
+        """The number of texts that were not embedded because they are duplicates."""
+        return self.exact_duplicates + self.near_duplicates
+
+
+@dataclass(frozen=True)
+class DuplicateCheck:
+    """The outcome of NearDuplicateDetector.check for a text, commit it once the text, or its skip, is final."""
+
+    id: str
+    text_hash: bytes
+    signature: Optional[np.ndarray] = None
+    canonical_id: Optional[str] = None
+    similarity: float = 0.0
+    exact: bool = False
+
+    @property
+    def is_duplicate(self) -> bool:
+        """Whether the text is a duplicate of the text with canonical_id."""
+        return self.canonical_id is not None
+
+
+class NearDuplicateDetector(KernelBaseModel):
+    """Finds texts that are the same or nearly the same as texts that were added before, to skip embedding them.
+
+    Exact duplicates are found by a hash of the text in lower case with collapsed whitespace. Near duplicates are
+    found with MinHash signatures of the word shingles of the texts, indexed with locality sensitive hashing:
+    the signatures are split into bands and texts that share a band are candidates, a candidate is a duplicate
+    when the share of equal values in the signatures, an estimate of the Jaccard similarity of the shingles, is
+    at least threshold. The bands are chosen so that texts at the threshold are very likely to be candidates.
+
+    Checking a text does not change the index, a check is committed once the text is stored, so texts whose
+    storing failed are not taken for duplicates later. The index is kept in memory, for the life of the
+    detector, about num_perm * 4 bytes per text.
+    """
+
+    threshold: float = Field(0.9, gt=0, le=1)
+    num_perm: int = Field(128, gt=0)
+    shingle_size: int = Field(3, gt=0)
+    seed: int = 1
+    report: DeduplicationReport = Field(default_factory=DeduplicationReport)
+
+    _coefficients: np.ndarray = PrivateAttr()
+    _rows: int = PrivateAttr()
+    _exact: Dict[bytes, str] = PrivateAttr(default_factory=dict)
+    _hashes: Dict[str, bytes] = PrivateAttr(default_factory=dict)
+    _signatures: Dict[str, np.ndarray] = PrivateAttr(default_factory=dict)
+    _bands: List[Dict[bytes, List[str]]] = PrivateAttr(default_factory=list)
+    _canonical_ids: Dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Optional[object] = None):
+        rng = np.random.default_rng(self.seed)
+        # the a and b of the hash functions a * x + b mod prime, a is not 0
+        self._coefficients = np.stack(
+            [
+                rng.integers(1, int(_MAX_HASH), self.num_perm, dtype=np.uint64),
+                rng.integers(0, int(_MAX_HASH), self.num_perm, dtype=np.uint64),
+            ]
+        )
+        self._rows = _get_band_rows(self.num_perm, self.threshold)
+        self._bands = [{} for _ in range(self.num_perm // self._rows)]
+
+    def check(self, id: str, text: str, pending: Sequence[DuplicateCheck] = ()) -> DuplicateCheck:
+        """Check whether a text is a duplicate of a text that was committed or of a pending text, without adding it.
+
+        A text that is the same as the text that was committed with the same id is a duplicate of itself,
+        a text that is only nearly the same replaces it when committed.
+
+        Arguments:
+            id {str} -- The id of the text, like the id of its memory record.
+            text {str} -- The text.
+            pending {Sequence[DuplicateCheck]} -- Checks that are not committed yet, like those of a batch that
+                is being stored, the text is also compared to their texts that are not duplicates.
+
+        Returns:
+            DuplicateCheck -- The id of the text it is a duplicate of and the similarity, to commit later.
+        """
+        text_hash = _hash_text(text)
+        canonical_id = self._exact.get(text_hash)
+        if canonical_id is None:
+            canonical_id = next(
+                (check.id for check in pending if not check.is_duplicate and check.text_hash == text_hash), None
+            )
+        if canonical_id is not None:
+            return DuplicateCheck(id=id, text_hash=text_hash, canonical_id=canonical_id, similarity=1.0, exact=True)
+
+        signature = self._get_signature(text)
+        match = self._find_match(id, signature)
+        for check in pending:
+            if check.is_duplicate or check.id == id:
+                continue
+            similarity = self._get_similarity(check.signature, signature)
+            if similarity >= self.threshold and (match is None or similarity > match[1]):
+                match = (check.id, similarity)
+        if match is None:
+            return DuplicateCheck(id=id, text_hash=text_hash, signature=signature)
+        return DuplicateCheck(
+            id=id, text_hash=text_hash, signature=signature, canonical_id=match[0], similarity=match[1]
+        )
+
+    def commit(self, checks: Iterable[DuplicateCheck]) -> None:
+        """Add the texts of checks that are not duplicates to the index and count and map the duplicates.
+
+        Arguments:
+            checks {Iterable[DuplicateCheck]} -- The checks, in the order they were made.
+        """
+        for check in checks:
+            self.report.texts += 1
+            if not check.is_duplicate:
+                self._add(check.id, check.text_hash, check.signature)
+                continue
+            if check.exact:
+                self.report.exact_duplicates += 1
+            else:
+                logger.debug(
+                    f"{check.id} is a near duplicate of {check.canonical_id}, similarity {check.similarity:.2f}"
+                )
+                self.report.near_duplicates += 1
+            if check.canonical_id != check.id:
+                self._canonical_ids[check.id] = check.canonical_id
+
+    def deduplicate(self, id: str, text: str) -> Optional[str]:
+        """Check a text and commit the check right away, see check.
+
+        Arguments:
+            id {str} -- The id of the text, like the id of its memory record.
+            text {str} -- The text.
+
+        Returns:
+            Optional[str] -- The id of the text it is a duplicate of, None when the text was added.
+        """
+        check = self.check(id, text)
+        self.commit([check])
+        return check.canonical_id
+
+    def find_duplicate(self, text: str) -> Optional[Tuple[str, float]]:
+        """Find the text that a text is a duplicate of, without adding it.
+
+        Arguments:
+            text {str} -- The text.
+
+        Returns:
+            Optional[Tuple[str, float]] -- The id of the most similar text that was added and the estimated
+                similarity, 1.0 for an exact duplicate, None when the text is not a duplicate.
+        """
+        canonical_id = self._exact.get(_hash_text(text))
+        if canonical_id is not None:
+            return canonical_id, 1.0
+        return self._find_match(None, self._get_signature(text))
+
+    def get_canonical_id(self, id: str) -> str:
+        """Get the id of the text that the text with an id was found to be a duplicate of, the id itself otherwise.
+
+        Arguments:
+            id {str} -- The id of a text that was deduplicated.
+
+        Returns:
+            str -- The id of the text that is kept for it.
+        """
+        return self._canonical_ids.get(id, id)
+
+    def _add(self, id: str, text_hash: bytes, signature: np.ndarray) -> None:
+        self._remove(id)
+        self._canonical_ids.pop(id, None)
+        self._exact[text_hash] = id
+        self._hashes[id] = text_hash
+        self._signatures[id] = signature
+        for band, key in zip(self._bands, self._get_band_keys(signature)):
+            band.setdefault(key, []).append(id)
+
+    def _remove(self, id: str) -> None:
+        text_hash = self._hashes.pop(id, None)
+        if text_hash is None:
+            return
+        if self._exact.get(text_hash) == id:
+            del self._exact[text_hash]
+        for band, key in zip(self._bands, self._get_band_keys(self._signatures.pop(id))):
+            ids = band[key]
+            ids.remove(id)
+            if not ids:
+                del band[key]
+
+    def _find_match(self, id: Optional[str], signature: np.ndarray) -> Optional[Tuple[str, float]]:
+        candidates = {
+            candidate
+            for band, key in zip(self._bands, self._get_band_keys(signature))
+            for candidate in band.get(key, ())
+            if candidate != id
+        }
+        best: Optional[Tuple[str, float]] = None
+        for candidate in candidates:
+            similarity = self._get_similarity(self._signatures[candidate], signature)
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (candidate, similarity)
+        return best
+
+    def _get_similarity(self, signature: np.ndarray, other: np.ndarray) -> float:
+        return float(np.count_nonzero(signature == other)) / self.num_perm
+
+    def _get_signature(self, text: str) -> np.ndarray:
+        words = text.lower().split()
+        size = min(self.shingle_size, len(words))
+        shingles = {" ".join(words[index : index + size]) for index in range(len(words) - size + 1)}
+        if not shingles:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64, count=len(shingles)
+        )
+        a, b = self._coefficients
+        values = (np.outer(a, hashes) + b[:, None]) % _PRIME & _MAX_HASH
+        return values.min(axis=1).astype(np.uint32)
+
+    def _get_band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[start : start + self._rows].tobytes()
+            for start in range(0, len(self._bands) * self._rows, self._rows)
+        ]
+
+
+def _get_band_rows(num_perm: int, threshold: float) -> int:
+    # texts with a similarity s share a band with probability 1 - (1 - s ** rows) ** bands, which is about half
+    # at (1 / bands) ** (1 / rows), take the most rows that keep that point at or below the threshold
+    rows = 1
+    for candidate in range(1, num_perm + 1):
+        if num_perm % candidate == 0 and (1 / (num_perm // candidate)) ** (1 / candidate) <= threshold:
+            rows = candidate
+    return rows
+
+
+def _hash_text(text: str) -> bytes:
+    return hashlib.blake2b(" ".join(text.lower().split()).encode("utf-8"), digest_size=16).digest()
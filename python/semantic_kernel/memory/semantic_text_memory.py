@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from typing import List, Optional
+import json
+from typing import TYPE_CHECKING, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
 from pydantic import PrivateAttr
 
@@ -9,21 +10,43 @@ from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import (
 )
 from semantic_kernel.memory.memory_query_result import MemoryQueryResult
 from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_reranker import MemoryReranker
 from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.memory.near_duplicate_detector import DuplicateCheck, NearDuplicateDetector
 from semantic_kernel.memory.semantic_text_memory_base import SemanticTextMemoryBase
 
+if TYPE_CHECKING:
+    from semantic_kernel.text.text_chunker import TextChunk
+
+T = TypeVar("T")
+
 
 class SemanticTextMemory(SemanticTextMemoryBase):
     _storage: MemoryStoreBase = PrivateAttr()
     _embeddings_generator: EmbeddingGeneratorBase = PrivateAttr()
+    _near_duplicate_detector: Optional[NearDuplicateDetector] = PrivateAttr()
+    _near_duplicate_detectors: Dict[str, NearDuplicateDetector] = PrivateAttr(default_factory=dict)
+    _reranker: Optional[MemoryReranker] = PrivateAttr()
 
-    def __init__(self, storage: MemoryStoreBase, embeddings_generator: EmbeddingGeneratorBase) -> None:
+    def __init__(
+        self,
+        storage: MemoryStoreBase,
+        embeddings_generator: EmbeddingGeneratorBase,
+        near_duplicate_detector: Optional[NearDuplicateDetector] = None,
+        reranker: Optional[MemoryReranker] = None,
+    ) -> None:
         """Initialize a new instance of SemanticTextMemory.
 
         Arguments:
             storage {MemoryStoreBase} -- The MemoryStoreBase to use for storage.
             embeddings_generator {EmbeddingGeneratorBase} -- The EmbeddingGeneratorBase
                 to use for generating embeddings.
+            near_duplicate_detector {Optional[NearDuplicateDetector]} -- Skips the paragraphs of save_chunks and
+                save_documents that are duplicates of paragraphs saved before to the same collection. Its settings
+                are used for a detector per collection, see get_near_duplicate_detector, and its report counts the
+                embeddings that were saved in all collections.
+            reranker {Optional[MemoryReranker]} -- Over-fetches the results of search and selects the most
+                relevant and diverse of them.
 
         Returns:
             None -- None.
@@ -31,6 +54,8 @@ class SemanticTextMemory(SemanticTextMemoryBase):
         super().__init__()
         self._storage = storage
         self._embeddings_generator = embeddings_generator
+        self._near_duplicate_detector = near_duplicate_detector
+        self._reranker = reranker
 
     async def save_information(
         self,
@@ -66,6 +91,122 @@ class SemanticTextMemory(SemanticTextMemoryBase):
 
         await self._storage.upsert(collection_name=collection, record=data)
 
+    async def save_chunks(
+        self,
+        collection: str,
+        chunks: Union[Iterable["TextChunk"], AsyncIterable["TextChunk"]],
+        document_id: str,
+        batch_size: int = 64,
+        description: Optional[str] = None,
+    ) -> int:
+        """Save the paragraphs of a document, embedding and upserting them in batches.
+
+        The chunks are read as they are needed, so the paragraphs of iter_plaintext_paragraphs or
+        iter_markdown_paragraphs can be saved for documents of any size with bounded memory. The id of a record
+        is the document id and the offsets of its chunk, its additional metadata the same as JSON.
+        With a near_duplicate_detector, paragraphs that duplicate a paragraph saved before to the collection are
+        not embedded or saved. Paragraphs count as saved for that once their batch is upserted, so the paragraphs
+        of a batch that failed are saved when they are saved again.
+
+        Arguments:
+            collection {str} -- The collection to save the paragraphs to.
+            chunks {Union[Iterable[TextChunk], AsyncIterable[TextChunk]]} -- The paragraphs of the document.
+            document_id {str} -- The id of the document.
+            batch_size {int} -- The number of paragraphs that are embedded and upserted at a time.
+            description {Optional[str]} -- The description of the paragraphs.
+
+        Returns:
+            int -- The number of paragraphs saved.
+        """
+        return await self.save_documents(collection, [(document_id, chunks)], batch_size, description)
+
+    async def save_documents(
+        self,
+        collection: str,
+        documents: Union[
+            Iterable[Tuple[str, Union[Iterable["TextChunk"], AsyncIterable["TextChunk"]]]],
+            AsyncIterable[Tuple[str, Union[Iterable["TextChunk"], AsyncIterable["TextChunk"]]]],
+        ],
+        batch_size: int = 64,
+        description: Optional[str] = None,
+    ) -> int:
+        """Save the paragraphs of many documents, like save_chunks, with batches that span documents.
+
+        Arguments:
+            collection {str} -- The collection to save the paragraphs to.
+            documents {Union[Iterable[Tuple[str, ...]], AsyncIterable[Tuple[str, ...]]]} -- The id and the
+                paragraphs of every document.
+            batch_size {int} -- The number of paragraphs that are embedded and upserted at a time.
+            description {Optional[str]} -- The description of the paragraphs.
+
+        Returns:
+            int -- The number of paragraphs saved, without the skipped duplicates.
+        """
+        if not await self._storage.does_collection_exist(collection_name=collection):
+            await self._storage.create_collection(collection_name=collection)
+
+        detector = self.get_near_duplicate_detector(collection)
+        count = 0
+        batch: List[Tuple[str, "TextChunk"]] = []
+        # the checks of the paragraphs since the last batch, committed when the batch is saved
+        checks: List[DuplicateCheck] = []
+        async for document_id, chunks in _iterate(documents):
+            async for chunk in _iterate(chunks):
+                if detector is not None:
+                    check = detector.check(_get_chunk_id(document_id, chunk), chunk.text, pending=checks)
+                    checks.append(check)
+                    if check.is_duplicate:
+                        continue
+                batch.append((document_id, chunk))
+                if len(batch) >= batch_size:
+                    count += await self._save_chunk_batch(collection, batch, description)
+                    batch = []
+                    if detector is not None:
+                        detector.commit(checks)
+                        checks = []
+        if batch:
+            count += await self._save_chunk_batch(collection, batch, description)
+        if detector is not None:
+            detector.commit(checks)
+        return count
+
+    def get_near_duplicate_detector(self, collection: str) -> Optional[NearDuplicateDetector]:
+        """Get the detector of the paragraphs saved to a collection.
+
+        Its get_canonical_id maps the id of a skipped paragraph to the record of the collection it duplicates.
+
+        Arguments:
+            collection {str} -- The collection.
+
+        Returns:
+            Optional[NearDuplicateDetector] -- The detector, None when the memory has no near_duplicate_detector.
+        """
+        if self._near_duplicate_detector is None:
+            return None
+        detector = self._near_duplicate_detectors.get(collection)
+        if detector is None:
+            template = self._near_duplicate_detector
+            detector = NearDuplicateDetector(**template.model_dump(exclude={"report"}), report=template.report)
+            self._near_duplicate_detectors[collection] = detector
+        return detector
+
+    async def _save_chunk_batch(
+        self, collection: str, batch: List[Tuple[str, "TextChunk"]], description: Optional[str]
+    ) -> int:
+        embeddings = await self._embeddings_generator.generate_embeddings([chunk.text for _, chunk in batch])
+        records = [
+            MemoryRecord.local_record(
+                id=_get_chunk_id(document_id, chunk),
+                text=chunk.text,
+                description=description,
+                additional_metadata=json.dumps({"document_id": document_id, "start": chunk.start, "end": chunk.end}),
+                embedding=embedding,
+            )
+            for (document_id, chunk), embedding in zip(batch, embeddings)
+        ]
+        await self._storage.upsert_batch(collection_name=collection, records=records)
+        return len(records)
+
     async def save_reference(
         self,
         collection: str,
@@ -129,6 +270,9 @@ class SemanticTextMemory(SemanticTextMemoryBase):
     ) -> List[MemoryQueryResult]:
         """Search the memory (calls the memory store's get_nearest_matches method).
 
+        With a reranker, more results than the limit are fetched, with their embeddings, and the reranker
+        selects the limit of them.
+
         Arguments:
             collection {str} -- The collection to search in.
             query {str} -- The query to search for.
@@ -140,15 +284,30 @@ class SemanticTextMemory(SemanticTextMemoryBase):
             List[MemoryQueryResult] -- The list of MemoryQueryResult found.
         """
         query_embedding = (await self._embeddings_generator.generate_embeddings([query]))[0]
+        if self._reranker is None:
+            results = await self._storage.get_nearest_matches(
+                collection_name=collection,
+                embedding=query_embedding,
+                limit=limit,
+                min_relevance_score=min_relevance_score,
+                with_embeddings=with_embeddings,
+            )
+            return [MemoryQueryResult.from_memory_record(r[0], r[1]) for r in results]
+
         results = await self._storage.get_nearest_matches(
             collection_name=collection,
             embedding=query_embedding,
-            limit=limit,
+            limit=self._reranker.get_fetch_limit(limit),
             min_relevance_score=min_relevance_score,
-            with_embeddings=with_embeddings,
+            with_embeddings=True,
         )
-
-        return [MemoryQueryResult.from_memory_record(r[0], r[1]) for r in results]
+        reranked = await self._reranker.rerank(
+            query, query_embedding, [MemoryQueryResult.from_memory_record(r[0], r[1]) for r in results], limit
+        )
+        if not with_embeddings:
+            for result in reranked:
+                result.embedding = None
+        return reranked
 
     async def get_collections(self) -> List[str]:
         """Get the list of collections in the memory (calls the memory store's get_collections method).
@@ -157,3 +316,16 @@ class SemanticTextMemory(SemanticTextMemoryBase):
             List[str] -- The list of all the memory collection names.
         """
         return await self._storage.get_collections()
+
+
+async def _iterate(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _get_chunk_id(document_id: str, chunk: "TextChunk") -> str:
+    return f"{document_id}:{chunk.start}-{chunk.end}"
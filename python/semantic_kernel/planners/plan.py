@@ -1,24 +1,35 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import json
 import logging
 import re
 import threading
 from copy import copy
-from typing import Any, Callable, ClassVar, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, Set, Tuple, Union
 
 from pydantic import PrivateAttr
 
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai import PromptExecutionSettings
-from semantic_kernel.exceptions import KernelInvokeException
+from semantic_kernel.exceptions import (
+    KernelInvokeException,
+    PlannerInvalidConfigurationError,
+    PlannerInvalidPlanError,
+)
 from semantic_kernel.functions.function_result import FunctionResult
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.functions.kernel_function import KernelFunction
 from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
 from semantic_kernel.utils.naming import generate_random_ascii_name
 
+if TYPE_CHECKING:
+    from semantic_kernel.caching.plan_cache import PlanCache
+
 logger: logging.Logger = logging.getLogger(__name__)
 
+VARIABLES_REGEX = r"\$(?P<var>\w+)"
+
 
 class Plan:
     _state: KernelArguments = PrivateAttr()
@@ -33,6 +44,8 @@ class Plan:
     _description: str = PrivateAttr()
     _is_prompt: bool = PrivateAttr()
     _prompt_execution_settings: PromptExecutionSettings = PrivateAttr()
+    _max_parallelism: int = PrivateAttr()
+    _cache: Optional["PlanCache"] = PrivateAttr()
     DEFAULT_RESULT_KEY: ClassVar[str] = "PLAN.RESULT"
 
     @property
@@ -86,6 +99,24 @@ class Plan:
     def next_step_index(self) -> int:
         return self._next_step_index
 
+    @property
+    def max_parallelism(self) -> int:
+        return self._max_parallelism
+
+    @max_parallelism.setter
+    def max_parallelism(self, value: int) -> None:
+        if value < 1:
+            raise PlannerInvalidConfigurationError(f"max_parallelism must be at least 1, got {value}")
+        self._max_parallelism = value
+
+    @property
+    def cache(self) -> Optional["PlanCache"]:
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: Optional["PlanCache"]) -> None:
+        self._cache = value
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -97,6 +128,8 @@ class Plan:
         outputs: Optional[List[str]] = None,
         steps: Optional[List["Plan"]] = None,
         function: Optional[KernelFunction] = None,
+        max_parallelism: Optional[int] = None,
+        cache: Optional["PlanCache"] = None,
     ) -> None:
         self._name = f"plan_{generate_random_ascii_name()}" if name is None else name
         self._plugin_name = f"p_{generate_random_ascii_name()}" if plugin_name is None else plugin_name
@@ -110,6 +143,8 @@ class Plan:
         self._is_prompt = None
         self._function = function or None
         self._prompt_execution_settings = None
+        self.max_parallelism = 1 if max_parallelism is None else max_parallelism
+        self._cache = cache
 
         if function is not None:
             self.set_function(function)
@@ -124,6 +159,84 @@ class Plan:
         plan.set_function(function)
         return plan
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the plan as a dictionary, functions are referred to by plugin and function name.
+
+        Returns:
+            Dict[str, Any]: The plan.
+        """
+        return {
+            "name": self._name,
+            "plugin_name": self._plugin_name,
+            "description": self._description,
+            "next_step_index": self._next_step_index,
+            "state": dict(self._state),
+            "parameters": dict(self._parameters),
+            "outputs": list(self._outputs),
+            "steps": [step.to_dict() for step in self._steps],
+            "max_parallelism": self._max_parallelism,
+            "is_function": self._function is not None,
+        }
+
+    def to_json(self) -> str:
+        """
+        Serialize the plan to a JSON string, values that are not JSON are stored as their text.
+
+        Returns:
+            str: The JSON string.
+        """
+        return json.dumps(self.to_dict(), default=str)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], kernel: Kernel) -> "Plan":
+        """
+        Create a plan from a dictionary made by to_dict, with the functions of the kernel.
+
+        Args:
+            data (Dict[str, Any]): The plan.
+            kernel (Kernel): The kernel with the functions of the plan.
+
+        Returns:
+            Plan: The plan.
+
+        Raises:
+            PlannerInvalidPlanError: If a function of the plan is not in the kernel.
+        """
+        plan = cls(
+            name=data["name"],
+            plugin_name=data["plugin_name"],
+            description=data["description"],
+            next_step_index=data["next_step_index"],
+            state=KernelArguments(**data["state"]),
+            parameters=KernelArguments(**data["parameters"]),
+            outputs=data["outputs"],
+            steps=[cls.from_dict(step, kernel) for step in data["steps"]],
+            max_parallelism=data.get("max_parallelism"),
+        )
+        if data.get("is_function"):
+            try:
+                plan.set_function(kernel.plugins[plan.plugin_name][plan.name])
+            except KeyError as exc:
+                raise PlannerInvalidPlanError(
+                    f"Failed to find function '{plan.name}' in plugin '{plan.plugin_name}'."
+                ) from exc
+        return plan
+
+    @classmethod
+    def from_json(cls, json_str: str, kernel: Kernel) -> "Plan":
+        """
+        Create a plan from a JSON string made by to_json, with the functions of the kernel.
+
+        Args:
+            json_str (str): The JSON string.
+            kernel (Kernel): The kernel with the functions of the plan.
+
+        Returns:
+            Plan: The plan.
+        """
+        return cls.from_dict(json.loads(json_str), kernel)
+
     async def invoke(
         self,
         kernel: Kernel,
@@ -157,6 +270,8 @@ class Plan:
                     exc,
                 ) from exc
             return result
+        elif self._max_parallelism > 1 and len(self._steps) - self._next_step_index > 1:
+            return await self._invoke_steps_concurrently(kernel, arguments)
         else:
             # loop through steps until completion
             partial_results = []
@@ -253,6 +368,21 @@ class Plan:
         # merge the state with the current context variables for step execution
         arguments = self.get_next_step_arguments(arguments, step)
 
+        result = await self._invoke_step(kernel, step, arguments)
+        self._update_state_with_step_result(self._state, step, result)
+
+        # Increment the step
+        self._next_step_index += 1
+        return result
+
+    async def _invoke_step(self, kernel: Kernel, step: "Plan", arguments: KernelArguments) -> FunctionResult:
+        key = None
+        if self._cache is not None and self._cache.is_cacheable(step):
+            key = self._cache.get_step_key(step.metadata, arguments)
+            cached_result = await self._cache.get_step_result(key)
+            if cached_result is not None:
+                logger.debug(f"Using the memoized result of plan step {step.plugin_name}.{step.name}")
+                return FunctionResult(function=step.metadata, value=cached_result, metadata={"cached": True})
         try:
             result = await step.invoke(kernel, arguments)
         except Exception as exc:
@@ -260,20 +390,117 @@ class Plan:
                 "Error occurred while running plan step: " + str(exc),
                 exc,
             ) from exc
+        if key is not None and "error" not in result.metadata:
+            await self._cache.set_step_result(key, result.value)
+        return result
 
+    def _update_state_with_step_result(self, state: KernelArguments, step: "Plan", result: FunctionResult) -> None:
         # Update state with result
-        self._state["input"] = str(result)
+        state["input"] = str(result)
 
         # Update plan result in state with matching outputs (if any)
         if set(self._outputs).intersection(set(step._outputs)):
             current_plan_result = ""
-            if Plan.DEFAULT_RESULT_KEY in self._state:
-                current_plan_result = self._state[Plan.DEFAULT_RESULT_KEY]
-            self._state[Plan.DEFAULT_RESULT_KEY] = current_plan_result.strip() + str(result)
+            if Plan.DEFAULT_RESULT_KEY in state:
+                current_plan_result = state[Plan.DEFAULT_RESULT_KEY]
+            state[Plan.DEFAULT_RESULT_KEY] = current_plan_result.strip() + str(result)
+
+    def _record_step_result(
+        self, state: KernelArguments, arguments: KernelArguments, step: "Plan", result: FunctionResult
+    ) -> KernelArguments:
+        """Update the state and arguments with the result of a step the way invoke does when it runs the steps
+        in order, the arguments are those the step was invoked after."""
+        self.add_variables_to_state(state, arguments)
+        self._update_state_with_step_result(state, step, result)
+        if result:
+            state[Plan.DEFAULT_RESULT_KEY] = str(result)
+            arguments = self._update_arguments_with_step_outputs(arguments, step, state)
+        return arguments
 
-        # Increment the step
-        self._next_step_index += 1
-        return result
+    async def _invoke_steps_concurrently(self, kernel: Kernel, arguments: KernelArguments) -> FunctionResult:
+        """Invoke the remaining steps, running up to max_parallelism steps that do not depend on each other at once.
+
+        A step gets the arguments it would get when the steps run in order, computed from the results of the
+        steps it depends on, and the state and arguments are updated with the results in step order once all
+        steps are done, so the result is the same as when the steps run in order.
+        """
+        steps = self._steps[self._next_step_index :]
+        dependencies = self._get_step_dependencies(steps)
+        results: Dict[int, FunctionResult] = {}
+        running: Dict["asyncio.Future[FunctionResult]", int] = {}
+        waiting = list(range(len(steps)))
+        try:
+            while waiting or running:
+                for index in [index for index in waiting if dependencies[index].issubset(results)]:
+                    if len(running) >= self._max_parallelism:
+                        break
+                    waiting.remove(index)
+                    step_arguments = self._get_concurrent_step_arguments(
+                        arguments, [(steps[i], results[i]) for i in sorted(dependencies[index])], steps[index]
+                    )
+                    logger.info(f"Invoking step: {steps[index].name} with arguments: {step_arguments}")
+                    running[asyncio.ensure_future(self._invoke_step(kernel, steps[index], step_arguments))] = index
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=running.__getitem__):
+                    results[running.pop(task)] = task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            # wait for the cancelled steps, so they do not outlive the plan and their errors are retrieved
+            await asyncio.gather(*running, return_exceptions=True)
+
+        partial_results = []
+        for index, step in enumerate(steps):
+            arguments = self._record_step_result(self._state, arguments, step, results[index])
+            if results[index]:
+                partial_results.append(results[index])
+        self._next_step_index = len(self._steps)
+        logger.info(f"updated arguments: {arguments}")
+
+        result_string = str(partial_results[-1]) if len(partial_results) > 0 else ""
+        return FunctionResult(function=self.metadata, value=result_string, metadata={"results": partial_results})
+
+    def _get_concurrent_step_arguments(
+        self, arguments: KernelArguments, previous_results: List[Tuple["Plan", FunctionResult]], step: "Plan"
+    ) -> KernelArguments:
+        state = copy(self._state)
+        arguments = copy(arguments)
+        for previous_step, result in previous_results:
+            arguments = self._record_step_result(state, arguments, previous_step, result)
+        arguments = copy(arguments)
+        self.add_variables_to_state(state, arguments)
+        return self._get_step_arguments(arguments, step, state)
+
+    def _get_step_dependencies(self, steps: List["Plan"]) -> List[Set[int]]:
+        """Get the indexes of the steps each step depends on, directly or through other steps.
+
+        A step depends on the earlier steps that write a variable it reads. Every step writes the input, the plan
+        result and its outputs. A function only gets the arguments of its parameters, so a step reads those and
+        the variables the values of its parameters refer to, except the input when the step binds it, a step
+        that is a plan itself may read anything.
+        """
+        dependencies: List[Set[int]] = []
+        for index, step in enumerate(steps):
+            reads = self._get_step_reads(step)
+            step_dependencies: Set[int] = set()
+            for previous_index in range(index):
+                previous_writes = {"input", Plan.DEFAULT_RESULT_KEY, *steps[previous_index]._outputs}
+                if reads is None or not reads.isdisjoint(previous_writes):
+                    step_dependencies.add(previous_index)
+                    step_dependencies.update(dependencies[previous_index])
+            dependencies.append(step_dependencies)
+        return dependencies
+
+    @staticmethod
+    def _get_step_reads(step: "Plan") -> Optional[Set[str]]:
+        if step._function is None:
+            return None
+        reads = {param.name for param in step.metadata.parameters}
+        if step._parameters.get("input"):
+            reads.discard("input")
+        for value in step._parameters.values():
+            reads.update(match.group("var") for match in re.finditer(VARIABLES_REGEX, str(value)))
+        return reads
 
     def add_variables_to_state(self, state: KernelArguments, variables: KernelArguments) -> None:
         for key in variables.keys():
@@ -281,21 +508,29 @@ class Plan:
                 state[key] = variables[key]
 
     def update_arguments_with_outputs(self, arguments: KernelArguments) -> KernelArguments:
-        if Plan.DEFAULT_RESULT_KEY in self._state:
-            result_string = self._state[Plan.DEFAULT_RESULT_KEY]
+        return self._update_arguments_with_step_outputs(arguments, self._steps[self._next_step_index - 1], self._state)
+
+    def _update_arguments_with_step_outputs(
+        self, arguments: KernelArguments, step: "Plan", state: KernelArguments
+    ) -> KernelArguments:
+        if Plan.DEFAULT_RESULT_KEY in state:
+            result_string = state[Plan.DEFAULT_RESULT_KEY]
         else:
-            result_string = str(self._state)
+            result_string = str(state)
 
         arguments["input"] = result_string
 
-        for item in self._steps[self._next_step_index - 1]._outputs:
-            if item in self._state:
-                arguments[item] = self._state[item]
+        for item in step._outputs:
+            if item in state:
+                arguments[item] = state[item]
             else:
                 arguments[item] = result_string
         return arguments
 
     def get_next_step_arguments(self, arguments: KernelArguments, step: "Plan") -> KernelArguments:
+        return self._get_step_arguments(arguments, step, self._state)
+
+    def _get_step_arguments(self, arguments: KernelArguments, step: "Plan", state: KernelArguments) -> KernelArguments:
         # Priority for Input
         # - Parameters (expand from variables if needed)
         # - KernelArguments
@@ -305,9 +540,9 @@ class Plan:
         input_ = None
         step_input_value = step._parameters.get("input")
         variables_input_value = arguments.get("input")
-        state_input_value = self._state.get("input")
+        state_input_value = state.get("input")
         if step_input_value and step_input_value != "":
-            input_ = step_input_value
+            input_ = self.expand_from_arguments(arguments, step_input_value)
         elif variables_input_value and variables_input_value != "":
             input_ = variables_input_value
         elif state_input_value and state_input_value != "":
@@ -328,12 +563,13 @@ class Plan:
         if function_params:
             logger.debug(f"Function parameters: {function_params.parameters}")
             for param in function_params.parameters:
+                if param.name == "input" and step_input_value:
+                    # the input the step binds comes first
+                    continue
                 if param.name in arguments:
                     step_arguments[param.name] = arguments[param.name]
-                elif param.name in self._state and (
-                    self._state[param.name] is not None and self._state[param.name] != ""
-                ):
-                    step_arguments[param.name] = self._state[param.name]
+                elif param.name in state and (state[param.name] is not None and state[param.name] != ""):
+                    step_arguments[param.name] = state[param.name]
         logger.debug(f"Added other parameters: {step_arguments}")
 
         for param_name, param_val in step.parameters.items():
@@ -342,8 +578,8 @@ class Plan:
 
             if param_name in arguments:
                 step_arguments[param_name] = param_val
-            elif param_name in self._state:
-                step_arguments[param_name] = self._state[param_name]
+            elif param_name in state:
+                step_arguments[param_name] = state[param_name]
             else:
                 expanded_value = self.expand_from_arguments(arguments, param_val)
                 step_arguments[param_name] = expanded_value
@@ -358,8 +594,7 @@ class Plan:
 
     def expand_from_arguments(self, arguments: KernelArguments, input_from_step: Any) -> str:
         result = input_from_step
-        variables_regex = r"\$(?P<var>\w+)"
-        matches = [m for m in re.finditer(variables_regex, str(input_from_step))]
+        matches = [m for m in re.finditer(VARIABLES_REGEX, str(input_from_step))]
         ordered_matches = sorted(matches, key=lambda m: len(m.group("var")), reverse=True)
 
         for match in ordered_matches:
@@ -1,7 +1,11 @@
 from semantic_kernel.planners.sequential_planner.sequential_planner import (
     SequentialPlanner,
 )
+from semantic_kernel.planners.sequential_planner.sequential_planner_function_index import (
+    SequentialPlannerFunctionIndex,
+)
 
 __all__ = [
     "SequentialPlanner",
+    "SequentialPlannerFunctionIndex",
 ]
@@ -97,6 +97,19 @@ class SequentialPlanner:
         relevant_function_manual = await KernelContextExtension.get_functions_manual(
             self._kernel, self._arguments, goal, self.config
         )
+        plan_cache = self.config.plan_cache
+        if plan_cache is not None:
+            plan_key = plan_cache.get_plan_key(
+                goal,
+                relevant_function_manual,
+                self._function_flow_function.prompt_template.prompt_template_config.template,
+                str(self.config.allow_missing_functions),
+            )
+            plan = await plan_cache.get_plan(plan_key, self._kernel)
+            if plan is not None:
+                plan.cache = plan_cache
+                return plan
+
         self._arguments["available_functions"] = relevant_function_manual
         self._arguments["input"] = goal
 
@@ -127,6 +140,9 @@ class SequentialPlanner:
                     f"Goal:{goal}\nFunctions:\n{relevant_function_manual}",
                 )
 
+            if plan_cache is not None:
+                await plan_cache.set_plan(plan_key, plan)
+                plan.cache = plan_cache
             return plan
 
         except PlannerException as e:
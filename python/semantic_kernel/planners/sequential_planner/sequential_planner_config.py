@@ -1,6 +1,12 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from typing import Callable, List, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+if TYPE_CHECKING:
+    from semantic_kernel.caching.plan_cache import PlanCache
+    from semantic_kernel.planners.sequential_planner.sequential_planner_function_index import (
+        SequentialPlannerFunctionIndex,
+    )
 
 
 class SequentialPlannerConfig:
@@ -15,6 +21,8 @@ class SequentialPlannerConfig:
         allow_missing_functions: bool = False,
         get_available_functions: Callable = None,
         get_plugin_function: Callable = None,
+        function_index: Optional["SequentialPlannerFunctionIndex"] = None,
+        plan_cache: Optional["PlanCache"] = None,
     ):
         self.relevancy_threshold: float = relevancy_threshold
         self.max_relevant_functions: int = max_relevant_functions
@@ -25,3 +33,7 @@ class SequentialPlannerConfig:
         self.allow_missing_functions: bool = allow_missing_functions
         self.get_available_functions = get_available_functions
         self.get_plugin_function = get_plugin_function
+        # finds the functions relevant for the goal when a relevancy_threshold is set
+        self.function_index = function_index
+        # reuses the plans of repeated goals and memoizes the cacheable steps of the plans
+        self.plan_cache = plan_cache
@@ -17,6 +17,12 @@ logger: logging.Logger = logging.getLogger(__name__)
 class SequentialPlannerFunctionExtension:
     @staticmethod
     def to_manual_string(function: KernelFunctionMetadata):
+        return function.get_derived_value(
+            "sequential_planner_manual", lambda: SequentialPlannerFunctionExtension._create_manual_string(function)
+        )
+
+    @staticmethod
+    def _create_manual_string(function: KernelFunctionMetadata):
         inputs = [
             f"  - {parameter.name}: {parameter.description}"
             + (f" (default value: {parameter.default_value})" if parameter.default_value else "")
@@ -82,16 +88,25 @@ class SequentialPlannerKernelExtension:
             # If a Memory provider has not been registered, return all available functions.
             return available_functions
 
+        memories = None
+        if config.function_index is not None:
+            memories = await config.function_index.search(
+                kernel.plugins,
+                semantic_query,
+                limit=config.max_relevant_functions,
+                min_relevance_score=config.relevancy_threshold,
+            )
+
         # Add functions that were found in the search results.
         relevant_functions = await SequentialPlannerKernelExtension.get_relevant_functions(
             kernel,
             available_functions,
+            memories,
         )
 
         # Add any missing functions that were included but not found in the search results.
-        missing_functions = [
-            func for func in included_functions if func not in [func.name for func in relevant_functions]
-        ]
+        relevant_names = {func.name for func in relevant_functions}
+        missing_functions = [func for func in included_functions if func not in relevant_names]
 
         relevant_functions += [func for func in available_functions if func.name in missing_functions]
 
@@ -107,15 +122,11 @@ class SequentialPlannerKernelExtension:
         # TODO: cancellation
         if memories is None:
             return relevant_functions
+        functions_by_name = {
+            SequentialPlannerFunctionExtension.to_fully_qualified_name(func): func for func in available_functions
+        }
         for memory_entry in memories:
-            function = next(
-                (
-                    func
-                    for func in available_functions
-                    if SequentialPlannerFunctionExtension.to_fully_qualified_name(func) == memory_entry.id
-                ),
-                None,
-            )
+            function = functions_by_name.get(memory_entry.id)
             if function is not None:
                 logger.debug(
                     "Found relevant function. Relevance Score: {0}, Function: {1}".format(
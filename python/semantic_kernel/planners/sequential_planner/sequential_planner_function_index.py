@@ -0,0 +1,125 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.functions.kernel_plugin_collection import KernelPluginCollection
+from semantic_kernel.memory.memory_query_result import MemoryQueryResult
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from semantic_kernel.planners.sequential_planner.sequential_planner_extensions import (
+    SequentialPlannerFunctionExtension,
+    SequentialPlannerKernelExtension,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class SequentialPlannerFunctionIndex:
+    """Index of the embeddings of the functions of a kernel, used to find the functions relevant for a goal.
+
+    The embedding of a function is computed from its embedding string once and stored in the memory store. When
+    the plugins change, only the functions that were added or whose embedding string changed are embedded again
+    and the functions that were removed are removed from the store.
+    """
+
+    def __init__(
+        self,
+        memory_store: MemoryStoreBase,
+        embedding_generator: EmbeddingGeneratorBase,
+        collection_name: str = SequentialPlannerKernelExtension.PLANNER_MEMORY_COLLECTION_NAME,
+    ) -> None:
+        """
+        Initializes a new instance of the SequentialPlannerFunctionIndex class.
+
+        Args:
+            memory_store (MemoryStoreBase): The store of the embeddings, the collection is used only by this index.
+            embedding_generator (EmbeddingGeneratorBase): Embeds the functions and the goals.
+            collection_name (str, optional): The collection of the embeddings.
+        """
+        self.memory_store = memory_store
+        self.embedding_generator = embedding_generator
+        self.collection_name = collection_name
+        self._plugins: Optional[KernelPluginCollection] = None
+        self._plugins_version: Optional[int] = None
+        # the embedding string of every indexed function by fully qualified name
+        self._indexed: Dict[str, str] = {}
+        self._lock = asyncio.Lock()
+
+    async def update(self, plugins: KernelPluginCollection) -> None:
+        """Bring the index up to date with the functions in the plugins.
+
+        Args:
+            plugins (KernelPluginCollection): The plugins of the kernel.
+        """
+        async with self._lock:
+            if plugins is self._plugins and plugins.version == self._plugins_version:
+                return
+            version = plugins.version
+            functions = {
+                SequentialPlannerFunctionExtension.to_fully_qualified_name(
+                    function
+                ): SequentialPlannerFunctionExtension.to_embedding_string(function)
+                for function in plugins.get_list_of_function_metadata()
+            }
+            if not await self.memory_store.does_collection_exist(self.collection_name):
+                await self.memory_store.create_collection(self.collection_name)
+                self._indexed = {}
+
+            changed = [name for name, text in functions.items() if self._indexed.get(name) != text]
+            if changed:
+                logger.debug(f"Embedding {len(changed)} functions for the planner function index")
+                embeddings = await self.embedding_generator.generate_embeddings([functions[name] for name in changed])
+                await self.memory_store.upsert_batch(
+                    self.collection_name,
+                    [
+                        MemoryRecord.local_record(
+                            id=name,
+                            text=functions[name],
+                            description=None,
+                            additional_metadata=None,
+                            embedding=embedding,
+                        )
+                        for name, embedding in zip(changed, embeddings)
+                    ],
+                )
+            removed = [name for name in self._indexed if name not in functions]
+            if removed:
+                await self.memory_store.remove_batch(self.collection_name, removed)
+
+            self._indexed = functions
+            self._plugins = plugins
+            self._plugins_version = version
+
+    async def search(
+        self,
+        plugins: KernelPluginCollection,
+        query: str,
+        limit: int,
+        min_relevance_score: float,
+    ) -> List[MemoryQueryResult]:
+        """Get the functions most relevant for the query, the index is updated first when the plugins changed.
+
+        Args:
+            plugins (KernelPluginCollection): The plugins of the kernel.
+            query (str): The goal.
+            limit (int): The maximum number of functions.
+            min_relevance_score (float): The minimum relevance of the functions.
+
+        Returns:
+            List[MemoryQueryResult]: The matches, the id is the fully qualified name of the function.
+        """
+        await self.update(plugins)
+        if not self._indexed:
+            return []
+        query_embedding = (await self.embedding_generator.generate_embeddings([query]))[0]
+        matches = await self.memory_store.get_nearest_matches(
+            collection_name=self.collection_name,
+            embedding=query_embedding,
+            limit=limit,
+            min_relevance_score=min_relevance_score,
+            with_embeddings=False,
+        )
+        return [MemoryQueryResult.from_memory_record(record, relevance) for record, relevance in matches]
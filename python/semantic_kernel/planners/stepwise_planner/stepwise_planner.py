@@ -6,7 +6,8 @@ import logging
 import os
 import re
 import sys
-from typing import TYPE_CHECKING, Dict, List, Optional
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -24,6 +25,7 @@ from semantic_kernel.functions.kernel_function_decorator import kernel_function
 from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
 from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
 from semantic_kernel.kernel import Kernel
+from semantic_kernel.kernel_pydantic import DerivedValueCache
 from semantic_kernel.planners.plan import Plan
 from semantic_kernel.planners.stepwise_planner.stepwise_planner_config import (
     StepwisePlannerConfig,
@@ -66,6 +68,33 @@ def is_null_or_empty(value: Optional[str] = None) -> bool:
     return value is None or value == ""
 
 
+class IterationPacer:
+    """Paces iterations to a minimum duration, sleeping only for the part of it an iteration did not take."""
+
+    def __init__(
+        self,
+        min_iteration_time: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.min_iteration_time = min_iteration_time
+        self._clock = clock
+        self._sleep = sleep
+        self._started: Optional[float] = None
+
+    def start(self) -> None:
+        """Mark the start of an iteration."""
+        self._started = self._clock()
+
+    async def wait(self) -> None:
+        """Wait until the minimum duration of the iteration that was started has passed."""
+        if self._started is None or self.min_iteration_time <= 0:
+            return
+        remaining = self.min_iteration_time - (self._clock() - self._started)
+        if remaining > 0:
+            await self._sleep(remaining)
+
+
 class StepwisePlanner:
     config: StepwisePlannerConfig
     _arguments: "KernelArguments"
@@ -98,6 +127,12 @@ class StepwisePlanner:
         self._native_functions = self._kernel.import_plugin_from_object(self, RESTRICTED_PLUGIN_NAME)
 
         self._context = KernelArguments()
+        self._arguments = KernelArguments()
+        self._clock: Callable[[], float] = time.monotonic
+        self._sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+        self._derived_values = DerivedValueCache()
+        # the token counts of the entries of the scratch pad of the plan being executed
+        self._token_counts: Dict[str, int] = {}
 
     @property
     def metadata(self) -> KernelFunctionMetadata:
@@ -143,8 +178,14 @@ class StepwisePlanner:
         function_descriptions: Annotated[List[str], "List of tool descriptions"],
     ) -> FunctionResult:
         steps_taken: List[SystemStep] = []
+        self._arguments = KernelArguments(question=question, function_descriptions=function_descriptions)
+        self._token_counts = {}
+        pacer = IterationPacer(self.config.min_iteration_time_ms / 1000, self._clock, self._sleep)
         if not is_null_or_empty(question):
             for i in range(self.config.max_iterations):
+                if i > 0:
+                    await pacer.wait()
+                pacer.start()
                 scratch_pad = self.create_scratch_pad(question, steps_taken)
 
                 self._arguments["agent_scratch_pad"] = scratch_pad
@@ -187,7 +228,6 @@ class StepwisePlanner:
                     )
 
                     try:
-                        await asyncio.sleep(self.config.min_iteration_time_ms / 1000)
                         result = await self.invoke_action(next_step.action, next_step.action_variables)
 
                         if is_null_or_empty(result):
@@ -203,9 +243,6 @@ class StepwisePlanner:
                 else:
                     logger.info("Action: No action to take")
 
-                # sleep 3 seconds
-                await asyncio.sleep(self.config.min_iteration_time_ms / 1000)
-
             steps_taken_str = json.dumps([s.__dict__ for s in steps_taken], indent=4)
             self._arguments["input"] = f"Result not found, review _steps_taken to see what happened.\n{steps_taken_str}"
         else:
@@ -286,34 +323,23 @@ class StepwisePlanner:
         if len(steps_taken) == 0:
             return ""
 
-        scratch_pad_lines: List[str] = []
-
         # Add the original first thought
-        scratch_pad_lines.append(SCRATCH_PAD_PREFIX)
-        scratch_pad_lines.append(f"{THOUGHT}\n{steps_taken[0].thought}")
-
-        # Keep track of where to insert the next step
-        insert_point = len(scratch_pad_lines)
+        scratch_pad_lines: List[str] = [SCRATCH_PAD_PREFIX, f"{THOUGHT}\n{steps_taken[0].thought}"]
+        token_count = sum(self._count_tokens(line) for line in scratch_pad_lines)
+        token_budget = self.config.max_tokens * 0.75
 
+        # Add the most recent steps that fit in the budget, the last step is always added
+        entries: List[str] = []
         for i in reversed(range(len(steps_taken))):
-            if len(scratch_pad_lines) / 4.0 > (self.config.max_tokens * 0.75):
+            entry, entry_token_count = self._create_scratch_pad_entry(steps_taken[i], include_thought=i != 0)
+            if entries and token_count + entry_token_count > token_budget:
                 logger.debug(f"Scratchpad is too long, truncating. Skipping {i + 1} steps.")
                 break
+            if entry:
+                entries.append(entry)
+            token_count += entry_token_count
 
-            s = steps_taken[i]
-
-            if not is_null_or_empty(s.observation):
-                scratch_pad_lines.insert(insert_point, f"{OBSERVATION}\n{s.observation}")
-
-            if not is_null_or_empty(s.action):
-                scratch_pad_lines.insert(
-                    insert_point,
-                    f'{ACTION}\n{{"action": "{s.action}", "action_variables": {json.dumps(s.action_variables)}}}',
-                )
-
-            if i != 0:
-                scratch_pad_lines.insert(insert_point, f"{THOUGHT}\n{s.thought}")
-
+        scratch_pad_lines.extend(reversed(entries))
         scratch_pad = "\n".join(scratch_pad_lines).strip()
 
         if not (is_null_or_empty(scratch_pad.strip())):
@@ -321,18 +347,33 @@ class StepwisePlanner:
 
         return scratch_pad
 
+    def _create_scratch_pad_entry(self, step: SystemStep, include_thought: bool) -> Tuple[str, int]:
+        lines: List[str] = []
+        if include_thought:
+            lines.append(f"{THOUGHT}\n{step.thought}")
+        if not is_null_or_empty(step.action):
+            lines.append(
+                f'{ACTION}\n{{"action": "{step.action}", "action_variables": {json.dumps(step.action_variables)}}}'
+            )
+        if not is_null_or_empty(step.observation):
+            lines.append(f"{OBSERVATION}\n{step.observation}")
+        entry = "\n".join(lines)
+        return entry, self._count_tokens(entry)
+
+    def _count_tokens(self, text: str) -> int:
+        # steps do not change once they are in the scratch pad, so their entries are only counted once
+        token_count = self._token_counts.get(text)
+        if token_count is None:
+            token_count = self._token_counts[text] = self.config.token_counter(text)
+        return token_count
+
     async def invoke_action(self, action_name: str, action_variables: Dict[str, str]) -> str:
-        available_functions = self.get_available_functions()
-        target_function = next(
-            (f for f in available_functions if self.to_fully_qualified_name(f) == action_name),
-            None,
-        )
+        function = self.get_available_function_map().get(action_name)
 
-        if target_function is None:
+        if function is None:
             raise PlannerExecutionException(f"The function '{action_name}' was not found.")
 
         try:
-            function = self._kernel.func(target_function.plugin_name, target_function.name)
             action_arguments = self.create_action_arguments(action_variables)
 
             result = await function.invoke(self._kernel, action_arguments)
@@ -341,14 +382,12 @@ class StepwisePlanner:
                 logger.error(f"Error occurred: {result.metadata['error']}")
                 return f"Error occurred: {result.metadata['error']}"
 
-            logger.debug(f"Invoked {target_function.name}. Result: {result}")
+            logger.debug(f"Invoked {function.name}. Result: {result}")
 
             return str(result)
 
         except Exception as e:
-            error_msg = (
-                f"Something went wrong in system step: {target_function.plugin_name}.{target_function.name}. Error: {e}"
-            )
+            error_msg = f"Something went wrong in system step: {function.plugin_name}.{function.name}. Error: {e}"
             logger.error(error_msg)
             return error_msg
 
@@ -375,6 +414,24 @@ class StepwisePlanner:
 
         return available_functions
 
+    def get_available_function_map(self) -> Dict[str, "KernelFunction"]:
+        """Get the available functions by fully qualified name, cached until the plugins or exclusions change."""
+        if self._kernel.plugins is None:
+            raise PlannerCreatePlanError("Plugin collection not found in the kernel")
+
+        return self._derived_values.get(
+            "available_functions",
+            (
+                self._kernel.plugins.version,
+                tuple(self.config.excluded_plugins or []),
+                tuple(self.config.excluded_functions or []),
+            ),
+            lambda: {
+                self.to_fully_qualified_name(function): self._kernel.func(function.plugin_name, function.name)
+                for function in self.get_available_functions()
+            },
+        )
+
     def get_function_descriptions(self) -> str:
         available_functions = self.get_available_functions()
 
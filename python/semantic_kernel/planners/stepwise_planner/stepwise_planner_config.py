@@ -1,6 +1,11 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from typing import List, Optional
+from typing import Callable, List, Optional
+
+
+def _token_counter(text: str) -> int:
+    """A rough estimate of the number of tokens in a text."""
+    return len(text) // 4
 
 
 class StepwisePlannerConfig:
@@ -14,6 +19,7 @@ class StepwisePlannerConfig:
         max_tokens: int = 1024,
         max_iterations: int = 100,
         min_iteration_time_ms: int = 0,
+        token_counter: Optional[Callable[[str], int]] = None,
     ):
         self.relevancy_threshold: float = relevancy_threshold
         self.max_relevant_functions: int = max_relevant_functions
@@ -23,3 +29,4 @@ class StepwisePlannerConfig:
         self.max_tokens: int = max_tokens
         self.max_iterations: int = max_iterations
         self.min_iteration_time_ms: int = min_iteration_time_ms
+        self.token_counter: Callable[[str], int] = token_counter or _token_counter
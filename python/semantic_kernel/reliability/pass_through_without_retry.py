@@ -14,17 +14,17 @@ logger: logging.Logger = logging.getLogger(__name__)
 class PassThroughWithoutRetry(RetryMechanismBase, KernelBaseModel):
     """A retry mechanism that does not retry."""
 
-    async def execute_with_retry(self, action: Callable[[], Awaitable[T]]) -> Awaitable[T]:
+    async def execute_with_retry(self, action: Callable[[], Awaitable[T]]) -> T:
         """Executes the given action with retry logic.
 
         Arguments:
             action {Callable[[], Awaitable[T]]} -- The action to retry on exception.
 
         Returns:
-            Awaitable[T] -- An awaitable that will return the result of the action.
+            T -- The result of the action.
         """
         try:
-            await action()
+            return await action()
         except Exception as e:
-            logger.warning(e, "Error executing action, not retrying")
+            logger.warning(f"Error executing action, not retrying: {e}")
             raise e
@@ -0,0 +1,204 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Deque, Optional
+
+from pydantic import Field, PrivateAttr
+
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class TokenBucket(KernelBaseModel):
+    """A bucket that refills continuously with refill_per_second up to its capacity.
+
+    The level can drop below zero when more was used than was reserved,
+    the deficit is then paid back by the refill before new reservations are possible.
+    """
+
+    capacity: float = Field(gt=0)
+    refill_per_second: float = Field(gt=0)
+    _level: float = PrivateAttr()
+    _updated_at: Optional[float] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Optional[object] = None):
+        self._level = self.capacity
+
+    @property
+    def level(self) -> float:
+        return self._level
+
+    def time_until_available(self, amount: float, now: float) -> float:
+        """Get the number of seconds until amount can be taken from the bucket.
+
+        Amounts larger than the capacity only wait for a full bucket, otherwise they would never fit.
+        """
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self._level >= amount:
+            return 0.0
+        return (amount - self._level) / self.refill_per_second
+
+    def consume(self, amount: float, now: float) -> None:
+        """Take amount from the bucket, a negative amount gives back to the bucket."""
+        self._refill(now)
+        self._level = min(self.capacity, self._level - amount)
+
+    def _refill(self, now: float) -> None:
+        if self._updated_at is not None and now > self._updated_at:
+            self._level = min(self.capacity, self._level + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+
+
+class RateLimitLease(KernelBaseModel):
+    """A granted request slot, the caller records the outcome of the request on it before it is released."""
+
+    estimated_tokens: int = 0
+    used_tokens: Optional[int] = None
+    rate_limited: bool = False
+    retry_after: Optional[float] = None
+
+
+class RateLimiter(KernelBaseModel):
+    """Client side rate limiter for AI services.
+
+    Requests wait, first come first served, until there is room in the requests-per-minute bucket,
+    the tokens-per-minute bucket and the concurrency limit. The token bucket is charged with the
+    estimated tokens up front and corrected with the actual usage when the lease is released.
+
+    The concurrency limit adapts with additive increase, multiplicative decrease (AIMD):
+    every successful request raises it by 1/limit (so by about one per round of requests),
+    every rate limited request multiplies it by concurrency_backoff, and new requests are held
+    back until the retry-after time the service sent has passed.
+
+    clock and sleep can be replaced, for instance with a fake clock in tests.
+    """
+
+    requests_per_minute: Optional[int] = Field(None, gt=0)
+    tokens_per_minute: Optional[int] = Field(None, gt=0)
+    max_concurrency: int = Field(16, gt=0)
+    min_concurrency: int = Field(1, gt=0)
+    concurrency_backoff: float = Field(0.5, gt=0, lt=1)
+    default_retry_after: float = Field(1.0, ge=0)
+    clock: Callable[[], float] = time.monotonic
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+
+    _request_bucket: Optional[TokenBucket] = PrivateAttr(default=None)
+    _token_bucket: Optional[TokenBucket] = PrivateAttr(default=None)
+    _concurrency_limit: float = PrivateAttr()
+    _in_flight: int = PrivateAttr(default=0)
+    _paused_until: float = PrivateAttr(default=0.0)
+    _waiters: Deque[asyncio.Future] = PrivateAttr(default_factory=deque)
+    _slot_released: Optional[asyncio.Future] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Optional[object] = None):
+        if self.requests_per_minute:
+            self._request_bucket = TokenBucket(
+                capacity=self.requests_per_minute, refill_per_second=self.requests_per_minute / 60
+            )
+        if self.tokens_per_minute:
+            self._token_bucket = TokenBucket(
+                capacity=self.tokens_per_minute, refill_per_second=self.tokens_per_minute / 60
+            )
+        self._concurrency_limit = float(self.max_concurrency)
+
+    @property
+    def concurrency_limit(self) -> int:
+        """The number of requests that are currently allowed to run at the same time."""
+        return max(self.min_concurrency, int(self._concurrency_limit))
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests that hold a lease."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """The number of requests waiting for a lease."""
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def limit(self, estimated_tokens: int = 0) -> AsyncIterator[RateLimitLease]:
+        """Wait for a lease and release it when the block exits.
+
+        Record the outcome of the request on the lease (used_tokens, rate_limited, retry_after)
+        inside the block, it is taken into account on release.
+        """
+        lease = await self.acquire(estimated_tokens)
+        try:
+            yield lease
+        finally:
+            self.release(lease)
+
+    async def acquire(self, estimated_tokens: int = 0) -> RateLimitLease:
+        """Wait until the request fits in the limits and take a lease for it.
+
+        Arguments:
+            estimated_tokens {int} -- The number of tokens the request is expected to use.
+
+        Returns:
+            RateLimitLease -- The lease, to be given back with release.
+        """
+        loop = asyncio.get_running_loop()
+        turn = loop.create_future()
+        self._waiters.append(turn)
+        if self._waiters[0] is turn:
+            turn.set_result(None)
+        try:
+            await turn
+            while True:
+                delay = self._time_until_ready(estimated_tokens)
+                if delay > 0:
+                    await self.sleep(delay)
+                    continue
+                if self._in_flight >= self.concurrency_limit:
+                    self._slot_released = loop.create_future()
+                    await self._slot_released
+                    continue
+                break
+            now = self.clock()
+            if self._request_bucket:
+                self._request_bucket.consume(1, now)
+            if self._token_bucket:
+                self._token_bucket.consume(estimated_tokens, now)
+            self._in_flight += 1
+            return RateLimitLease(estimated_tokens=estimated_tokens)
+        finally:
+            self._waiters.remove(turn)
+            if self._waiters and not self._waiters[0].done():
+                self._waiters[0].set_result(None)
+
+    def release(self, lease: RateLimitLease) -> None:
+        """Give back a lease and adapt the limits to the outcome recorded on it."""
+        now = self.clock()
+        self._in_flight -= 1
+        if self._token_bucket and lease.used_tokens is not None:
+            self._token_bucket.consume(lease.used_tokens - lease.estimated_tokens, now)
+        if lease.rate_limited:
+            self._concurrency_limit = max(self.min_concurrency, self._concurrency_limit * self.concurrency_backoff)
+            retry_after = lease.retry_after if lease.retry_after is not None else self.default_retry_after
+            self._paused_until = max(self._paused_until, now + retry_after)
+            logger.info(
+                f"Request was rate limited, concurrency limit lowered to {self.concurrency_limit}, "
+                f"pausing for {retry_after} seconds"
+            )
+        else:
+            self._concurrency_limit = min(
+                self.max_concurrency, self._concurrency_limit + 1 / max(self._concurrency_limit, 1)
+            )
+        if self._slot_released and not self._slot_released.done():
+            self._slot_released.set_result(None)
+
+    def _time_until_ready(self, estimated_tokens: int) -> float:
+        now = self.clock()
+        delay = self._paused_until - now
+        if self._request_bucket:
+            delay = max(delay, self._request_bucket.time_until_available(1, now))
+        if self._token_bucket:
+            delay = max(delay, self._token_bucket.time_until_available(estimated_tokens, now))
+        return max(delay, 0.0)
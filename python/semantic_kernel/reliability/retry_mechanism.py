@@ -0,0 +1,119 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from openai import APIConnectionError
+from pydantic import Field, PrivateAttr
+
+from semantic_kernel.exceptions import ServiceRateLimitException
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.reliability.retry_mechanism_base import RetryMechanismBase
+
+T = TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+RETRYABLE_EXCEPTION_TYPES: Tuple[Type[BaseException], ...] = (
+    ServiceRateLimitException,
+    APIConnectionError,
+    asyncio.TimeoutError,
+    TimeoutError,
+    ConnectionError,
+)
+
+
+class RetryMechanism(RetryMechanismBase, KernelBaseModel):
+    """A retry mechanism with exponential backoff and jitter.
+
+    An action is retried when it raises a transient exception, which is a rate limit, a timeout,
+    a connection error or a response with a 408, 429 or 5xx status code, also when it is wrapped
+    in another exception, like a ServiceResponseException. The delay before the n-th retry is
+    initial_delay * backoff_factor ** (n - 1), capped at max_delay and randomized by +/- jitter,
+    unless the service sent a retry-after time, which is then used instead.
+
+    Retrying stops after max_retries retries or when the next delay would exceed max_elapsed_time,
+    the last exception is then raised.
+
+    clock and sleep can be replaced, for instance with a fake clock in tests.
+    """
+
+    max_retries: int = Field(5, ge=0)
+    initial_delay: float = Field(1.0, ge=0)
+    backoff_factor: float = Field(2.0, ge=1)
+    max_delay: float = Field(60.0, ge=0)
+    jitter: float = Field(0.1, ge=0, le=1)
+    max_elapsed_time: Optional[float] = Field(120.0, ge=0)
+    clock: Callable[[], float] = time.monotonic
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+
+    _retry_count: int = PrivateAttr(default=0)
+    _backoff_time: float = PrivateAttr(default=0.0)
+
+    @property
+    def retry_count(self) -> int:
+        """The total number of retries done by this retry mechanism."""
+        return self._retry_count
+
+    @property
+    def backoff_time(self) -> float:
+        """The total number of seconds spent waiting between retries."""
+        return self._backoff_time
+
+    async def execute_with_retry(self, action: Callable[[], Awaitable[T]]) -> T:
+        """Executes the given action with retry logic.
+
+        Arguments:
+            action {Callable[[], Awaitable[T]]} -- The action to retry on exception.
+
+        Returns:
+            T -- The result of the action.
+        """
+        start = self.clock()
+        attempt = 0
+        while True:
+            try:
+                return await action()
+            except Exception as exc:
+                if attempt >= self.max_retries or not self.should_retry(exc):
+                    raise
+                delay = self.get_delay(attempt, exc)
+                if self.max_elapsed_time is not None and self.clock() - start + delay > self.max_elapsed_time:
+                    logger.warning(f"Not retrying, the maximum elapsed time of {self.max_elapsed_time}s is reached")
+                    raise
+                attempt += 1
+                logger.info(f"Retrying after error, attempt {attempt} of {self.max_retries} in {delay:.2f}s: {exc}")
+                self._retry_count += 1
+                self._backoff_time += delay
+                await self.sleep(delay)
+
+    def should_retry(self, exc: BaseException) -> bool:
+        """Check if the exception, or one of the exceptions it was raised from, is transient."""
+        while exc is not None:
+            if isinstance(exc, RETRYABLE_EXCEPTION_TYPES):
+                return True
+            if getattr(exc, "status_code", None) in RETRYABLE_STATUS_CODES:
+                return True
+            exc = exc.__cause__
+        return False
+
+    def get_delay(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """Get the number of seconds to wait before the next attempt."""
+        retry_after = _get_retry_after(exc)
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.initial_delay * self.backoff_factor**attempt, self.max_delay)
+        return max(delay * (1 + random.uniform(-self.jitter, self.jitter)), 0.0)
+
+
+def _get_retry_after(exc: Optional[BaseException]) -> Optional[float]:
+    """Get the retry-after time from the exception or one of the exceptions it was raised from."""
+    while exc is not None:
+        if isinstance(exc, ServiceRateLimitException) and exc.retry_after is not None:
+            return exc.retry_after
+        exc = exc.__cause__
+    return None
@@ -13,6 +13,7 @@ from pydantic import Field, StringConstraints
 
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.reliability.rate_limiter import RateLimiter
 
 
 class AIServiceClientBase(KernelBaseModel, ABC):
@@ -24,10 +25,13 @@ class AIServiceClientBase(KernelBaseModel, ABC):
     or can just be a string that is used to identify the model in the service.
 
     The service_id is used in Semantic Kernel to identify the service, if empty the ai_model_id is used.
+
+    The rate_limiter is optional, services that support it wait for a lease before sending a request.
     """
 
     ai_model_id: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
     service_id: str = Field("")
+    rate_limiter: Optional[RateLimiter] = Field(None, exclude=True)
 
     def model_post_init(self, __context: Optional[object] = None):
         """Update the service_id if it is not set."""
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Tuple, Union
+from typing import TYPE_CHECKING, Awaitable, Callable, Tuple, TypeVar, Union
 
 from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
@@ -8,6 +8,8 @@ from semantic_kernel.functions.kernel_arguments import KernelArguments
 
 ALL_COMPLETION_SERVICE_TYPES = Union[TextCompletionClientBase, ChatCompletionClientBase]
 
+T = TypeVar("T")
+
 if TYPE_CHECKING:
     from semantic_kernel.functions.kernel_function import KernelFunction
     from semantic_kernel.kernel import Kernel
@@ -18,6 +20,7 @@ class AIServiceSelector:
 
     To use a custom service selector, subclass this class and override the select_ai_service method.
     Make sure that the function signature stays the same.
+    To observe or reroute the requests to the selected service, override the invoke_service method.
     """
 
     def select_ai_service(
@@ -39,3 +42,18 @@ class AIServiceSelector:
                 service_settings = service.get_prompt_execution_settings_from_settings(settings)
                 return service, service_settings
         raise KernelServiceNotFoundError("No service found.")
+
+    async def invoke_service(
+        self,
+        service: ALL_COMPLETION_SERVICE_TYPES,
+        settings: PromptExecutionSettings,
+        call: Callable[[ALL_COMPLETION_SERVICE_TYPES, PromptExecutionSettings], Awaitable[T]],
+        idempotent: bool = True,
+    ) -> T:
+        """Invoke a selected service, call makes the request with the service and settings it is given.
+
+        A call that is not idempotent has side effects, like functions that a chat completion auto-invokes,
+        so it must not be made more than once, for instance to hedge a slow service.
+        The default calls the selected service with the selected settings.
+        """
+        return await call(service, settings)
@@ -0,0 +1,279 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Awaitable, Callable, Deque, Dict, List, Literal, Optional, Tuple, TypeVar
+
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.connectors.ai.text_completion_client_base import TextCompletionClientBase
+from semantic_kernel.exceptions import KernelServiceNotFoundError
+from semantic_kernel.functions.kernel_arguments import KernelArguments
+from semantic_kernel.services.ai_service_selector import ALL_COMPLETION_SERVICE_TYPES, AIServiceSelector
+from semantic_kernel.services.request_latency import record_request_latencies
+
+if TYPE_CHECKING:
+    from semantic_kernel.functions.kernel_function import KernelFunction
+    from semantic_kernel.kernel import Kernel
+
+T = TypeVar("T")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ServiceStats:
+    """Load and health statistics of a single service."""
+
+    def __init__(self, ewma_alpha: float, latency_window: int):
+        self.ewma_alpha = ewma_alpha
+        self.in_flight: int = 0
+        self.ewma_latency: Optional[float] = None
+        self.error_rate: float = 0.0
+        self.latencies: Deque[float] = deque(maxlen=latency_window)
+
+    def record(self, latency: Optional[float], failed: bool) -> None:
+        """Record the outcome of a finished request, the latency is only recorded for successful requests."""
+        self.error_rate += self.ewma_alpha * ((1.0 if failed else 0.0) - self.error_rate)
+        if failed or latency is None:
+            return
+        self.add_latency(latency)
+
+    def add_latency(self, latency: float) -> None:
+        """Record the latency of a single request."""
+        self.latencies.append(latency)
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += self.ewma_alpha * (latency - self.ewma_latency)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Get a percentile of the recent latencies, None if there are none."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(percentile / 100 * len(ordered)))]
+
+
+class LoadBalancingAIServiceSelector(AIServiceSelector):
+    """Service selector that spreads requests over equivalent services.
+
+    The candidates for a request are the services named in the execution settings, where a service_id
+    that is a key in service_groups stands for all services in that group, for instance a group with the
+    AzureChatCompletion services of several regional deployments of the same model.
+
+    For every service the selector tracks the requests in flight, an exponentially weighted moving average
+    (EWMA) of the latency and of the error rate. The load of a service is
+    (in_flight + 1) * ewma_latency * (1 + error_penalty * error_rate), services without a latency yet are
+    tried first. With the "least_loaded" strategy the candidate with the lowest load is used, with
+    "power_of_two" the less loaded of two random candidates, which avoids sending every request to the
+    same service when many are selected at once.
+
+    The latency of a service is the latency of its requests, as reported with report_request_latency, like the
+    OpenAI services do, so the time of functions that a chat completion auto-invokes does not count. For services
+    that do not report their requests it is the duration of the call.
+
+    When hedge_percentile is set and a request to a service in a group takes longer than that percentile of
+    its recent latencies, the same request is also sent to another service of the group; the first to
+    finish is used and the other request is cancelled, or closed when it finished as well. Calls that are not
+    idempotent, like chat completions that auto-invoke functions, are never hedged.
+    """
+
+    def __init__(
+        self,
+        service_groups: Optional[Dict[str, List[str]]] = None,
+        strategy: Literal["least_loaded", "power_of_two"] = "least_loaded",
+        ewma_alpha: float = 0.2,
+        error_penalty: float = 4.0,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 20,
+        latency_window: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+        random_generator: Optional[random.Random] = None,
+    ) -> None:
+        """Initializes a new instance of the LoadBalancingAIServiceSelector class.
+
+        Arguments:
+            service_groups {Optional[Dict[str, List[str]]]} -- Groups of interchangeable services,
+                by a name that can be used as service_id in the execution settings.
+            strategy {str} -- "least_loaded" or "power_of_two", the way to choose between candidates.
+            ewma_alpha {float} -- The weight of a new sample in the latency and error rate averages.
+            error_penalty {float} -- How much the error rate adds to the load of a service.
+            hedge_percentile {Optional[float]} -- The latency percentile after which a request is hedged,
+                None to never hedge.
+            hedge_min_samples {int} -- The number of latencies of a service needed before it is hedged.
+            latency_window {int} -- The number of recent latencies kept per service for the percentile.
+            clock {Callable[[], float]} -- The clock used to measure latencies.
+            random_generator {Optional[random.Random]} -- The random generator for power_of_two.
+        """
+        if strategy not in ("least_loaded", "power_of_two"):
+            raise ValueError(f"Unknown load balancing strategy: {strategy}")
+        if hedge_percentile is not None and not 0 < hedge_percentile < 100:
+            raise ValueError("hedge_percentile must be between 0 and 100")
+        self.service_groups = service_groups or {}
+        self.strategy = strategy
+        self.ewma_alpha = ewma_alpha
+        self.error_penalty = error_penalty
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.latency_window = latency_window
+        self.clock = clock
+        self.random = random_generator or random.Random()
+        self._stats: Dict[str, ServiceStats] = {}
+        self._kernel_services: Dict[str, ALL_COMPLETION_SERVICE_TYPES] = {}
+
+    def get_stats(self, service_id: str) -> ServiceStats:
+        """Get the statistics of a service."""
+        if service_id not in self._stats:
+            self._stats[service_id] = ServiceStats(self.ewma_alpha, self.latency_window)
+        return self._stats[service_id]
+
+    def get_load(self, service_id: str) -> float:
+        """Get the load of a service, lower is better.
+
+        A service without latency samples is assumed to be as fast as the fastest known service.
+        """
+        stats = self.get_stats(service_id)
+        latency = stats.ewma_latency
+        if latency is None:
+            known = [other.ewma_latency for other in self._stats.values() if other.ewma_latency is not None]
+            latency = min(known) if known else 1.0
+        return (stats.in_flight + 1) * latency * (1 + self.error_penalty * stats.error_rate)
+
+    def select_ai_service(
+        self, kernel: "Kernel", function: "KernelFunction", arguments: KernelArguments
+    ) -> Tuple[ALL_COMPLETION_SERVICE_TYPES, PromptExecutionSettings]:
+        """Select the least loaded of the services that can execute the function."""
+        execution_settings_dict = dict(arguments.execution_settings or {})
+        if func_exec_settings := getattr(function, "prompt_execution_settings", None):
+            for id, settings in func_exec_settings.items():
+                if id not in execution_settings_dict:
+                    execution_settings_dict[id] = settings
+        candidates: Dict[str, Tuple[ALL_COMPLETION_SERVICE_TYPES, PromptExecutionSettings]] = {}
+        for service_id, settings in execution_settings_dict.items():
+            for candidate_id in self.service_groups.get(service_id, [service_id]):
+                if candidate_id in candidates:
+                    continue
+                service = kernel.services.get(candidate_id)
+                if isinstance(service, (TextCompletionClientBase, ChatCompletionClientBase)):
+                    candidates[candidate_id] = (service, settings)
+                    self._kernel_services[candidate_id] = service
+        if not candidates:
+            raise KernelServiceNotFoundError("No service found.")
+        service, settings = candidates[self._choose(list(candidates))]
+        return service, service.get_prompt_execution_settings_from_settings(settings)
+
+    def _choose(self, service_ids: List[str]) -> str:
+        if self.strategy == "power_of_two" and len(service_ids) > 2:
+            service_ids = self.random.sample(service_ids, 2)
+        loads = {service_id: self.get_load(service_id) for service_id in service_ids}
+        lowest = min(loads.values())
+        # break ties randomly, so services with the same load, like at the start, all get requests
+        return self.random.choice([service_id for service_id, load in loads.items() if load == lowest])
+
+    async def invoke_service(
+        self,
+        service: ALL_COMPLETION_SERVICE_TYPES,
+        settings: PromptExecutionSettings,
+        call: Callable[[ALL_COMPLETION_SERVICE_TYPES, PromptExecutionSettings], Awaitable[T]],
+        idempotent: bool = True,
+    ) -> T:
+        """Invoke the selected service while tracking its load, hedging it when it is slow and idempotent."""
+        hedge_delay = self._get_hedge_delay(service.service_id) if idempotent else None
+        alternative = self._get_alternative(service.service_id) if hedge_delay is not None else None
+        if alternative is None:
+            return await self._tracked_call(service, settings, call)
+
+        # create the settings for the alternative before the selected service gets to change its settings
+        alternative_settings = alternative.get_prompt_execution_settings_from_settings(settings)
+        primary = asyncio.ensure_future(self._tracked_call(service, settings, call))
+        tasks = {primary}
+        winner = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if done:
+                winner = primary
+                return primary.result()
+            logger.info(
+                f"Service {service.service_id} did not respond within {hedge_delay:.2f}s, "
+                f"hedging the request to {alternative.service_id}"
+            )
+            tasks.add(asyncio.ensure_future(self._tracked_call(alternative, alternative_settings, call)))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        return task.result()
+            # both failed, raise the error of the selected service
+            return primary.result()
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            # wait for the cancellations, so the in-flight counts are up to date when returning
+            await asyncio.gather(*losers, return_exceptions=True)
+            for task in tasks:
+                if task is not winner and not task.cancelled() and task.exception() is None:
+                    await _close_result(task.result())
+
+    async def _tracked_call(
+        self,
+        service: ALL_COMPLETION_SERVICE_TYPES,
+        settings: PromptExecutionSettings,
+        call: Callable[[ALL_COMPLETION_SERVICE_TYPES, PromptExecutionSettings], Awaitable[T]],
+    ) -> T:
+        stats = self.get_stats(service.service_id)
+        stats.in_flight += 1
+        latencies: List[float] = []
+        start = self.clock()
+        try:
+            with record_request_latencies(latencies.append):
+                result = await call(service, settings)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            stats.record(None, failed=True)
+            raise
+        else:
+            stats.record(None if latencies else self.clock() - start, failed=False)
+            for latency in latencies:
+                stats.add_latency(latency)
+            return result
+        finally:
+            stats.in_flight -= 1
+
+    def _get_hedge_delay(self, service_id: str) -> Optional[float]:
+        if self.hedge_percentile is None:
+            return None
+        stats = self.get_stats(service_id)
+        if len(stats.latencies) < self.hedge_min_samples:
+            return None
+        return stats.latency_percentile(self.hedge_percentile)
+
+    def _get_alternative(self, service_id: str) -> Optional[ALL_COMPLETION_SERVICE_TYPES]:
+        """Get the least loaded other service from the groups the service is in."""
+        alternatives = {
+            candidate_id
+            for group in self.service_groups.values()
+            if service_id in group
+            for candidate_id in group
+            if candidate_id != service_id and candidate_id in self._kernel_services
+        }
+        if not alternatives:
+            return None
+        return self._kernel_services[min(sorted(alternatives), key=self.get_load)]
+
+
+async def _close_result(result: object) -> None:
+    """Close the result of a hedged call that lost, like a started stream, when it can be closed."""
+    aclose = getattr(result, "aclose", None)
+    if aclose is None:
+        return
+    try:
+        await aclose()
+    except Exception as exc:
+        logger.warning(f"Failed to close the result of a hedged request: {exc}")
@@ -0,0 +1,36 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+_recorder: ContextVar[Optional[Callable[[float], None]]] = ContextVar("request_latency_recorder", default=None)
+
+
+@contextmanager
+def record_request_latencies(recorder: Callable[[float], None]) -> Iterator[None]:
+    """Pass the latencies that services report while the block runs, also in the tasks it starts, to recorder.
+
+    Arguments:
+        recorder {Callable[[float], None]} -- Called with the latency of every request, in seconds.
+    """
+    token = _recorder.set(recorder)
+    try:
+        yield
+    finally:
+        _recorder.reset(token)
+
+
+def report_request_latency(latency: float) -> None:
+    """Report the latency of a single request to a service, services call this for every request they send.
+
+    A call to a service can send several requests, like the requests of the auto-invoke loop of a chat completion,
+    the service selector then uses the latencies of the requests instead of the duration of the call, which also
+    includes the time of the invoked functions.
+
+    Arguments:
+        latency {float} -- The seconds until the service responded.
+    """
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder(latency)
@@ -168,10 +168,5 @@ these will be ignored."
         """
         if function_block.plugin_name is not None and len(function_block.plugin_name) > 0:
             return plugins[function_block.plugin_name][function_block.function_name]
-        else:
-            # We now require a plug-in name, but if one isn't set then we'll try to find the function
-            for plugin in plugins:
-                if function_block.function_name in plugin:
-                    return plugin[function_block.function_name]
-
-        return None
+        # We now require a plug-in name, but if one isn't set then we'll try to find the function
+        return plugins.get_function(function_block.function_name)
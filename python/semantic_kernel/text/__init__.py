@@ -1,17 +1,36 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from semantic_kernel.text.function_extension import aggregate_chunked_results
+from semantic_kernel.text.chunking_pool import ChunkedDocument, ChunkingPool
+from semantic_kernel.text.function_extension import (
+    aggregate_chunked_results,
+    reduce_chunked_results,
+    stream_chunked_results,
+)
 from semantic_kernel.text.text_chunker import (
+    TextChunk,
+    iter_markdown_paragraphs,
+    iter_plaintext_paragraphs,
     split_markdown_lines,
     split_markdown_paragraph,
     split_plaintext_lines,
     split_plaintext_paragraph,
 )
+from semantic_kernel.text.tokenizers import BpeTokenizer, HeuristicTokenizer, TokenizerBase
 
 __all__ = [
     "split_plaintext_lines",
     "split_markdown_paragraph",
     "split_plaintext_paragraph",
     "split_markdown_lines",
+    "iter_plaintext_paragraphs",
+    "iter_markdown_paragraphs",
+    "TextChunk",
+    "ChunkingPool",
+    "ChunkedDocument",
     "aggregate_chunked_results",
+    "reduce_chunked_results",
+    "stream_chunked_results",
+    "TokenizerBase",
+    "HeuristicTokenizer",
+    "BpeTokenizer",
 ]
@@ -0,0 +1,307 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import hashlib
+import logging
+import os
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from semantic_kernel.text.text_chunker import (
+    TextChunk,
+    _token_counter,
+    iter_markdown_paragraphs,
+    iter_plaintext_paragraphs,
+)
+
+if TYPE_CHECKING:
+    from semantic_kernel.memory.semantic_text_memory import SemanticTextMemory
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ChunkedDocument:
+    """The paragraphs of a document, with the hashes of their normalized text when the pool deduplicates."""
+
+    document_id: str
+    chunks: List[TextChunk]
+    hashes: List[bytes] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class _ChunkingSettings:
+    max_tokens: int
+    max_token_per_line: Optional[int]
+    markdown: bool
+    normalize: bool
+    deduplicate: bool
+    token_counter: Callable[[str], int]
+
+
+# the settings of the worker process, set once by its initializer, so the tokenizer is not sent with every task
+_worker_settings: Optional[_ChunkingSettings] = None
+
+
+def _init_worker(settings: _ChunkingSettings) -> None:
+    global _worker_settings
+    _worker_settings = settings
+
+
+def _chunk_documents(documents: List[Tuple[str, str]]) -> List[ChunkedDocument]:
+    return [_chunk_document(document_id, text, _worker_settings) for document_id, text in documents]
+
+
+def _chunk_document(document_id: str, text: str, settings: _ChunkingSettings) -> ChunkedDocument:
+    if settings.normalize:
+        text = unicodedata.normalize("NFKC", text)
+    iter_paragraphs = iter_markdown_paragraphs if settings.markdown else iter_plaintext_paragraphs
+    chunks = list(iter_paragraphs(text, settings.max_tokens, settings.max_token_per_line, settings.token_counter))
+    hashes = [_hash_chunk(chunk.text) for chunk in chunks] if settings.deduplicate else []
+    return ChunkedDocument(document_id=document_id, chunks=chunks, hashes=hashes)
+
+
+def _hash_chunk(text: str) -> bytes:
+    # paragraphs that only differ in case and whitespace are duplicates
+    return hashlib.blake2b(" ".join(text.lower().split()).encode("utf-8"), digest_size=16).digest()
+
+
+class ChunkingPool:
+    """Chunks documents in worker processes, for ingesting large corpora on all cores.
+
+    Documents are sent to the workers in batches of documents_per_task and the paragraphs come back as pickled
+    batches, in the order the tasks finish. At most max_pending_tasks tasks are in flight, documents are only
+    read when a task can be submitted, so a slow consumer, like the embedding and upsert of ingest, holds back
+    the reading and chunking of documents instead of letting paragraphs pile up in memory.
+
+    With deduplicate, paragraphs whose normalized text was seen before, in any document, are left out. The hashes
+    of the max_seen paragraphs that were seen last are kept, about 150 bytes each, so a paragraph that did not
+    show up for that many paragraphs is not found to be a duplicate anymore.
+
+    When the consumer stops early, the tasks that did not start are cancelled. The tasks that the workers already
+    run can not be stopped, so a pool that started its own workers shuts them down without waiting, the workers
+    exit once their tasks are done and the next call starts new ones.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        max_token_per_line: Optional[int] = None,
+        markdown: bool = False,
+        normalize: bool = False,
+        deduplicate: bool = False,
+        token_counter: Callable[[str], int] = _token_counter,
+        max_workers: Optional[int] = None,
+        documents_per_task: int = 16,
+        max_pending_tasks: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        max_seen: Optional[int] = 100_000,
+    ) -> None:
+        """
+        Initializes a new instance of the ChunkingPool class.
+
+        Args:
+            max_tokens (int): The maximum number of tokens of a paragraph.
+            max_token_per_line (Optional[int]): The maximum number of tokens of a line, max_tokens by default.
+            markdown (bool): Split the documents as markdown instead of plain text.
+            normalize (bool): Apply NFKC unicode normalization to the documents, the offsets of the paragraphs
+                are then in the normalized documents.
+            deduplicate (bool): Leave out paragraphs that were seen before.
+            token_counter (Callable[[str], int]): Counts the tokens in a text, it is sent to every worker once
+                so it must be picklable.
+            max_workers (Optional[int]): The number of worker processes, the number of CPUs by default.
+            documents_per_task (int): The number of documents sent to a worker at a time.
+            max_pending_tasks (Optional[int]): The maximum number of tasks in flight, twice the number of
+                workers by default.
+            executor (Optional[Executor]): The executor to run the tasks in instead of a pool of max_workers
+                processes, the pool does not shut it down.
+            max_seen (Optional[int]): The number of paragraph hashes kept to find duplicates, the least recently
+                seen are dropped first, None keeps all of them.
+        """
+        self._settings = _ChunkingSettings(
+            max_tokens=max_tokens,
+            max_token_per_line=max_token_per_line,
+            markdown=markdown,
+            normalize=normalize,
+            deduplicate=deduplicate,
+            token_counter=token_counter,
+        )
+        self.documents_per_task = documents_per_task
+        self._max_workers = max_workers
+        self._max_pending_tasks = max_pending_tasks
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_seen = max_seen
+        # the chunk_documents calls that submit tasks to the executor
+        self._active_calls = 0
+        # the hashes of the paragraphs that were seen, the least recently seen first
+        self._seen: "OrderedDict[bytes, None]" = OrderedDict()
+
+    @property
+    def max_pending_tasks(self) -> int:
+        """The maximum number of tasks in flight."""
+        if self._max_pending_tasks is not None:
+            return self._max_pending_tasks
+        return 2 * (self._max_workers or os.cpu_count() or 1)
+
+    async def chunk_documents(
+        self, documents: Union[Iterable[Tuple[str, str]], AsyncIterable[Tuple[str, str]]]
+    ) -> AsyncIterator[ChunkedDocument]:
+        """Chunk documents in the worker processes and yield their paragraphs as the tasks finish.
+
+        Args:
+            documents (Union[Iterable[Tuple[str, str]], AsyncIterable[Tuple[str, str]]]): The id and the text
+                of every document.
+
+        Yields:
+            ChunkedDocument: The paragraphs of a document, without the duplicates when the pool deduplicates.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        self._active_calls += 1
+        max_pending_tasks = self.max_pending_tasks
+        batches = _iterate_batches(documents, self.documents_per_task)
+        # the tasks in flight by the order they were submitted in
+        pending: Dict["asyncio.Future[List[ChunkedDocument]]", int] = {}
+        submitted = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < max_pending_tasks:
+                    try:
+                        batch = await batches.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    # an executor of the caller does not run the initializer, so it gets the settings with every task
+                    call = (
+                        (_chunk_documents, batch)
+                        if self._owns_executor
+                        else (_chunk_batch_with_settings, batch, self._settings)
+                    )
+                    pending[loop.run_in_executor(executor, *call)] = submitted
+                    submitted += 1
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=pending.__getitem__):
+                    del pending[task]
+                    for document in task.result():
+                        yield self._deduplicate(document)
+        finally:
+            self._active_calls -= 1
+            for task in pending:
+                task.cancel()
+            if pending and self._owns_executor and not self._active_calls:
+                # the cancelled tasks that already run can not be stopped, let the workers exit when they are done
+                self._shutdown_executor(wait=False)
+            await batches.aclose()
+
+    async def ingest(
+        self,
+        memory: "SemanticTextMemory",
+        collection: str,
+        documents: Union[Iterable[Tuple[str, str]], AsyncIterable[Tuple[str, str]]],
+        batch_size: int = 64,
+    ) -> int:
+        """Chunk documents in the worker processes and save their paragraphs to the memory.
+
+        The paragraphs are embedded and upserted in batches that span documents, see
+        SemanticTextMemory.save_documents, while the workers chunk the next documents.
+
+        Args:
+            memory (SemanticTextMemory): The memory to save the paragraphs to.
+            collection (str): The collection to save the paragraphs to.
+            documents (Union[Iterable[Tuple[str, str]], AsyncIterable[Tuple[str, str]]]): The id and the text
+                of every document.
+            batch_size (int): The number of paragraphs that are embedded and upserted at a time.
+
+        Returns:
+            int: The number of paragraphs saved.
+        """
+
+        async def chunked_documents() -> AsyncIterator[Tuple[str, List[TextChunk]]]:
+            async for document in self.chunk_documents(documents):
+                yield document.document_id, document.chunks
+
+        return await memory.save_documents(collection, chunked_documents(), batch_size)
+
+    def close(self) -> None:
+        """Shut down the worker processes, when the pool started them."""
+        if self._owns_executor:
+            self._shutdown_executor(wait=True)
+
+    async def __aenter__(self) -> "ChunkingPool":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.close()
+
+    def _shutdown_executor(self, wait: bool) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers, initializer=_init_worker, initargs=(self._settings,)
+            )
+        return self._executor
+
+    def _deduplicate(self, document: ChunkedDocument) -> ChunkedDocument:
+        if not self._settings.deduplicate:
+            return document
+        chunks = []
+        for chunk, chunk_hash in zip(document.chunks, document.hashes):
+            if chunk_hash in self._seen:
+                self._seen.move_to_end(chunk_hash)
+                continue
+            self._seen[chunk_hash] = None
+            if self._max_seen is not None and len(self._seen) > self._max_seen:
+                self._seen.popitem(last=False)
+            chunks.append(chunk)
+        if len(chunks) < len(document.chunks):
+            logger.debug(
+                f"Left out {len(document.chunks) - len(chunks)} duplicate paragraphs of {document.document_id}"
+            )
+        return ChunkedDocument(document_id=document.document_id, chunks=chunks)
+
+
+def _chunk_batch_with_settings(documents: List[Tuple[str, str]], settings: _ChunkingSettings) -> List[ChunkedDocument]:
+    return [_chunk_document(document_id, text, settings) for document_id, text in documents]
+
+
+async def _iterate_batches(
+    documents: Union[Iterable[Tuple[str, str]], AsyncIterable[Tuple[str, str]]], batch_size: int
+) -> AsyncIterator[List[Tuple[str, str]]]:
+    batch: List[Tuple[str, str]] = []
+    if isinstance(documents, AsyncIterable):
+        async for document in documents:
+            batch.append(document)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    else:
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
@@ -1,23 +1,116 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from typing import List
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Tuple
 
+from semantic_kernel.exceptions import KernelInvokeException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.functions.kernel_function import KernelFunction
 from semantic_kernel.kernel import Kernel
+from semantic_kernel.text.text_chunker import _token_counter, split_plaintext_lines, split_plaintext_paragraph
+
+
+async def stream_chunked_results(
+    func: KernelFunction,
+    chunked_results: Iterable[str],
+    kernel: Kernel,
+    arguments: KernelArguments,
+    max_concurrency: int = 8,
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Invoke the function on every chunk and yield the results as they finish.
+
+    Every chunk is invoked with a copy of the arguments with the chunk as input, the arguments are not changed.
+    At most max_concurrency chunks are invoked at a time. When a chunk fails, the running chunks are cancelled.
+
+    Args:
+        func (KernelFunction): The function to invoke, it reads the chunk from its input.
+        chunked_results (Iterable[str]): The chunks.
+        kernel (Kernel): The kernel.
+        arguments (KernelArguments): The arguments every chunk is invoked with.
+        max_concurrency (int): The maximum number of chunks that are invoked at a time.
+
+    Yields:
+        Tuple[int, str]: The index of the chunk and the result of the function.
+
+    Raises:
+        KernelInvokeException: When the function fails for a chunk.
+    """
+    results = kernel.invoke_many(
+        func, (_get_chunk_arguments(arguments, chunk) for chunk in chunked_results), max_concurrency=max_concurrency
+    )
+    try:
+        async for index, result in results:
+            if isinstance(result, Exception):
+                raise result
+            if result is not None and "error" in result.metadata:
+                raise KernelInvokeException(
+                    f"Error occurred while invoking function: '{func.plugin_name}.{func.name}' on chunk {index}",
+                    result.metadata["error"],
+                ) from result.metadata["error"]
+            yield index, str(result) if result is not None else ""
+    finally:
+        await results.aclose()
 
 
 async def aggregate_chunked_results(
-    func: KernelFunction, chunked_results: List[str], kernel: Kernel, arguments: KernelArguments
+    func: KernelFunction,
+    chunked_results: List[str],
+    kernel: Kernel,
+    arguments: KernelArguments,
+    max_concurrency: int = 8,
 ) -> str:
     """
     Aggregate the results from the chunked results.
+
+    The chunks are invoked concurrently, see stream_chunked_results, the results are joined in the order of the chunks.
+    """
+    results: Dict[int, str] = {}
+    async for index, result in stream_chunked_results(func, chunked_results, kernel, arguments, max_concurrency):
+        results[index] = result
+    return "\n".join(results[index] for index in range(len(results)))
+
+
+async def reduce_chunked_results(
+    func: KernelFunction,
+    chunked_results: List[str],
+    kernel: Kernel,
+    arguments: KernelArguments,
+    max_tokens: int,
+    max_concurrency: int = 8,
+    token_counter: Callable[[str], int] = _token_counter,
+) -> str:
+    """
+    Aggregate the results from the chunked results, then reduce them with the function until they fit in max_tokens.
+
+    The joined results are split into chunks of max_tokens again and the function is invoked on those, which is
+    repeated while the results are too long and the number of chunks goes down, like summaries of summaries.
+
+    Args:
+        func (KernelFunction): The function to invoke, it reads the chunk from its input.
+        chunked_results (List[str]): The chunks.
+        kernel (Kernel): The kernel.
+        arguments (KernelArguments): The arguments every chunk is invoked with.
+        max_tokens (int): The maximum number of tokens of the result, and of the chunks of a reduce pass.
+        max_concurrency (int): The maximum number of chunks that are invoked at a time.
+        token_counter (Callable[[str], int]): Counts the tokens in a text.
+
+    Returns:
+        str: The joined results of the last pass.
     """
-    results = []
-    for chunk in chunked_results:
-        arguments["input"] = chunk
-        result = await func.invoke(kernel, arguments)
+    chunk_count = len(chunked_results)
+    result = await aggregate_chunked_results(func, chunked_results, kernel, arguments, max_concurrency)
+    while chunk_count > 1 and token_counter(result) > max_tokens:
+        lines = split_plaintext_lines(result, max_tokens, token_counter)
+        chunks = split_plaintext_paragraph(lines, max_tokens, token_counter)
+        if len(chunks) >= chunk_count:
+            break
+        chunk_count = len(chunks)
+        result = await aggregate_chunked_results(func, chunks, kernel, arguments, max_concurrency)
+    return result
 
-        results.append(str(result))
 
-    return "\n".join(results)
+def _get_chunk_arguments(arguments: KernelArguments, chunk: str) -> KernelArguments:
+    return KernelArguments(
+        settings=list(arguments.execution_settings.values()) if arguments.execution_settings else None,
+        **{**arguments, "input": chunk},
+    )
@@ -4,12 +4,21 @@ Split text in chunks, attempting to leave meaning intact.
 For plain text, split looking at new lines first, then periods, and so on.
 For markdown, split looking at punctuation first, and so on.
 """
+import codecs
 import os
 import re
-from typing import Callable, List, Tuple
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from semantic_kernel.text.tokenizers import HeuristicTokenizer, to_tokenizer
 
 NEWLINE = os.linesep
 
+# The size of the sections, in characters, that documents are read and chunked in by the iter_* functions
+DEFAULT_SEGMENT_SIZE = 256 * 1024
+
 TEXT_SPLIT_OPTIONS = [
     ["\n", "\r"],
     ["."],
@@ -37,15 +46,9 @@ MD_SPLIT_OPTIONS = [
 ]
 
 
-def _token_counter(text: str) -> int:
-    """
-    Count the number of tokens in a string.
-
-    TODO: chunking methods should be configurable to allow for different
-          tokenization strategies depending on the model to be called.
-          For now, we use an extremely rough estimate.
-    """
-    return len(text) // 4
+# The default token counter, an extremely rough estimate. Pass a tokenizer of the model, like a BpeTokenizer,
+# as token_counter for chunks that fit the model exactly.
+_token_counter = HeuristicTokenizer()
 
 
 def split_plaintext_lines(text: str, max_token_per_line: int, token_counter: Callable = _token_counter) -> List[str]:
@@ -111,6 +114,213 @@ def split_markdown_paragraph(text: List[str], max_tokens: int, token_counter: Ca
     return _split_text_paragraph(text=split_lines, max_tokens=max_tokens, token_counter=token_counter)
 
 
+@dataclass(frozen=True)
+class TextChunk:
+    """
+    A paragraph of a document and the span of the document it was made from.
+
+    The offsets are in characters for text documents and in bytes for binary documents, like memory-mapped files.
+    """
+
+    text: str
+    start: int
+    end: int
+
+
+def iter_plaintext_paragraphs(
+    source: Union[str, bytes, Iterable[Union[str, bytes]], IO[Any]],
+    max_tokens: int,
+    max_token_per_line: Optional[int] = None,
+    token_counter: Callable = _token_counter,
+    segment_size: int = DEFAULT_SEGMENT_SIZE,
+    encoding: str = "utf-8",
+) -> Iterator[TextChunk]:
+    """
+    Split a plain text document into paragraphs, like split_plaintext_lines and split_plaintext_paragraph do.
+
+    The document can be a string, bytes, a file object opened in text or binary mode, a memory-mapped file,
+    or an iterable of strings or bytes, like the lines of a file. It is read in segments of about segment_size
+    characters that end at a blank line or else at a line end where possible, and every segment is split on
+    its own, so memory stays bounded by the size of a segment. Paragraphs do not span segments.
+    """
+    return _iter_paragraphs(
+        source,
+        max_tokens,
+        max_token_per_line or max_tokens,
+        token_counter,
+        segment_size,
+        encoding,
+        split_plaintext_lines,
+        split_plaintext_paragraph,
+    )
+
+
+def iter_markdown_paragraphs(
+    source: Union[str, bytes, Iterable[Union[str, bytes]], IO[Any]],
+    max_tokens: int,
+    max_token_per_line: Optional[int] = None,
+    token_counter: Callable = _token_counter,
+    segment_size: int = DEFAULT_SEGMENT_SIZE,
+    encoding: str = "utf-8",
+) -> Iterator[TextChunk]:
+    """
+    Split a markdown document into paragraphs, like split_markdown_lines and split_markdown_paragraph do.
+
+    The document is read in segments, see iter_plaintext_paragraphs.
+    """
+    return _iter_paragraphs(
+        source,
+        max_tokens,
+        max_token_per_line or max_tokens,
+        token_counter,
+        segment_size,
+        encoding,
+        split_markdown_lines,
+        split_markdown_paragraph,
+    )
+
+
+def _iter_paragraphs(
+    source: Union[str, bytes, Iterable[Union[str, bytes]], IO[Any]],
+    max_tokens: int,
+    max_token_per_line: int,
+    token_counter: Callable,
+    segment_size: int,
+    encoding: str,
+    split_lines: Callable[..., List[str]],
+    split_paragraph: Callable[..., List[str]],
+) -> Iterator[TextChunk]:
+    tokenizer = to_tokenizer(token_counter)
+    for segment, char_offset, byte_offset in _iter_segments(source, segment_size, encoding):
+        normalized = segment.replace("\r\n", "\n")
+        lines = split_lines(normalized, max_token_per_line, tokenizer)
+        paragraphs = split_paragraph(lines, max_tokens, tokenizer)
+        spans = _locate_paragraphs(paragraphs, normalized)
+
+        # map the offsets in the normalized segment to the document, they only go up
+        crlf_positions = (
+            [match.start() - index for index, match in enumerate(re.finditer("\r\n", segment))]
+            if len(normalized) != len(segment)
+            else []
+        )
+        last_index = 0
+        last_byte_offset = byte_offset
+        for paragraph, (start, end) in zip(paragraphs, spans):
+            offsets = []
+            for index in (start + bisect_right(crlf_positions, start), end + bisect_right(crlf_positions, end - 1)):
+                if byte_offset < 0:
+                    offsets.append(char_offset + index)
+                    continue
+                last_byte_offset += len(segment[last_index:index].encode(encoding))
+                last_index = index
+                offsets.append(last_byte_offset)
+            yield TextChunk(text=paragraph, start=offsets[0], end=offsets[1])
+
+
+def _locate_paragraphs(paragraphs: List[str], text: str) -> List[Tuple[int, int]]:
+    """
+    Find the spans of the paragraphs in the text they were split from.
+
+    Splitting only cuts the text and changes whitespace, so the paragraphs have the characters other than
+    whitespace of the text, in order. A paragraph spans from its first to its last one of those.
+    """
+    words = re.finditer(r"\S+", text)
+    word = None
+    position = 0
+    spans = []
+    for paragraph in paragraphs:
+        remaining = sum(map(len, paragraph.split()))
+        start = None
+        while remaining > 0:
+            if word is None or position >= word.end():
+                word = next(words, None)
+                if word is None:
+                    break
+                position = word.start()
+            if start is None:
+                start = position
+            taken = min(remaining, word.end() - position)
+            position += taken
+            remaining -= taken
+        spans.append((position if start is None else start, position))
+    return spans
+
+
+def _iter_segments(
+    source: Union[str, bytes, Iterable[Union[str, bytes]], IO[Any]], segment_size: int, encoding: str
+) -> Iterator[Tuple[str, int, int]]:
+    """
+    Read a document in segments that end at a blank line, or at a line end when there is none.
+
+    Yields the segments with their offset in characters and, for binary documents, in bytes, else -1.
+    """
+    decoder = None
+    char_offset = 0
+    byte_offset = -1
+    pending: List[str] = []
+    pending_length = 0
+    for piece in _read_pieces(source, segment_size):
+        if isinstance(piece, (bytes, bytearray, memoryview)):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)()
+                byte_offset = 0
+            piece = decoder.decode(piece)
+        pending.append(piece)
+        pending_length += len(piece)
+        if pending_length < segment_size:
+            continue
+
+        buffer = "".join(pending)
+        while len(buffer) >= segment_size:
+            cut = _find_segment_end(buffer, segment_size)
+            if cut is None:
+                break
+            segment, buffer = buffer[:cut], buffer[cut:]
+            yield segment, char_offset, byte_offset
+            char_offset += len(segment)
+            if byte_offset >= 0:
+                byte_offset += len(segment.encode(encoding))
+        pending = [buffer]
+        pending_length = len(buffer)
+
+    if decoder is not None:
+        pending.append(decoder.decode(b"", final=True))
+    buffer = "".join(pending)
+    if buffer:
+        yield buffer, char_offset, byte_offset
+
+
+def _find_segment_end(buffer: str, segment_size: int) -> Optional[int]:
+    cut = buffer.rfind("\n\n")
+    if cut >= 0:
+        return cut + 2
+    cut = buffer.rfind("\n")
+    if cut >= 0:
+        return cut + 1
+    # a line that is much longer than a segment is cut anywhere
+    return segment_size if len(buffer) >= 4 * segment_size else None
+
+
+def _read_pieces(
+    source: Union[str, bytes, Iterable[Union[str, bytes]], IO[Any]], block_size: int
+) -> Iterator[Union[str, bytes]]:
+    if isinstance(source, str):
+        for start in range(0, len(source), block_size):
+            yield source[start : start + block_size]
+    elif isinstance(source, (bytes, bytearray)):
+        view = memoryview(source)
+        for start in range(0, len(view), block_size):
+            yield bytes(view[start : start + block_size])
+    elif hasattr(source, "read"):
+        while True:
+            block = source.read(block_size)
+            if not block:
+                break
+            yield block
+    else:
+        yield from source
+
+
 def _split_text_paragraph(text: List[str], max_tokens: int, token_counter: Callable = _token_counter) -> List[str]:
     """
     Split text into paragraphs.
@@ -118,18 +328,22 @@ def _split_text_paragraph(text: List[str], max_tokens: int, token_counter: Calla
     if not text:
         return []
 
+    tokenizer = to_tokenizer(token_counter)
     paragraphs = []
     current_paragraph = []
+    paragraph_tokens = tokenizer.create_running_count()
 
     for line in text:
-        num_tokens_line = token_counter(line)
-        num_tokens_paragraph = token_counter("".join(current_paragraph))
+        num_tokens_line = tokenizer.count_tokens(line)
 
-        if num_tokens_paragraph + num_tokens_line + 1 >= max_tokens and len(current_paragraph) > 0:
+        if paragraph_tokens.tokens + num_tokens_line + 1 >= max_tokens and len(current_paragraph) > 0:
             paragraphs.append("".join(current_paragraph).strip())
             current_paragraph = []
+            paragraph_tokens.reset()
 
-        current_paragraph.append(f"{line}{NEWLINE}")
+        line = f"{line}{NEWLINE}"
+        current_paragraph.append(line)
+        paragraph_tokens.add(line)
 
     if len(current_paragraph) > 0:
         paragraphs.append("".join(current_paragraph).strip())
@@ -142,7 +356,7 @@ def _split_text_paragraph(text: List[str], max_tokens: int, token_counter: Calla
         last_para = paragraphs[-1]
         sec_last_para = paragraphs[-2]
 
-        if token_counter(last_para) < max_tokens / 4:
+        if tokenizer.count_tokens(last_para) < max_tokens / 4:
             last_para_tokens = last_para.split(" ")
             sec_last_para_tokens = sec_last_para.split(" ")
             last_para_token_count = len(last_para_tokens)
@@ -207,6 +421,9 @@ def _split_str_lines(
         return []
 
     text = text.replace("\r\n", "\n")
+    tokenizer = to_tokenizer(token_counter)
+    # the lines that are known to fit, so they are not counted again for every separator
+    fitting: Set[str] = set()
     lines = []
     was_split = False
     for split_option in separators:
@@ -216,7 +433,8 @@ def _split_str_lines(
                 max_tokens=max_tokens,
                 separators=split_option,
                 trim=trim,
-                token_counter=token_counter,
+                token_counter=tokenizer,
+                fitting=fitting,
             )
         else:
             lines, was_split = _split_list(
@@ -224,7 +442,8 @@ def _split_str_lines(
                 max_tokens=max_tokens,
                 separators=split_option,
                 trim=trim,
-                token_counter=token_counter,
+                token_counter=tokenizer,
+                fitting=fitting,
             )
         if was_split:
             break
@@ -238,59 +457,69 @@ def _split_str(
     separators: List[str],
     trim: bool,
     token_counter: Callable = _token_counter,
+    fitting: Optional[Set[str]] = None,
 ) -> Tuple[List[str], bool]:
     """
     Split text into lines.
+
+    Parts that are too long are cut at the separator closest to their middle, until every part fits or has
+    no separator left. The parts still to be split are kept on a stack, so the lines come out in order.
     """
     input_was_split = False
     if not text:
         return [], input_was_split
 
-    if trim:
-        text = text.strip()
+    tokenizer = to_tokenizer(token_counter)
+    fitting = set() if fitting is None else fitting
+    lines = []
+    parts = [text]
+    while parts:
+        part = parts.pop()
+        if not part:
+            continue
+        if trim:
+            part = part.strip()
+
+        if part in fitting or not tokenizer.exceeds(part, max_tokens):
+            fitting.add(part)
+            lines.append(part)
+            continue
+
+        cutpoint = _find_cutpoint(part, _get_separator_regex(tuple(separators)) if separators else None)
+        if 0 < cutpoint < len(part):
+            parts.append(part[cutpoint:])
+            parts.append(part[:cutpoint])
+        else:
+            lines.append(part)
 
-    text_as_is = [text]
+    return lines, input_was_split
 
-    if token_counter(text) <= max_tokens:
-        return text_as_is, input_was_split
 
-    half = len(text) // 2
+@lru_cache(maxsize=None)
+def _get_separator_regex(separators: Tuple[str, ...]) -> "re.Pattern":
+    return re.compile("|".join(re.escape(s) for s in separators))
 
-    cutpoint = -1
 
-    if not separators:
-        cutpoint = half
-    elif set(separators) & set(text) and len(text) > 2:
-        regex_separators = re.compile("|".join(re.escape(s) for s in separators))
-        min_dist = half
-        for match in re.finditer(regex_separators, text):
-            end = match.end()
-            dist = abs(half - end)
-            if dist < min_dist:
-                min_dist = dist
-                cutpoint = end
-            elif end > half:
-                # distance is increasing, so we can stop searching
-                break
-    else:
-        return text_as_is, input_was_split
+def _find_cutpoint(text: str, regex_separators: Optional["re.Pattern"]) -> int:
+    half = len(text) // 2
 
-    if 0 < cutpoint < len(text):
-        lines = []
-        for text_part in [text[:cutpoint], text[cutpoint:]]:
-            split, has_split = _split_str(
-                text=text_part,
-                max_tokens=max_tokens,
-                separators=separators,
-                trim=trim,
-                token_counter=token_counter,
-            )
-            lines.extend(split)
-            input_was_split = input_was_split or has_split
-    else:
-        return text_as_is, input_was_split
+    if regex_separators is None:
+        return half
+    if len(text) <= 2:
+        return -1
 
-    return lines, input_was_split
+    cutpoint = -1
+    min_dist = half
+    for match in regex_separators.finditer(text):
+        end = match.end()
+        dist = abs(half - end)
+        if dist < min_dist:
+            min_dist = dist
+            cutpoint = end
+        elif end > half:
+            # distance is increasing, so we can stop searching
+            break
+    return cutpoint
 
 
 def _split_list(
@@ -299,6 +528,7 @@ def _split_list(
     separators: List[str],
     trim: bool,
     token_counter: Callable = _token_counter,
+    fitting: Optional[Set[str]] = None,
 ) -> Tuple[List[str], bool]:
     """
     Split list of string into lines.
@@ -306,15 +536,21 @@ def _split_list(
     if not text:
         return [], False
 
+    tokenizer = to_tokenizer(token_counter)
+    fitting = set() if fitting is None else fitting
     lines = []
     input_was_split = False
     for line in text:
+        if line and line in fitting:
+            lines.append(line.strip() if trim else line)
+            continue
         split_str, was_split = _split_str(
             text=line,
             max_tokens=max_tokens,
             separators=separators,
             trim=trim,
-            token_counter=token_counter,
+            token_counter=tokenizer,
+            fitting=fitting,
         )
         lines.extend(split_str)
         input_was_split = input_was_split or was_split
@@ -0,0 +1,213 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import base64
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Tuple, Union
+
+import regex
+
+# The pattern of the cl100k_base encoding of the gpt-3.5-turbo and gpt-4 models
+CL100K_PATTERN = (
+    r"""(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]+[\r\n]*|\s*[\r\n]+|"""
+    r"""\s+(?!\S)|\s+"""
+)
+
+
+class RunningTokenCount:
+    """The number of tokens of a text that is built up part by part, without counting the whole text again.
+
+    The parts are counted on their own, so for tokenizers that merge characters across parts the count can be
+    slightly higher than the count of the whole text.
+    """
+
+    def __init__(self, tokenizer: "TokenizerBase") -> None:
+        self._tokenizer = tokenizer
+        self._tokens = 0
+
+    @property
+    def tokens(self) -> int:
+        """The number of tokens of the parts that were added."""
+        return self._tokens
+
+    def add(self, text: str) -> None:
+        """Add a part to the text."""
+        self._tokens += self._tokenizer.count_tokens(text)
+
+    def reset(self) -> None:
+        """Start a new text."""
+        self._tokens = 0
+
+
+class TokenizerBase(ABC):
+    """Counts the tokens in texts, an instance can be used wherever a token_counter callable is expected."""
+
+    @abstractmethod
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens in a text.
+
+        Arguments:
+            text {str} -- The text.
+
+        Returns:
+            int -- The number of tokens.
+        """
+        pass
+
+    def exceeds(self, text: str, max_tokens: int) -> bool:
+        """Whether a text has more than max_tokens tokens, tokenizers can stop counting once it is exceeded.
+
+        Arguments:
+            text {str} -- The text.
+            max_tokens {int} -- The maximum number of tokens.
+
+        Returns:
+            bool -- True when the text has more tokens.
+        """
+        return self.count_tokens(text) > max_tokens
+
+    def create_running_count(self) -> RunningTokenCount:
+        """Create a count of the tokens of a text that is built up part by part."""
+        return RunningTokenCount(self)
+
+    def __call__(self, text: str) -> int:
+        return self.count_tokens(text)
+
+
+class _RunningCharacterCount(RunningTokenCount):
+    def __init__(self, tokenizer: "HeuristicTokenizer") -> None:
+        super().__init__(tokenizer)
+        self._characters = 0
+
+    @property
+    def tokens(self) -> int:
+        return self._characters // self._tokenizer.chars_per_token
+
+    def add(self, text: str) -> None:
+        self._characters += len(text)
+
+    def reset(self) -> None:
+        self._characters = 0
+
+
+class HeuristicTokenizer(TokenizerBase):
+    """A rough estimate of the number of tokens from the number of characters, which is fast but not exact."""
+
+    def __init__(self, chars_per_token: int = 4) -> None:
+        self.chars_per_token = chars_per_token
+
+    def count_tokens(self, text: str) -> int:
+        return len(text) // self.chars_per_token
+
+    def create_running_count(self) -> RunningTokenCount:
+        # the estimate of a text only depends on its length, so the running count is exact
+        return _RunningCharacterCount(self)
+
+
+class BpeTokenizer(TokenizerBase):
+    """A byte pair encoding tokenizer, compatible with the encodings of tiktoken.
+
+    The text is split into pieces with the pattern of the encoding and the pieces are merged into tokens by
+    rank. The tokens of pieces are cached, so counting natural language, where words repeat, is mostly a
+    matter of splitting the text. Special tokens are encoded as ordinary text.
+    """
+
+    def __init__(self, ranks: Dict[bytes, int], pattern: str = CL100K_PATTERN, max_cache_size: int = 100_000) -> None:
+        """Initializes a new instance of the BpeTokenizer class.
+
+        Arguments:
+            ranks {Dict[bytes, int]} -- The rank of every token, which is also its id. Lower ranks are merged first.
+            pattern {str} -- The pattern that splits a text into pieces, for the regex package.
+            max_cache_size {int} -- The maximum number of pieces whose tokens are cached.
+        """
+        self._ranks = ranks
+        self._decoder = {rank: token for token, rank in ranks.items()}
+        self._pattern = regex.compile(pattern)
+        self._max_cache_size = max_cache_size
+        self._cache: Dict[str, Tuple[int, ...]] = {}
+
+    @classmethod
+    def from_tiktoken_file(cls, path: str, pattern: str = CL100K_PATTERN) -> "BpeTokenizer":
+        """Load the ranks of an encoding from a local tiktoken file, like cl100k_base.tiktoken.
+
+        Every line of the file is a base64 encoded token and its rank.
+
+        Arguments:
+            path {str} -- The path of the file.
+            pattern {str} -- The pattern of the encoding.
+
+        Returns:
+            BpeTokenizer -- The tokenizer.
+        """
+        with open(path, "rb") as file:
+            ranks = {
+                base64.b64decode(token): int(rank)
+                for token, rank in (line.split() for line in file.read().splitlines() if line)
+            }
+        return cls(ranks, pattern)
+
+    def count_tokens(self, text: str) -> int:
+        return sum(map(len, map(self._encode_piece, self._pattern.findall(text))))
+
+    def exceeds(self, text: str, max_tokens: int) -> bool:
+        # a character is at most four bytes and a token at least one byte
+        if len(text) * 4 <= max_tokens:
+            return False
+        if len(text) <= max_tokens * 8:
+            return self.count_tokens(text) > max_tokens
+        tokens = 0
+        for match in self._pattern.finditer(text):
+            tokens += len(self._encode_piece(match.group()))
+            if tokens > max_tokens:
+                return True
+        return False
+
+    def encode(self, text: str) -> List[int]:
+        """Encode a text into token ids."""
+        return [token for piece in self._pattern.findall(text) for token in self._encode_piece(piece)]
+
+    def decode(self, tokens: List[int]) -> str:
+        """Decode token ids into a text."""
+        return b"".join(self._decoder[token] for token in tokens).decode("utf-8", errors="replace")
+
+    def _encode_piece(self, piece: str) -> Tuple[int, ...]:
+        tokens = self._cache.get(piece)
+        if tokens is None:
+            tokens = self._byte_pair_merge(piece.encode("utf-8"))
+            if len(self._cache) >= self._max_cache_size:
+                self._cache.clear()
+            self._cache[piece] = tokens
+        return tokens
+
+    def _byte_pair_merge(self, piece: bytes) -> Tuple[int, ...]:
+        rank = self._ranks.get(piece)
+        if rank is not None:
+            return (rank,)
+        # the boundaries of the parts, starting from single bytes, the adjacent pair with the lowest rank is merged
+        boundaries = list(range(len(piece) + 1))
+        while len(boundaries) > 2:
+            min_rank = None
+            min_index = -1
+            for index in range(len(boundaries) - 2):
+                rank = self._ranks.get(piece[boundaries[index] : boundaries[index + 2]])
+                if rank is not None and (min_rank is None or rank < min_rank):
+                    min_rank = rank
+                    min_index = index
+            if min_rank is None:
+                break
+            del boundaries[min_index + 1]
+        return tuple(self._ranks[piece[start:end]] for start, end in zip(boundaries, boundaries[1:]))
+
+
+class _CallableTokenizer(TokenizerBase):
+    def __init__(self, token_counter: Callable[[str], int]) -> None:
+        self._token_counter = token_counter
+
+    def count_tokens(self, text: str) -> int:
+        return self._token_counter(text)
+
+
+def to_tokenizer(token_counter: Union[TokenizerBase, Callable[[str], int]]) -> TokenizerBase:
+    """Get a tokenizer for a token_counter callable, tokenizers are returned as they are."""
+    if isinstance(token_counter, TokenizerBase):
+        return token_counter
+    return _CallableTokenizer(token_counter)
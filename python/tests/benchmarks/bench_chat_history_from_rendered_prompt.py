@@ -0,0 +1,42 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of ChatHistory.from_rendered_prompt on large rendered chat histories.
+
+Reports the best time per message of a few runs, which should stay flat as the history grows.
+
+Run from the python folder with: python -m tests.benchmarks.bench_chat_history_from_rendered_prompt
+"""
+
+import time
+
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_role import ChatRole
+
+MESSAGE_COUNTS = [100, 500, 1000, 2000, 4000]
+REPEATS = 5
+MESSAGE_TEXT = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4
+
+
+def render_history(count: int) -> str:
+    history = ChatHistory(system_message="You are a helpful assistant.")
+    for index in range(count):
+        role = ChatRole.USER if index % 2 == 0 else ChatRole.ASSISTANT
+        history.add_message({"role": role, "content": f"{index}: {MESSAGE_TEXT}"})
+    return f"Answer the last question.\n{history}\n"
+
+
+def main() -> None:
+    print(f"{'messages':>9} {'prompt KB':>10} {'us/message':>12}")
+    for count in MESSAGE_COUNTS:
+        rendered = render_history(count)
+        elapsed = float("inf")
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            chat_history = ChatHistory.from_rendered_prompt(rendered)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        assert len(chat_history) == count + 2
+        print(f"{count:>9} {len(rendered) / 1024:>10.0f} {elapsed / count * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
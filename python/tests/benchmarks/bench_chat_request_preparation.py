@@ -0,0 +1,111 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of preparing the requests of the OpenAI auto-invoke loop.
+
+Runs complete_chat with a 200 message chat history against a mocked client that answers with
+a tool call for 5 rounds and then with a text, and reports the time per complete_chat call and
+the time spent preparing the requests, the messages and the settings dict.
+
+Run from the python folder with: python -m tests.benchmarks.bench_chat_request_preparation
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+from openai.types.chat import ChatCompletion
+
+from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
+    OpenAIChatPromptExecutionSettings,
+)
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from semantic_kernel.kernel import Kernel
+
+HISTORY_LENGTH = 200
+TOOL_CALL_ROUNDS = 5
+REPEATS = 20
+
+
+class LookupPlugin:
+    @kernel_function(name="lookup")
+    def lookup(self, key: str) -> str:
+        return f"the value of {key}"
+
+
+def completion(round: int) -> ChatCompletion:
+    if round < TOOL_CALL_ROUNDS:
+        message = {
+            "role": "assistant",
+            "tool_calls": [
+                {
+                    "id": f"call_{round}",
+                    "type": "function",
+                    "function": {"name": "bench-lookup", "arguments": f'{{"key": "key {round}"}}'},
+                }
+            ],
+        }
+        finish_reason = "tool_calls"
+    else:
+        message = {"role": "assistant", "content": "done"}
+        finish_reason = "stop"
+    return ChatCompletion.model_validate(
+        {
+            "id": "chatcmpl-benchmark",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-benchmark",
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+    )
+
+
+def create_chat_history() -> ChatHistory:
+    chat_history = ChatHistory(system_message="You are a helpful assistant that looks up values.")
+    for index in range(HISTORY_LENGTH // 2):
+        chat_history.add_user_message(f"Question {index}: what is the value of key {index}? " * 5)
+        chat_history.add_assistant_message(f"Answer {index}: the value of key {index} is {index}. " * 5)
+    return chat_history
+
+
+async def run() -> None:
+    kernel = Kernel()
+    kernel.import_plugin_from_object(LookupPlugin(), "bench")
+    service = OpenAIChatCompletion(ai_model_id="gpt-benchmark", api_key="test")
+    responses = [completion(round) for round in range(TOOL_CALL_ROUNDS + 1)]
+    create = AsyncMock()
+    service.client.chat.completions.create = create
+
+    prepare_time = 0.0
+    prepare_settings = service._prepare_settings
+
+    def timed_prepare_settings(*args, **kwargs):
+        nonlocal prepare_time
+        start = time.perf_counter()
+        settings = prepare_settings(*args, **kwargs)
+        settings.prepare_settings_dict()
+        prepare_time += time.perf_counter() - start
+        return settings
+
+    service._prepare_settings = timed_prepare_settings
+
+    best_total, best_prepare = float("inf"), float("inf")
+    for _ in range(REPEATS):
+        chat_history = create_chat_history()
+        settings = OpenAIChatPromptExecutionSettings(auto_invoke_kernel_functions=True, max_auto_invoke_attempts=10)
+        create.side_effect = list(responses)
+        prepare_time = 0.0
+        start = time.perf_counter()
+        await service.complete_chat(chat_history, settings, kernel=kernel)
+        best_total = min(best_total, time.perf_counter() - start)
+        best_prepare = min(best_prepare, prepare_time)
+    print(
+        f"{HISTORY_LENGTH} messages, {TOOL_CALL_ROUNDS} tool call rounds: "
+        f"complete_chat {best_total * 1000:8.2f} ms, request preparation {best_prepare * 1000:8.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
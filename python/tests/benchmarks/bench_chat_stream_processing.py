@@ -0,0 +1,104 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of processing streamed OpenAI chat completions.
+
+Replays recorded-style SSE streams, a text answer and a tool call with long arguments,
+through OpenAIChatCompletionBase._process_chat_stream_response and reports the time per chunk,
+which should stay flat as the stream grows.
+
+Run from the python folder with: python -m tests.benchmarks.bench_chat_stream_processing
+"""
+
+import asyncio
+import json
+import time
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
+
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
+from semantic_kernel.connectors.ai.open_ai.services.tool_call_behavior import ToolCallBehavior
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.kernel import Kernel
+
+CHUNK_COUNTS = [500, 1000, 2000, 4000, 8000]
+
+
+def record_sse(deltas: List[dict], finish_reason: str) -> List[str]:
+    """Create the data lines of an SSE stream as the chat completions API sends them."""
+    lines = []
+    for index, delta in enumerate(deltas + [{}]):
+        lines.append(
+            json.dumps(
+                {
+                    "id": "chatcmpl-benchmark",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": "gpt-benchmark",
+                    "system_fingerprint": None,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "delta": delta,
+                            "logprobs": None,
+                            "finish_reason": finish_reason if index == len(deltas) else None,
+                        }
+                    ],
+                }
+            )
+        )
+    return lines
+
+
+def text_stream(count: int) -> List[str]:
+    return record_sse([{"role": "assistant", "content": ""}] + [{"content": " token"}] * count, "stop")
+
+
+def tool_call_stream(count: int) -> List[str]:
+    first = {
+        "role": "assistant",
+        "tool_calls": [
+            {"index": 0, "id": "call_1", "type": "function", "function": {"name": "plugin-function", "arguments": ""}}
+        ],
+    }
+    fragments = [{"tool_calls": [{"index": 0, "function": {"arguments": '{"input": "'}}]}]
+    fragments += [{"tool_calls": [{"index": 0, "function": {"arguments": "abcdef"}}]}] * count
+    fragments += [{"tool_calls": [{"index": 0, "function": {"arguments": '"}'}}]}]
+    return record_sse([first] + fragments, "tool_calls")
+
+
+async def replay(lines: List[str]):
+    for line in lines:
+        yield ChatCompletionChunk.model_validate_json(line)
+
+
+async def process(service: OpenAIChatCompletion, lines: List[str], auto_invoke: bool) -> float:
+    kernel = MagicMock(spec=Kernel)
+    kernel.invoke = AsyncMock(return_value=MagicMock(value="result"))
+    # parse the chunks up front, so only the processing is measured
+    chunks = [chunk async for chunk in replay(lines)]
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    start = time.perf_counter()
+    async for _ in service._process_chat_stream_response(
+        stream(), ToolCallBehavior(auto_invoke_kernel_functions=auto_invoke), ChatHistory(), kernel
+    ):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    service = OpenAIChatCompletion(service_id="benchmark", ai_model_id="gpt-benchmark", api_key="benchmark")
+    print(f"{'chunks':>8} {'text us/chunk':>15} {'tool call us/chunk':>20}")
+    for count in CHUNK_COUNTS:
+        text = asyncio.run(process(service, text_stream(count), auto_invoke=False))
+        tool_call = asyncio.run(process(service, tool_call_stream(count), auto_invoke=True))
+        print(f"{count:>8} {text / count * 1e6:>15.2f} {tool_call / count * 1e6:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
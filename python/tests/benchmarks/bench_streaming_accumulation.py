@@ -0,0 +1,68 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of combining streamed chunks in Kernel.invoke_stream.
+
+Compares adding the chunks one by one with StreamingKernelContent.merge and measures the
+overhead per chunk of Kernel.invoke_stream, which should stay flat as the response grows.
+
+Run from the python folder with: python -m tests.benchmarks.bench_streaming_accumulation
+"""
+
+import asyncio
+import time
+from copy import copy
+from typing import AsyncIterable, List
+
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.functions.kernel_function import KernelFunction
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from semantic_kernel.kernel import Kernel
+
+CHUNK_COUNTS = [500, 1000, 2000, 4000, 8000]
+
+
+def create_chunks(count: int) -> List[StreamingChatMessageContent]:
+    return [StreamingChatMessageContent(choice_index=0, content=" token") for _ in range(count)]
+
+
+def add_one_by_one(chunks: List[StreamingChatMessageContent]) -> StreamingChatMessageContent:
+    result = copy(chunks[0])
+    for chunk in chunks[1:]:
+        result += chunk
+    return result
+
+
+async def invoke_stream(kernel: Kernel, function: KernelFunction) -> None:
+    async for _ in kernel.invoke_stream(function):
+        pass
+
+
+def main() -> None:
+    print(f"{'chunks':>8} {'add us/chunk':>14} {'merge us/chunk':>16} {'invoke_stream us/chunk':>24}")
+    for count in CHUNK_COUNTS:
+        chunks = create_chunks(count)
+
+        start = time.perf_counter()
+        add_one_by_one(chunks)
+        added = time.perf_counter() - start
+
+        start = time.perf_counter()
+        StreamingChatMessageContent.merge(chunks)
+        merged = time.perf_counter() - start
+
+        @kernel_function(name="stream")
+        async def stream() -> AsyncIterable[List[StreamingChatMessageContent]]:
+            for chunk in chunks:
+                yield [chunk]
+
+        kernel = Kernel()
+        function = KernelFunction.from_method(method=stream, plugin_name="benchmark")
+        start = time.perf_counter()
+        asyncio.run(invoke_stream(kernel, function))
+        streamed = time.perf_counter() - start
+
+        print(f"{count:>8} {added / count * 1e6:>14.2f} {merged / count * 1e6:>16.2f} {streamed / count * 1e6:>24.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+"""Benchmark of text_chunker on a large corpus with the heuristic and a BPE tokenizer.
+
+Chunks a generated corpus of 50 MB into lines and paragraphs and reports the throughput and the size of the
+largest chunk in tokens, which should not be above the limit. Pass the path of a tiktoken file, like
+cl100k_base.tiktoken, to count with a real encoding, otherwise an encoding of the words of the corpus is used.
+
+Run from the python folder with: python -m tests.benchmarks.bench_text_chunker [path/to/encoding.tiktoken]
+"""
+
+import random
+import sys
+import time
+
+from semantic_kernel.text import split_plaintext_lines, split_plaintext_paragraph
+from semantic_kernel.text.tokenizers import BpeTokenizer, HeuristicTokenizer, TokenizerBase
+
+CORPUS_MB = 50
+MAX_TOKENS_PER_LINE = 100
+MAX_TOKENS_PER_PARAGRAPH = 1024
+WORDS = (
+    "the of and to in is was for that with as on by at from his her it an are were which be this has had not but "
+    "semantic kernel planner function plugin memory embedding prompt completion token chunk summary conversation"
+).split()
+PUNCTUATION = [".", ".", ",", ",", ",", "?", "!", ";", ":"]
+
+
+def generate_corpus(size: int) -> str:
+    rng = random.Random(42)
+    sentences = []
+    for _ in range(1000):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(5, 30))]
+        for index in range(3, len(words), 7):
+            words[index] += rng.choice(PUNCTUATION)
+        sentences.append(" ".join(words).capitalize() + ".")
+    paragraphs = [" ".join(rng.choice(sentences) for _ in range(rng.randint(2, 8))) for _ in range(500)]
+    corpus = []
+    length = 0
+    while length < size:
+        paragraph = rng.choice(paragraphs)
+        corpus.append(paragraph)
+        length += len(paragraph) + 2
+    return "\n\n".join(corpus)
+
+
+def corpus_tokenizer() -> BpeTokenizer:
+    ranks = {bytes([byte]): byte for byte in range(256)}
+    for word in WORDS:
+        for token in (word, f" {word}", word.capitalize(), f" {word.capitalize()}"):
+            for end in range(2, len(token) + 1):
+                ranks.setdefault(token[:end].encode("utf-8"), len(ranks))
+    return BpeTokenizer(ranks)
+
+
+def bench(name: str, corpus: str, tokenizer: TokenizerBase) -> None:
+    start = time.perf_counter()
+    lines = split_plaintext_lines(corpus, MAX_TOKENS_PER_LINE, tokenizer)
+    paragraphs = split_plaintext_paragraph(lines, MAX_TOKENS_PER_PARAGRAPH, tokenizer)
+    elapsed = time.perf_counter() - start
+    largest = max(tokenizer.count_tokens(paragraph) for paragraph in paragraphs)
+    megabytes = len(corpus) / 1024 / 1024
+    print(f"{name:>10} {elapsed:>8.1f} {megabytes / elapsed:>7.2f} {len(lines):>9} {len(paragraphs):>11} {largest:>8}")
+
+
+def main() -> None:
+    corpus = generate_corpus(CORPUS_MB * 1024 * 1024)
+    bpe = BpeTokenizer.from_tiktoken_file(sys.argv[1]) if len(sys.argv) > 1 else corpus_tokenizer()
+    print(f"{'tokenizer':>10} {'seconds':>8} {'MB/s':>7} {'lines':>9} {'paragraphs':>11} {'largest':>8}")
+    bench("heuristic", corpus, HeuristicTokenizer())
+    bench("bpe", corpus, bpe)
+
+
+if __name__ == "__main__":
+    main()
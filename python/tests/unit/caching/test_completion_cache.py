@@ -0,0 +1,209 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from semantic_kernel.caching.completion_cache import CompletionCache
+from semantic_kernel.caching.completion_cache_store_base import CachedCompletion
+from semantic_kernel.caching.sqlite_completion_cache_store import SqliteCompletionCacheStore
+from semantic_kernel.caching.volatile_completion_cache_store import VolatileCompletionCacheStore
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
+    OpenAIChatPromptExecutionSettings,
+)
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.functions.kernel_function_from_prompt import KernelFunctionFromPrompt
+from semantic_kernel.kernel import Kernel
+
+COMPLETE_CHAT = (
+    "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion.OpenAIChatCompletion.complete_chat"
+)
+COMPLETE_CHAT_STREAM = (
+    "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion.OpenAIChatCompletion.complete_chat_stream"
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class KeywordEmbeddings(EmbeddingGeneratorBase):
+    """Embeds texts by the keywords they contain, so similar questions get similar embeddings."""
+
+    calls: int = 0
+
+    async def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        self.calls += 1
+        keywords = ["refund", "order", "password", "shipping"]
+        return np.array([[1.0 + (keyword in text.lower()) * 5 for keyword in keywords] for text in texts])
+
+
+def completion(text: str, created_at: float = 0.0) -> CachedCompletion:
+    return CachedCompletion(contents=[text], created_at=created_at)
+
+
+@pytest.mark.asyncio
+async def test_volatile_store_evicts_least_recently_used():
+    store = VolatileCompletionCacheStore(max_entries=2)
+    assert await store.set("a", completion("a")) == []
+    assert await store.set("b", completion("b")) == []
+    await store.get("a")
+    assert await store.set("c", completion("c")) == ["b"]
+    assert await store.get("b") is None
+    assert len(store) == 2
+
+
+@pytest.mark.asyncio
+async def test_volatile_store_size_budget():
+    size = completion("x" * 10).size
+    store = VolatileCompletionCacheStore(max_size=size * 2)
+    await store.set("a", completion("x" * 10))
+    await store.set("b", completion("x" * 10))
+    assert await store.set("c", completion("x" * 10)) == ["a"]
+    assert store.total_size == size * 2
+    # a completion that is larger than the budget on its own is not kept
+    assert "d" in await store.set("d", completion("x" * size * 2))
+    assert await store.get("d") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store(tmp_path):
+    clock = FakeClock()
+    database = str(tmp_path / "cache.db")
+    store = SqliteCompletionCacheStore(database, max_entries=2, clock=clock)
+    await store.set("a", completion("a"))
+    clock.now += 1
+    await store.set("b", completion("b"))
+    clock.now += 1
+    assert (await store.get("a")).contents == ["a"]
+    clock.now += 1
+    assert await store.set("c", completion("c")) == ["b"]
+    store.close()
+
+    reopened = SqliteCompletionCacheStore(database, max_entries=2, clock=clock)
+    assert (await reopened.get("c")).contents == ["c"]
+    assert await reopened.get("b") is None
+    await reopened.remove("c")
+    assert await reopened.get("c") is None
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_exact_tier_scope_and_ttl():
+    clock = FakeClock()
+    cache = CompletionCache(ttl=60, clock=clock)
+    service = OpenAIChatCompletion(service_id="test", ai_model_id="test", api_key="test")
+    scope = cache.get_scope(service, OpenAIChatPromptExecutionSettings(temperature=0.0))
+
+    await cache.set(scope, "What is 2+2?", ["4"])
+    cached, tier = await cache.get(scope, "What is 2+2?")
+    assert cached.contents == ["4"]
+    assert tier == "exact"
+    assert await cache.get(scope, "What is 3+3?") is None
+
+    other_settings = cache.get_scope(service, OpenAIChatPromptExecutionSettings(temperature=1.0))
+    assert await cache.get(other_settings, "What is 2+2?") is None
+    # the fields services fill in with the request are not part of the scope
+    assert scope == cache.get_scope(
+        service, OpenAIChatPromptExecutionSettings(temperature=0.0, messages=[{"role": "user", "content": "x"}])
+    )
+
+    clock.now += 61
+    assert await cache.get(scope, "What is 2+2?") is None
+
+
+@pytest.mark.asyncio
+async def test_semantic_tier():
+    embeddings = KeywordEmbeddings(service_id="embeddings", ai_model_id="test")
+    cache = CompletionCache(embedding_generator=embeddings, similarity_threshold=0.99)
+    service = OpenAIChatCompletion(service_id="test", ai_model_id="test", api_key="test")
+    scope = cache.get_scope(service, OpenAIChatPromptExecutionSettings())
+    other_scope = cache.get_scope(service, OpenAIChatPromptExecutionSettings(max_tokens=5))
+
+    assert await cache.get(scope, "How do I get a refund?") is None
+    await cache.set(scope, "How do I get a refund?", ["Use the refund form."])
+    # the embedding of the miss is reused when the completion is stored
+    assert embeddings.calls == 1
+
+    cached, tier = await cache.get(scope, "Can I get a refund please")
+    assert cached.contents == ["Use the refund form."]
+    assert tier == "semantic"
+    assert await cache.get(scope, "I forgot my password") is None
+    assert await cache.get(other_scope, "Can I get a refund please") is None
+
+
+@pytest.mark.asyncio
+async def test_semantic_tier_drops_evicted_completions():
+    embeddings = KeywordEmbeddings(service_id="embeddings", ai_model_id="test")
+    cache = CompletionCache(
+        store=VolatileCompletionCacheStore(max_entries=1), embedding_generator=embeddings, similarity_threshold=0.99
+    )
+    service = OpenAIChatCompletion(service_id="test", ai_model_id="test", api_key="test")
+    scope = cache.get_scope(service, OpenAIChatPromptExecutionSettings())
+
+    await cache.set(scope, "How do I get a refund?", ["Use the refund form."])
+    await cache.set(scope, "Where is my order?", ["It is on its way."])
+    assert await cache.get(scope, "Can I get a refund please") is None
+    assert len(await cache.semantic_store.get_nearest_matches("completion_cache", np.ones(4), limit=10)) == 1
+
+
+@pytest.mark.asyncio
+async def test_prompt_function_uses_cache():
+    kernel = Kernel(completion_cache=CompletionCache())
+    kernel.add_service(OpenAIChatCompletion(service_id="test", ai_model_id="test", api_key="test"))
+    function = KernelFunctionFromPrompt(
+        function_name="test",
+        plugin_name="test",
+        prompt="{{$input}}",
+        prompt_execution_settings=PromptExecutionSettings(service_id="test"),
+    )
+
+    with patch(COMPLETE_CHAT) as mock:
+        mock.return_value = [ChatMessageContent(role="assistant", content="answer", metadata={})]
+        first = await function.invoke(kernel=kernel, input="question")
+        second = await function.invoke(kernel=kernel, input="question")
+        assert mock.call_count == 1
+    assert str(first) == str(second) == "answer"
+    assert second.value[0].metadata["cache_hit"] == "exact"
+
+    with patch(COMPLETE_CHAT_STREAM) as mock:
+        results = [result async for result in function.invoke_stream(kernel=kernel, input="question")]
+        assert mock.call_count == 0
+    assert len(results) == 1
+    assert isinstance(results[0][0], StreamingChatMessageContent)
+    assert str(results[0][0]) == "answer"
+
+
+@pytest.mark.asyncio
+async def test_prompt_function_caches_streamed_completion():
+    kernel = Kernel(completion_cache=CompletionCache())
+    kernel.add_service(OpenAIChatCompletion(service_id="test", ai_model_id="test", api_key="test"))
+    function = KernelFunctionFromPrompt(
+        function_name="test",
+        plugin_name="test",
+        prompt="{{$input}}",
+        prompt_execution_settings=PromptExecutionSettings(service_id="test"),
+    )
+
+    async def stream(**kwargs):
+        for part in ["an", "s", "wer"]:
+            yield [StreamingChatMessageContent(choice_index=0, role="assistant", content=part)]
+
+    with patch(COMPLETE_CHAT_STREAM, side_effect=[stream()]):
+        results = [result async for result in function.invoke_stream(kernel=kernel, input="question")]
+    assert len(results) == 3
+
+    with patch(COMPLETE_CHAT) as mock:
+        result = await function.invoke(kernel=kernel, input="question")
+        assert mock.call_count == 0
+    assert str(result) == "answer"
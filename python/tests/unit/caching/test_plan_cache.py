@@ -0,0 +1,196 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from semantic_kernel.caching.plan_cache import PlanCache
+from semantic_kernel.caching.volatile_completion_cache_store import VolatileCompletionCacheStore
+from semantic_kernel.exceptions import PlannerInvalidPlanError
+from semantic_kernel.functions.function_result import FunctionResult
+from semantic_kernel.functions.kernel_arguments import KernelArguments
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from semantic_kernel.kernel import Kernel
+from semantic_kernel.planners import Plan
+from semantic_kernel.planners.sequential_planner.sequential_planner import SequentialPlanner
+from semantic_kernel.planners.sequential_planner.sequential_planner_config import SequentialPlannerConfig
+from semantic_kernel.planners.sequential_planner.sequential_planner_parser import SequentialPlanParser
+
+PLAN_XML = """<plan>
+    <function.lookup.capital country="France" setContextVariable="CAPITAL"/>
+    <function.lookup.greet name="$CAPITAL"/>
+</plan>"""
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class LookupPlugin:
+    def __init__(self) -> None:
+        self.calls = []
+
+    @kernel_function(name="capital", cacheable=True)
+    def capital(self, country: str) -> str:
+        self.calls.append(country)
+        return {"France": "Paris", "Italy": "Rome"}[country]
+
+    @kernel_function(name="greet")
+    def greet(self, name: str) -> str:
+        self.calls.append(name)
+        return f"Hello {name}"
+
+
+def create_kernel():
+    kernel = Kernel()
+    plugin = LookupPlugin()
+    kernel.import_plugin_from_object(plugin, "lookup")
+    return kernel, plugin
+
+
+def create_plan(kernel: Kernel, cache: PlanCache) -> Plan:
+    plan = SequentialPlanParser.to_plan_from_xml(PLAN_XML, "goal", SequentialPlanParser.get_plugin_function(kernel))
+    plan.cache = cache
+    return plan
+
+
+def test_cacheable_is_in_the_metadata():
+    kernel, _ = create_kernel()
+    assert kernel.plugins["lookup"]["capital"].metadata.is_cacheable
+    assert not kernel.plugins["lookup"]["greet"].metadata.is_cacheable
+
+
+@pytest.mark.asyncio
+async def test_cacheable_steps_are_memoized():
+    kernel, plugin = create_kernel()
+    cache = PlanCache()
+
+    first = await create_plan(kernel, cache).invoke(kernel, KernelArguments(input="go"))
+    second = await create_plan(kernel, cache).invoke(kernel, KernelArguments(input="again"))
+
+    assert str(first) == str(second) == "Hello Paris"
+    # the capital is looked up once, the greeting is not cacheable
+    assert plugin.calls == ["France", "Paris", "Paris"]
+    assert second.metadata["results"][0].metadata == {"cached": True}
+
+
+class NumbersPlugin:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @kernel_function(name="digits", cacheable=True)
+    def digits(self, number: str) -> list:
+        self.calls += 1
+        return [int(digit) for digit in number]
+
+    @kernel_function(name="count", cacheable=True)
+    def count(self, number: str) -> int:
+        self.calls += 1
+        return len(number)
+
+
+@pytest.mark.asyncio
+async def test_memoized_steps_keep_the_type_of_their_result():
+    kernel = Kernel()
+    plugin = NumbersPlugin()
+    kernel.import_plugin_from_object(plugin, "numbers")
+    cache = PlanCache()
+    plan_xml = '<plan><function.numbers.digits number="123"/><function.numbers.count number="123"/></plan>'
+
+    results = []
+    for _ in range(2):
+        plan = SequentialPlanParser.to_plan_from_xml(plan_xml, "goal", SequentialPlanParser.get_plugin_function(kernel))
+        plan.cache = cache
+        results.append([result.value for result in (await plan.invoke(kernel)).metadata["results"]])
+
+    assert results == [[[1, 2, 3], 3], [[1, 2, 3], 3]]
+    assert isinstance(results[1][1], int)
+    assert plugin.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_results_json_does_not_restore_are_not_memoized():
+    cache = PlanCache()
+
+    await cache.set_step_result("tuple", (1, 2))
+    await cache.set_step_result("nested", {"a": (1, 2)})
+    await cache.set_step_result("object", object())
+
+    assert await cache.get_step_result("tuple") == (1, 2)
+    assert await cache.get_step_result("nested") is None
+    assert await cache.get_step_result("object") is None
+
+
+@pytest.mark.asyncio
+async def test_step_key_only_uses_function_parameters():
+    kernel, _ = create_kernel()
+    cache = PlanCache()
+    metadata = kernel.plugins["lookup"]["capital"].metadata
+
+    key = cache.get_step_key(metadata, KernelArguments(country="France", input="a"))
+
+    assert key == cache.get_step_key(metadata, KernelArguments(country="France", input="b"))
+    assert key != cache.get_step_key(metadata, KernelArguments(country="Italy", input="a"))
+    assert key != cache.get_step_key(kernel.plugins["lookup"]["greet"].metadata, KernelArguments(country="France"))
+
+
+@pytest.mark.asyncio
+async def test_memoized_steps_expire_and_are_evicted():
+    kernel, _ = create_kernel()
+    clock = FakeClock()
+    cache = PlanCache(store=VolatileCompletionCacheStore(max_entries=1), ttl=60, clock=clock)
+    metadata = kernel.plugins["lookup"]["capital"].metadata
+    france = cache.get_step_key(metadata, {"country": "France"})
+    italy = cache.get_step_key(metadata, {"country": "Italy"})
+
+    await cache.set_step_result(france, "Paris")
+    assert await cache.get_step_result(france) == "Paris"
+    clock.now += 61
+    assert await cache.get_step_result(france) is None
+
+    await cache.set_step_result(france, "Paris")
+    await cache.set_step_result(italy, "Rome")
+    assert await cache.get_step_result(france) is None
+    assert await cache.get_step_result(italy) == "Rome"
+
+
+@pytest.mark.asyncio
+async def test_plan_json_round_trip():
+    kernel, _ = create_kernel()
+    plan = create_plan(kernel, None)
+    plan.max_parallelism = 2
+
+    restored = Plan.from_json(plan.to_json(), kernel)
+
+    assert restored.to_dict() == plan.to_dict()
+    assert restored.max_parallelism == 2
+    assert restored.steps[0].function is kernel.plugins["lookup"]["capital"]
+    assert restored.steps[1].parameters["name"] == "$CAPITAL"
+    result = await restored.invoke(kernel, KernelArguments(input="go"))
+    assert str(result) == "Hello Paris"
+
+    with pytest.raises(PlannerInvalidPlanError):
+        Plan.from_json(plan.to_json(), Kernel())
+
+
+@pytest.mark.asyncio
+async def test_sequential_planner_reuses_plans_for_repeated_goals():
+    kernel, _ = create_kernel()
+    cache = PlanCache()
+    planner = SequentialPlanner(kernel, service_id="test", config=SequentialPlannerConfig(plan_cache=cache))
+    flow_result = FunctionResult(function=planner._function_flow_function.metadata, value=PLAN_XML)
+
+    with patch.object(type(planner._function_flow_function), "invoke", AsyncMock(return_value=flow_result)) as invoke:
+        first = await planner.create_plan("Greet the capital of France")
+        second = await planner.create_plan("Greet the capital of France")
+        assert invoke.await_count == 1
+        await planner.create_plan("Greet the capital of Italy")
+        assert invoke.await_count == 2
+
+    assert second.to_dict() == first.to_dict()
+    assert second.cache is cache
+    assert str(await second.invoke(kernel, KernelArguments(input="go"))) == "Hello Paris"
@@ -6,7 +6,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pydantic import ValidationError
 
+from semantic_kernel.exceptions import ServiceResponseException
+
 if sys.version_info >= (3, 9):
+    from google.api_core.exceptions import TooManyRequests
+
     from semantic_kernel.connectors.ai.google_palm.services.gp_text_embedding import (
         GooglePalmTextEmbedding,
     )
@@ -65,3 +69,65 @@ async def test_google_palm_text_embedding_calls_with_parameters() -> None:
             model=ai_model_id,
             text=text,
         )
+
+
+@pytest.mark.asyncio
+async def test_google_palm_text_embedding_configures_once_and_preserves_order() -> None:
+    mock_gp = MagicMock()
+    mock_gp.generate_embeddings.side_effect = lambda model, text: {"embedding": [float(len(text))]}
+    with patch(
+        "semantic_kernel.connectors.ai.google_palm.services.gp_text_embedding.palm",
+        new=mock_gp,
+    ):
+        gp_text_embedding = GooglePalmTextEmbedding(
+            ai_model_id="test_model_id",
+            api_key="test_api_key",
+            max_concurrency=2,
+        )
+        texts = ["a" * i for i in range(1, 11)]
+
+        embeddings = await gp_text_embedding.generate_embeddings(texts)
+        await gp_text_embedding.generate_embeddings(texts)
+
+        mock_gp.configure.assert_called_once_with(api_key="test_api_key")
+        assert [embedding[0] for embedding in embeddings] == [float(i) for i in range(1, 11)]
+
+
+@pytest.mark.asyncio
+async def test_google_palm_text_embedding_retries_when_rate_limited() -> None:
+    mock_gp = MagicMock()
+    mock_gp.generate_embeddings.side_effect = [TooManyRequests("rate limited"), {"embedding": [0.1, 0.2, 0.3]}]
+    with patch(
+        "semantic_kernel.connectors.ai.google_palm.services.gp_text_embedding.palm",
+        new=mock_gp,
+    ):
+        gp_text_embedding = GooglePalmTextEmbedding(
+            ai_model_id="test_model_id",
+            api_key="test_api_key",
+            retry_delay=0,
+        )
+
+        embeddings = await gp_text_embedding.generate_embeddings(["hello world"])
+
+        assert mock_gp.generate_embeddings.call_count == 2
+        assert embeddings.shape == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_google_palm_text_embedding_raises_after_max_retries() -> None:
+    mock_gp = MagicMock()
+    mock_gp.generate_embeddings.side_effect = TooManyRequests("rate limited")
+    with patch(
+        "semantic_kernel.connectors.ai.google_palm.services.gp_text_embedding.palm",
+        new=mock_gp,
+    ):
+        gp_text_embedding = GooglePalmTextEmbedding(
+            ai_model_id="test_model_id",
+            api_key="test_api_key",
+            max_retries=2,
+            retry_delay=0,
+        )
+
+        with pytest.raises(ServiceResponseException):
+            await gp_text_embedding.generate_embeddings(["hello world"])
+        assert mock_gp.generate_embeddings.call_count == 3
@@ -1,9 +1,15 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
 import pytest
+import torch
 
 import semantic_kernel.connectors.ai.hugging_face as sk_hf
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.exceptions import ServiceResponseException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.kernel import Kernel
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
@@ -126,3 +132,85 @@ async def test_text_completion_stream(model_name, task, input_str):
     output = str(summary).strip()
     print(f"Completion using input string: '{output}'")
     assert len(output) > 0
+
+
+@pytest.mark.asyncio
+async def test_text_completion_stream_reuses_tokenizer():
+    def generate(prompt, streamer, **kwargs):
+        streamer.on_finalized_text("Hello ")
+        streamer.on_finalized_text("world", stream_end=True)
+
+    generator = MagicMock(side_effect=generate)
+    with patch(
+        "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline", return_value=generator
+    ), patch(
+        "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.AutoTokenizer"
+    ) as mock_auto_tokenizer:
+        service = sk_hf.HuggingFaceTextCompletion(service_id="test", ai_model_id="test-model", task="text-generation")
+        settings = sk_hf.HuggingFacePromptExecutionSettings()
+        for _ in range(2):
+            chunks = [chunk[0].text async for chunk in service.complete_stream("prompt", settings)]
+            assert chunks == ["Hello ", "world"]
+
+    assert service.tokenizer is generator.tokenizer
+    mock_auto_tokenizer.from_pretrained.assert_not_called()
+    assert generator.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_text_completion_stream_generation_fails():
+    generator = MagicMock(side_effect=RuntimeError("generation failed"))
+    with patch(
+        "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline", return_value=generator
+    ):
+        service = sk_hf.HuggingFaceTextCompletion(service_id="test", ai_model_id="test-model", task="text-generation")
+        with pytest.raises(ServiceResponseException):
+            async for _ in service.complete_stream("prompt", sk_hf.HuggingFacePromptExecutionSettings()):
+                pass
+
+
+def generate_until_stopped(prompt, streamer, stopping_criteria, **kwargs):
+    input_ids = torch.zeros((1, 1), dtype=torch.long)
+    while not stopping_criteria(input_ids, None).all():
+        streamer.on_finalized_text("token ")
+        time.sleep(0.01)
+    streamer.on_finalized_text("", stream_end=True)
+
+
+@pytest.mark.asyncio
+async def test_text_completion_stream_stops_generation_when_consumer_stops():
+    generator = MagicMock(side_effect=generate_until_stopped)
+    with patch(
+        "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline", return_value=generator
+    ):
+        service = sk_hf.HuggingFaceTextCompletion(service_id="test", ai_model_id="test-model", task="text-generation")
+        settings = sk_hf.HuggingFacePromptExecutionSettings()
+        for _ in range(2):
+            # the second stream only gets the single generation thread when the first generation stopped
+            stream = service.complete_stream("prompt", settings)
+            chunk = await asyncio.wait_for(stream.__anext__(), timeout=5)
+            assert chunk[0].text == "token "
+            await stream.aclose()
+        service.close()
+
+    assert generator.call_count == 2
+    assert service._stream_executor is None
+
+
+@pytest.mark.asyncio
+async def test_close_stops_running_generations():
+    generator = MagicMock(side_effect=generate_until_stopped)
+    with patch(
+        "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline", return_value=generator
+    ):
+        service = sk_hf.HuggingFaceTextCompletion(service_id="test", ai_model_id="test-model", task="text-generation")
+        stream = service.complete_stream("prompt", sk_hf.HuggingFacePromptExecutionSettings())
+        await stream.__anext__()
+        service.close()
+        chunks = await asyncio.wait_for(_read_all(stream), timeout=5)
+
+    assert all(chunk[0].text in ("token ", "") for chunk in chunks)
+
+
+async def _read_all(stream):
+    return [chunk async for chunk in stream]
@@ -5,7 +5,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from openai import AsyncOpenAI
+from openai.types.chat.chat_completion_chunk import (
+    ChatCompletionChunk,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
+from pydantic import BaseModel
 
+from semantic_kernel.connectors.ai.open_ai.contents.function_call import FunctionCall
 from semantic_kernel.connectors.ai.open_ai.contents.open_ai_chat_message_content import (
     OpenAIChatMessageContent,
 )
@@ -16,7 +25,10 @@ from semantic_kernel.connectors.ai.open_ai.contents.tool_calls import ToolCall
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import (
     OpenAIChatCompletionBase,
 )
+from semantic_kernel.connectors.ai.open_ai.services.streaming_chat_state import StreamingChatState
 from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.chat_role import ChatRole
 from semantic_kernel.kernel import Kernel
 
 
@@ -29,14 +41,14 @@ async def mock_async_process_chat_stream_response(arg1, response, tool_call_beha
 async def test_complete_chat_stream():
     chat_history = MagicMock()
     settings = MagicMock()
-    mock_response = MagicMock()
+    mock_response = AsyncMock()
 
     with patch(
         "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion_base.OpenAIChatCompletionBase._get_auto_invoke_execution_settings",
         return_value=(True, 3),
     ) as settings_mock, patch(
         "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion_base.OpenAIChatCompletionBase._validate_kernel_for_tool_calling",
-        return_value=MagicMock(),
+        side_effect=lambda kernel: kernel,
     ) as validate_kernel_mock, patch(
         "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion_base.OpenAIChatCompletionBase._prepare_settings",
         return_value=settings,
@@ -60,6 +72,7 @@ async def test_complete_chat_stream():
         validate_kernel_mock.assert_called_once_with(kernel=kernel)
         prepare_settings_mock.assert_called_with(settings, chat_history, stream_request=True)
         mock_send_chat_stream_request.assert_called_with(settings)
+        assert mock_response.close.await_count == 3
 
 
 @pytest.mark.parametrize("tool_call", [False, True])
@@ -74,7 +87,7 @@ async def test_complete_chat(tool_call):
         return_value=(True, 3),
     ) as settings_mock, patch(
         "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion_base.OpenAIChatCompletionBase._validate_kernel_for_tool_calling",
-        return_value=MagicMock(),
+        side_effect=lambda kernel: kernel,
     ) as validate_kernel_mock, patch(
         "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion_base.OpenAIChatCompletionBase._prepare_settings",
         return_value=settings,
@@ -113,12 +126,32 @@ def test_build_streaming_message_with_tool_call():
         ai_model_id="test_model_id", service_id="test", client=MagicMock(spec=AsyncOpenAI)
     )
 
-    stream_chunks = {1: [MagicMock(spec=OpenAIStreamingChatMessageContent)]}
-    update_storage = {"tool_call_ids_by_index": {1: MagicMock(spec=ToolCall)}}
+    state = StreamingChatState()
+    chunk = ChatCompletionChunk(
+        id="test",
+        created=0,
+        model="test",
+        object="chat.completion.chunk",
+        choices=[
+            ChunkChoice(
+                index=1,
+                delta=ChoiceDelta(
+                    tool_calls=[
+                        ChoiceDeltaToolCall(
+                            index=0, id="call_1", function=ChoiceDeltaToolCallFunction(name="a-b", arguments="{}")
+                        )
+                    ]
+                ),
+            )
+        ],
+    )
+    state.update(chunk, chunk.choices[0])
 
-    result = chat_completion_base._build_streaming_message_with_tool_call(stream_chunks, update_storage)
+    result = chat_completion_base._build_streaming_message_with_tool_call(state)
 
-    assert result is not None
+    assert len(result) == 1
+    assert result[0].choice_index == 1
+    assert result[0].tool_calls[0].function.name == "a-b"
 
 
 @pytest.mark.asyncio
@@ -187,3 +220,51 @@ async def test_should_return_completions_response(completions, auto_invoke_kerne
     )
     result = chat_completion_base._should_return_completions_response(completions, auto_invoke_kernel_functions)
     assert result == expected_result
+
+
+def test_prepare_chat_history_for_request_serializes_new_and_changed_messages():
+    chat_completion_base = OpenAIChatCompletionBase(
+        ai_model_id="test_model_id", service_id="test", client=MagicMock(spec=AsyncOpenAI)
+    )
+    chat_history = ChatHistory(system_message="be brief")
+    chat_history.add_user_message("hello")
+    prepared = chat_completion_base._prepare_chat_history_for_request(chat_history)
+
+    with patch.object(ChatMessageContent, "model_dump", autospec=True, side_effect=BaseModel.model_dump) as model_dump:
+        chat_history.add_tool_message("42", metadata={"tool_call_id": "1", "function_name": "math-add"})
+        chat_history.messages[1].content = "hello again"
+        prepared_again = chat_completion_base._prepare_chat_history_for_request(chat_history)
+
+    # the metadata of the tool message can be changed in place, it is dumped on its own on every call
+    assert sum(1 for call in model_dump.call_args_list if call.kwargs.get("include") is None) == 2
+    assert prepared == [{"role": "system", "content": "be brief"}, {"role": "user", "content": "hello"}]
+    assert prepared_again == [
+        {"role": "system", "content": "be brief"},
+        {"role": "user", "content": "hello again"},
+        {"role": "tool", "content": "42", "tool_call_id": "1", "name": "math-add"},
+    ]
+    # the returned dicts are copies, changing them does not change the cached dicts
+    prepared_again[0]["author"] = prepared_again[0].pop("role")
+    assert chat_completion_base._prepare_chat_history_for_request(chat_history)[0]["role"] == "system"
+
+
+def test_prepare_chat_history_for_request_sees_changes_in_place():
+    chat_completion_base = OpenAIChatCompletionBase(
+        ai_model_id="test_model_id", service_id="test", client=MagicMock(spec=AsyncOpenAI)
+    )
+    chat_history = ChatHistory()
+    chat_history.add_tool_message("42", metadata={"tool_call_id": "1", "function_name": "math-add"})
+    chat_history.add_message(
+        OpenAIChatMessageContent(
+            role=ChatRole.ASSISTANT,
+            tool_calls=[ToolCall(id="1", function=FunctionCall(name="math-add", arguments="{}"))],
+        )
+    )
+    chat_completion_base._prepare_chat_history_for_request(chat_history)
+
+    chat_history.messages[0].metadata["tool_call_id"] = "2"
+    chat_history.messages[1].tool_calls.append(ToolCall(id="2", function=FunctionCall(name="math-sub")))
+    prepared = chat_completion_base._prepare_chat_history_for_request(chat_history)
+
+    assert prepared[0]["tool_call_id"] == "2"
+    assert [tool_call["id"] for tool_call in prepared[1]["tool_calls"]] == ["1", "2"]
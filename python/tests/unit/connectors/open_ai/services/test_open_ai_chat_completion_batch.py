@@ -0,0 +1,259 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import json
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from openai import AsyncAzureOpenAI, AsyncOpenAI
+
+from semantic_kernel.connectors.ai.open_ai.contents.open_ai_chat_message_content import OpenAIChatMessageContent
+from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
+    OpenAIChatPromptExecutionSettings,
+)
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion_batch import (
+    OpenAIBatchJob,
+    OpenAIChatCompletionBatch,
+)
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.exceptions import ServiceResponseException
+
+
+def completion_line(custom_id: str, content: str) -> bytes:
+    body = {
+        "id": f"chatcmpl-{custom_id}",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "test-model",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+    }
+    line = {"id": f"batch_req_{custom_id}", "custom_id": custom_id, "response": {"status_code": 200, "body": body}}
+    return json.dumps(line).encode() + b"\n"
+
+
+class StandInServer:
+    """Serves the files and batches endpoints from memory, the job is completed on the second status check."""
+
+    def __init__(self, output: bytes, errors: bytes = b""):
+        self.files = {"file-output": output}
+        if errors:
+            self.files["file-errors"] = errors
+        self.jobs = {}
+        self.ranges = []
+
+    async def upload(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        assert form["purpose"] == "batch"
+        self.files["file-input"] = form["file"].file.read()
+        return web.json_response(
+            {
+                "id": "file-input",
+                "object": "file",
+                "bytes": len(self.files["file-input"]),
+                "created_at": 0,
+                "filename": "requests.jsonl",
+                "purpose": "batch",
+                "status": "processed",
+            }
+        )
+
+    async def create_batch(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        job = {"id": "batch_1", "status": "validating", "checks": 0, **body}
+        self.jobs[job["id"]] = job
+        return web.json_response(job)
+
+    async def get_batch(self, request: web.Request) -> web.Response:
+        job = self.jobs[request.match_info["batch_id"]]
+        job["checks"] += 1
+        if job["checks"] > 1:
+            job["status"] = "completed"
+            job["output_file_id"] = "file-output"
+            job["error_file_id"] = "file-errors" if "file-errors" in self.files else None
+        job["request_counts"] = {"total": 2, "completed": job["checks"] - 1, "failed": 0}
+        return web.json_response(job)
+
+    async def cancel_batch(self, request: web.Request) -> web.Response:
+        job = self.jobs[request.match_info["batch_id"]]
+        job["status"] = "cancelling"
+        return web.json_response(job)
+
+    async def content(self, request: web.Request) -> web.StreamResponse:
+        data = self.files[request.match_info["file_id"]]
+        start = 0
+        if "Range" in request.headers:
+            start = int(request.headers["Range"][len("bytes=") :].rstrip("-"))
+            self.ranges.append(start)
+            if start >= len(data):
+                return web.json_response({"error": {"message": "Range not satisfiable"}}, status=416)
+        response = web.StreamResponse(status=206 if start else 200)
+        await response.prepare(request)
+        data = data[start:]
+        for index in range(0, len(data), 7):
+            await response.write(data[index : index + 7])
+        await response.write_eof()
+        return response
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/v1/files", self.upload)
+        app.router.add_post("/v1/batches", self.create_batch)
+        app.router.add_get("/v1/batches/{batch_id}", self.get_batch)
+        app.router.add_post("/v1/batches/{batch_id}/cancel", self.cancel_batch)
+        app.router.add_get("/v1/files/{file_id}/content", self.content)
+        return app
+
+
+@pytest_asyncio.fixture
+async def stand_in():
+    async def start(server: StandInServer, azure: bool = False) -> OpenAIChatCompletionBatch:
+        runner = web.AppRunner(server.app())
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        runners.append(runner)
+        port = site._server.sockets[0].getsockname()[1]
+        if azure:
+            client = AsyncAzureOpenAI(
+                api_key="test", base_url=f"http://127.0.0.1:{port}/v1", api_version="2024-07-01-preview", max_retries=0
+            )
+        else:
+            client = AsyncOpenAI(api_key="test", base_url=f"http://127.0.0.1:{port}/v1", max_retries=0)
+        service = OpenAIChatCompletion(ai_model_id="test-model", async_client=client)
+
+        async def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+
+        return OpenAIChatCompletionBatch(service=service, poll_interval=5, chunk_size=16, sleep=sleep)
+
+    runners = []
+    sleeps = []
+    start.sleeps = sleeps
+    yield start
+    for runner in runners:
+        await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_write_requests(tmp_path):
+    service = OpenAIChatCompletion(ai_model_id="test-model", api_key="test")
+    batch = OpenAIChatCompletionBatch(service=service)
+    chat_history = ChatHistory(system_message="Be brief.")
+    chat_history.add_user_message("Hello")
+    path = str(tmp_path / "requests.jsonl")
+
+    count = await batch.write_requests(
+        [
+            ("a", chat_history, OpenAIChatPromptExecutionSettings(max_tokens=10)),
+            ("b", chat_history, PromptExecutionSettings(extension_data={"temperature": 0.5})),
+        ],
+        path,
+    )
+
+    assert count == 2
+    with open(path) as file:
+        lines = [json.loads(line) for line in file]
+    assert [line["custom_id"] for line in lines] == ["a", "b"]
+    assert lines[0]["url"] == "/v1/chat/completions"
+    assert lines[0]["body"]["model"] == "test-model"
+    assert lines[0]["body"]["max_tokens"] == 10
+    assert lines[0]["body"]["messages"] == [
+        {"role": "system", "content": "Be brief."},
+        {"role": "user", "content": "Hello"},
+    ]
+    assert "stream" not in lines[0]["body"] or lines[0]["body"]["stream"] is False
+    assert lines[1]["body"]["temperature"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_submit_wait_and_get_results(stand_in, tmp_path):
+    errors = json.dumps(
+        {"custom_id": "c", "response": None, "error": {"code": "invalid_request", "message": "Bad request"}}
+    ).encode()
+    server = StandInServer(completion_line("a", "First") + completion_line("b", "Second"), errors + b"\n")
+    batch = await stand_in(server)
+    chat_history = ChatHistory()
+    chat_history.add_user_message("Hello")
+    requests_path = str(tmp_path / "requests.jsonl")
+    await batch.write_requests([("a", chat_history, OpenAIChatPromptExecutionSettings())], requests_path)
+
+    job = await batch.submit(requests_path, metadata={"run": "1"})
+    assert job.status == "validating"
+    assert json.loads(server.files["file-input"])["custom_id"] == "a"
+    assert server.jobs["batch_1"]["endpoint"] == "/v1/chat/completions"
+    assert server.jobs["batch_1"]["completion_window"] == "24h"
+
+    job = await batch.wait(job.id)
+    assert job.status == "completed"
+    assert stand_in.sleeps == [5]
+
+    results = [result async for result in batch.get_results(job)]
+    assert [custom_id for custom_id, _ in results] == ["a", "b", "c"]
+    assert isinstance(results[0][1][0], OpenAIChatMessageContent)
+    assert results[0][1][0].content == "First"
+    assert results[0][1][0].metadata["usage"].total_tokens == 12
+    assert results[1][1][0].content == "Second"
+    assert isinstance(results[2][1], ServiceResponseException)
+
+
+@pytest.mark.asyncio
+async def test_submit_to_azure_uses_endpoint_without_version(stand_in, tmp_path):
+    server = StandInServer(b"")
+    batch = await stand_in(server, azure=True)
+    chat_history = ChatHistory()
+    chat_history.add_user_message("Hello")
+    requests_path = str(tmp_path / "requests.jsonl")
+    await batch.write_requests([("a", chat_history, OpenAIChatPromptExecutionSettings())], requests_path)
+
+    await batch.submit(requests_path)
+
+    assert json.loads(server.files["file-input"])["url"] == "/chat/completions"
+    assert server.jobs["batch_1"]["endpoint"] == "/chat/completions"
+
+
+@pytest.mark.asyncio
+async def test_get_results_resumes_partial_download(stand_in, tmp_path):
+    output = b"".join(completion_line(str(index), f"Answer {index}") for index in range(5))
+    server = StandInServer(output)
+    batch = await stand_in(server)
+    job = OpenAIBatchJob(id="batch_1", status="completed", output_file_id="file-output")
+    path = str(tmp_path / "results.jsonl")
+    # an earlier download stopped in the middle of the third line
+    with open(path, "wb") as file:
+        file.write(output[: output.index(b"\n", output.index(b"\n") + 1) + 20])
+
+    results = [result async for result in batch.get_results(job, path)]
+
+    assert [custom_id for custom_id, _ in results] == ["0", "1", "2", "3", "4"]
+    assert [messages[0].content for _, messages in results] == [f"Answer {index}" for index in range(5)]
+    assert server.ranges == [output.index(b"\n", output.index(b"\n") + 1) + 1]
+    with open(path, "rb") as file:
+        assert file.read() == output
+
+    # the complete local copy is read without downloading it again
+    results = [result async for result in batch.get_results(job, path)]
+    assert len(results) == 5
+    assert server.ranges[-1] == len(output)
+
+
+@pytest.mark.asyncio
+async def test_wait_timeout_cancel_and_unfinished_job(stand_in):
+    server = StandInServer(completion_line("a", "First"))
+    batch = await stand_in(server)
+    server.jobs["batch_1"] = {"id": "batch_1", "status": "in_progress", "checks": -10}
+
+    job = await batch.wait("batch_1", timeout=10)
+    assert job.status == "in_progress"
+    assert stand_in.sleeps == [5, 5]
+
+    with pytest.raises(ServiceResponseException):
+        [result async for result in batch.get_results(job)]
+
+    job = await batch.cancel("batch_1")
+    assert job.status == "cancelling"
+
+    with pytest.raises(ServiceResponseException):
+        await batch.get_job("unknown")
@@ -0,0 +1,126 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from openai.types.chat.chat_completion_chunk import (
+    ChatCompletionChunk,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
+
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
+from semantic_kernel.connectors.ai.open_ai.services.streaming_chat_state import StreamingChatState
+from semantic_kernel.connectors.ai.open_ai.services.tool_call_behavior import ToolCallBehavior
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_role import ChatRole
+from semantic_kernel.contents.finish_reason import FinishReason
+from semantic_kernel.kernel import Kernel
+
+
+def chunk(
+    content: Optional[str] = None,
+    tool_calls: Optional[List[ChoiceDeltaToolCall]] = None,
+    finish_reason: Optional[str] = None,
+    role: Optional[str] = None,
+) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="chatcmpl-test",
+        created=0,
+        model="gpt-test",
+        object="chat.completion.chunk",
+        choices=[
+            ChunkChoice(
+                index=0,
+                delta=ChoiceDelta(role=role, content=content, tool_calls=tool_calls),
+                finish_reason=finish_reason,
+            )
+        ],
+    )
+
+
+def tool_call_delta(
+    index: int, arguments: str, id: Optional[str] = None, name: Optional[str] = None
+) -> ChoiceDeltaToolCall:
+    return ChoiceDeltaToolCall(
+        index=index,
+        id=id,
+        type="function" if id else None,
+        function=ChoiceDeltaToolCallFunction(name=name, arguments=arguments),
+    )
+
+
+async def replay(chunks: List[ChatCompletionChunk]):
+    for item in chunks:
+        yield item
+
+
+TOOL_CALL_STREAM = [
+    chunk(role="assistant", tool_calls=[tool_call_delta(0, "", id="call_1", name="math-Add")]),
+    chunk(tool_calls=[tool_call_delta(0, '{"input": ')]),
+    chunk(tool_calls=[tool_call_delta(1, "", id="call_2", name="math-Subtract")]),
+    chunk(tool_calls=[tool_call_delta(1, '{"input": 2}')]),
+    chunk(tool_calls=[tool_call_delta(0, "1}")]),
+    chunk(finish_reason="tool_calls"),
+]
+
+
+def test_state_assembles_tool_calls_by_index():
+    state = StreamingChatState()
+    for item in TOOL_CALL_STREAM:
+        state.update(item, item.choices[0])
+
+    buffer = state.choices[0]
+    assert buffer.role == ChatRole.ASSISTANT
+    assert buffer.content is None
+    assert buffer.finish_reason == FinishReason.TOOL_CALLS
+    assert [(call.id, call.function.name, call.function.arguments) for call in buffer.get_tool_calls()] == [
+        ("call_1", "math-Add", '{"input": 1}'),
+        ("call_2", "math-Subtract", '{"input": 2}'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_stream_invokes_assembled_tool_calls():
+    service = OpenAIChatCompletion(service_id="test", ai_model_id="test", api_key="test")
+    kernel = MagicMock(spec=Kernel)
+    kernel.invoke = AsyncMock(return_value=MagicMock(value="result"))
+    chat_history = ChatHistory()
+
+    contents = [
+        content
+        async for content in service._process_chat_stream_response(
+            replay(TOOL_CALL_STREAM), ToolCallBehavior(auto_invoke_kernel_functions=True), chat_history, kernel
+        )
+    ]
+
+    # the chunks of the tool calls are not passed on
+    assert len(contents) == 0
+    assert [call.kwargs for call in kernel.func.call_args_list] == [
+        {"plugin_name": "math", "function_name": "Add"},
+        {"plugin_name": "math", "function_name": "Subtract"},
+    ]
+    assert [dict(call.args[1]) for call in kernel.invoke.call_args_list] == [{"input": 1}, {"input": 2}]
+    assert chat_history.messages[0].role == ChatRole.ASSISTANT
+    assert len(chat_history.messages[0].tool_calls) == 2
+    assert [message.metadata["tool_call_id"] for message in chat_history.messages[1:]] == ["call_1", "call_2"]
+
+
+@pytest.mark.asyncio
+async def test_process_stream_yields_content_chunks():
+    service = OpenAIChatCompletion(service_id="test", ai_model_id="test", api_key="test")
+    tool_call_behavior = ToolCallBehavior(auto_invoke_kernel_functions=True)
+    stream = [chunk(role="assistant", content="Hello"), chunk(content=" world"), chunk(finish_reason="stop")]
+
+    contents = [
+        content
+        async for content in service._process_chat_stream_response(
+            replay(stream), tool_call_behavior, ChatHistory(), MagicMock(spec=Kernel)
+        )
+    ]
+
+    assert [str(content[0]) for content in contents] == ["Hello", " world"]
+    assert not tool_call_behavior.auto_invoke_kernel_functions
@@ -1,6 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from unittest.mock import patch
+
 import pytest
+from pydantic import BaseModel
 
 from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.azure_chat_prompt_execution_settings import (
     AzureAISearchDataSources,
@@ -259,3 +262,43 @@ def test_azure_open_ai_chat_prompt_execution_settings_with_aisearch_data_sources
     }
     settings = AzureChatPromptExecutionSettings.model_validate(input_dict, strict=True, from_attributes=True)
     assert settings.extra_body["dataSources"][0]["type"] == "AzureCognitiveSearch"
+
+
+def test_prepare_settings_dict_caches_settings_without_messages():
+    settings = OpenAIChatPromptExecutionSettings(temperature=0.5, messages=[{"role": "user", "content": "Hello"}])
+    with patch.object(
+        OpenAIChatPromptExecutionSettings, "model_dump", autospec=True, side_effect=BaseModel.model_dump
+    ) as model_dump:
+
+        def count_full_dumps():
+            # the logit_bias dict can be changed in place, it is dumped on its own on every call
+            return sum(1 for call in model_dump.call_args_list if call.kwargs.get("include") is None)
+
+        options = settings.prepare_settings_dict()
+        settings.messages = settings.messages + [{"role": "assistant", "content": "Hi"}]
+        options_with_answer = settings.prepare_settings_dict()
+        assert count_full_dumps() == 1
+
+        settings.temperature = 1.0
+        options_with_temperature = settings.prepare_settings_dict()
+        assert count_full_dumps() == 2
+
+    assert len(options["messages"]) == 1
+    assert len(options_with_answer["messages"]) == 2
+    assert options_with_answer["temperature"] == 0.5
+    assert options_with_temperature["temperature"] == 1.0
+    assert settings == settings.model_copy()
+
+
+def test_prepare_settings_dict_sees_changes_in_place():
+    settings = OpenAIChatPromptExecutionSettings(stop=["a"], tools=[{"type": "function", "function": {"name": "f"}}])
+    assert settings.prepare_settings_dict()["stop"] == ["a"]
+
+    settings.stop.append("b")
+    settings.logit_bias[42] = 1.0
+    settings.tools[0]["function"]["name"] = "g"
+    options = settings.prepare_settings_dict()
+
+    assert options["stop"] == ["a", "b"]
+    assert options["logit_bias"] == {42: 1.0}
+    assert options["tools"] == [{"type": "function", "function": {"name": "g"}}]
@@ -0,0 +1,109 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import pytest
+
+from semantic_kernel.connectors.ai.open_ai.utils import get_function_calling_object, get_tool_call_object
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
+from semantic_kernel.kernel import Kernel
+from semantic_kernel.planners.sequential_planner.sequential_planner_extensions import (
+    SequentialPlannerFunctionExtension,
+)
+
+
+class MathPlugin:
+    @kernel_function(name="add", description="Add two numbers")
+    def add(self, a: int, b: int) -> int:
+        return a + b
+
+    @kernel_function(name="negate")
+    def negate(self, a: int) -> int:
+        return -a
+
+
+class TextPlugin:
+    @kernel_function(name="upper")
+    def upper(self, text: str) -> str:
+        return text.upper()
+
+
+@pytest.fixture
+def kernel() -> Kernel:
+    kernel = Kernel()
+    kernel.import_plugin_from_object(MathPlugin(), "math")
+    kernel.import_plugin_from_object(TextPlugin(), "text")
+    return kernel
+
+
+def names(objects):
+    return [obj["function"]["name"] if "function" in obj else obj["name"] for obj in objects]
+
+
+def test_get_tool_call_object(kernel: Kernel):
+    tools = get_tool_call_object(kernel, {})
+
+    assert names(tools) == ["math-add", "math-negate", "text-upper"]
+    assert tools[0] == {
+        "type": "function",
+        "function": {
+            "name": "math-add",
+            "description": "Add two numbers",
+            "parameters": {
+                "type": "object",
+                "properties": {"a": {"description": "", "type": "number"}, "b": {"description": "", "type": "number"}},
+                "required": ["a", "b"],
+            },
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "filter, expected",
+    [
+        ({"include_plugin": ["text"]}, ["text-upper"]),
+        ({"exclude_plugin": ["text"]}, ["math-add", "math-negate"]),
+        ({"include_function": ["math-negate", "text-upper"]}, ["math-negate", "text-upper"]),
+        ({"exclude_function": ["math-negate"], "include_plugin": None}, ["math-add", "text-upper"]),
+    ],
+)
+def test_get_tool_call_object_filters(kernel: Kernel, filter, expected):
+    assert names(get_tool_call_object(kernel, filter)) == expected
+    assert names(get_function_calling_object(kernel, filter)) == expected
+
+
+def test_get_tool_call_object_invalid_filter(kernel: Kernel):
+    with pytest.raises(ValueError):
+        get_tool_call_object(kernel, {"include_plugin": ["math"], "exclude_plugin": ["text"]})
+
+
+def test_tool_call_objects_are_cached_until_plugins_change(kernel: Kernel):
+    tools = get_tool_call_object(kernel, {"exclude_plugin": ["text"]})
+    tools_again = get_tool_call_object(kernel, {"exclude_plugin": ["text"]})
+    assert tools_again is not tools
+    assert all(a is b for a, b in zip(tools, tools_again))
+
+    version = kernel.plugins.version
+    kernel.plugins.remove_by_name("math")
+    assert kernel.plugins.version != version
+    assert get_tool_call_object(kernel, {"exclude_plugin": ["text"]}) == []
+
+    kernel.import_plugin_from_object(MathPlugin(), "math")
+    assert names(get_tool_call_object(kernel, {})) == ["text-upper", "math-add", "math-negate"]
+    # the schemas of functions that were already there are reused
+    assert get_tool_call_object(kernel, {})[0] is get_tool_call_object(kernel, {"include_plugin": ["text"]})[0]
+
+
+def test_tool_call_objects_follow_metadata_changed_in_place(kernel: Kernel):
+    function = kernel.plugins["math"]["negate"]
+    tools = get_tool_call_object(kernel, {"include_plugin": ["math"]})
+    assert list(tools[1]["function"]["parameters"]["properties"]) == ["a"]
+
+    function.metadata.parameters.append(KernelParameterMetadata(name="b", type="int", is_required=True))
+    function.metadata.parameters[0].description = "The number"
+    tools = get_tool_call_object(kernel, {"include_plugin": ["math"]})
+
+    parameters = tools[1]["function"]["parameters"]
+    assert parameters["properties"]["a"]["description"] == "The number"
+    assert parameters["properties"]["b"]["type"] == "number"
+    assert parameters["required"] == ["a", "b"]
+    assert SequentialPlannerFunctionExtension.to_manual_string(function.metadata).count("  - ") == 2
@@ -1,6 +1,8 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import random
 
+import defusedxml.ElementTree as ET
 import pytest
 
 from semantic_kernel.connectors.ai.open_ai.contents.function_call import FunctionCall
@@ -275,6 +277,76 @@ stuff</message>
     assert chat_history.messages[1].role == ChatRole.USER
 
 
+def render_remaining_reference(prompt, first=False):
+    """The previous, slicing implementation of from_rendered_prompt, for one message at a time."""
+    if not prompt:
+        return None, None
+    prompt = prompt.strip()
+    start = prompt.find("<message")
+    end = prompt.find("</message>")
+    end_of_tag = end + len("</message>")
+    if end == -1:
+        end = prompt.find("/>")
+        end_of_tag = end + len("/>")
+    role = ChatRole.SYSTEM if first else ChatRole.USER
+    if start == -1 or end == -1:
+        return ChatMessageContent(role=role, content=prompt), None
+    if start > 0 and end > 0:
+        return ChatMessageContent(role=role, content=prompt[:start]), prompt[start:]
+    try:
+        return ChatMessageContent.from_element(ET.fromstring(prompt[start:end_of_tag])), prompt[end_of_tag:]
+    except ET.ParseError:
+        return ChatMessageContent(role=role, content=prompt[start:end_of_tag]), prompt[end_of_tag:]
+
+
+def from_rendered_prompt_reference(prompt):
+    messages = []
+    result, remainder = render_remaining_reference(prompt, True)
+    if result:
+        messages.append(result)
+    while remainder:
+        result, remainder = render_remaining_reference(remainder)
+        if result:
+            messages.append(result)
+    return messages
+
+
+@pytest.mark.parametrize(
+    "rendered",
+    [
+        "   ",
+        "just text",
+        '  intro\n<message role="user">a</message>  between <message role="assistant">b</message>\n outro \n',
+        '<message role="user"/><message role="assistant">b</message>',
+        '<message role="user"/> text <message role="assistant"/>',
+        '<message role="user">unclosed',
+        '<message role="user">a</message></message>',
+        'text/><message role="user">a</message>',
+        '<message role="user">a &amp; b</message><message role="user">broken <b></message>',
+    ],
+)
+def test_chat_history_from_rendered_prompt_like_reference(rendered):
+    assert ChatHistory.from_rendered_prompt(rendered).messages == from_rendered_prompt_reference(rendered)
+
+
+def test_chat_history_from_rendered_prompt_random_like_reference():
+    fragments = [
+        '<message role="user">question</message>',
+        '<message role="assistant">answer\n</message>',
+        '<message role="system"/>',
+        "<message",
+        "</message>",
+        "/>",
+        " free text ",
+        "\n",
+        "<b>",
+    ]
+    generator = random.Random(42)
+    for _ in range(500):
+        rendered = "".join(generator.choice(fragments) for _ in range(generator.randint(1, 12)))
+        assert ChatHistory.from_rendered_prompt(rendered).messages == from_rendered_prompt_reference(rendered)
+
+
 @pytest.mark.asyncio
 async def test_template():
     chat_history = ChatHistory()
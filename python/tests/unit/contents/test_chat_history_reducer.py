@@ -0,0 +1,181 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from semantic_kernel.connectors.ai.open_ai.contents.function_call import FunctionCall
+from semantic_kernel.connectors.ai.open_ai.contents.open_ai_chat_message_content import OpenAIChatMessageContent
+from semantic_kernel.connectors.ai.open_ai.contents.tool_calls import ToolCall
+from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
+    OpenAIChatPromptExecutionSettings,
+)
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_history_reducer import ChatHistoryReducer
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.chat_role import ChatRole
+from semantic_kernel.kernel import Kernel
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def contents(messages):
+    return [message.content for message in messages]
+
+
+def test_get_window_keeps_system_message_and_newest_messages():
+    reducer = ChatHistoryReducer(max_tokens=5, token_counter=count_words, tokens_per_message=0)
+    chat_history = ChatHistory(system_message="be brief")
+    for index in range(5):
+        chat_history.add_user_message(f"question {index}")
+
+    # the system message uses 2 of the 5 tokens, leaving room for one message of 2 tokens
+    assert contents(reducer.get_window(chat_history)) == ["be brief", "question 4"]
+    assert len(chat_history) == 6
+
+
+def test_get_window_keeps_newest_message_over_budget():
+    reducer = ChatHistoryReducer(max_tokens=1, token_counter=count_words, tokens_per_message=0)
+    chat_history = ChatHistory()
+    chat_history.add_user_message("a question that is too long")
+
+    assert contents(reducer.get_window(chat_history)) == ["a question that is too long"]
+
+
+def test_get_window_counts_only_new_messages():
+    counted = []
+
+    def counter(text: str) -> int:
+        counted.append(text)
+        return count_words(text)
+
+    reducer = ChatHistoryReducer(max_tokens=4, token_counter=counter, tokens_per_message=0)
+    chat_history = ChatHistory()
+    chat_history.add_user_message("one two")
+    chat_history.add_assistant_message("three four")
+    assert contents(reducer.get_window(chat_history)) == ["one two", "three four"]
+    assert counted == ["one two", "three four"]
+
+    counted.clear()
+    chat_history.add_user_message("five six")
+    assert contents(reducer.get_window(chat_history)) == ["three four", "five six"]
+    # only the new message is counted, the dropped message had its count cached
+    assert counted == ["five six"]
+
+
+def test_get_window_starts_over_when_history_changes():
+    reducer = ChatHistoryReducer(max_tokens=4, token_counter=count_words, tokens_per_message=0)
+    chat_history = ChatHistory()
+    for text in ["one two", "three four", "five six"]:
+        chat_history.add_user_message(text)
+    assert contents(reducer.get_window(chat_history)) == ["three four", "five six"]
+
+    chat_history.messages[-1] = ChatMessageContent(role=ChatRole.USER, content="seven")
+    assert contents(reducer.get_window(chat_history)) == ["three four", "seven"]
+
+    chat_history.messages = chat_history.messages[:1]
+    assert contents(reducer.get_window(chat_history)) == ["one two"]
+
+
+def test_get_window_keeps_tool_results_with_tool_call():
+    reducer = ChatHistoryReducer(max_tokens=3, token_counter=count_words, tokens_per_message=0)
+    chat_history = ChatHistory()
+    chat_history.add_user_message("what is the weather")
+    chat_history.add_message(
+        OpenAIChatMessageContent(
+            role=ChatRole.ASSISTANT,
+            tool_calls=[ToolCall(id="1", function=FunctionCall(name="weather", arguments="{}"))],
+        )
+    )
+    chat_history.add_tool_message("sunny and warm", metadata={"tool_call_id": "1", "function_name": "weather"})
+
+    # the tool result alone fits, but is kept together with the tool call
+    assert [message.role for message in reducer.get_window(chat_history)] == [ChatRole.ASSISTANT, ChatRole.TOOL]
+
+    chat_history.add_assistant_message("it is sunny")
+    # the window does not start with the tool result of a dropped tool call
+    assert contents(reducer.get_window(chat_history)) == ["it is sunny"]
+
+
+def test_token_count_is_cached_until_content_changes():
+    counted = []
+
+    def counter(text: str) -> int:
+        counted.append(text)
+        return count_words(text)
+
+    message = OpenAIChatMessageContent(role=ChatRole.ASSISTANT, content="calling")
+    assert message.get_token_count(counter) == 1
+    assert message.get_token_count(counter) == 1
+    assert len(counted) == 1
+    assert message == message.model_copy()
+
+    message.content = "calling the weather"
+    assert message.get_token_count(counter) == 3
+    assert len(counted) == 2
+
+
+def test_token_count_sees_tool_calls_changed_in_place():
+    message = OpenAIChatMessageContent(
+        role=ChatRole.ASSISTANT,
+        content="calling",
+        tool_calls=[ToolCall(id="1", function=FunctionCall(name="weather", arguments='{"city": "Paris"}'))],
+    )
+    assert message.get_token_count(count_words) == 4
+
+    message.tool_calls.append(ToolCall(id="2", function=FunctionCall(name="time", arguments="{}")))
+    assert message.get_token_count(count_words) == 6
+
+
+@pytest.mark.asyncio
+async def test_reduce_summarizes_dropped_messages_incrementally():
+    calls = []
+
+    async def summarizer(summary, messages):
+        calls.append((summary, contents(messages)))
+        return f"summary{len(calls)}"
+
+    reducer = ChatHistoryReducer(max_tokens=100, token_counter=count_words, tokens_per_message=0, summarizer=summarizer)
+    chat_history = ChatHistory(system_message="be brief")
+    for text in ["one two", "three four", "five six"]:
+        chat_history.add_user_message(text)
+    reduced = await reducer.reduce(chat_history)
+    assert reduced.messages == chat_history.messages
+    assert calls == []
+
+    # 4 tokens are left after the system message, 3 once the summary of 1 token is added,
+    # so the window is fitted again and the message that made room is summarized too
+    reducer.max_tokens = 6
+    reduced = await reducer.reduce(chat_history)
+    assert contents(reduced) == ["be brief", "summary2", "five six"]
+    assert reduced.messages[1].role == ChatRole.SYSTEM
+
+    chat_history.add_user_message("seven eight")
+    reduced = await reducer.reduce(chat_history)
+    assert contents(reduced) == ["be brief", "summary3", "seven eight"]
+    assert sum(count_words(message.content) for message in reduced.messages) <= reducer.max_tokens
+
+    # the summary is kept when no more messages are dropped
+    assert contents(await reducer.reduce(chat_history)) == contents(reduced)
+    assert calls == [(None, ["one two"]), ("summary1", ["three four"]), ("summary2", ["five six"])]
+    assert len(chat_history) == 5
+
+
+@pytest.mark.asyncio
+async def test_complete_chat_sends_reduced_history():
+    reducer = ChatHistoryReducer(max_tokens=2, token_counter=count_words, tokens_per_message=0)
+    service = OpenAIChatCompletion(ai_model_id="test", api_key="test")
+    service.chat_history_reducer = reducer
+    chat_history = ChatHistory()
+    chat_history.add_user_message("one two")
+    chat_history.add_user_message("three four")
+    settings = OpenAIChatPromptExecutionSettings()
+
+    with patch.object(OpenAIChatCompletion, "_send_chat_request", AsyncMock(return_value=[])) as mock:
+        await service.complete_chat(chat_history, settings, kernel=Kernel())
+
+    assert [message["content"] for message in mock.call_args.args[0].messages] == ["three four"]
+    assert "chat_history_reducer" not in service.model_dump()
@@ -0,0 +1,125 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from copy import copy
+from functools import reduce
+from typing import AsyncIterable, List
+
+import pytest
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
+
+from semantic_kernel.connectors.ai.open_ai.contents.azure_streaming_chat_message_content import (
+    AzureStreamingChatMessageContent,
+)
+from semantic_kernel.connectors.ai.open_ai.contents.function_call import FunctionCall
+from semantic_kernel.connectors.ai.open_ai.contents.open_ai_streaming_chat_message_content import (
+    OpenAIStreamingChatMessageContent,
+)
+from semantic_kernel.connectors.ai.open_ai.contents.tool_calls import ToolCall
+from semantic_kernel.contents.finish_reason import FinishReason
+from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+from semantic_kernel.contents.streaming_text_content import StreamingTextContent
+from semantic_kernel.exceptions import ContentAdditionException
+from semantic_kernel.functions.kernel_function import KernelFunction
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from semantic_kernel.kernel import Kernel
+
+CHUNK = ChatCompletionChunk(id="test", choices=[], created=0, model="test", object="chat.completion.chunk")
+
+
+def add_all(contents):
+    return reduce(lambda result, content: result + content, contents[1:], copy(contents[0]))
+
+
+def test_merge_text_content_like_adding():
+    contents = [StreamingTextContent(choice_index=0, text=text) for text in ["Hello", None, " world", "!"]]
+    merged = StreamingTextContent.merge(contents)
+    assert merged == add_all(contents)
+    assert merged.text == "Hello world!"
+
+
+def test_merge_chat_message_content_like_adding():
+    contents = [
+        StreamingChatMessageContent(choice_index=1, role="assistant", content="Hello", metadata={"id": "1"}),
+        StreamingChatMessageContent(choice_index=1, role=None, content=" world"),
+        StreamingChatMessageContent(choice_index=1, role=None, content=None, finish_reason=FinishReason.STOP),
+    ]
+    merged = StreamingChatMessageContent.merge(contents)
+    assert merged == add_all(contents)
+    assert merged.content == "Hello world"
+    assert merged.finish_reason == FinishReason.STOP
+    assert merged.metadata == {"id": "1"}
+
+
+def test_merge_single_content_is_a_copy():
+    content = StreamingTextContent(choice_index=0, text="Hello")
+    merged = StreamingTextContent.merge([content])
+    assert merged == content
+    assert merged is not content
+
+
+def test_merge_checks_like_adding():
+    with pytest.raises(ContentAdditionException):
+        StreamingChatMessageContent.merge(
+            [
+                StreamingChatMessageContent(choice_index=0, role="assistant", content="a"),
+                StreamingChatMessageContent(choice_index=0, role="user", content="b"),
+            ]
+        )
+    with pytest.raises(ContentAdditionException):
+        StreamingTextContent.merge(
+            [StreamingTextContent(choice_index=0, text="a"), StreamingTextContent(choice_index=1, text="b")]
+        )
+
+
+def test_merge_open_ai_tool_calls_by_index():
+    def delta(tool_calls: List[ToolCall]) -> OpenAIStreamingChatMessageContent:
+        return OpenAIStreamingChatMessageContent(
+            choice_index=0, inner_content=CHUNK, role="assistant", content=None, tool_calls=tool_calls
+        )
+
+    contents = [
+        delta([ToolCall(index=0, id="call_1", function=FunctionCall(name="math-Add", arguments=""))]),
+        delta([ToolCall(index=0, function=FunctionCall(arguments='{"a": '))]),
+        delta([ToolCall(index=1, id="call_2", function=FunctionCall(name="math-Subtract", arguments='{"a"'))]),
+        delta([ToolCall(index=0, function=FunctionCall(arguments="1}"))]),
+        delta([ToolCall(index=1, function=FunctionCall(arguments=": 2}"))]),
+    ]
+    merged = OpenAIStreamingChatMessageContent.merge(contents)
+    assert [
+        (tool_call.id, tool_call.function.name, tool_call.function.arguments) for tool_call in merged.tool_calls
+    ] == [
+        ("call_1", "math-Add", '{"a": 1}'),
+        ("call_2", "math-Subtract", '{"a": 2}'),
+    ]
+    # a single tool call combines the same way as adding the deltas
+    assert OpenAIStreamingChatMessageContent.merge(contents[:2]) == add_all(contents[:2])
+
+
+def test_merge_azure_tool_messages():
+    contents = [
+        AzureStreamingChatMessageContent(choice_index=0, inner_content=CHUNK, content="a", tool_message="tool "),
+        AzureStreamingChatMessageContent(choice_index=0, inner_content=CHUNK, content="b", tool_message="message"),
+    ]
+    merged = AzureStreamingChatMessageContent.merge(contents)
+    assert isinstance(merged, AzureStreamingChatMessageContent)
+    assert merged.content == "ab"
+    assert merged.tool_message == "tool message"
+
+
+@pytest.mark.asyncio
+async def test_kernel_invoke_stream_combines_choices():
+    @kernel_function(name="stream")
+    async def stream() -> AsyncIterable[List[StreamingTextContent]]:
+        for part in ["a", "b", "c"]:
+            # the choices arrive in reverse order
+            yield [StreamingTextContent(choice_index=index, text=f"{part}{index}") for index in (1, 0)]
+
+    kernel = Kernel()
+    results = []
+    kernel.add_function_invoked_handler(lambda kernel, args: results.append(args.function_result))
+    function = KernelFunction.from_method(method=stream, plugin_name="test")
+
+    chunks = [chunk async for chunk in kernel.invoke_stream(function)]
+
+    assert len(chunks) == 3
+    assert [str(content) for content in results[0].value] == ["a0b0c0", "a1b1c1"]
@@ -1,19 +1,28 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from semantic_kernel.connectors.ai.open_ai.contents.function_call import FunctionCall
+from semantic_kernel.connectors.ai.open_ai.contents.open_ai_chat_message_content import OpenAIChatMessageContent
+from semantic_kernel.connectors.ai.open_ai.contents.tool_calls import ToolCall
+from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
+    OpenAIChatPromptExecutionSettings,
+)
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_completion import OpenAITextCompletion
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.contents.chat_message_content import ChatMessageContent
 from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
 from semantic_kernel.contents.text_content import TextContent
-from semantic_kernel.exceptions import FunctionInitializationError
+from semantic_kernel.exceptions import FunctionInitializationError, ServiceRateLimitException
+from semantic_kernel.functions.kernel_function import KernelFunction
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
 from semantic_kernel.functions.kernel_function_from_prompt import KernelFunctionFromPrompt
 from semantic_kernel.kernel import Kernel
 from semantic_kernel.prompt_template.input_variable import InputVariable
 from semantic_kernel.prompt_template.kernel_prompt_template import KernelPromptTemplate
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
+from semantic_kernel.reliability.retry_mechanism import RetryMechanism
 
 
 def test_init_minimal_prompt():
@@ -287,3 +296,93 @@ def test_create_with_multiple_settings():
     assert (
         function.prompt_template.prompt_template_config.execution_settings["test2"].extension_data["temperature"] == 1.0
     )
+
+
+@pytest.mark.asyncio
+async def test_invoke_retries_service_calls():
+    sleeps = []
+
+    async def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    kernel = Kernel(retry_mechanism=RetryMechanism(jitter=0, sleep=sleep))
+    kernel.add_service(OpenAIChatCompletion(service_id="test", ai_model_id="test", api_key="test"))
+    function = KernelFunctionFromPrompt(
+        function_name="test",
+        plugin_name="test",
+        prompt="test",
+        prompt_execution_settings=PromptExecutionSettings(service_id="test"),
+    )
+    with patch(
+        "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion.OpenAIChatCompletion._send_chat_request",
+        side_effect=[
+            ServiceRateLimitException("rate limited", retry_after=3),
+            [ChatMessageContent(role="assistant", content="test", metadata={})],
+        ],
+    ) as mock:
+        result = await function.invoke(kernel=kernel)
+        assert str(result) == "test"
+        assert mock.call_count == 2
+    assert sleeps == [3]
+
+    async def process_stream(self, response, tool_call_behavior, chat_history, kernel):
+        yield [StreamingChatMessageContent(choice_index=0, role="assistant", content="test", metadata={})]
+
+    stream = AsyncMock()
+
+    with patch(
+        "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion.OpenAIChatCompletion."
+        "_send_chat_stream_request",
+        side_effect=[ServiceRateLimitException("rate limited", retry_after=5), stream],
+    ) as mock, patch(
+        "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion.OpenAIChatCompletion."
+        "_process_chat_stream_response",
+        new=process_stream,
+    ):
+        results = [result async for result in function.invoke_stream(kernel=kernel)]
+        assert [str(result[0]) for result in results] == ["test"]
+        assert mock.call_count == 2
+        stream.close.assert_awaited_once()
+    assert sleeps == [3, 5]
+    assert kernel.retry_mechanism.retry_count == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_does_not_invoke_functions_again():
+    calls = []
+
+    async def sleep(seconds: float) -> None:
+        pass
+
+    @kernel_function(name="lookup")
+    def lookup() -> str:
+        calls.append("lookup")
+        return "found"
+
+    kernel = Kernel(retry_mechanism=RetryMechanism(jitter=0, sleep=sleep))
+    kernel.add_service(OpenAIChatCompletion(service_id="test", ai_model_id="test", api_key="test"))
+    kernel.add_plugin("tools", [KernelFunction.from_method(lookup, "tools")])
+    function = KernelFunctionFromPrompt(
+        function_name="test",
+        plugin_name="test",
+        prompt="test",
+        prompt_execution_settings=OpenAIChatPromptExecutionSettings(
+            service_id="test", auto_invoke_kernel_functions=True
+        ),
+    )
+    tool_call = ToolCall(id="call_1", type="function", function=FunctionCall(name="tools-lookup", arguments="{}"))
+    with patch(
+        "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion.OpenAIChatCompletion._send_chat_request",
+        side_effect=[
+            [OpenAIChatMessageContent(role="assistant", tool_calls=[tool_call], metadata={})],
+            ServiceRateLimitException("rate limited", retry_after=1),
+            [OpenAIChatMessageContent(role="assistant", content="done", metadata={})],
+        ],
+    ) as mock:
+        result = await function.invoke(kernel=kernel)
+
+    # the request after the function call is retried, not the function call
+    assert str(result) == "done"
+    assert mock.call_count == 3
+    assert calls == ["lookup"]
+    assert kernel.retry_mechanism.retry_count == 1
@@ -4,6 +4,8 @@ from string import ascii_uppercase
 
 import pytest
 
+from semantic_kernel.functions.kernel_function import KernelFunction
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
 from semantic_kernel.functions.kernel_plugin import KernelPlugin
 from semantic_kernel.functions.kernel_plugin_collection import KernelPluginCollection
 
@@ -106,3 +108,56 @@ def test_overwrite_plugin_with_same_name_succeeds():
     collection.add(plugin2)
 
     assert len(collection) == 1
+
+
+def create_function(name: str, plugin_name: str) -> KernelFunction:
+    @kernel_function(name=name)
+    def function() -> str:
+        return f"{plugin_name}.{name}"
+
+    return KernelFunction.from_method(method=function, plugin_name=plugin_name)
+
+
+def test_get_function():
+    collection = KernelPluginCollection()
+    collection.add_plugin_from_functions("first", [create_function("shared", "first")])
+    collection.add_plugin_from_functions(
+        "second", [create_function("shared", "second"), create_function("only_second", "second")]
+    )
+
+    assert collection.get_function("shared", "second").plugin_name == "second"
+    assert collection.get_function("shared").plugin_name == "first"
+    assert collection.get_function("only_second").plugin_name == "second"
+    assert [function.plugin_name for function in collection.get_functions_by_name("shared")] == ["first", "second"]
+    assert collection.get_function("missing") is None
+    assert collection.get_function("shared", "missing") is None
+
+    collection.remove_by_name("first")
+    assert collection.get_function("shared").plugin_name == "second"
+
+
+def test_get_function_after_direct_change():
+    collection = KernelPluginCollection()
+    collection.add_plugin_from_functions("first", [create_function("shared", "first")])
+    assert collection.get_function("shared").plugin_name == "first"
+
+    # changes that bypass the collection are not in the index, they are still found
+    del collection.plugins["first"].functions["shared"]
+    collection.plugins["first"].functions["added"] = create_function("added", "first")
+    assert collection.get_function("shared") is None
+    assert collection.get_function("added").name == "added"
+
+
+def test_get_list_of_function_metadata_is_cached_until_changed():
+    collection = KernelPluginCollection()
+    collection.add_plugin_from_functions("first", [create_function("one", "first")])
+    metadata = collection.get_list_of_function_metadata()
+    assert [m.name for m in metadata] == ["one"]
+    assert collection.get_list_of_function_metadata() is not metadata
+    assert collection.get_list_of_function_metadata()[0] is metadata[0]
+    assert collection.get_list_of_function_metadata(include_native=False) == []
+
+    version = collection.version
+    collection.add_functions_to_plugin([create_function("two", "first")], "first")
+    assert collection.version != version
+    assert [m.name for m in collection.get_list_of_function_metadata()] == ["one", "two"]
@@ -0,0 +1,113 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+
+import pytest
+
+from semantic_kernel import Kernel
+from semantic_kernel.functions.batch_progress import BatchProgress
+from semantic_kernel.functions.function_result import FunctionResult
+from semantic_kernel.functions.kernel_arguments import KernelArguments
+from semantic_kernel.functions.kernel_function import KernelFunction
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+
+
+class Tracker:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+
+def create_function(tracker: Tracker) -> KernelFunction:
+    @kernel_function(name="square")
+    async def square(number: int) -> int:
+        tracker.running += 1
+        tracker.max_running = max(tracker.max_running, tracker.running)
+        try:
+            # later items finish first
+            await asyncio.sleep(0.001 * (5 - number % 5))
+            if number == 3:
+                raise ValueError("three is not allowed")
+            return number * number
+        finally:
+            tracker.running -= 1
+
+    return KernelFunction.from_method(method=square, plugin_name="math")
+
+
+@pytest.mark.asyncio
+async def test_invoke_many_bounds_concurrency_and_isolates_failures():
+    tracker = Tracker()
+    kernel = Kernel()
+    progress = BatchProgress()
+    invoked = []
+    kernel.add_function_invoked_handler(lambda kernel, args: invoked.append(args.arguments["number"]))
+
+    def fail_six(kernel, args):
+        if args.arguments["number"] == 6:
+            raise RuntimeError("six is not allowed")
+        return args
+
+    kernel.add_function_invoking_handler(fail_six)
+
+    results = {}
+    async for index, outcome in kernel.invoke_many(
+        create_function(tracker), ({"number": number} for number in range(10)), max_concurrency=3, progress=progress
+    ):
+        results[index] = outcome
+
+    assert tracker.max_running == 3
+    assert sorted(results) == list(range(10))
+    assert isinstance(results[3].metadata["error"], ValueError)
+    assert isinstance(results[6], RuntimeError)
+    assert all(isinstance(results[index], FunctionResult) for index in results if index != 6)
+    assert results[4].value == 16
+    assert sorted(invoked) == [number for number in range(10) if number != 6]
+    assert (progress.started, progress.succeeded, progress.failed, progress.in_flight) == (10, 8, 2, 0)
+    assert progress.throughput > 0
+
+
+@pytest.mark.asyncio
+async def test_invoke_many_ordered_from_async_iterable():
+    async def argument_sets():
+        for number in range(7):
+            yield KernelArguments(number=number)
+
+    kernel = Kernel()
+    indexes = []
+    async for index, outcome in kernel.invoke_many(
+        create_function(Tracker()), argument_sets(), max_concurrency=4, ordered=True
+    ):
+        indexes.append(index)
+        if index != 3:
+            assert outcome.value == index * index
+
+    assert indexes == list(range(7))
+
+
+@pytest.mark.asyncio
+async def test_invoke_many_reads_arguments_lazily_and_cancels_on_close():
+    tracker = Tracker()
+    read = []
+
+    def argument_sets():
+        for number in range(1000):
+            read.append(number)
+            yield {"number": number}
+
+    kernel = Kernel()
+    progress = BatchProgress()
+    batch = kernel.invoke_many(create_function(tracker), argument_sets(), max_concurrency=2, progress=progress)
+    await batch.__anext__()
+    await batch.aclose()
+
+    assert len(read) <= 3
+    assert tracker.running == 0
+    assert progress.in_flight == progress.started - progress.completed
+
+
+@pytest.mark.asyncio
+async def test_invoke_many_invalid_concurrency():
+    with pytest.raises(ValueError):
+        async for _ in Kernel().invoke_many(create_function(Tracker()), [], max_concurrency=0):
+            pass
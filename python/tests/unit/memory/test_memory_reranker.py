@@ -0,0 +1,88 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import threading
+from typing import List
+
+import numpy as np
+import pytest
+
+from semantic_kernel.memory.memory_query_result import MemoryQueryResult
+from semantic_kernel.memory.memory_reranker import CrossEncoderBase, MemoryReranker, maximal_marginal_relevance
+
+QUERY = np.array([1.0, 0.0, 0.0])
+EMBEDDINGS = np.array(
+    [
+        [0.9, 0.1, 0.0],
+        [0.9, 0.11, 0.0],
+        [0.7, 0.0, 0.7],
+        [0.0, 1.0, 0.0],
+    ]
+)
+
+
+class KeywordCrossEncoder(CrossEncoderBase):
+    """Scores texts by the number of words of the query they contain and records the threads it ran on."""
+
+    def __init__(self) -> None:
+        self.threads: List[int] = []
+
+    def score(self, query: str, texts: List[str]) -> List[float]:
+        self.threads.append(threading.get_ident())
+        return [float(sum(word in text for word in query.split())) for text in texts]
+
+
+def create_results() -> List[MemoryQueryResult]:
+    norms = np.linalg.norm(EMBEDDINGS, axis=1)
+    return [
+        MemoryQueryResult(
+            is_reference=False,
+            external_source_name=None,
+            id=str(index),
+            description=None,
+            text=text,
+            additional_metadata=None,
+            embedding=embedding,
+            relevance=float(embedding @ QUERY / norm),
+        )
+        for index, (text, embedding, norm) in enumerate(
+            zip(["paris", "paris again", "paris and london", "berlin"], EMBEDDINGS, norms)
+        )
+    ]
+
+
+def test_maximal_marginal_relevance():
+    # by relevance the near duplicate is second, with diversity the other relevant result is
+    assert maximal_marginal_relevance(QUERY, EMBEDDINGS, 3, diversity=0.0) == [0, 1, 2]
+    assert maximal_marginal_relevance(QUERY, EMBEDDINGS, 2, diversity=0.5) == [0, 2]
+    assert maximal_marginal_relevance(QUERY, EMBEDDINGS, 10, diversity=0.5) == [0, 2, 1, 3]
+    assert maximal_marginal_relevance(QUERY, EMBEDDINGS, 0) == []
+
+
+def test_fetch_limit():
+    assert MemoryReranker(over_fetch_factor=2.5).get_fetch_limit(3) == 8
+    assert MemoryReranker(over_fetch_factor=1).get_fetch_limit(3) == 3
+
+
+@pytest.mark.asyncio
+async def test_rerank_with_cross_encoder_in_thread():
+    cross_encoder = KeywordCrossEncoder()
+    reranker = MemoryReranker(diversity=0.5, cross_encoder=cross_encoder)
+
+    results = await reranker.rerank("paris london", QUERY, create_results(), 3)
+
+    # the cross-encoder prefers the result with both words, one of the near duplicates makes room for berlin
+    assert [result.id for result in results[:2]] == ["2", "3"]
+    assert results[2].id in ("0", "1")
+    assert results[0].relevance == pytest.approx(np.sqrt(0.5))
+    assert cross_encoder.threads and threading.get_ident() not in cross_encoder.threads
+
+
+@pytest.mark.asyncio
+async def test_rerank_without_embeddings_by_relevance():
+    results = create_results()
+    for result in results:
+        result.embedding = None
+
+    reranked = await MemoryReranker().rerank("paris", QUERY, results, 2)
+
+    assert [result.id for result in reranked] == ["0", "1"]
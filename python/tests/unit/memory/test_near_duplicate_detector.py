@@ -0,0 +1,76 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from semantic_kernel.memory.near_duplicate_detector import NearDuplicateDetector
+
+TEXT = (
+    "The semantic kernel is an SDK that integrates large language models with conventional programming languages. "
+    "Plugins expose native and prompt functions that planners combine into plans to reach the goals of users, "
+    "and memories give the models the context they need to answer questions about private documents."
+)
+
+
+def test_exact_and_near_duplicates():
+    detector = NearDuplicateDetector(threshold=0.8)
+
+    assert detector.deduplicate("a", TEXT) is None
+    assert detector.deduplicate("b", "  " + TEXT.upper()) == "a"
+    assert detector.deduplicate("c", TEXT.replace("private documents", "private files")) == "a"
+    assert detector.deduplicate("d", "A different paragraph about the weather in Seattle today.") is None
+
+    assert detector.get_canonical_id("b") == "a"
+    assert detector.get_canonical_id("c") == "a"
+    assert detector.get_canonical_id("d") == "d"
+    assert detector.report.texts == 4
+    assert detector.report.exact_duplicates == 1
+    assert detector.report.near_duplicates == 1
+    assert detector.report.embeddings_saved == 2
+
+
+def test_similarity_threshold():
+    changed = TEXT.replace("planners combine into plans", "a planner combines into a plan")
+
+    assert NearDuplicateDetector().find_duplicate(TEXT) is None
+
+    lenient = NearDuplicateDetector(threshold=0.5)
+    lenient.deduplicate("a", TEXT)
+    canonical_id, similarity = lenient.find_duplicate(changed)
+    assert canonical_id == "a"
+    assert 0.5 <= similarity < 0.9
+
+    strict = NearDuplicateDetector(threshold=0.95)
+    strict.deduplicate("a", TEXT)
+    assert strict.find_duplicate(changed) is None
+    assert strict.find_duplicate(TEXT) == ("a", 1.0)
+
+
+def test_changed_text_replaces_its_id():
+    detector = NearDuplicateDetector(threshold=0.8)
+    detector.deduplicate("a", TEXT)
+
+    # the same text under the same id is unchanged, a near duplicate under the same id is an update
+    assert detector.deduplicate("a", TEXT) == "a"
+    changed = TEXT.replace("private documents", "private files")
+    assert detector.deduplicate("a", changed) is None
+    assert detector.find_duplicate(TEXT)[0] == "a"
+    assert detector.find_duplicate(changed) == ("a", 1.0)
+    assert detector.get_canonical_id("a") == "a"
+
+
+def test_checks_change_nothing_until_committed():
+    detector = NearDuplicateDetector(threshold=0.8)
+
+    first = detector.check("a", TEXT)
+    # a pending check is compared to, the index is not changed
+    second = detector.check("b", TEXT.upper(), pending=[first])
+    third = detector.check("c", TEXT.replace("private documents", "private files"), pending=[first, second])
+    assert not first.is_duplicate
+    assert second.canonical_id == "a" and second.exact
+    assert third.canonical_id == "a" and not third.exact
+    assert detector.find_duplicate(TEXT) is None
+    assert detector.report.texts == 0
+
+    detector.commit([first, second, third])
+
+    assert detector.find_duplicate(TEXT) == ("a", 1.0)
+    assert detector.get_canonical_id("c") == "a"
+    assert detector.report.embeddings_saved == 2
@@ -0,0 +1,138 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import json
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.memory.memory_reranker import MemoryReranker
+from semantic_kernel.memory.near_duplicate_detector import NearDuplicateDetector
+from semantic_kernel.memory.semantic_text_memory import SemanticTextMemory
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+from semantic_kernel.text import iter_plaintext_paragraphs
+from semantic_kernel.text.text_chunker import TextChunk
+
+
+class KeywordEmbeddings(EmbeddingGeneratorBase):
+    """Embeds texts by the keywords they contain and records the batches that were embedded."""
+
+    batches: List[List[str]] = []
+
+    async def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        self.batches.append(texts)
+        keywords = ["weather", "email", "math"]
+        return np.array([[0.01 + (keyword in text.lower()) for keyword in keywords] for text in texts])
+
+
+def create_memory(near_duplicate_detector=None, reranker=None):
+    embeddings = KeywordEmbeddings(ai_model_id="keywords", batches=[])
+    memory = SemanticTextMemory(
+        storage=VolatileMemoryStore(),
+        embeddings_generator=embeddings,
+        near_duplicate_detector=near_duplicate_detector,
+        reranker=reranker,
+    )
+    return memory, embeddings
+
+
+@pytest.mark.asyncio
+async def test_save_chunks_in_batches():
+    memory, embeddings = create_memory()
+    topics = ["weather", "email", "math"]
+    document = "\n\n".join(f"Paragraph {index} is about {topics[index % 3]}." for index in range(10))
+
+    count = await memory.save_chunks(
+        "docs", iter_plaintext_paragraphs(document, max_tokens=8), document_id="doc", batch_size=4
+    )
+
+    assert count == 10
+    assert [len(batch) for batch in embeddings.batches] == [4, 4, 2]
+    results = await memory.search("docs", "email", limit=3)
+    assert {result.text for result in results} == {f"Paragraph {index} is about email." for index in (1, 4, 7)}
+    metadata = json.loads(results[0].additional_metadata)
+    assert document[metadata["start"] : metadata["end"]] == results[0].text
+    assert results[0].id == f"doc:{metadata['start']}-{metadata['end']}"
+
+
+@pytest.mark.asyncio
+async def test_save_chunks_from_an_async_iterable():
+    memory, embeddings = create_memory()
+
+    async def chunks():
+        for chunk in iter_plaintext_paragraphs("About math.\n\nAbout weather.", max_tokens=4):
+            yield chunk
+
+    assert await memory.save_chunks("docs", chunks(), document_id="doc") == 2
+    assert embeddings.batches == [["About math.", "About weather."]]
+
+
+@pytest.mark.asyncio
+async def test_save_documents_skips_duplicates():
+    detector = NearDuplicateDetector(threshold=0.7)
+    memory, embeddings = create_memory(detector)
+    paragraph = "The weather in Seattle is rainy in the winter and sunny in the summer, bring an umbrella."
+    near_duplicate = paragraph.replace("an umbrella", "a raincoat")
+    documents = [
+        ("first", [TextChunk(paragraph, 0, 89), TextChunk("Send the email to the team.", 91, 118)]),
+        ("second", [TextChunk(paragraph.upper(), 0, 89), TextChunk("Do the math homework.", 91, 112)]),
+        ("third", [TextChunk(near_duplicate, 0, 88)]),
+    ]
+
+    assert await memory.save_documents("docs", documents) == 3
+
+    assert sum(len(batch) for batch in embeddings.batches) == 3
+    assert detector.report.exact_duplicates == 1
+    assert detector.report.near_duplicates == 1
+    assert detector.report.embeddings_saved == 2
+    collection_detector = memory.get_near_duplicate_detector("docs")
+    assert collection_detector.get_canonical_id("second:0-89") == "first:0-89"
+    canonical_id = collection_detector.get_canonical_id("third:0-88")
+    assert canonical_id == "first:0-89"
+    assert (await memory.get("docs", canonical_id)).text == paragraph
+
+
+@pytest.mark.asyncio
+async def test_search_with_reranker_returns_diverse_results():
+    memory, _ = create_memory(reranker=MemoryReranker(over_fetch_factor=3, diversity=0.6))
+    for index, text in enumerate(
+        ["The weather is sunny.", "The weather is sunny today.", "Email about the weather.", "The math exam."]
+    ):
+        await memory.save_information("docs", text, id=str(index))
+
+    results = await memory.search("docs", "weather", limit=2, min_relevance_score=0.5)
+
+    # the two sunny weather records are the same to the embeddings, only one of them is returned
+    assert [result.id for result in results] == ["0", "2"]
+    assert all(result.embedding is None for result in results)
+    results = await memory.search("docs", "weather", limit=2, min_relevance_score=0.5, with_embeddings=True)
+    assert results[0].embedding is not None
+
+
+@pytest.mark.asyncio
+async def test_duplicates_are_per_collection():
+    memory, _ = create_memory(NearDuplicateDetector())
+    chunks = [TextChunk("About the weather.", 0, 18), TextChunk("About the weather.", 20, 38)]
+
+    assert await memory.save_chunks("a", chunks, document_id="doc") == 1
+    assert await memory.save_chunks("b", chunks, document_id="doc") == 1
+
+    assert (await memory.get("b", "doc:0-18")).text == "About the weather."
+    assert memory.get_near_duplicate_detector("b").get_canonical_id("doc:20-38") == "doc:0-18"
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_saved_on_retry():
+    detector = NearDuplicateDetector()
+    memory, embeddings = create_memory(detector)
+    chunks = [TextChunk("About the weather.", 0, 18), TextChunk("About email.", 20, 32)]
+
+    with patch.object(VolatileMemoryStore, "upsert_batch", side_effect=ConnectionError("store unavailable")):
+        with pytest.raises(ConnectionError):
+            await memory.save_chunks("docs", chunks, document_id="doc")
+
+    assert await memory.save_chunks("docs", chunks, document_id="doc") == 2
+    assert (await memory.get("docs", "doc:20-32")).text == "About email."
+    assert detector.report.texts == 2
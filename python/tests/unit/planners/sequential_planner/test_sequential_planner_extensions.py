@@ -1,21 +1,30 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from typing import List
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
 from semantic_kernel.functions.kernel_arguments import KernelArguments
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
 from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
 from semantic_kernel.functions.kernel_plugin_collection import (
     KernelPluginCollection,
 )
 from semantic_kernel.kernel import Kernel
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
 from semantic_kernel.planners.sequential_planner.sequential_planner_config import (
     SequentialPlannerConfig,
 )
 from semantic_kernel.planners.sequential_planner.sequential_planner_extensions import (
+    SequentialPlannerFunctionExtension,
     SequentialPlannerKernelExtension,
 )
+from semantic_kernel.planners.sequential_planner.sequential_planner_function_index import (
+    SequentialPlannerFunctionIndex,
+)
 
 
 async def _async_generator(query_result):
@@ -109,3 +118,86 @@ async def test_can_call_get_available_functions_with_default_relevancy():
 
     # Assert
     assert result is not None
+
+
+class KeywordEmbeddings(EmbeddingGeneratorBase):
+    """Embeds texts by the keywords they contain and records what was embedded."""
+
+    texts: List[str] = []
+
+    async def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        self.texts.extend(texts)
+        keywords = ["weather", "email", "math"]
+        return np.array([[0.01 + (keyword in text.lower()) for keyword in keywords] for text in texts])
+
+
+class WeatherPlugin:
+    @kernel_function(name="forecast", description="Get the weather forecast")
+    def forecast(self, city: str) -> str:
+        return "sunny"
+
+    @kernel_function(name="alerts", description="Get the weather alerts")
+    def alerts(self, city: str) -> str:
+        return "none"
+
+
+class EmailPlugin:
+    @kernel_function(name="send", description="Send an email")
+    def send(self, to: str) -> str:
+        return "sent"
+
+
+class MathPlugin:
+    @kernel_function(name="add", description="Add math numbers")
+    def add(self, a: str, b: str) -> str:
+        return "3"
+
+
+@pytest.mark.asyncio
+async def test_get_available_functions_with_function_index():
+    kernel = Kernel()
+    kernel.import_plugin_from_object(WeatherPlugin(), "weather")
+    kernel.import_plugin_from_object(EmailPlugin(), "email")
+    embeddings = KeywordEmbeddings(ai_model_id="keywords")
+    store = VolatileMemoryStore()
+    index = SequentialPlannerFunctionIndex(store, embeddings)
+    config = SequentialPlannerConfig(relevancy_threshold=0.9, function_index=index)
+
+    result = await SequentialPlannerKernelExtension.get_available_functions(
+        kernel, KernelArguments(), config, "What is the weather in Paris?"
+    )
+
+    assert [f"{func.plugin_name}.{func.name}" for func in result] == ["weather.alerts", "weather.forecast"]
+    assert len(embeddings.texts) == 4
+
+    # the functions are embedded once, only the goal is embedded for the next plan
+    await SequentialPlannerKernelExtension.get_available_functions(kernel, KernelArguments(), config, "Send an email")
+    assert embeddings.texts[4:] == ["Send an email"]
+
+    # only added functions are embedded and removed functions are removed from the store
+    kernel.import_plugin_from_object(MathPlugin(), "math")
+    kernel.plugins.remove_by_name("email")
+    result = await SequentialPlannerKernelExtension.get_available_functions(
+        kernel, KernelArguments(), config, "Send an email"
+    )
+    assert result == []
+    assert len(embeddings.texts) == 7
+    assert "math" in embeddings.texts[5]
+    assert await store.get_batch(index.collection_name, ["email.send"], False) == []
+
+
+def test_manual_string_is_cached():
+    metadata = KernelFunctionMetadata(
+        name="functionName",
+        plugin_name="pluginName",
+        description="description",
+        parameters=[],
+        is_prompt=True,
+    )
+
+    manual = SequentialPlannerFunctionExtension.to_manual_string(metadata)
+
+    assert manual.startswith("pluginName.functionName:\n  description: description")
+    assert SequentialPlannerFunctionExtension.to_manual_string(metadata) is manual
+    metadata.description = "other"
+    assert "other" in SequentialPlannerFunctionExtension.to_manual_string(metadata)
@@ -0,0 +1,157 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from semantic_kernel.functions.function_result import FunctionResult
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from semantic_kernel.kernel import Kernel
+from semantic_kernel.planners.stepwise_planner.stepwise_planner import (
+    SCRATCH_PAD_PREFIX,
+    IterationPacer,
+    StepwisePlanner,
+)
+from semantic_kernel.planners.stepwise_planner.stepwise_planner_config import StepwisePlannerConfig
+from semantic_kernel.planners.stepwise_planner.system_step import SystemStep
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+class MathPlugin:
+    def __init__(self) -> None:
+        self.calls = []
+
+    @kernel_function(name="add", description="Adds two numbers")
+    def add(self, first: str, second: str) -> str:
+        self.calls.append((first, second))
+        return str(int(first) + int(second))
+
+
+def action(name: str, **variables: str) -> str:
+    return f"[THOUGHT] Use {name}\n[ACTION] {json.dumps({'action': name, 'action_variables': variables})}"
+
+
+def create_planner(config: StepwisePlannerConfig = None):
+    kernel = Kernel()
+    plugin = MathPlugin()
+    kernel.import_plugin_from_object(plugin, "math")
+    return StepwisePlanner(kernel, config), plugin
+
+
+async def execute(planner: StepwisePlanner, responses, clock: FakeClock = None, step_time: float = 0.0):
+    planner._clock = clock or FakeClock()
+    planner._sleep = planner._clock.sleep
+    responses = iter(responses)
+    prompts = []
+
+    async def invoke(function, kernel, arguments):
+        prompts.append(dict(arguments))
+        planner._clock.now += step_time
+        return FunctionResult(function=function.metadata, value=next(responses))
+
+    with patch.object(type(planner._system_step_function), "invoke", invoke):
+        result = await planner.execute_plan("What is 1 + 2 + 3?", planner.get_function_descriptions())
+    return result, prompts
+
+
+@pytest.mark.asyncio
+async def test_actions_are_invoked_and_observed():
+    planner, plugin = create_planner()
+
+    result, prompts = await execute(
+        planner,
+        [action("math.add", first="1", second="2"), action("math.add", first="3", second="3"), "[FINAL ANSWER] 6"],
+    )
+
+    assert str(result) == "6"
+    assert plugin.calls == [("1", "2"), ("3", "3")]
+    assert prompts[0]["question"] == "What is 1 + 2 + 3?"
+    assert "math.add" in prompts[0]["function_descriptions"]
+    assert "[OBSERVATION]\n3" in prompts[1]["agent_scratch_pad"]
+    assert result.metadata["arguments"]["step_count"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_iterations_only_sleep_the_remaining_time():
+    planner, _ = create_planner(StepwisePlannerConfig(min_iteration_time_ms=1000))
+    clock = FakeClock()
+
+    await execute(
+        planner,
+        [action("math.add", first="1", second="2"), action("math.add", first="3", second="3"), "[FINAL ANSWER] 6"],
+        clock=clock,
+        step_time=0.3,
+    )
+
+    # one sleep between iterations, none after the last one
+    assert clock.sleeps == [0.7, 0.7]
+
+
+@pytest.mark.asyncio
+async def test_pacer_does_not_sleep_after_slow_iterations():
+    clock = FakeClock()
+    pacer = IterationPacer(0.5, clock, clock.sleep)
+
+    await pacer.wait()
+    pacer.start()
+    clock.now += 2
+    await pacer.wait()
+    pacer.start()
+    clock.now += 0.2
+    await pacer.wait()
+
+    assert clock.sleeps == [0.3]
+
+
+def test_scratch_pad_keeps_the_first_thought_and_the_latest_steps_in_the_token_budget():
+    # one token per word
+    planner, _ = create_planner(StepwisePlannerConfig(max_tokens=80, token_counter=lambda text: len(text.split())))
+    steps = [
+        SystemStep(thought=f"thought {i}", action="math.add", action_variables={}, observation=f"result {i}")
+        for i in range(10)
+    ]
+
+    scratch_pad = planner.create_scratch_pad("question", steps)
+
+    assert scratch_pad.startswith(f"{SCRATCH_PAD_PREFIX}\n[THOUGHT]\nthought 0\n[THOUGHT]\nthought 7")
+    assert scratch_pad.endswith(
+        "[THOUGHT]\nthought 9\n[ACTION]\n" '{"action": "math.add", "action_variables": {}}\n' "[OBSERVATION]\nresult 9"
+    )
+    assert "thought 6" not in scratch_pad
+    assert planner.create_scratch_pad("question", steps[:1]) == (
+        f"{SCRATCH_PAD_PREFIX}\n[THOUGHT]\nthought 0\n[ACTION]\n"
+        '{"action": "math.add", "action_variables": {}}\n[OBSERVATION]\nresult 0'
+    )
+
+
+@pytest.mark.asyncio
+async def test_action_lookup_is_cached_until_the_plugins_change():
+    planner, _ = create_planner()
+
+    functions = planner.get_available_function_map()
+    assert planner.get_available_function_map() is functions
+    assert "StepwisePlanner.ExecutePlan" not in functions
+    assert await planner.invoke_action("math.add", {"first": "2", "second": "2"}) == "4"
+
+    class TextPlugin:
+        @kernel_function(name="upper")
+        def upper(self, input: str) -> str:
+            return input.upper()
+
+    planner._kernel.import_plugin_from_object(TextPlugin(), "text")
+
+    assert planner.get_available_function_map() is not functions
+    assert await planner.invoke_action("text.upper", {"input": "hi"}) == "HI"
@@ -0,0 +1,189 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+import pytest
+
+from semantic_kernel.exceptions import KernelInvokeException, PlannerInvalidConfigurationError
+from semantic_kernel.functions.kernel_arguments import KernelArguments
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from semantic_kernel.kernel import Kernel
+from semantic_kernel.planners import Plan
+from semantic_kernel.planners.sequential_planner.sequential_planner_parser import SequentialPlanParser
+
+CITIES = ["Amsterdam", "Berlin", "Cairo", "Delhi", "Edinburgh", "Florence", "Geneva", "Hanoi"]
+
+
+class WeatherPlugin:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.calls = []
+        self.finished = []
+        self.cancelled = []
+
+    @kernel_function(name="lookup")
+    async def lookup(self, city: str) -> str:
+        self.calls.append(city)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(city)
+            raise
+        finally:
+            self.running -= 1
+        self.finished.append(city)
+        return f"sunny in {city}"
+
+    @kernel_function(name="forecast")
+    async def forecast(self, input: str) -> str:
+        return await self.lookup(input)
+
+    @kernel_function(name="combine")
+    def combine(self, first: str, second: str) -> str:
+        return f"{first} and {second}"
+
+    @kernel_function(name="shout")
+    def shout(self, input: str) -> str:
+        return input.upper() + "!"
+
+
+def create_plan(kernel: Kernel, xml: str) -> Plan:
+    return SequentialPlanParser.to_plan_from_xml(
+        f"<plan>{xml}</plan>", "goal", SequentialPlanParser.get_plugin_function(kernel)
+    )
+
+
+def fan_out_xml(cities=CITIES) -> str:
+    lookups = "".join(
+        f'<function.weather.lookup city="{city}" setContextVariable="WEATHER_{index}"/>'
+        for index, city in enumerate(cities)
+    )
+    return (
+        lookups
+        + '<function.weather.combine first="$WEATHER_0" second="$WEATHER_7" setContextVariable="BOTH"/>'
+        + '<function.weather.shout appendToResult="RESULT__SHOUTED"/>'
+    )
+
+
+@pytest.mark.asyncio
+async def test_fan_out_plan_runs_independent_steps_concurrently():
+    kernel = Kernel()
+    plugin = WeatherPlugin(delay=0.05)
+    kernel.import_plugin_from_object(plugin, "weather")
+
+    sequential_plan = create_plan(kernel, fan_out_xml())
+    start = time.perf_counter()
+    sequential_result = await sequential_plan.invoke(kernel, KernelArguments(input="go"))
+    sequential_time = time.perf_counter() - start
+
+    parallel_plan = create_plan(kernel, fan_out_xml())
+    parallel_plan.max_parallelism = 8
+    start = time.perf_counter()
+    parallel_result = await parallel_plan.invoke(kernel, KernelArguments(input="go"))
+    parallel_time = time.perf_counter() - start
+
+    assert plugin.max_running == 8
+    assert parallel_time < sequential_time / 3
+    assert str(parallel_result) == str(sequential_result) == "SUNNY IN AMSTERDAM AND SUNNY IN HANOI!"
+    assert [str(result) for result in parallel_result.metadata["results"]] == [
+        str(result) for result in sequential_result.metadata["results"]
+    ]
+    assert dict(parallel_plan.state) == dict(sequential_plan.state)
+    assert not parallel_plan.has_next_step
+
+
+@pytest.mark.asyncio
+async def test_max_parallelism_limits_running_steps():
+    kernel = Kernel()
+    plugin = WeatherPlugin(delay=0.01)
+    kernel.import_plugin_from_object(plugin, "weather")
+    plan = create_plan(kernel, fan_out_xml())
+    plan.max_parallelism = 3
+
+    await plan.invoke(kernel, KernelArguments(input="go"))
+
+    assert plugin.max_running == 3
+    # steps are started in plan order
+    assert plugin.calls == CITIES
+
+
+@pytest.mark.asyncio
+async def test_dependent_steps_run_in_order():
+    kernel = Kernel()
+    plugin = WeatherPlugin()
+    kernel.import_plugin_from_object(plugin, "weather")
+    xml = (
+        '<function.weather.lookup city="Paris" setContextVariable="PARIS"/>'
+        + '<function.weather.lookup city="$PARIS"/>'
+        + "<function.weather.shout/>"
+    )
+    plan = create_plan(kernel, xml)
+
+    assert plan._get_step_dependencies(plan.steps) == [set(), {0}, {0, 1}]
+
+    plan.max_parallelism = 4
+    result = await plan.invoke(kernel, KernelArguments(input="go"))
+    assert str(result) == "SUNNY IN SUNNY IN PARIS!"
+
+
+@pytest.mark.asyncio
+async def test_failing_step_cancels_running_steps():
+    kernel = Kernel()
+    plugin = WeatherPlugin(delay=0.01)
+    kernel.import_plugin_from_object(plugin, "weather")
+    plan = create_plan(kernel, fan_out_xml())
+    plan.max_parallelism = 2
+
+    async def fail(kernel, arguments):
+        raise ValueError("Lookup failed")
+
+    plan.steps[0].invoke = fail
+
+    with pytest.raises(KernelInvokeException):
+        await plan.invoke(kernel, KernelArguments(input="go"))
+    # the lookup that was running was cancelled and awaited before the plan failed
+    assert plugin.calls == ["Berlin"]
+    assert plugin.cancelled == ["Berlin"]
+    assert plugin.finished == []
+    assert plugin.running == 0
+
+
+@pytest.mark.asyncio
+async def test_steps_binding_input_depend_only_on_what_the_input_references():
+    kernel = Kernel()
+    plugin = WeatherPlugin(delay=0.05)
+    kernel.import_plugin_from_object(plugin, "weather")
+    xml = (
+        '<function.weather.forecast input="Oslo" setContextVariable="OSLO"/>'
+        + '<function.weather.forecast input="Rome" setContextVariable="ROME"/>'
+        + '<function.weather.forecast input="$OSLO"/>'
+        + '<function.weather.combine first="$OSLO" second="$ROME"/>'
+    )
+
+    sequential_plan = create_plan(kernel, xml)
+    sequential_result = await sequential_plan.invoke(kernel, KernelArguments(input="go"))
+
+    plugin = WeatherPlugin(delay=0.05)
+    kernel = Kernel()
+    kernel.import_plugin_from_object(plugin, "weather")
+    parallel_plan = create_plan(kernel, xml)
+    parallel_plan.max_parallelism = 4
+    assert parallel_plan._get_step_dependencies(parallel_plan.steps) == [set(), set(), {0}, {0, 1}]
+
+    parallel_result = await parallel_plan.invoke(kernel, KernelArguments(input="go"))
+
+    assert plugin.max_running == 2
+    # the input a step binds is used, not the result of the previous step
+    assert plugin.calls == ["Oslo", "Rome", "sunny in Oslo"]
+    assert str(parallel_result) == str(sequential_result) == "sunny in Oslo and sunny in Rome"
+    assert dict(parallel_plan.state) == dict(sequential_plan.state)
+
+
+def test_max_parallelism_must_be_positive():
+    with pytest.raises(PlannerInvalidConfigurationError):
+        Plan(max_parallelism=0)
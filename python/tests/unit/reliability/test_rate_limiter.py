@@ -0,0 +1,239 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from openai import AsyncOpenAI
+
+from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
+    OpenAIChatPromptExecutionSettings,
+)
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.exceptions import ServiceRateLimitException
+from semantic_kernel.kernel import Kernel
+from semantic_kernel.reliability.rate_limiter import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def test_token_bucket_refills_up_to_capacity():
+    bucket = TokenBucket(capacity=10, refill_per_second=1)
+    bucket.consume(10, now=0)
+    assert bucket.time_until_available(4, now=0) == 4
+    assert bucket.time_until_available(4, now=4) == 0
+    assert bucket.level == 4
+    assert bucket.time_until_available(20, now=100) == 0
+    assert bucket.level == 10
+
+
+@pytest.mark.asyncio
+async def test_requests_per_minute():
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        async with limiter.limit():
+            pass
+
+    assert clock.sleeps == [30.0]
+
+
+@pytest.mark.asyncio
+async def test_tokens_per_minute_reconciled_with_usage():
+    clock = FakeClock()
+    limiter = RateLimiter(tokens_per_minute=1000, clock=clock, sleep=clock.sleep)
+
+    async with limiter.limit(estimated_tokens=600) as lease:
+        lease.used_tokens = 100
+    async with limiter.limit(estimated_tokens=800):
+        pass
+    assert clock.sleeps == []
+
+    async with limiter.limit(estimated_tokens=600):
+        pass
+    # 100 tokens are left, 500 more are refilled at 1000 tokens per minute
+    assert clock.sleeps == [pytest.approx(30.0)]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_lowers_concurrency_and_pauses():
+    clock = FakeClock()
+    limiter = RateLimiter(max_concurrency=4, clock=clock, sleep=clock.sleep)
+
+    async with limiter.limit() as lease:
+        lease.rate_limited = True
+        lease.retry_after = 5
+    assert limiter.concurrency_limit == 2
+
+    async with limiter.limit():
+        pass
+    assert clock.sleeps == [5.0]
+
+    for _ in range(10):
+        async with limiter.limit():
+            pass
+    assert limiter.concurrency_limit == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_fair():
+    limiter = RateLimiter(max_concurrency=1)
+    order = []
+
+    async def request(index: int):
+        async with limiter.limit():
+            order.append(index)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*[request(index) for index in range(5)])
+
+    assert order == list(range(5))
+    assert limiter.in_flight == 0
+    assert limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_block_queue():
+    limiter = RateLimiter(max_concurrency=1)
+    lease = await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    limiter.release(lease)
+
+    async with limiter.limit():
+        assert limiter.in_flight == 1
+    assert limiter.queued == 0
+
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "test-model",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Hi"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+}
+
+
+@pytest.mark.asyncio
+async def test_open_ai_service_with_rate_limiter_against_stub_server():
+    responses = [
+        web.json_response(
+            {"error": {"message": "Rate limit reached", "type": "requests", "code": "429"}},
+            status=429,
+            headers={"retry-after": "2"},
+        ),
+        web.json_response(CHAT_COMPLETION),
+    ]
+
+    async def chat_completions(request: web.Request) -> web.Response:
+        return responses.pop(0)
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        clock = FakeClock()
+        service = OpenAIChatCompletion(
+            ai_model_id="test-model",
+            async_client=AsyncOpenAI(api_key="test", base_url=f"http://127.0.0.1:{port}/v1", max_retries=0),
+        )
+        service.rate_limiter = RateLimiter(tokens_per_minute=1000, max_concurrency=4, clock=clock, sleep=clock.sleep)
+        chat_history = ChatHistory()
+        chat_history.add_user_message("Hello")
+        settings = OpenAIChatPromptExecutionSettings(max_tokens=100)
+
+        with pytest.raises(ServiceRateLimitException) as exc_info:
+            await service.complete_chat(chat_history, settings, kernel=Kernel())
+        assert exc_info.value.retry_after == 2
+        assert service.rate_limiter.concurrency_limit == 2
+
+        result = await service.complete_chat(chat_history, settings, kernel=Kernel())
+        assert result[0].content == "Hi"
+        assert clock.sleeps == [2.0]
+        assert service.rate_limiter.in_flight == 0
+    finally:
+        await runner.cleanup()
+
+
+def chat_completion_chunk(delta, finish_reason=None):
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "test-model",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_open_ai_stream_holds_lease_until_closed():
+    chunks = [
+        chat_completion_chunk({"role": "assistant", "content": "Hel"}),
+        chat_completion_chunk({"content": "lo"}),
+        chat_completion_chunk({}, "stop"),
+    ]
+    body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+
+    async def chat_completions(request: web.Request) -> web.Response:
+        return web.Response(text=body, content_type="text/event-stream")
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        clock = FakeClock()
+        service = OpenAIChatCompletion(
+            ai_model_id="test-model",
+            async_client=AsyncOpenAI(api_key="test", base_url=f"http://127.0.0.1:{port}/v1", max_retries=0),
+        )
+        service.rate_limiter = RateLimiter(tokens_per_minute=1000, clock=clock, sleep=clock.sleep)
+        chat_history = ChatHistory()
+        chat_history.add_user_message("Hello")
+        settings = OpenAIChatPromptExecutionSettings(max_tokens=100)
+
+        with patch.object(RateLimiter, "release", autospec=True, side_effect=RateLimiter.release) as release:
+            stream = service.complete_chat_stream(chat_history, settings, kernel=Kernel())
+            await stream.__anext__()
+            assert service.rate_limiter.in_flight == 1
+            await stream.aclose()
+            assert service.rate_limiter.in_flight == 0
+
+            contents = [
+                content[0].content
+                async for content in service.complete_chat_stream(chat_history, settings, kernel=Kernel())
+            ]
+            assert contents == ["Hel", "lo"]
+            assert service.rate_limiter.in_flight == 0
+
+        early_lease, lease = (call.args[1] for call in release.call_args_list)
+        # the prompt and the 2 tokens estimated for the streamed text instead of the max_tokens
+        assert lease.used_tokens == lease.estimated_tokens - 100 + 2
+        assert early_lease.used_tokens == early_lease.estimated_tokens - 100 + 1
+    finally:
+        await runner.cleanup()
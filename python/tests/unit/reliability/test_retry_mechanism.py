@@ -0,0 +1,107 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from semantic_kernel.exceptions import ServiceRateLimitException, ServiceResponseException
+from semantic_kernel.reliability.pass_through_without_retry import PassThroughWithoutRetry
+from semantic_kernel.reliability.retry_mechanism import RetryMechanism
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+def wrapped(exc: Exception) -> ServiceResponseException:
+    try:
+        raise ServiceResponseException("service failed") from exc
+    except ServiceResponseException as service_exc:
+        return service_exc
+
+
+@pytest.mark.asyncio
+async def test_pass_through_returns_result():
+    action = AsyncMock(return_value="result")
+    assert await PassThroughWithoutRetry().execute_with_retry(action) == "result"
+
+
+@pytest.mark.asyncio
+async def test_retries_with_exponential_backoff():
+    clock = FakeClock()
+    retry = RetryMechanism(initial_delay=1, backoff_factor=2, jitter=0, clock=clock, sleep=clock.sleep)
+    action = AsyncMock(side_effect=[wrapped(StatusError(503)), wrapped(StatusError(500)), TimeoutError(), "result"])
+
+    assert await retry.execute_with_retry(action) == "result"
+    assert clock.sleeps == [1, 2, 4]
+    assert retry.retry_count == 3
+    assert retry.backoff_time == 7
+
+
+@pytest.mark.asyncio
+async def test_honors_retry_after():
+    clock = FakeClock()
+    retry = RetryMechanism(jitter=0, clock=clock, sleep=clock.sleep)
+    action = AsyncMock(side_effect=[ServiceRateLimitException("rate limited", retry_after=7.5), "result"])
+
+    assert await retry.execute_with_retry(action) == "result"
+    assert clock.sleeps == [7.5]
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_other_errors():
+    clock = FakeClock()
+    retry = RetryMechanism(clock=clock, sleep=clock.sleep)
+    action = AsyncMock(side_effect=wrapped(StatusError(400)))
+
+    with pytest.raises(ServiceResponseException):
+        await retry.execute_with_retry(action)
+    assert action.call_count == 1
+    assert retry.retry_count == 0
+
+
+@pytest.mark.asyncio
+async def test_stops_after_max_retries():
+    clock = FakeClock()
+    retry = RetryMechanism(max_retries=2, jitter=0, clock=clock, sleep=clock.sleep)
+    action = AsyncMock(side_effect=ServiceRateLimitException("rate limited"))
+
+    with pytest.raises(ServiceRateLimitException):
+        await retry.execute_with_retry(action)
+    assert action.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_stops_at_max_elapsed_time():
+    clock = FakeClock()
+    retry = RetryMechanism(
+        initial_delay=10, backoff_factor=2, jitter=0, max_elapsed_time=25, clock=clock, sleep=clock.sleep
+    )
+    action = AsyncMock(side_effect=ServiceRateLimitException("rate limited"))
+
+    with pytest.raises(ServiceRateLimitException):
+        await retry.execute_with_retry(action)
+    # the third attempt would have to wait until 10 + 20 + 40 seconds
+    assert clock.sleeps == [10]
+    assert action.call_count == 2
+
+
+def test_delay_is_capped_and_jittered():
+    retry = RetryMechanism(initial_delay=1, backoff_factor=10, max_delay=30, jitter=0.1)
+    for _ in range(20):
+        assert 27 <= retry.get_delay(5) <= 33
@@ -0,0 +1,227 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion import OpenAIChatCompletion
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.exceptions import KernelServiceNotFoundError
+from semantic_kernel.functions.kernel_arguments import KernelArguments
+from semantic_kernel.functions.kernel_function_from_prompt import KernelFunctionFromPrompt
+from semantic_kernel.kernel import Kernel
+from semantic_kernel.services.load_balancing_ai_service_selector import LoadBalancingAIServiceSelector
+from semantic_kernel.services.request_latency import report_request_latency
+
+
+def create_kernel(selector: LoadBalancingAIServiceSelector, service_ids=("eastus", "westus")) -> Kernel:
+    kernel = Kernel(ai_service_selector=selector)
+    for service_id in service_ids:
+        kernel.add_service(OpenAIChatCompletion(service_id=service_id, ai_model_id="gpt-4", api_key="test"))
+    return kernel
+
+
+def create_function(service_id: str = "gpt-4") -> KernelFunctionFromPrompt:
+    return KernelFunctionFromPrompt(
+        function_name="test",
+        plugin_name="test",
+        prompt="test",
+        prompt_execution_settings=PromptExecutionSettings(service_id=service_id),
+    )
+
+
+def test_selects_least_loaded_service():
+    selector = LoadBalancingAIServiceSelector(service_groups={"gpt-4": ["eastus", "westus"]})
+    kernel = create_kernel(selector)
+    selector.get_stats("eastus").record(2.0, failed=False)
+    selector.get_stats("westus").record(0.5, failed=False)
+
+    service, settings = selector.select_ai_service(kernel, create_function(), KernelArguments())
+    assert service.service_id == "westus"
+
+    selector.get_stats("westus").in_flight = 4
+    service, _ = selector.select_ai_service(kernel, create_function(), KernelArguments())
+    assert service.service_id == "eastus"
+
+
+def test_errors_add_to_load():
+    selector = LoadBalancingAIServiceSelector(service_groups={"gpt-4": ["eastus", "westus"]})
+    kernel = create_kernel(selector)
+    for service_id in ("eastus", "westus"):
+        selector.get_stats(service_id).record(1.0, failed=False)
+    selector.get_stats("eastus").record(None, failed=True)
+
+    service, _ = selector.select_ai_service(kernel, create_function(), KernelArguments())
+    assert service.service_id == "westus"
+
+
+def test_spreads_requests_without_latencies():
+    selector = LoadBalancingAIServiceSelector(service_groups={"gpt-4": ["eastus", "westus"]})
+    kernel = create_kernel(selector)
+
+    selected = {
+        selector.select_ai_service(kernel, create_function(), KernelArguments())[0].service_id for _ in range(50)
+    }
+    assert selected == {"eastus", "westus"}
+
+
+def test_power_of_two_choices():
+    selector = LoadBalancingAIServiceSelector(service_groups={"gpt-4": ["a", "b", "c", "d"]}, strategy="power_of_two")
+    kernel = create_kernel(selector, service_ids=("a", "b", "c", "d"))
+    for index, service_id in enumerate(("a", "b", "c", "d")):
+        selector.get_stats(service_id).record(index + 1.0, failed=False)
+
+    selected = {
+        selector.select_ai_service(kernel, create_function(), KernelArguments())[0].service_id for _ in range(50)
+    }
+    assert "d" not in selected
+    assert "a" in selected
+
+
+def test_skips_missing_services():
+    selector = LoadBalancingAIServiceSelector(service_groups={"gpt-4": ["eastus", "northeurope"]})
+    kernel = create_kernel(selector, service_ids=("eastus",))
+
+    service, _ = selector.select_ai_service(kernel, create_function(), KernelArguments())
+    assert service.service_id == "eastus"
+
+    with pytest.raises(KernelServiceNotFoundError):
+        selector.select_ai_service(kernel, create_function("unknown"), KernelArguments())
+
+
+@pytest.mark.asyncio
+async def test_tracks_in_flight_and_latency():
+    now = [0.0]
+    selector = LoadBalancingAIServiceSelector(clock=lambda: now[0])
+    kernel = create_kernel(selector, service_ids=("eastus",))
+    service, settings = selector.select_ai_service(kernel, create_function("eastus"), KernelArguments())
+
+    async def call(service, settings):
+        assert selector.get_stats(service.service_id).in_flight == 1
+        now[0] += 0.25
+        return "done"
+
+    assert await selector.invoke_service(service, settings, call) == "done"
+    stats = selector.get_stats("eastus")
+    assert stats.in_flight == 0
+    assert stats.ewma_latency == 0.25
+
+
+@pytest.mark.asyncio
+async def test_hedges_slow_request_and_cancels_loser():
+    selector = LoadBalancingAIServiceSelector(
+        service_groups={"gpt-4": ["eastus", "westus"]}, hedge_percentile=90, hedge_min_samples=5
+    )
+    kernel = create_kernel(selector)
+    for _ in range(5):
+        selector.get_stats("eastus").record(0.01, failed=False)
+        selector.get_stats("westus").record(0.02, failed=False)
+    service, settings = selector.select_ai_service(kernel, create_function(), KernelArguments())
+    assert service.service_id == "eastus"
+    cancelled = []
+
+    async def call(service, settings):
+        if service.service_id == "eastus":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(service.service_id)
+                raise
+        return service.service_id
+
+    assert await selector.invoke_service(service, settings, call) == "westus"
+    assert cancelled == ["eastus"]
+    assert selector.get_stats("eastus").in_flight == 0
+    assert selector.get_stats("westus").in_flight == 0
+
+
+def create_hedging_selector() -> LoadBalancingAIServiceSelector:
+    selector = LoadBalancingAIServiceSelector(
+        service_groups={"gpt-4": ["eastus", "westus"]}, hedge_percentile=90, hedge_min_samples=5
+    )
+    for _ in range(5):
+        selector.get_stats("eastus").record(0.01, failed=False)
+        selector.get_stats("westus").record(0.02, failed=False)
+    return selector
+
+
+@pytest.mark.asyncio
+async def test_does_not_hedge_calls_with_side_effects():
+    selector = create_hedging_selector()
+    kernel = create_kernel(selector)
+    service, settings = selector.select_ai_service(kernel, create_function(), KernelArguments())
+    called = []
+
+    async def call(service, settings):
+        called.append(service.service_id)
+        await asyncio.sleep(0.05)
+        return service.service_id
+
+    assert await selector.invoke_service(service, settings, call, idempotent=False) == "eastus"
+    assert called == ["eastus"]
+
+
+@pytest.mark.asyncio
+async def test_closes_result_of_finished_loser():
+    selector = create_hedging_selector()
+    kernel = create_kernel(selector)
+    service, settings = selector.select_ai_service(kernel, create_function(), KernelArguments())
+    released = asyncio.Event()
+    closed = []
+
+    class Started:
+        def __init__(self, service_id):
+            self.service_id = service_id
+
+        async def aclose(self):
+            closed.append(self.service_id)
+
+    async def call(service, settings):
+        if service.service_id == "eastus":
+            await released.wait()
+        else:
+            released.set()
+        return Started(service.service_id)
+
+    winner = await selector.invoke_service(service, settings, call)
+
+    # both finished, the one that was not used is closed
+    assert closed == [{"eastus": "westus", "westus": "eastus"}[winner.service_id]]
+
+
+@pytest.mark.asyncio
+async def test_records_latency_per_request():
+    now = [0.0]
+    selector = LoadBalancingAIServiceSelector(clock=lambda: now[0])
+    kernel = create_kernel(selector, service_ids=("eastus",))
+    service, settings = selector.select_ai_service(kernel, create_function("eastus"), KernelArguments())
+
+    async def call(service, settings):
+        # two requests and the functions that were invoked in between
+        report_request_latency(0.1)
+        now[0] += 5
+        report_request_latency(0.3)
+        return "done"
+
+    assert await selector.invoke_service(service, settings, call) == "done"
+    assert list(selector.get_stats("eastus").latencies) == [0.1, 0.3]
+
+
+@pytest.mark.asyncio
+async def test_invoke_function_through_selector():
+    selector = LoadBalancingAIServiceSelector(service_groups={"gpt-4": ["eastus", "westus"]})
+    kernel = create_kernel(selector)
+    function = create_function()
+
+    with patch(
+        "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion.OpenAIChatCompletion.complete_chat"
+    ) as mock:
+        mock.return_value = [ChatMessageContent(role="assistant", content="test", metadata={})]
+        for _ in range(10):
+            result = await kernel.invoke(function)
+            assert str(result) == "test"
+
+    latencies = [len(selector.get_stats(service_id).latencies) for service_id in ("eastus", "westus")]
+    assert sum(latencies) == 10
@@ -0,0 +1,122 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import numpy as np
+import pytest
+
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.memory.semantic_text_memory import SemanticTextMemory
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+from semantic_kernel.text import ChunkingPool, split_plaintext_lines, split_plaintext_paragraph
+
+
+class CountingEmbeddings(EmbeddingGeneratorBase):
+    batches: List[int] = []
+
+    async def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        self.batches.append(len(texts))
+        return np.array([[1.0, float(len(text))] for text in texts])
+
+
+def create_documents(count: int):
+    return [
+        (f"doc-{index}", f"Document {index} starts here.\n\nIt has a second paragraph, with more words in it.")
+        for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_chunk_documents_in_worker_processes():
+    documents = create_documents(20)
+
+    async with ChunkingPool(max_tokens=10, max_workers=2, documents_per_task=3) as pool:
+        chunked = {document.document_id: document async for document in pool.chunk_documents(documents)}
+
+    assert len(chunked) == 20
+    for document_id, text in documents:
+        assert [chunk.text for chunk in chunked[document_id].chunks] == split_plaintext_paragraph(
+            split_plaintext_lines(text, 10), 10
+        )
+
+
+@pytest.mark.asyncio
+async def test_duplicate_paragraphs_are_left_out():
+    documents = [("a", "Shared paragraph.\n\nOnly in a."), ("b", "shared   PARAGRAPH.\n\nOnly in b.")]
+
+    with ThreadPoolExecutor(1) as executor:
+        pool = ChunkingPool(max_tokens=4, deduplicate=True, executor=executor, documents_per_task=1)
+        chunked = [document async for document in pool.chunk_documents(documents)]
+
+    assert [[chunk.text for chunk in document.chunks] for document in chunked] == [
+        ["Shared paragraph.", "Only in a."],
+        ["Only in b."],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_only_the_most_recently_seen_paragraphs_are_kept():
+    documents = [("a", "First."), ("b", "Second."), ("c", "Second."), ("d", "First.")]
+
+    with ThreadPoolExecutor(1) as executor:
+        pool = ChunkingPool(max_tokens=4, deduplicate=True, executor=executor, documents_per_task=1, max_seen=1)
+        chunked = [document async for document in pool.chunk_documents(documents)]
+
+    assert [[chunk.text for chunk in document.chunks] for document in chunked] == [
+        ["First."],
+        ["Second."],
+        [],
+        ["First."],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stopping_early_shuts_down_own_workers():
+    pool = ChunkingPool(max_tokens=10, max_workers=1, documents_per_task=1, max_pending_tasks=4)
+    chunked = pool.chunk_documents(create_documents(20))
+    await chunked.__anext__()
+    executor = pool._executor
+    await chunked.aclose()
+
+    assert pool._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(len, "")
+    # the next call starts new workers
+    async with pool:
+        assert len([document async for document in pool.chunk_documents(create_documents(2))]) == 2
+
+
+@pytest.mark.asyncio
+async def test_documents_are_read_as_tasks_can_be_submitted():
+    read = []
+
+    def documents():
+        for document in create_documents(100):
+            read.append(document[0])
+            yield document
+
+    with ThreadPoolExecutor(2) as executor:
+        pool = ChunkingPool(max_tokens=10, executor=executor, documents_per_task=5, max_pending_tasks=2)
+        chunked = pool.chunk_documents(documents())
+        await chunked.__anext__()
+        # the tasks in flight and the one that was consumed
+        assert len(read) <= 3 * 5
+        await chunked.aclose()
+
+
+@pytest.mark.asyncio
+async def test_ingest_saves_paragraphs_in_batches_across_documents():
+    embeddings = CountingEmbeddings(ai_model_id="counting", batches=[])
+    memory = SemanticTextMemory(storage=VolatileMemoryStore(), embeddings_generator=embeddings)
+
+    with ThreadPoolExecutor(2) as executor:
+        pool = ChunkingPool(max_tokens=10, executor=executor, documents_per_task=4)
+        count = await pool.ingest(memory, "docs", create_documents(25), batch_size=16)
+
+    expected = sum(
+        len(split_plaintext_paragraph(split_plaintext_lines(text, 10), 10)) for _, text in create_documents(25)
+    )
+    assert count == expected
+    assert embeddings.batches == [16] * (expected // 16) + [expected % 16]
+    assert len(await memory._storage.get_batch("docs", [f"doc-3:0-{len('Document 3 starts here.')}"])) == 1
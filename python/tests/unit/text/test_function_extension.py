@@ -1,11 +1,14 @@
+import asyncio
+
 import pytest
 
 from semantic_kernel import Kernel
+from semantic_kernel.exceptions import KernelInvokeException
 from semantic_kernel.functions.function_result import FunctionResult
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.functions.kernel_function import KernelFunction
 from semantic_kernel.functions.kernel_function_decorator import kernel_function
-from semantic_kernel.text import aggregate_chunked_results
+from semantic_kernel.text import aggregate_chunked_results, reduce_chunked_results, stream_chunked_results
 
 
 @pytest.mark.asyncio
@@ -33,3 +36,81 @@ async def test_aggregate_results():
     result = await aggregate_chunked_results(func, chunked, kernel, KernelArguments())
     print(result)
     assert result == "\n".join(chunked)
+
+
+class Summarizer:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.inputs = []
+
+    @kernel_function(name="summarize")
+    async def summarize(self, input: str, style: str) -> str:
+        self.inputs.append(input)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        # later chunks finish first
+        await asyncio.sleep(self.delay / (len(self.inputs)))
+        self.running -= 1
+        if input == "fail":
+            raise ValueError("Cannot summarize")
+        return f"{style}({input[:8]})"
+
+
+@pytest.mark.asyncio
+async def test_aggregate_results_concurrently_with_copies_of_the_arguments():
+    kernel = Kernel()
+    summarizer = Summarizer(delay=0.02)
+    func = KernelFunction.from_method(method=summarizer.summarize, plugin_name="test")
+    arguments = KernelArguments(input="original", style="short")
+    chunks = [f"chunk {index}" for index in range(6)]
+
+    result = await aggregate_chunked_results(func, chunks, kernel, arguments, max_concurrency=3)
+
+    assert result == "\n".join(f"short({chunk[:8]})" for chunk in chunks)
+    assert summarizer.max_running == 3
+    assert arguments["input"] == "original"
+
+
+@pytest.mark.asyncio
+async def test_stream_results_as_they_finish():
+    kernel = Kernel()
+    summarizer = Summarizer(delay=0.05)
+    func = KernelFunction.from_method(method=summarizer.summarize, plugin_name="test")
+
+    results = [
+        item
+        async for item in stream_chunked_results(func, ["first", "second", "third"], kernel, KernelArguments(style="s"))
+    ]
+
+    assert results == [(2, "s(third)"), (1, "s(second)"), (0, "s(first)")]
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_raises():
+    kernel = Kernel()
+    func = KernelFunction.from_method(method=Summarizer().summarize, plugin_name="test")
+
+    with pytest.raises(KernelInvokeException):
+        await aggregate_chunked_results(func, ["fine", "fail"], kernel, KernelArguments(style="s"))
+
+
+@pytest.mark.asyncio
+async def test_reduce_results_until_they_fit():
+    kernel = Kernel()
+
+    @kernel_function(name="shorten")
+    def shorten(input: str) -> str:
+        # keeps half of the words of a chunk
+        words = input.split()
+        return " ".join(words[: max(1, len(words) // 2)])
+
+    func = KernelFunction.from_method(method=shorten, plugin_name="test")
+    chunks = [" ".join(["word"] * 40)] * 16
+
+    result = await reduce_chunked_results(
+        func, chunks, kernel, KernelArguments(), max_tokens=40, token_counter=lambda text: len(text.split())
+    )
+
+    assert 0 < len(result.split()) <= 40
@@ -2,6 +2,8 @@
 import os
 
 from semantic_kernel.text import (
+    iter_markdown_paragraphs,
+    iter_plaintext_paragraphs,
     split_markdown_lines,
     split_markdown_paragraph,
     split_plaintext_lines,
@@ -562,3 +564,48 @@ def test_split_md_on_newlines():
     max_token_per_line = 15
     split = split_markdown_paragraph(test, max_token_per_line)
     assert expected == split
+
+
+def _paragraphs(count: int) -> str:
+    return "\n\n".join(
+        f"Paragraph {index}. It has a few sentences, with commas!\nAnd a second line." for index in range(count)
+    )
+
+
+def test_iter_plaintext_paragraphs_matches_the_list_api():
+    text = _paragraphs(5)
+
+    chunks = list(iter_plaintext_paragraphs(text, max_tokens=20))
+
+    assert [chunk.text for chunk in chunks] == split_plaintext_paragraph(split_plaintext_lines(text, 20), 20)
+    for chunk in chunks:
+        assert "".join(text[chunk.start : chunk.end].split()) == "".join(chunk.text.split())
+
+
+def test_iter_plaintext_paragraphs_reads_files_in_segments(tmp_path):
+    text = _paragraphs(200).replace("\n", "\r\n")
+    path = tmp_path / "document.txt"
+    path.write_bytes(text.encode("utf-8"))
+
+    with open(path, "r", newline="") as file:
+        chunks = list(iter_plaintext_paragraphs(file, max_tokens=30, segment_size=500))
+    with open(path, "rb") as file:
+        binary_chunks = list(iter_plaintext_paragraphs(file, max_tokens=30, segment_size=500))
+
+    assert len(chunks) > 100
+    assert [chunk.text for chunk in binary_chunks] == [chunk.text for chunk in chunks]
+    assert "".join("".join(chunk.text.split()) for chunk in chunks) == "".join(text.split())
+    for chunk in chunks:
+        assert "".join(text[chunk.start : chunk.end].split()) == "".join(chunk.text.split())
+
+
+def test_iter_markdown_paragraphs_has_byte_offsets_for_binary_documents():
+    text = "## Café\n\nCrème brûlée. Déjà vu!\n\n" * 50
+    data = text.encode("utf-8")
+
+    chunks = list(iter_markdown_paragraphs(iter(data.splitlines(keepends=True)), max_tokens=10, segment_size=200))
+
+    assert chunks
+    for chunk in chunks:
+        assert "".join(data[chunk.start : chunk.end].decode("utf-8").split()) == "".join(chunk.text.split())
+    assert chunks[-1].end == len(data.rstrip())
@@ -0,0 +1,70 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import base64
+
+from semantic_kernel.text import split_plaintext_lines, split_plaintext_paragraph
+from semantic_kernel.text.tokenizers import BpeTokenizer, HeuristicTokenizer, to_tokenizer
+
+MERGES = [b"he", b"ll", b"hell", b"hello", b" w", b"or", b" wor", b"ld", b" world"]
+
+
+def write_tiktoken_file(path) -> None:
+    tokens = [bytes([byte]) for byte in range(256)] + MERGES
+    path.write_bytes(
+        b"".join(base64.b64encode(token) + b" " + str(rank).encode() + b"\n" for rank, token in enumerate(tokens))
+    )
+
+
+def test_bpe_tokenizer_merges_by_rank(tmp_path):
+    path = tmp_path / "test.tiktoken"
+    write_tiktoken_file(path)
+    tokenizer = BpeTokenizer.from_tiktoken_file(str(path))
+
+    tokens = tokenizer.encode("hello world, help!")
+
+    assert tokens[:2] == [259, 264]
+    assert tokenizer.decode(tokens) == "hello world, help!"
+    # hello, " world", ",", " ", "he", "l", "p", "!"
+    assert tokenizer.count_tokens("hello world, help!") == len(tokens) == 8
+    assert tokenizer("hello") == 1
+
+
+def test_bpe_tokenizer_stops_counting_past_the_limit(tmp_path):
+    path = tmp_path / "test.tiktoken"
+    write_tiktoken_file(path)
+    tokenizer = BpeTokenizer.from_tiktoken_file(str(path))
+    text = "hello world " * 10 + "tail"
+
+    assert tokenizer.exceeds(text, 5)
+    # the pieces after the limit are not tokenized
+    assert " tail" not in tokenizer._cache
+    assert not tokenizer.exceeds(text, tokenizer.count_tokens(text))
+
+
+def test_running_counts():
+    heuristic = HeuristicTokenizer().create_running_count()
+    for part in ["abc", "def", "gh"]:
+        heuristic.add(part)
+    # counted over all characters, like the whole text
+    assert heuristic.tokens == HeuristicTokenizer().count_tokens("abcdefgh") == 2
+
+    words = to_tokenizer(lambda text: len(text.split())).create_running_count()
+    words.add("one two")
+    words.add("three")
+    assert words.tokens == 3
+    words.reset()
+    assert words.tokens == 0
+
+
+def test_chunks_fit_the_tokenizer(tmp_path):
+    path = tmp_path / "test.tiktoken"
+    write_tiktoken_file(path)
+    tokenizer = BpeTokenizer.from_tiktoken_file(str(path))
+    text = "\n".join(f"hello world number {index}. The quick brown fox jumps over the lazy dog." for index in range(50))
+
+    lines = split_plaintext_lines(text, 20, tokenizer)
+    paragraphs = split_plaintext_paragraph(lines, 60, tokenizer)
+
+    assert all(tokenizer.count_tokens(line) <= 20 for line in lines)
+    assert all(tokenizer.count_tokens(paragraph) <= 60 for paragraph in paragraphs)
+    assert " ".join(" ".join(paragraphs).split()) == " ".join(text.split())